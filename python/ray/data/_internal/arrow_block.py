@@ -1,4 +1,5 @@
 import collections
+import functools
 import random
 import heapq
 from typing import (
@@ -27,11 +28,11 @@ from ray.data.block import (
     BlockExecStats,
     U,
     KeyFn,
-    KeyType,
 )
 from ray.data.row import TableRow
 from ray.data._internal.table_block import TableBlockAccessor, TableBlockBuilder
 from ray.data.aggregate import AggregateFn
+from ray.data._internal.util import _hash_partition
 
 if TYPE_CHECKING:
     import pandas
@@ -39,6 +40,10 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# The target size in bytes of the batches that sorted runs are consumed in by the
+# k-way merge of sort reducers. At most one batch per run is held at a time.
+SORT_MERGE_BATCH_SIZE = 16 * 1024 * 1024
+
 
 class ArrowRow(TableRow):
     """
@@ -107,6 +112,24 @@ class ArrowBlockAccessor(TableBlockAccessor):
         random = np.random.RandomState(random_seed)
         return self._table.take(random.permutation(self.num_rows()))
 
+    def take(self, indices: List[int]) -> "pyarrow.Table":
+        return self._table.take(indices)
+
+    def filter(self, predicate: "pyarrow.dataset.Expression") -> "pyarrow.Table":
+        import pyarrow.dataset as pads
+
+        # Evaluate the predicate with Arrow's vectorized compute kernels.
+        return pads.dataset(self._table).to_table(filter=predicate)
+
+    def select(self, columns: List[str]) -> "pyarrow.Table":
+        missing = [c for c in columns if c not in self._table.column_names]
+        if missing:
+            raise ValueError(
+                f"Cannot select columns {missing}, available columns: "
+                f"{self._table.column_names}"
+            )
+        return self._table.select(columns)
+
     def schema(self) -> "pyarrow.lib.Schema":
         return self._table.schema
 
@@ -326,57 +349,133 @@ class ArrowBlockAccessor(TableBlockAccessor):
                 f"got: {type(key)}."
             )
 
-        def iter_groups() -> Iterator[Tuple[KeyType, Block]]:
-            """Creates an iterator over zero-copy group views."""
-            if key is None:
-                # Global aggregation consists of a single "group", so we short-circuit.
-                yield None, self.to_block()
-                return
-
-            start = end = 0
-            iter = self.iter_rows()
-            next_row = None
-            while True:
-                try:
-                    if next_row is None:
-                        next_row = next(iter)
-                    next_key = next_row[key]
-                    while next_row[key] == next_key:
-                        end += 1
-                        try:
-                            next_row = next(iter)
-                        except StopIteration:
-                            next_row = None
-                            break
-                    yield next_key, self.slice(start, end, copy=False)
-                    start = end
-                except StopIteration:
-                    break
+        if key is None:
+            # Global aggregation consists of a single "group", so we short-circuit.
+            return self._combine_groups(None, aggs, [0, self.num_rows()])
+        if self.num_rows() == 0:
+            return ArrowBlockAccessor._empty_table()
+        return self._combine_groups(key, aggs, self._find_group_boundaries(key))
 
-        builder = ArrowBlockBuilder()
-        for group_key, group_view in iter_groups():
+    def hash_partition_and_combine(
+        self, key: KeyFn, aggs: Tuple[AggregateFn], num_partitions: int
+    ) -> List[Block[ArrowRow]]:
+        """Hash partition rows by key and combine rows with the same key.
+
+        Unlike ``combine()``, this does not require the block to be sorted.
+
+        Args:
+            key: The column name of key or None for global aggregation.
+            aggs: The aggregations to do.
+            num_partitions: The number of partitions to hash the keys into.
+
+        Returns:
+            A list of ``num_partitions`` blocks of [k, v_1, ..., v_n] columns,
+            in the same format as ``combine()`` but not sorted by key.
+            If key is None then a single block without the k column is returned.
+        """
+        if key is None:
+            return [self.combine(None, aggs)]
+        if not isinstance(key, str):
+            raise ValueError(
+                "key must be a string or None when aggregating on Arrow blocks, but "
+                f"got: {type(key)}."
+            )
+        if self.num_rows() == 0:
+            return [ArrowBlockAccessor._empty_table()] * num_partitions
+
+        import pandas
+
+        # Build the hash table of keys, then bring rows with the same key together.
+        codes, _ = pandas.factorize(self.to_numpy(key))
+        # Nulls are assigned a negative code; group them together as their own key.
+        codes = np.where(codes < 0, codes.max() + 1, codes)
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        boundaries = np.concatenate(
+            ([0], np.flatnonzero(codes[1:] != codes[:-1]) + 1, [len(codes)])
+        )
+        combined = ArrowBlockAccessor(self._table.take(order))._combine_groups(
+            key, aggs, boundaries
+        )
+
+        partition_ids = _hash_partition(combined[key].to_pylist(), num_partitions)
+        order = np.argsort(partition_ids, kind="stable")
+        offsets = np.cumsum(np.bincount(partition_ids, minlength=num_partitions))
+        combined = combined.take(order)
+        ret = []
+        prev_i = 0
+        for i in offsets:
+            # Slices need to be copied to avoid including the base table
+            # during serialization.
+            ret.append(_copy_table(combined.slice(prev_i, i - prev_i)))
+            prev_i = i
+        return ret
+
+    def _combine_groups(
+        self, key: Optional[str], aggs: Tuple[AggregateFn], boundaries: List[int]
+    ) -> Block[ArrowRow]:
+        """Combine each group of contiguous rows into an accumulator.
+
+        Group i spans rows [boundaries[i], boundaries[i + 1]) of this block.
+        """
+        # Resolve the output column names of the aggregations up front.
+        count = collections.defaultdict(int)
+        agg_names = []
+        for agg in aggs:
+            name = agg.name
+            # Check for conflicts with existing aggregation name.
+            if count[name] > 0:
+                name = self._munge_conflict(name, count[name])
+            count[name] += 1
+            agg_names.append(name)
+
+        columns = {}
+        if key is None:
+            group_keys = [None]
+        else:
+            # The key column is gathered directly from the grouped key column.
+            key_col = self._table[key].take(boundaries[:-1])
+            if isinstance(key_col, pyarrow.ChunkedArray):
+                key_col = key_col.combine_chunks()
+            columns[key] = key_col
+            group_keys = key_col.to_pylist()
+
+        agg_cols = [[] for _ in aggs]
+        for i, group_key in enumerate(group_keys):
+            start, end = boundaries[i], boundaries[i + 1]
+            group_view = self.slice(start, end, copy=False)
             # Aggregate.
-            accumulators = [agg.init(group_key) for agg in aggs]
-            for i in range(len(aggs)):
-                accumulators[i] = aggs[i].accumulate_block(accumulators[i], group_view)
+            for j, agg in enumerate(aggs):
+                agg_cols[j].append(
+                    agg.accumulate_block(agg.init(group_key), group_view)
+                )
 
-            # Build the row.
-            row = {}
-            if key is not None:
-                row[key] = group_key
+        for name, col in zip(agg_names, agg_cols):
+            columns[name] = col
+        return pyarrow.Table.from_pydict(columns)
 
-            count = collections.defaultdict(int)
-            for agg, accumulator in zip(aggs, accumulators):
-                name = agg.name
-                # Check for conflicts with existing aggregation name.
-                if count[name] > 0:
-                    name = self._munge_conflict(name, count[name])
-                count[name] += 1
-                row[name] = accumulator
+    def _find_group_boundaries(self, key: str) -> np.ndarray:
+        """Find the boundaries of the runs of equal keys in this block.
 
-            builder.add(row)
+        This assumes the block is already sorted by key. Nulls are treated as
+        equal to each other.
 
-        return builder.build()
+        Args:
+            key: The column name of the key.
+
+        Returns:
+            An array of the start offsets of each group, followed by the total
+            number of rows, i.e. group i spans [boundaries[i], boundaries[i + 1]).
+        """
+        import pyarrow.compute as pac
+
+        num_rows = self.num_rows()
+        keys = self.to_numpy(key)
+        nulls = np.asarray(pac.is_null(self._table[key]), dtype=bool)
+        changed = keys[1:] != keys[:-1]
+        changed &= ~(nulls[1:] & nulls[:-1])
+        changed |= nulls[1:] != nulls[:-1]
+        return np.concatenate(([0], np.flatnonzero(changed) + 1, [num_rows]))
 
     @staticmethod
     def _munge_conflict(name, count):
@@ -391,9 +490,13 @@ class ArrowBlockAccessor(TableBlockAccessor):
         if len(blocks) == 0:
             ret = ArrowBlockAccessor._empty_table()
         else:
-            ret = pyarrow.concat_tables(blocks, promote=True)
-            indices = pyarrow.compute.sort_indices(ret, sort_keys=key)
-            ret = ret.take(indices)
+            runs = [_iter_sorted_run_batches(b) for b in blocks]
+            # The push-based shuffle expects a single block per partition. The
+            # simple shuffle sort instead outputs the merged stream as multiple
+            # blocks, see _merge_sorted_runs_to_partition().
+            ret = pyarrow.concat_tables(
+                list(_merge_sorted_runs(runs, key)), promote=True
+            )
         return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
 
     @staticmethod
@@ -488,6 +591,57 @@ class ArrowBlockAccessor(TableBlockAccessor):
         ret = builder.build()
         return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
 
+    @staticmethod
+    def aggregate_hash_combined_blocks(
+        blocks: List[Block[ArrowRow]], key: KeyFn, aggs: Tuple[AggregateFn]
+    ) -> Tuple[Block[ArrowRow], BlockMetadata]:
+        """Aggregate hash partitioned, partially combined blocks.
+
+        Unlike ``aggregate_combined_blocks()``, the blocks need not be sorted;
+        the accumulators of each key are merged through a hash table.
+
+        Args:
+            blocks: A list of partially combined blocks with the same key partition.
+            key: The column name of key or None for global aggregation.
+            aggs: The aggregations to do.
+
+        Returns:
+            A block of [k, v_1, ..., v_n] columns and its metadata where k is
+            the groupby key and v_i is the corresponding aggregation result for
+            the ith given aggregation. Rows are not sorted by key.
+            If key is None then the k column is omitted.
+        """
+        stats = BlockExecStats.builder()
+        blocks = [b for b in blocks if b.num_rows > 0]
+        if len(blocks) == 0:
+            ret = ArrowBlockAccessor._empty_table()
+            return ret, ArrowBlockAccessor(ret).get_metadata(
+                None, exec_stats=stats.build()
+            )
+
+        names = blocks[0].schema.names
+        agg_names = names[1:] if key is not None else names
+        merged = {}
+        for block in blocks:
+            columns = block.to_pydict()
+            keys = columns[names[0]] if key is not None else [None] * block.num_rows
+            agg_cols = [columns[name] for name in agg_names]
+            for i, k in enumerate(keys):
+                accumulators = merged.get(k)
+                if accumulators is None:
+                    merged[k] = [col[i] for col in agg_cols]
+                else:
+                    for j, agg in enumerate(aggs):
+                        accumulators[j] = agg.merge(accumulators[j], agg_cols[j][i])
+
+        columns = {}
+        if key is not None:
+            columns[names[0]] = list(merged.keys())
+        for j, (agg, name) in enumerate(zip(aggs, agg_names)):
+            columns[name] = [agg.finalize(a[j]) for a in merged.values()]
+        ret = pyarrow.Table.from_pydict(columns)
+        return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
+
 
 def _copy_table(table: "pyarrow.Table") -> "pyarrow.Table":
     """Copy the provided Arrow table."""
@@ -509,3 +663,164 @@ def _copy_table(table: "pyarrow.Table") -> "pyarrow.Table":
             arr = col.combine_chunks()
         new_cols.append(arr)
     return pa.Table.from_arrays(new_cols, schema=table.schema)
+
+
+def _rows_per_sorted_run_batch(table: "pyarrow.Table") -> int:
+    if table.num_rows == 0:
+        return 1
+    return max(1, int(table.num_rows * SORT_MERGE_BATCH_SIZE / max(1, table.nbytes)))
+
+
+def _iter_sorted_run_batches(table: "pyarrow.Table") -> Iterator["pyarrow.Table"]:
+    """Split a sorted run into zero-copy batches for the k-way merge."""
+    rows = _rows_per_sorted_run_batch(table)
+    for start in range(0, table.num_rows, rows):
+        yield table.slice(start, rows)
+
+
+def _merge_sorted_runs(
+    runs: List[Iterator["pyarrow.Table"]], key: "SortKeyT"
+) -> Iterator["pyarrow.Table"]:
+    """Merge runs that are sorted by the key columns into a sorted stream of tables.
+
+    Each run is consumed one batch at a time. Every row with a key that is no
+    greater than the smallest last key of the current batches precedes all rows
+    that have not been read yet, so these rows are merged and yielded in each
+    step. The batches that have the smallest last key are consumed entirely, so
+    every step makes progress. Keys are compared across all key columns.
+
+    Like ``sort_indices()``, rows with null or NaN keys are placed at the end.
+    """
+    import pyarrow.compute as pac
+
+    col = key[0][0]
+    signs = [-1 if order == "descending" else 1 for _, order in key]
+    # Rows with null or NaN keys in the first key column, which are at the end
+    # of each run.
+    tails = []
+
+    def next_batch(run: Iterator["pyarrow.Table"]) -> Optional["pyarrow.Table"]:
+        for batch in run:
+            num_nulls = pac.sum(pac.is_null(batch[col], nan_is_null=True)).as_py()
+            if num_nulls:
+                tails.append(batch.slice(batch.num_rows - num_nulls))
+                batch = batch.slice(0, batch.num_rows - num_nulls)
+            if batch.num_rows > 0:
+                return batch
+        return None
+
+    def key_columns(batch: "pyarrow.Table") -> List[np.ndarray]:
+        return [batch[c].to_numpy() for c, _ in key]
+
+    def row_key(keys: List[np.ndarray], i: int) -> Tuple[Any, ...]:
+        return tuple(k[i] for k in keys)
+
+    def compare(a: Tuple[Any, ...], b: Tuple[Any, ...]) -> int:
+        for x, y, sign in zip(a, b, signs):
+            x_missing, y_missing = _is_null_or_nan(x), _is_null_or_nan(y)
+            if x_missing or y_missing:
+                # Nulls and NaNs are placed at the end in either order.
+                if x_missing != y_missing:
+                    return 1 if x_missing else -1
+            elif x != y:
+                return sign if x > y else -sign
+        return 0
+
+    heads = []
+    for run in runs:
+        run = iter(run)
+        batch = next_batch(run)
+        if batch is not None:
+            heads.append((run, batch, key_columns(batch)))
+
+    while heads:
+        bound = min(
+            (row_key(keys, len(keys[0]) - 1) for _, _, keys in heads),
+            key=functools.cmp_to_key(compare),
+        )
+        pieces = []
+        next_heads = []
+        for run, batch, keys in heads:
+            # Binary search for the number of rows with keys no greater than bound.
+            cut, hi = 0, len(keys[0])
+            while cut < hi:
+                mid = (cut + hi) // 2
+                if compare(row_key(keys, mid), bound) <= 0:
+                    cut = mid + 1
+                else:
+                    hi = mid
+            if cut > 0:
+                pieces.append(batch.slice(0, cut))
+            if cut < len(keys[0]):
+                next_heads.append((run, batch.slice(cut), [k[cut:] for k in keys]))
+            else:
+                batch = next_batch(run)
+                if batch is not None:
+                    next_heads.append((run, batch, key_columns(batch)))
+        heads = next_heads
+        if len(pieces) == 1:
+            yield pieces[0]
+        else:
+            merged = pyarrow.concat_tables(pieces, promote=True)
+            yield merged.take(pac.sort_indices(merged, sort_keys=key))
+
+    if tails:
+        merged = pyarrow.concat_tables(tails, promote=True)
+        yield merged.take(pac.sort_indices(merged, sort_keys=key))
+
+
+def _split_at_key_boundaries(
+    tables: Iterator["pyarrow.Table"], key: "SortKeyT", target_max_block_size: int
+) -> Iterator["pyarrow.Table"]:
+    """Regroup a sorted stream of tables into blocks of about the target size.
+
+    Blocks are only split between rows with different keys, so that all rows
+    with the same key end up in the same block, which map_groups() relies on.
+    Only the tables of the current block are held at a time.
+    """
+    buffer = []
+    buffer_size = 0
+    for table in tables:
+        buffer.append(table)
+        buffer_size += table.nbytes
+        if buffer_size < target_max_block_size:
+            continue
+        # Concatenating tables doesn't copy their data.
+        merged = pyarrow.concat_tables(buffer, promote=True)
+        rows_per_block = max(
+            1, merged.num_rows * target_max_block_size // max(1, merged.nbytes)
+        )
+        start = 0
+        while merged.num_rows - start > rows_per_block:
+            end = start + rows_per_block
+            # Extend the block to the last row with the same key as its last row.
+            end += _num_leading_equal_keys(merged.slice(end - 1), key) - 1
+            if end >= merged.num_rows:
+                # Later tables may have more rows with this key.
+                break
+            yield merged.slice(start, end - start)
+            start = end
+        buffer = [merged.slice(start)]
+        buffer_size = merged.nbytes * (merged.num_rows - start) // merged.num_rows
+    if buffer:
+        yield pyarrow.concat_tables(buffer, promote=True)
+
+
+def _num_leading_equal_keys(table: "pyarrow.Table", key: "SortKeyT") -> int:
+    """Return the number of rows at the start of a table with the same key."""
+    import pyarrow.compute as pac
+
+    equal = np.ones(table.num_rows, dtype=bool)
+    for col, _ in key:
+        values = table[col].to_numpy()
+        if _is_null_or_nan(values[0]):
+            # Nulls and NaNs are equal to each other, as in the merge.
+            equal &= np.asarray(pac.is_null(table[col], nan_is_null=True), dtype=bool)
+        else:
+            equal &= values == values[0]
+    different = np.flatnonzero(~equal)
+    return table.num_rows if len(different) == 0 else int(different[0])
+
+
+def _is_null_or_nan(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and np.isnan(value))
@@ -315,17 +315,30 @@ def get_compute(compute_spec: Union[str, ComputeStrategy]) -> ComputeStrategy:
         raise ValueError("compute must be one of [`tasks`, `actors`, ComputeStrategy]")
 
 
+def _input_size_bytes(block: Block) -> Optional[int]:
+    try:
+        return BlockAccessor.for_block(block).size_bytes()
+    except TypeError:
+        # The input is not a block, e.g., it's a read function of a fused read.
+        return None
+
+
 def _map_block_split(block: Block, fn: Any, input_files: List[str]) -> BlockPartition:
     output = []
     stats = BlockExecStats.builder()
+    input_size_bytes = _input_size_bytes(block)
     for new_block in fn(block):
         accessor = BlockAccessor.for_block(new_block)
+        exec_stats = stats.build()
+        if not output:
+            # Attribute the input to the first output block of the task.
+            exec_stats.input_size_bytes = input_size_bytes
         new_meta = BlockMetadata(
             num_rows=accessor.num_rows(),
             size_bytes=accessor.size_bytes(),
             schema=accessor.schema(),
             input_files=input_files,
-            exec_stats=stats.build(),
+            exec_stats=exec_stats,
         )
         owner = DatasetContext.get_current().block_owner
         output.append((ray.put(new_block, _owner=owner), new_meta))
@@ -337,11 +350,14 @@ def _map_block_nosplit(
     block: Block, fn: Any, input_files: List[str]
 ) -> Tuple[Block, BlockMetadata]:
     stats = BlockExecStats.builder()
+    input_size_bytes = _input_size_bytes(block)
     builder = DelegatingBlockBuilder()
     for new_block in fn(block):
         builder.add_block(new_block)
     new_block = builder.build()
     accessor = BlockAccessor.for_block(new_block)
+    exec_stats = stats.build()
+    exec_stats.input_size_bytes = input_size_bytes
     return new_block, accessor.get_metadata(
-        input_files=input_files, exec_stats=stats.build()
+        input_files=input_files, exec_stats=exec_stats
     )
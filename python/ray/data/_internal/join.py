@@ -0,0 +1,335 @@
+"""
+We implement a distributed hash join in the style of the sort and groupby
+shuffles, with an optional broadcast join for small right hand side datasets.
+
+Hash join: the blocks of both datasets are fed to the same map stage. Each map
+task hash partitions its block by the join key, so that rows with equal keys
+land in the same partition regardless of which dataset they come from. Each
+reduce task then receives one partition from every left and right block and
+joins them locally.
+
+Broadcast join: the right hand side dataset is concatenated into a single
+block, which is joined locally against each block of the left hand side
+dataset without any shuffle.
+"""
+from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union, TYPE_CHECKING
+
+import numpy as np
+
+import ray
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data._internal.block_list import BlockList
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
+from ray.data._internal.util import _hash_partition
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+T = TypeVar("T")
+
+# Tabular datasets are joined on a column name or a list of column names, and
+# simple datasets on a key function (or None for the whole record).
+JoinKeyT = Union[None, str, List[str], Callable[[T], Any]]
+
+# The schema of a tabular dataset, as in BlockMetadata.
+SchemaT = Union[type, "pyarrow.lib.Schema"]
+
+# The supported join types.
+JOIN_TYPES = ("inner", "left", "outer")
+
+
+class _JoinOp(ShuffleOp):
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        on: JoinKeyT,
+    ) -> List[Union[BlockMetadata, Block]]:
+        """Hash partition the block by the join key."""
+        stats = BlockExecStats.builder()
+        acc = BlockAccessor.for_block(block)
+        partition_ids = _partition_ids(acc, on, output_num_blocks)
+        order = np.argsort(partition_ids, kind="stable")
+        offsets = np.cumsum(np.bincount(partition_ids, minlength=output_num_blocks))
+        parts = []
+        prev_i = 0
+        for i in offsets:
+            parts.append(acc.take(order[prev_i:i]))
+            prev_i = i
+        meta = acc.get_metadata(input_files=None, exec_stats=stats.build())
+        return [meta] + parts
+
+    @staticmethod
+    def reduce(
+        on: JoinKeyT,
+        how: str,
+        num_left_blocks: int,
+        left_schema: Optional[SchemaT],
+        right_schema: Optional[SchemaT],
+        *mapper_outputs: List[Block],
+    ) -> (Block, BlockMetadata):
+        """Join the partitions of the left and right blocks with the same keys."""
+        stats = BlockExecStats.builder()
+        left = _concat_blocks(*mapper_outputs[:num_left_blocks])
+        right = _concat_blocks(*mapper_outputs[num_left_blocks:])
+        ret = _join_blocks(left, right, on, how, left_schema, right_schema)
+        return ret, BlockAccessor.for_block(ret).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+
+
+class SimpleShuffleJoinOp(_JoinOp, SimpleShufflePlan):
+    pass
+
+
+def join_impl(
+    left_blocks: BlockList,
+    right_blocks: BlockList,
+    clear_input_blocks: bool,
+    on: JoinKeyT,
+    how: str,
+    broadcast: bool,
+) -> Tuple[BlockList, dict]:
+    """Join the blocks of two datasets on the given key."""
+    left_list = left_blocks.get_blocks_with_metadata()
+    right_list = right_blocks.get_blocks_with_metadata()
+    if len(left_list) == 0 and len(right_list) == 0:
+        return BlockList([], []), {}
+    left_schema = _get_schema([m for _, m in left_list])
+    right_schema = _get_schema([m for _, m in right_list])
+
+    if broadcast:
+        if clear_input_blocks:
+            left_blocks.clear()
+        return _broadcast_join(
+            left_list, right_list, on, how, left_schema, right_schema
+        )
+
+    # Note that the push-based shuffle merges map outputs in arbitrary groups,
+    # which would lose track of which dataset a partition came from, so we
+    # always use the simple shuffle here.
+    blocks, metadata = zip(*(left_list + right_list))
+    input_blocks = BlockList(list(blocks), list(metadata))
+    if clear_input_blocks:
+        left_blocks.clear()
+    num_reducers = max(len(left_list), len(right_list))
+    join_op = SimpleShuffleJoinOp(
+        map_args=[on],
+        reduce_args=[on, how, len(left_list), left_schema, right_schema],
+    )
+    return join_op.execute(input_blocks, num_reducers, clear_input_blocks=True)
+
+
+def _broadcast_join(
+    left_list: List[Tuple[ray.ObjectRef, BlockMetadata]],
+    right_list: List[Tuple[ray.ObjectRef, BlockMetadata]],
+    on: JoinKeyT,
+    how: str,
+    left_schema: Optional[SchemaT],
+    right_schema: Optional[SchemaT],
+) -> Tuple[BlockList, dict]:
+    """Join each left block against the entire right dataset."""
+    concat = cached_remote_fn(_concat_blocks)
+    join_block = cached_remote_fn(_join_block, num_returns=2)
+
+    # The right dataset is put into the object store once and shared by all
+    # join tasks on the same node.
+    right = concat.remote(*[b for b, _ in right_list])
+    join_out = [
+        join_block.remote(b, right, on, how, left_schema, right_schema)
+        for b, _ in left_list
+    ]
+    del right
+    blocks, metadata = zip(*join_out) if join_out else ([], [])
+    join_bar = ProgressBar("Broadcast Join", total=len(join_out))
+    metadata = join_bar.fetch_until_complete(list(metadata))
+    join_bar.close()
+    return BlockList(list(blocks), metadata), {"join": metadata}
+
+
+def _join_block(
+    left: Block,
+    right: Block,
+    on: JoinKeyT,
+    how: str,
+    left_schema: Optional[SchemaT],
+    right_schema: Optional[SchemaT],
+) -> (Block, BlockMetadata):
+    stats = BlockExecStats.builder()
+    ret = _join_blocks(left, right, on, how, left_schema, right_schema)
+    return ret, BlockAccessor.for_block(ret).get_metadata(
+        input_files=None, exec_stats=stats.build()
+    )
+
+
+def _get_schema(metadata: List[BlockMetadata]) -> Optional[SchemaT]:
+    """Return the schema of a tabular dataset, or None if unknown."""
+    for m in metadata:
+        if m.schema is not None and hasattr(m.schema, "names"):
+            return m.schema
+    return None
+
+
+def _concat_blocks(*blocks: List[Block]) -> Block:
+    builder = DelegatingBlockBuilder()
+    for block in blocks:
+        builder.add_block(block)
+    return builder.build()
+
+
+def _partition_ids(acc: BlockAccessor, on: JoinKeyT, num_partitions: int):
+    """Return the hash partition of the join key of each row in the block."""
+    if isinstance(acc.to_block(), list):
+        keys = [r if on is None else on(r) for r in acc.iter_rows()]
+        return _hash_partition(keys, num_partitions)
+    if acc.num_rows() == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    import pandas
+
+    df = acc.to_pandas()
+    if isinstance(on, str) or len(on) == 1:
+        # Hash each distinct key only once.
+        codes, uniques = pandas.factorize(df[on if isinstance(on, str) else on[0]])
+        ids = _hash_partition(list(uniques) + [None], num_partitions)
+        return ids[codes]
+    keys = list(zip(*(df[col].tolist() for col in on)))
+    return _hash_partition(keys, num_partitions)
+
+
+def _join_blocks(
+    left: Block,
+    right: Block,
+    on: JoinKeyT,
+    how: str,
+    left_schema: Optional[SchemaT],
+    right_schema: Optional[SchemaT],
+) -> Block:
+    """Join two blocks locally.
+
+    Tabular blocks are joined with ``pandas.merge()``, and any duplicate column
+    names on the right hand side are disambiguated with a _1 suffix. Records
+    of simple blocks are joined into (left, right) tuples, with None standing
+    in for a missing record in left and outer joins.
+
+    As in SQL, null keys never match: rows with a null key are dropped by
+    inner joins and kept unmatched by left and outer joins.
+    """
+    if isinstance(left, list) or isinstance(right, list):
+        # An empty side may have been built as an (empty) Arrow block.
+        left = list(BlockAccessor.for_block(left).iter_rows())
+        right = list(BlockAccessor.for_block(right).iter_rows())
+        return _join_simple_blocks(left, right, on, how)
+
+    import pyarrow
+
+    left_acc = BlockAccessor.for_block(left)
+    right_acc = BlockAccessor.for_block(right)
+    left_df = _to_pandas(left_acc, left_schema)
+    right_df = _to_pandas(right_acc, right_schema)
+    ret = _merge_non_null_keys(left_df, right_df, on, how)
+    if isinstance(left, pyarrow.Table) or (
+        left_acc.num_rows() == 0 and isinstance(right, pyarrow.Table)
+    ):
+        return pyarrow.Table.from_pandas(ret, preserve_index=False)
+    return ret
+
+
+def _merge_non_null_keys(
+    left_df: "pandas.DataFrame",
+    right_df: "pandas.DataFrame",
+    on: Union[str, List[str]],
+    how: str,
+) -> "pandas.DataFrame":
+    """Merge two data frames, without matching rows with a null key.
+
+    Unlike SQL, ``pandas.merge()`` matches null keys with each other.
+    """
+    import pandas
+
+    keys = [on] if isinstance(on, str) else on
+    left_null = left_df[keys].isna().any(axis=1)
+    right_null = right_df[keys].isna().any(axis=1)
+    ret = pandas.merge(
+        left_df[~left_null], right_df[~right_null], how=how, on=on, suffixes=("", "_1")
+    )
+    if how == "inner" or not (left_null.any() or right_null.any()):
+        return ret
+    # Merge the rows with a null key against an empty frame, so that they have
+    # the same columns as the matched rows.
+    unmatched = [
+        pandas.merge(
+            left_df[left_null], right_df[:0], how="left", on=on, suffixes=("", "_1")
+        )
+    ]
+    if how == "outer":
+        unmatched.append(
+            pandas.merge(
+                left_df[:0],
+                right_df[right_null],
+                how="right",
+                on=on,
+                suffixes=("", "_1"),
+            )
+        )
+    return pandas.concat(
+        [ret] + [df for df in unmatched if len(df) > 0], ignore_index=True
+    )
+
+
+def _to_pandas(acc: BlockAccessor, schema: Optional[SchemaT]) -> "pandas.DataFrame":
+    import pandas
+    import pyarrow
+
+    df = acc.to_pandas()
+    if acc.num_rows() > 0 or schema is None or set(schema.names) <= set(df.columns):
+        return df
+    # Empty blocks may not have a schema, so fall back to the dataset's, so
+    # that the column types don't depend on whether a partition is empty.
+    if isinstance(schema, pyarrow.Schema):
+        return schema.empty_table().to_pandas()
+    return pandas.DataFrame(
+        {
+            name: pandas.Series(dtype=dtype)
+            for name, dtype in zip(schema.names, schema.types)
+        }
+    )
+
+
+def _join_simple_blocks(
+    left: List[T], right: List[T], on: JoinKeyT, how: str
+) -> List[Tuple[Optional[T], Optional[T]]]:
+    key_fn = (lambda r: r) if on is None else on
+    right_by_key = {}
+    right_null_keys = []
+    for r in right:
+        k = key_fn(r)
+        if _is_null(k):
+            right_null_keys.append(r)
+        else:
+            right_by_key.setdefault(k, []).append(r)
+    ret = []
+    matched = set()
+    for r in left:
+        k = key_fn(r)
+        matches = None if _is_null(k) else right_by_key.get(k)
+        if matches:
+            matched.add(k)
+            ret.extend((r, m) for m in matches)
+        elif how != "inner":
+            ret.append((r, None))
+    if how == "outer":
+        for k, rs in right_by_key.items():
+            if k not in matched:
+                ret.extend((None, r) for r in rs)
+        ret.extend((None, r) for r in right_null_keys)
+    return ret
+
+
+def _is_null(key: Any) -> bool:
+    return key is None or (isinstance(key, float) and np.isnan(key))
@@ -1,8 +1,13 @@
-from typing import Callable, Any, Optional
+import collections
+from typing import Callable, Any, List, Optional
 
 from ray.data.block import Block, BlockAccessor
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 
+# Output blocks larger than this multiple of the target max block size (e.g., from
+# a UDF that returns a single huge batch) are sliced into target sized blocks.
+MAX_SAFE_BLOCK_SIZE_FACTOR = 1.5
+
 
 class BlockOutputBuffer(object):
     """Generates output blocks of a given size given a stream of inputs.
@@ -10,10 +15,11 @@ class BlockOutputBuffer(object):
     This class is used to turn a stream of items / blocks of arbitrary size
     into a stream of blocks of ``target_max_block_size``. The caller should
     check ``has_next()`` after each ``add()`` call, and call ``next()`` to get
-    the next block when ``has_next()`` returns True.
+    the next block while ``has_next()`` returns True. A single added block that
+    is much larger than the target is sliced into several output blocks.
 
     When all items have been added, the caller must call ``finalize()`` and
-    then check ``has_next()`` one last time.
+    then drain the remaining blocks one last time.
 
     Examples:
         >>> from ray.data._internal.output_buffer import BlockOutputBuffer
@@ -23,10 +29,10 @@ class BlockOutputBuffer(object):
         >>> output = BlockOutputBuffer(udf, 500 * 1024 * 1024) # doctest: +SKIP
         >>> for item in generator(): # doctest: +SKIP
         ...     output.add(item) # doctest: +SKIP
-        ...     if output.has_next(): # doctest: +SKIP
+        ...     while output.has_next(): # doctest: +SKIP
         ...         yield output.next() # doctest: +SKIP
         >>> output.finalize() # doctest: +SKIP
-        >>> if output.has_next() # doctest: +SKIP
+        >>> while output.has_next() # doctest: +SKIP
         ...     yield output.next() # doctest: +SKIP
     """
 
@@ -36,6 +42,8 @@ class BlockOutputBuffer(object):
         self._target_max_block_size = target_max_block_size
         self._block_udf = block_udf
         self._buffer = DelegatingBlockBuilder()
+        # Slices of an oversized block that are ready to be returned.
+        self._pending = collections.deque()
         self._returned_at_least_one_block = False
         self._finalized = False
 
@@ -56,6 +64,8 @@ class BlockOutputBuffer(object):
 
     def has_next(self) -> bool:
         """Returns true when a complete output block is produced."""
+        if self._pending:
+            return True
         if self._finalized:
             return not self._returned_at_least_one_block or self._buffer.num_rows() > 0
         else:
@@ -66,10 +76,30 @@ class BlockOutputBuffer(object):
     def next(self) -> Block:
         """Returns the next complete output block."""
         assert self.has_next()
-        block = self._buffer.build()
+        if not self._pending:
+            block = self._buffer.build()
+            self._buffer = DelegatingBlockBuilder()
+            self._pending.extend(self._split_oversized_block(block))
+        block = self._pending.popleft()
         accessor = BlockAccessor.for_block(block)
         if self._block_udf and accessor.num_rows() > 0:
             block = self._block_udf(block)
-        self._buffer = DelegatingBlockBuilder()
         self._returned_at_least_one_block = True
         return block
+
+    def _split_oversized_block(self, block: Block) -> List[Block]:
+        accessor = BlockAccessor.for_block(block)
+        num_rows = accessor.num_rows()
+        size_bytes = accessor.size_bytes()
+        if (
+            num_rows <= 1
+            or size_bytes <= self._target_max_block_size * MAX_SAFE_BLOCK_SIZE_FACTOR
+        ):
+            return [block]
+        rows_per_block = max(1, num_rows * self._target_max_block_size // size_bytes)
+        # Make sure to copy the slices to avoid the Arrow serialization bug where we
+        # include the entire base view on serialization.
+        return [
+            accessor.slice(i, min(i + rows_per_block, num_rows), copy=True)
+            for i in range(0, num_rows, rows_per_block)
+        ]
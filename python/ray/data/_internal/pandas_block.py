@@ -104,6 +104,22 @@ class PandasBlockAccessor(TableBlockAccessor):
     def random_shuffle(self, random_seed: Optional[int]) -> "pandas.DataFrame":
         return self._table.sample(frac=1, random_state=random_seed)
 
+    def take(self, indices: List[int]) -> "pandas.DataFrame":
+        return self._table.iloc[indices].reset_index(drop=True)
+
+    def filter(self, predicate: "pyarrow.dataset.Expression") -> "pandas.DataFrame":
+        table = ArrowBlockAccessor(self.to_arrow()).filter(predicate)
+        return table.to_pandas()
+
+    def select(self, columns: List[str]) -> "pandas.DataFrame":
+        missing = [c for c in columns if c not in self._table.columns]
+        if missing:
+            raise ValueError(
+                f"Cannot select columns {missing}, available columns: "
+                f"{self._table.columns.tolist()}"
+            )
+        return self._table[columns]
+
     def schema(self) -> PandasBlockSchema:
         dtypes = self._table.dtypes
         schema = PandasBlockSchema(
@@ -250,6 +266,17 @@ class PandasBlockAccessor(TableBlockAccessor):
         # TODO (kfstorm): A workaround to pass tests. Not efficient.
         return BlockAccessor.for_block(self.to_arrow()).combine(key, aggs).to_pandas()
 
+    def hash_partition_and_combine(
+        self, key: KeyFn, aggs: Tuple[AggregateFn], num_partitions: int
+    ) -> List["pandas.DataFrame"]:
+        # TODO: Hash partition natively on pandas blocks.
+        return [
+            BlockAccessor.for_block(b).to_pandas()
+            for b in BlockAccessor.for_block(
+                self.to_arrow()
+            ).hash_partition_and_combine(key, aggs, num_partitions)
+        ]
+
     @staticmethod
     def merge_sorted_blocks(
         blocks: List["pandas.DataFrame"], key: "SortKeyT", _descending: bool
@@ -271,3 +298,13 @@ class PandasBlockAccessor(TableBlockAccessor):
             [BlockAccessor.for_block(block).to_arrow() for block in blocks], key, aggs
         )
         return BlockAccessor.for_block(block).to_pandas(), metadata
+
+    @staticmethod
+    def aggregate_hash_combined_blocks(
+        blocks: List["pandas.DataFrame"], key: KeyFn, aggs: Tuple[AggregateFn]
+    ) -> Tuple["pandas.DataFrame", BlockMetadata]:
+        # TODO: Aggregate natively on pandas blocks.
+        block, metadata = ArrowBlockAccessor.aggregate_hash_combined_blocks(
+            [BlockAccessor.for_block(block).to_arrow() for block in blocks], key, aggs
+        )
+        return BlockAccessor.for_block(block).to_pandas(), metadata
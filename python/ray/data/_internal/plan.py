@@ -15,12 +15,14 @@ if TYPE_CHECKING:
     import pyarrow
 
 import ray
+from ray.types import ObjectRef
 from ray.data.context import DatasetContext
-from ray.data.block import Block
+from ray.data.block import Block, BlockMetadata
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.compute import get_compute
 from ray.data._internal.stats import DatasetStats
 from ray.data._internal.lazy_block_list import LazyBlockList
+from ray.data._internal.streaming_executor import StreamingExecutor
 
 # Scheduling strategy can be inherited from prev stage if not specified.
 INHERITABLE_REMOTE_ARGS = ["scheduling_strategy"]
@@ -270,6 +272,43 @@ class ExecutionPlan:
             self._snapshot_blocks = self._snapshot_blocks.compute_to_blocklist()
         return self._snapshot_blocks
 
+    def execute_streaming(self) -> Iterator[Tuple[ObjectRef[Block], BlockMetadata]]:
+        """Execute this plan, streaming the output blocks as they are produced.
+
+        Leading stages that can't be streamed (e.g., shuffles) are executed as
+        usual, and the trailing one-to-one stages are pipelined across blocks by
+        the streaming executor, with a bounded object store memory budget.
+
+        Unlike ``execute()``, the output blocks are not saved as a snapshot, so
+        streaming the plan again re-executes it.
+
+        Returns:
+            An iterator over the output blocks and their metadata, in order.
+        """
+        if self.has_computed_output():
+            yield from self._snapshot_blocks.iter_blocks_with_metadata()
+            return
+        context = DatasetContext.get_current()
+        blocks, _, stages = self._optimize()
+        num_bulk_stages = len(stages)
+        while num_bulk_stages > 0 and _is_streamable(stages[num_bulk_stages - 1]):
+            num_bulk_stages -= 1
+        for stage_idx, stage in enumerate(stages[:num_bulk_stages]):
+            clear_input_blocks = self._should_clear_input_blocks(blocks, stage_idx)
+            blocks, _ = stage(blocks, clear_input_blocks)
+        streaming_stages = stages[num_bulk_stages:]
+        if not streaming_stages:
+            yield from blocks.iter_blocks_with_metadata()
+            return
+        object_store_memory = ray.cluster_resources().get("object_store_memory", 0)
+        memory_limit = int(
+            object_store_memory * context.streaming_object_store_memory_fraction
+        )
+        executor = StreamingExecutor(streaming_stages, memory_limit)
+        yield from executor.execute(
+            blocks.iter_blocks_with_metadata(), blocks.initial_num_blocks()
+        )
+
     def clear_block_refs(self) -> None:
         """Clear all cached block references of this plan, including input blocks.
 
@@ -317,6 +356,10 @@ class ExecutionPlan:
         """
         context = DatasetContext.get_current()
         blocks, stats, stages = self._get_source_blocks_and_stages()
+        if context.optimize_pushdown_read_stages:
+            # If reading from a lazy datasource, push leading column selections and
+            # filters into the read tasks.
+            blocks, stages = _push_down_into_read_stage(blocks, stages)
         if context.optimize_fuse_stages:
             if context.optimize_fuse_read_stages:
                 # If using a lazy datasource, rewrite read stage into one-to-one stage
@@ -402,11 +445,34 @@ class OneToOneStage(Stage):
         block_fn: Callable[[Block], Block],
         compute: str,
         ray_remote_args: dict,
+        *,
+        projection: Optional[List[str]] = None,
+        predicate: Optional["pyarrow.dataset.Expression"] = None,
     ):
+        """Create a one-to-one stage.
+
+        Args:
+            name: The name of the stage.
+            block_fn: The function applied to each block.
+            compute: The compute strategy of the stage.
+            ray_remote_args: Ray remote arguments for the stage's tasks.
+            projection: If set, ``block_fn`` is equivalent to selecting these
+                columns (after applying ``predicate``, if also set).
+            predicate: If set, ``block_fn`` is equivalent to filtering rows with
+                this Arrow expression.
+        """
         super().__init__(name, None)
         self.block_fn = block_fn
         self.compute = compute or "tasks"
         self.ray_remote_args = ray_remote_args or {}
+        self.projection = projection
+        self.predicate = predicate
+
+    def can_push_down(self) -> bool:
+        """Whether this stage can be pushed down into a read stage."""
+        return (
+            self.projection is not None or self.predicate is not None
+        ) and self.compute == "tasks"
 
     def can_fuse(self, prev: Stage):
         if not isinstance(prev, OneToOneStage):
@@ -547,6 +613,59 @@ def _rewrite_read_stage(
     return block_list, stats, stage
 
 
+def _push_down_into_read_stage(
+    blocks: BlockList, stages: List[Stage]
+) -> Tuple[BlockList, List[Stage]]:
+    """Push down leading column selection and filter stages into the read tasks.
+
+    For example, suppose the plan was [Read -> Filter(x > 5) -> Select(x, y) -> Map].
+    If the read tasks support pushdown, this is rewritten to
+    [Read(columns=[x, y], filter=x > 5) -> Map], so that the datasource can
+    skip unneeded columns and rows (e.g., Parquet row groups) entirely.
+
+    Args:
+        blocks: The source blocks of the plan.
+        stages: The stages to execute over the source blocks.
+
+    Returns:
+        The (possibly rewritten) source blocks and the remaining stages.
+    """
+    if not _is_lazy(blocks):
+        return blocks, stages
+    columns, predicate = None, None
+    num_pushed = 0
+    for stage in stages:
+        if not isinstance(stage, OneToOneStage) or not stage.can_push_down():
+            break
+        if stage.predicate is not None:
+            predicate = (
+                stage.predicate if predicate is None else predicate & stage.predicate
+            )
+        if stage.projection is not None:
+            if columns is not None:
+                missing = [c for c in stage.projection if c not in columns]
+                if missing:
+                    raise ValueError(
+                        f"Cannot select columns {missing}, available columns: "
+                        f"{columns}"
+                    )
+            columns = stage.projection
+        num_pushed += 1
+    if num_pushed == 0:
+        return blocks, stages
+    tasks = [task.with_pushdown(columns, predicate) for task in blocks._tasks]
+    if any(task is None for task in tasks):
+        # The datasource doesn't support pushdown.
+        return blocks, stages
+    # Blocks that were already read (e.g. the first block, which is read when the
+    # dataset is created) have all columns and rows, so the new block list is
+    # created from the rewritten read tasks only and reads all blocks again.
+    blocks = LazyBlockList(
+        tasks, ray_remote_args=blocks._remote_args, stats_uuid=blocks._stats_uuid
+    )
+    return blocks, stages[num_pushed:]
+
+
 def _fuse_one_to_one_stages(stages: List[Stage]) -> List[Stage]:
     """Fuses compatible one-to-one stages.
 
@@ -583,6 +702,11 @@ def _are_remote_args_compatible(prev_args, next_args):
     return True
 
 
+def _is_streamable(stage: Stage) -> bool:
+    """Whether the stage can be executed by the streaming executor."""
+    return isinstance(stage, OneToOneStage) and stage.compute == "tasks"
+
+
 def _is_lazy(blocks: BlockList) -> bool:
     """Whether the provided block list is lazy."""
     return isinstance(blocks, LazyBlockList)
@@ -1,6 +1,6 @@
 from typing import List, Optional, Dict, Any, Tuple, Union
 
-from ray.data.block import Block, BlockMetadata
+from ray.data.block import Block, BlockMetadata, BlockPartition
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.remote_fn import cached_remote_fn
@@ -33,14 +33,29 @@ class ShuffleOp:
         raise NotImplementedError
 
     @staticmethod
-    def reduce(*mapper_outputs: List[Block]) -> (Block, BlockMetadata):
+    def reduce(
+        *mapper_outputs: List[Block],
+    ) -> Union[Tuple[Block, BlockMetadata], BlockPartition]:
         """
-        Reduce function to be run for each output block.
+        Reduce function to be run for each output partition.
+
+        Returns the output block and its metadata, or a BlockPartition if the
+        plan's `reduce_returns_partition` is set.
         """
         raise NotImplementedError
 
 
 class SimpleShufflePlan(ShuffleOp):
+    # Whether to pass reduce tasks a list of refs to their input blocks, instead of
+    # the blocks themselves. This allows reducers to fetch their inputs one at a
+    # time, rather than holding all of them in memory.
+    reduce_inputs_by_ref = False
+    # Whether reduce tasks return a BlockPartition, i.e., a list of refs to their
+    # output blocks with their metadata, instead of a single block and its
+    # metadata. This allows reducers to put each output block into the object
+    # store as soon as it is built, rather than holding all of them in memory.
+    reduce_returns_partition = False
+
     def execute(
         self,
         input_blocks: BlockList,
@@ -89,18 +104,29 @@ class SimpleShufflePlan(ShuffleOp):
         map_bar.close()
 
         reduce_bar = ProgressBar("Shuffle Reduce", total=output_num_blocks)
-        shuffle_reduce_out = [
-            shuffle_reduce.options(**reduce_ray_remote_args, num_returns=2,).remote(
-                *self._reduce_args,
-                *[shuffle_map_out[i][j] for i in range(input_num_blocks)],
+        shuffle_reduce_out = []
+        for j in range(output_num_blocks):
+            reduce_inputs = [shuffle_map_out[i][j] for i in range(input_num_blocks)]
+            if self.reduce_inputs_by_ref:
+                reduce_inputs = [reduce_inputs]
+            num_returns = 1 if self.reduce_returns_partition else 2
+            shuffle_reduce_out.append(
+                shuffle_reduce.options(
+                    **reduce_ray_remote_args, num_returns=num_returns
+                ).remote(*self._reduce_args, *reduce_inputs)
             )
-            for j in range(output_num_blocks)
-        ]
         # Eagerly delete the map block references in order to eagerly release
         # the blocks' memory.
         del shuffle_map_out
-        new_blocks, new_metadata = zip(*shuffle_reduce_out)
-        new_metadata = reduce_bar.fetch_until_complete(list(new_metadata))
+        if self.reduce_returns_partition:
+            new_blocks, new_metadata = [], []
+            for partition in reduce_bar.fetch_until_complete(shuffle_reduce_out):
+                for block, metadata in partition:
+                    new_blocks.append(block)
+                    new_metadata.append(metadata)
+        else:
+            new_blocks, new_metadata = zip(*shuffle_reduce_out)
+            new_metadata = reduce_bar.fetch_until_complete(list(new_metadata))
         reduce_bar.close()
 
         stats = {
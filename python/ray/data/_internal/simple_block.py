@@ -24,6 +24,7 @@ from ray.data.block import (
 )
 from ray.data._internal.block_builder import BlockBuilder
 from ray.data._internal.size_estimator import SizeEstimator
+from ray.data._internal.util import _hash_partition
 
 
 class SimpleBlockBuilder(BlockBuilder[T]):
@@ -79,6 +80,18 @@ class SimpleBlockAccessor(BlockAccessor):
         random.shuffle(items)
         return items
 
+    def take(self, indices: List[int]) -> List[T]:
+        return [self._items[i] for i in indices]
+
+    def filter(self, predicate: "pyarrow.dataset.Expression") -> List[T]:
+        raise ValueError(
+            "Expression filters are only supported for tabular datasets; use a "
+            "filter function instead."
+        )
+
+    def select(self, columns: List[str]) -> List[T]:
+        raise ValueError("Column selection is only supported for tabular datasets.")
+
     def to_pandas(self) -> "pandas.DataFrame":
         import pandas
 
@@ -340,6 +353,45 @@ class SimpleBlockAccessor(BlockAccessor):
                 ret.append((group_key,) + tuple(accumulators))
         return ret
 
+    def hash_partition_and_combine(
+        self, key: KeyFn, aggs: Tuple[AggregateFn], num_partitions: int
+    ) -> List[Block[Tuple[KeyType, AggType]]]:
+        """Hash partition rows by key and combine rows with the same key.
+
+        Unlike ``combine()``, this does not require the block to be sorted.
+
+        Args:
+            key: The key function that returns the key from the row
+                or None for global aggregation.
+            aggs: The aggregations to do.
+            num_partitions: The number of partitions to hash the keys into.
+
+        Returns:
+            A list of ``num_partitions`` blocks of (k, v_1, ..., v_n) tuples,
+            in the same format as ``combine()`` but not sorted by key.
+            If key is None then a single block without the k element is returned.
+        """
+        if key is None:
+            return [self.combine(None, aggs)]
+        if not callable(key):
+            raise ValueError(
+                "key must be a callable or None when aggregating on Simple blocks, but "
+                f"got: {type(key)}."
+            )
+
+        groups = {}
+        for r in self._items:
+            groups.setdefault(key(r), []).append(r)
+
+        partition_ids = _hash_partition(list(groups.keys()), num_partitions)
+        ret = [[] for _ in range(num_partitions)]
+        for partition_id, (group_key, group) in zip(partition_ids, groups.items()):
+            accumulators = [
+                agg.accumulate_block(agg.init(group_key), group) for agg in aggs
+            ]
+            ret[partition_id].append((group_key,) + tuple(accumulators))
+        return ret
+
     @staticmethod
     def merge_sorted_blocks(
         blocks: List[Block[T]], key: "SortKeyT", descending: bool
@@ -433,3 +485,50 @@ class SimpleBlockAccessor(BlockAccessor):
         return ret, SimpleBlockAccessor(ret).get_metadata(
             None, exec_stats=stats.build()
         )
+
+    @staticmethod
+    def aggregate_hash_combined_blocks(
+        blocks: List[Block[Tuple[KeyType, AggType]]],
+        key: KeyFn,
+        aggs: Tuple[AggregateFn],
+    ) -> Tuple[Block[Tuple[KeyType, U]], BlockMetadata]:
+        """Aggregate hash partitioned, partially combined blocks.
+
+        Unlike ``aggregate_combined_blocks()``, the blocks need not be sorted;
+        the accumulators of each key are merged through a hash table.
+
+        Args:
+            blocks: A list of partially combined blocks with the same key partition.
+            key: The key function that returns the key from the row
+                or None for global aggregation.
+            aggs: The aggregations to do.
+
+        Returns:
+            A block of (k, v_1, ..., v_n) tuples and its metadata where k is
+            the groupby key and v_i is the corresponding aggregation result for
+            the ith given aggregation. Rows are not sorted by key.
+            If key is None then the k element of tuple is omitted.
+        """
+        stats = BlockExecStats.builder()
+        merged = {}
+        for block in blocks:
+            for r in block:
+                k = r[0] if key else None
+                values = r[1:] if key else r
+                accumulators = merged.get(k)
+                if accumulators is None:
+                    merged[k] = list(values)
+                else:
+                    for i, agg in enumerate(aggs):
+                        accumulators[i] = agg.merge(accumulators[i], values[i])
+
+        ret = []
+        for k, accumulators in merged.items():
+            finalized = tuple(
+                agg.finalize(accumulator)
+                for agg, accumulator in zip(aggs, accumulators)
+            )
+            ret.append(finalized if key is None else (k,) + finalized)
+        return ret, SimpleBlockAccessor(ret).get_metadata(
+            None, exec_stats=stats.build()
+        )
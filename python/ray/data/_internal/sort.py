@@ -14,13 +14,34 @@ This is an all-to-all shuffle.
 
 Merging: a merge task would receive a block from every worker that consists
 of items in a certain range. It then merges the sorted blocks into one sorted
-block and becomes part of the new, sorted dataset.
+block and becomes part of the new, sorted dataset. For tabular blocks, this is
+a k-way merge that consumes each sorted block in small batches, and the merged
+rows are output as multiple blocks of about the target max block size, which
+are only split between different keys. If a spill directory is configured,
+merge tasks fetch their input blocks one at a time and write them to local
+disk, and then stream the sorted runs back from disk while merging, so that
+they never hold all of their inputs in memory.
 """
-from typing import List, Any, Callable, TypeVar, Tuple, Union
+import os
+import tempfile
+from typing import List, Any, Callable, Iterator, TypeVar, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
+import ray
 from ray.types import ObjectRef
-from ray.data.block import Block, BlockMetadata, BlockAccessor, BlockExecStats
+from ray.data.block import (
+    Block,
+    BlockMetadata,
+    BlockAccessor,
+    BlockExecStats,
+    BlockPartition,
+)
+from ray.data._internal.arrow_block import (
+    _iter_sorted_run_batches,
+    _merge_sorted_runs,
+    _rows_per_sorted_run_batch,
+    _split_at_key_boundaries,
+)
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.progress_bar import ProgressBar
@@ -29,6 +50,10 @@ from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
 from ray.data.context import DatasetContext
 
+if TYPE_CHECKING:
+    import pyarrow
+    from ray.data.block import _BlockExecStatsBuilder
+
 T = TypeVar("T")
 
 # Data can be sorted by value (None), a list of columns and
@@ -66,13 +91,113 @@ class _SortOp(ShuffleOp):
 
 
 class SimpleSortOp(_SortOp, SimpleShufflePlan):
-    pass
+    """A sort whose reducers output their merged partition as multiple blocks."""
+
+    reduce_returns_partition = True
+
+    @staticmethod
+    def reduce(
+        key: SortKeyT, descending: bool, *mapper_outputs: List[Block]
+    ) -> BlockPartition:
+        import pyarrow
+
+        first = mapper_outputs[0]
+        if isinstance(first, list):
+            block, meta = _SortOp.reduce(key, descending, *mapper_outputs)
+            return [(_put_block(block), meta)]
+
+        stats = BlockExecStats.builder()
+        runs = []
+        for block in mapper_outputs:
+            acc = BlockAccessor.for_block(block)
+            if acc.num_rows() > 0:
+                runs.append(_iter_sorted_run_batches(acc.to_arrow()))
+        return _merge_sorted_runs_to_partition(
+            runs, key, first, not isinstance(first, pyarrow.Table), stats
+        )
 
 
 class PushBasedSortOp(_SortOp, PushBasedShufflePlan):
     pass
 
 
+class SpillingSortOp(_SortOp, SimpleShufflePlan):
+    """A sort whose reducers spill their sorted input runs to local disk."""
+
+    reduce_inputs_by_ref = True
+
+    @staticmethod
+    def reduce(
+        key: SortKeyT,
+        descending: bool,
+        spill_dir: str,
+        mapper_outputs: List[ObjectRef[Block]],
+    ) -> BlockPartition:
+        import pyarrow
+
+        first = ray.get(mapper_outputs[0])
+        if isinstance(first, list):
+            # Spilling is only supported for tabular blocks.
+            return SimpleSortOp.reduce(key, descending, *ray.get(mapper_outputs))
+
+        stats = BlockExecStats.builder()
+        to_pandas = not isinstance(first, pyarrow.Table)
+        # Keep an empty block with the input's type in case all inputs are empty.
+        empty = BlockAccessor.for_block(first).slice(0, 0, copy=True)
+        del first
+        os.makedirs(spill_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix="sort-", dir=spill_dir) as tmp_dir:
+            paths = []
+            # Fetch one input block at a time, so that only one is in memory.
+            for i, ref in enumerate(mapper_outputs):
+                acc = BlockAccessor.for_block(ray.get(ref))
+                if acc.num_rows() > 0:
+                    paths.append(os.path.join(tmp_dir, f"{i}.arrow"))
+                    _write_sorted_run(acc.to_arrow(), paths[-1])
+                del acc
+            runs = [_read_sorted_run(path) for path in paths]
+            return _merge_sorted_runs_to_partition(runs, key, empty, to_pandas, stats)
+
+
+def _merge_sorted_runs_to_partition(
+    runs: List[Iterator["pyarrow.Table"]],
+    key: SortKeyT,
+    empty: Block,
+    to_pandas: bool,
+    stats: "_BlockExecStatsBuilder",
+) -> BlockPartition:
+    """Merge sorted runs into blocks of about the target max block size.
+
+    Each block is put into the object store as soon as it is built, so that the
+    reducer never holds its whole merged partition in memory. Blocks are only
+    split between different keys. If there are no rows, the empty block is
+    returned instead.
+    """
+    context = DatasetContext.get_current()
+    output = []
+    for block in _split_at_key_boundaries(
+        _merge_sorted_runs(runs, key), key, context.target_max_block_size
+    ):
+        if to_pandas:
+            block = BlockAccessor.for_block(block).to_pandas()
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        output.append((_put_block(block), meta))
+        stats = BlockExecStats.builder()
+    if not output:
+        meta = BlockAccessor.for_block(empty).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        output.append((_put_block(empty), meta))
+    return output
+
+
+def _put_block(block: Block) -> ObjectRef[Block]:
+    owner = DatasetContext.get_current().block_owner
+    return ray.put(block, _owner=owner)
+
+
 def sample_boundaries(
     blocks: List[ObjectRef[Block]], key: SortKeyT, num_reducers: int
 ) -> List[T]:
@@ -136,12 +261,16 @@ def sort_impl(
         boundaries.reverse()
 
     context = DatasetContext.get_current()
+    reduce_args = [key, descending]
     if context.use_push_based_shuffle:
         sort_op_cls = PushBasedSortOp
+    elif context.sort_spill_dir is not None:
+        sort_op_cls = SpillingSortOp
+        reduce_args.append(context.sort_spill_dir)
     else:
         sort_op_cls = SimpleSortOp
     sort_op = sort_op_cls(
-        map_args=[boundaries, key, descending], reduce_args=[key, descending]
+        map_args=[boundaries, key, descending], reduce_args=reduce_args
     )
     return sort_op.execute(
         blocks,
@@ -152,3 +281,21 @@ def sort_impl(
 
 def _sample_block(block: Block[T], n_samples: int, key: SortKeyT) -> Block[T]:
     return BlockAccessor.for_block(block).sample(n_samples, key)
+
+
+def _write_sorted_run(table: "pyarrow.Table", path: str) -> None:
+    import pyarrow
+
+    with pyarrow.OSFile(path, "wb") as sink:
+        with pyarrow.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=_rows_per_sorted_run_batch(table))
+
+
+def _read_sorted_run(path: str) -> Iterator["pyarrow.Table"]:
+    """Read a sorted run from disk, one batch at a time."""
+    import pyarrow
+
+    with pyarrow.OSFile(path, "rb") as source:
+        reader = pyarrow.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            yield pyarrow.Table.from_batches([reader.get_batch(i)])
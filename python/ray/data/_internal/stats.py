@@ -1,5 +1,6 @@
 from contextlib import contextmanager
-from typing import List, Optional, Set, Dict, Tuple, Union
+from typing import Any, Deque, List, Optional, Set, Dict, Tuple, Union
+import json
 import time
 import collections
 import numpy as np
@@ -9,6 +10,13 @@ from ray.data.block import BlockMetadata
 from ray.data.context import DatasetContext
 from ray.data._internal.block_list import BlockList
 
+# The max number of iterator events (e.g., waiting for a block) to keep for the
+# timeline of a dataset or pipeline. Older events are dropped.
+MAX_ITER_EVENTS = 10000
+
+# The supported formats of exported stats.
+STATS_EXPORT_FORMATS = ("json", "chrome_trace")
+
 
 def fmt(seconds: float) -> str:
     if seconds > 1:
@@ -20,10 +28,18 @@ def fmt(seconds: float) -> str:
 
 
 class Timer:
-    """Helper class for tracking accumulated time (in seconds)."""
+    """Helper class for tracking accumulated time (in seconds).
 
-    def __init__(self):
+    If an events deque is given, each timed interval is also recorded in it as a
+    (name, start timestamp, duration) tuple.
+    """
+
+    def __init__(
+        self, name: Optional[str] = None, events: Optional[Deque[Tuple]] = None
+    ):
         self._value: float = 0
+        self._name = name
+        self._events = events
 
     @contextmanager
     def timer(self) -> None:
@@ -31,10 +47,12 @@ class Timer:
         try:
             yield
         finally:
-            self._value += time.perf_counter() - time_start
+            self.add(time.perf_counter() - time_start)
 
     def add(self, value: float) -> None:
         self._value += value
+        if self._events is not None:
+            self._events.append((self._name, time.time() - value, value))
 
     def get(self) -> float:
         return self._value
@@ -51,6 +69,7 @@ class _DatasetStatsBuilder:
         self.stage_name = stage_name
         self.parent = parent
         self.start_time = time.perf_counter()
+        self.start_timestamp = time.time()
 
     def build_multistage(
         self, stages: Dict[str, List[BlockMetadata]]
@@ -67,6 +86,7 @@ class _DatasetStatsBuilder:
             base_name=self.stage_name,
         )
         stats.time_total_s = time.perf_counter() - self.start_time
+        stats.start_time_s = self.start_timestamp
         return stats
 
     def build(self, final_blocks: BlockList) -> "DatasetStats":
@@ -75,6 +95,7 @@ class _DatasetStatsBuilder:
             parent=self.parent,
         )
         stats.time_total_s = time.perf_counter() - self.start_time
+        stats.start_time_s = self.start_timestamp
         return stats
 
 
@@ -178,15 +199,18 @@ class DatasetStats:
         self.base_name = base_name
         self.dataset_uuid: str = None
         self.time_total_s: float = 0
+        # The UNIX timestamp at which the stages were submitted, if known.
+        self.start_time_s: Optional[float] = None
         self.needs_stats_actor = needs_stats_actor
         self.stats_uuid = stats_uuid
 
         # Iteration stats, filled out if the user iterates over the dataset.
-        self.iter_wait_s: Timer = Timer()
-        self.iter_get_s: Timer = Timer()
-        self.iter_format_batch_s: Timer = Timer()
-        self.iter_user_s: Timer = Timer()
-        self.iter_total_s: Timer = Timer()
+        self.iter_events: Deque[Tuple] = collections.deque(maxlen=MAX_ITER_EVENTS)
+        self.iter_wait_s: Timer = Timer("wait", self.iter_events)
+        self.iter_get_s: Timer = Timer("get", self.iter_events)
+        self.iter_format_batch_s: Timer = Timer("format_batch", self.iter_events)
+        self.iter_user_s: Timer = Timer("user", self.iter_events)
+        self.iter_total_s: Timer = Timer("total", self.iter_events)
 
     @property
     def stats_actor(self):
@@ -210,13 +234,7 @@ class DatasetStats:
         if already_printed is None:
             already_printed = set()
 
-        if self.needs_stats_actor:
-            # XXX this is a super hack, clean it up.
-            stats_map, self.time_total_s = ray.get(
-                self.stats_actor.get.remote(self.stats_uuid)
-            )
-            for i, metadata in stats_map.items():
-                self.stages["read"][i] = metadata
+        self._fetch_stats_actor_metadata()
         out = ""
         if self.parents:
             for p in self.parents:
@@ -253,6 +271,70 @@ class DatasetStats:
         out += self._summarize_iter()
         return out
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the stats of this Dataset and its parents as a JSON-able dict.
+
+        Unlike the summary string, this includes the per-task stats of each
+        stage, and the timeline of events of the dataset iterator.
+        """
+        self._fetch_stats_actor_metadata()
+        return {
+            "number": self.number,
+            "dataset_uuid": self.dataset_uuid,
+            "base_name": self.base_name,
+            "start_time_s": self.start_time_s,
+            "time_total_s": self.time_total_s,
+            "stages": [
+                {
+                    "name": stage_name,
+                    "tasks": [
+                        _block_to_dict(i, m, self.start_time_s)
+                        for i, m in enumerate(metadata)
+                    ],
+                }
+                for stage_name, metadata in self.stages.items()
+            ],
+            "iter": _iter_to_dict(self),
+            "parents": [p.to_dict() for p in self.parents or []],
+        }
+
+    def to_chrome_trace(self) -> List[Dict[str, Any]]:
+        """Return the stats as a list of events in the Chrome trace format.
+
+        The trace can be loaded in ``chrome://tracing`` or Perfetto. Tasks are
+        grouped by the node they ran on, and the time the consumer of the dataset
+        iterator spent waiting or in user code is shown on the "iterator" track.
+        """
+        self._fetch_stats_actor_metadata()
+        events = []
+        already_traced = set()
+        stack = [self]
+        while stack:
+            stats = stack.pop()
+            for stage_name, metadata in stats.stages.items():
+                stage_uuid = "{}{}".format(stats.dataset_uuid, stage_name)
+                if stage_uuid not in already_traced:
+                    already_traced.add(stage_uuid)
+                    events.extend(
+                        _task_trace_events(stage_name, metadata, stats.start_time_s)
+                    )
+            events.extend(_iter_trace_events("Dataset iterator", stats.iter_events))
+            stack.extend(stats.parents or [])
+        return events
+
+    def export(self, path: str, format: str = "json") -> None:
+        """Write the stats to a file, as JSON or as a Chrome trace."""
+        _export(self, path, format)
+
+    def _fetch_stats_actor_metadata(self) -> None:
+        if self.needs_stats_actor:
+            # XXX this is a super hack, clean it up.
+            stats_map, self.time_total_s = ray.get(
+                self.stats_actor.get.remote(self.stats_uuid)
+            )
+            for i, metadata in stats_map.items():
+                self.stages["read"][i] = metadata
+
     def _summarize_iter(self) -> str:
         out = ""
         if (
@@ -365,12 +447,13 @@ class DatasetPipelineStats:
         self.wait_time_s = []
 
         # Iteration stats, filled out if the user iterates over the pipeline.
-        self.iter_ds_wait_s: Timer = Timer()
-        self.iter_wait_s: Timer = Timer()
-        self.iter_get_s: Timer = Timer()
-        self.iter_format_batch_s: Timer = Timer()
-        self.iter_user_s: Timer = Timer()
-        self.iter_total_s: Timer = Timer()
+        self.iter_events: Deque[Tuple] = collections.deque(maxlen=MAX_ITER_EVENTS)
+        self.iter_ds_wait_s: Timer = Timer("ds_wait", self.iter_events)
+        self.iter_wait_s: Timer = Timer("wait", self.iter_events)
+        self.iter_get_s: Timer = Timer("get", self.iter_events)
+        self.iter_format_batch_s: Timer = Timer("format_batch", self.iter_events)
+        self.iter_user_s: Timer = Timer("user", self.iter_events)
+        self.iter_total_s: Timer = Timer("total", self.iter_events)
 
     def add(self, stats: DatasetStats) -> None:
         """Called to add stats for a newly computed window."""
@@ -424,3 +507,148 @@ class DatasetPipelineStats:
             )
         out += self._summarize_iter()
         return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the stats of the tracked windows as a JSON-able dict."""
+        iter_stats = _iter_to_dict(self)
+        iter_stats["ds_wait_s"] = self.iter_ds_wait_s.get()
+        return {
+            "windows": [
+                {"window": i, "stats": stats.to_dict()}
+                for i, stats in self.history_buffer
+            ],
+            "wait_time_s": self.wait_time_s,
+            "iter": iter_stats,
+        }
+
+    def to_chrome_trace(self) -> List[Dict[str, Any]]:
+        """Return the stats of the tracked windows in the Chrome trace format."""
+        events = []
+        for i, stats in self.history_buffer:
+            for event in stats.to_chrome_trace():
+                event["args"]["window"] = i
+                events.append(event)
+        events.extend(_iter_trace_events("Pipeline iterator", self.iter_events))
+        return events
+
+    def export(self, path: str, format: str = "json") -> None:
+        """Write the stats to a file, as JSON or as a Chrome trace."""
+        _export(self, path, format)
+
+
+def _export(
+    stats: Union[DatasetStats, DatasetPipelineStats], path: str, format: str
+) -> None:
+    if format == "json":
+        data = stats.to_dict()
+    elif format == "chrome_trace":
+        data = stats.to_chrome_trace()
+    else:
+        raise ValueError(
+            f"The stats format must be one of {STATS_EXPORT_FORMATS}, got: {format}"
+        )
+    with open(path, "w") as f:
+        # Fall back to strings for values such as numpy scalars.
+        json.dump(data, f, default=str)
+
+
+def _block_to_dict(
+    index: int, meta: BlockMetadata, stage_start_time_s: Optional[float]
+) -> Dict[str, Any]:
+    out = {
+        "block_index": index,
+        "num_rows": meta.num_rows,
+        "size_bytes": meta.size_bytes,
+    }
+    exec_stats = meta.exec_stats
+    if exec_stats is not None:
+        out.update(
+            node_id=exec_stats.node_id,
+            start_time_s=exec_stats.start_time_s,
+            end_time_s=exec_stats.end_time_s,
+            wall_time_s=exec_stats.wall_time_s,
+            cpu_time_s=exec_stats.cpu_time_s,
+            input_size_bytes=exec_stats.input_size_bytes,
+        )
+        if stage_start_time_s is not None and exec_stats.start_time_s is not None:
+            # The time from the submission of the stage until the task started,
+            # including queueing and fetching the task arguments.
+            out["scheduling_delay_s"] = max(
+                0.0, exec_stats.start_time_s - stage_start_time_s
+            )
+    return out
+
+
+def _iter_to_dict(stats: Union[DatasetStats, DatasetPipelineStats]) -> Dict[str, Any]:
+    return {
+        "wait_s": stats.iter_wait_s.get(),
+        "get_s": stats.iter_get_s.get(),
+        "format_batch_s": stats.iter_format_batch_s.get(),
+        "user_s": stats.iter_user_s.get(),
+        "total_s": stats.iter_total_s.get(),
+        # The time the consumer was blocked on the iterator.
+        "blocked_s": (
+            stats.iter_wait_s.get()
+            + stats.iter_get_s.get()
+            + stats.iter_format_batch_s.get()
+        ),
+        "events": [
+            {"name": name, "start_time_s": start, "duration_s": duration}
+            for name, start, duration in stats.iter_events
+        ],
+    }
+
+
+def _task_trace_events(
+    stage_name: str, blocks: List[BlockMetadata], stage_start_time_s: Optional[float]
+) -> List[Dict[str, Any]]:
+    tasks = [
+        (i, m)
+        for i, m in enumerate(blocks)
+        if m.exec_stats is not None and m.exec_stats.start_time_s is not None
+    ]
+    tasks.sort(key=lambda t: t[1].exec_stats.start_time_s)
+    # Tasks that overlap in time are placed on separate lanes of their node.
+    lane_end_times = collections.defaultdict(list)
+    events = []
+    for i, meta in tasks:
+        exec_stats = meta.exec_stats
+        lanes = lane_end_times[exec_stats.node_id]
+        for lane, end_time in enumerate(lanes):
+            if end_time <= exec_stats.start_time_s:
+                break
+        else:
+            lane = len(lanes)
+            lanes.append(None)
+        lanes[lane] = exec_stats.end_time_s
+        args = _block_to_dict(i, meta, stage_start_time_s)
+        del args["start_time_s"], args["end_time_s"]
+        events.append(
+            {
+                "name": stage_name,
+                "cat": "task",
+                "ph": "X",
+                "ts": exec_stats.start_time_s * 1e6,
+                "dur": exec_stats.wall_time_s * 1e6,
+                "pid": "Node {}".format(exec_stats.node_id),
+                "tid": "Worker lane {}".format(lane),
+                "args": args,
+            }
+        )
+    return events
+
+
+def _iter_trace_events(pid: str, iter_events: Deque[Tuple]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": name,
+            "cat": "iter",
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": duration * 1e6,
+            "pid": pid,
+            "tid": "iterator",
+            "args": {},
+        }
+        for name, start, duration in iter_events
+    ]
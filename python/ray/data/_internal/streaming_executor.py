@@ -0,0 +1,217 @@
+"""
+A pull-based executor that pipelines one-to-one stages across blocks.
+
+Bulk execution runs each stage over all blocks before the next stage starts,
+so all intermediate data of a stage must fit in the object store at once. The
+streaming executor instead pulls input blocks on demand and pushes each block
+through the chain of stages, so that downstream stages (and the consumer of
+the output) run concurrently with upstream stages.
+
+Backpressure: a new task is only launched if the bytes of produced blocks that
+have not yet been consumed, plus the estimated output bytes of all running
+tasks, stay within the object store memory budget. Downstream stages are
+scheduled first, so that memory is freed as early as possible.
+"""
+import collections
+from typing import Deque, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+import ray
+from ray.types import ObjectRef
+from ray.data.block import Block, BlockMetadata, BlockPartition
+from ray.data.context import DatasetContext
+from ray.data._internal.compute import _map_block_split
+from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.remote_fn import cached_remote_fn
+
+if TYPE_CHECKING:
+    from ray.data._internal.plan import OneToOneStage
+
+
+class _RunningTask:
+    def __init__(self, ref: ObjectRef[BlockPartition], estimated_output_bytes: int):
+        self.ref = ref
+        self.estimated_output_bytes = estimated_output_bytes
+
+
+class _StageState:
+    """Execution state of a single one-to-one stage."""
+
+    def __init__(self, stage: "OneToOneStage"):
+        self.stage = stage
+        self.map_block = cached_remote_fn(_map_block_split).options(
+            **stage.ray_remote_args
+        )
+        # Input blocks that are ready to be processed by this stage.
+        self.inputs: Deque[Tuple[ObjectRef[Block], BlockMetadata]] = collections.deque()
+        # Tasks of this stage, in the order of their inputs.
+        self.running: Deque[_RunningTask] = collections.deque()
+        self.num_tasks_finished = 0
+        self.output_bytes = 0
+
+    def estimate_output_bytes(self, target_max_block_size: int) -> int:
+        if self.num_tasks_finished > 0:
+            return self.output_bytes // self.num_tasks_finished
+        return target_max_block_size
+
+
+class StreamingExecutor:
+    """Executes a chain of one-to-one stages over a stream of input blocks.
+
+    Examples:
+        >>> from ray.data._internal.streaming_executor import StreamingExecutor
+        >>> stages = ... # doctest: +SKIP
+        >>> blocks = ... # doctest: +SKIP
+        >>> executor = StreamingExecutor(stages, 1e9) # doctest: +SKIP
+        >>> for block, meta in executor.execute( # doctest: +SKIP
+        ...         blocks.iter_blocks_with_metadata()):
+        ...     print(meta) # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        stages: List["OneToOneStage"],
+        memory_limit: int,
+        max_tasks_in_flight: Optional[int] = None,
+    ):
+        """Create a streaming executor.
+
+        Args:
+            stages: The one-to-one stages to execute, which must use the "tasks"
+                compute strategy.
+            memory_limit: The object store memory budget in bytes for blocks
+                produced by the stages that have not been consumed yet.
+            max_tasks_in_flight: The max number of concurrently running tasks
+                across all stages. Defaults to twice the number of CPUs in the
+                cluster.
+        """
+        assert stages
+        assert all(stage.compute == "tasks" for stage in stages), stages
+        if max_tasks_in_flight is None:
+            max_tasks_in_flight = 2 * int(ray.cluster_resources().get("CPU", 1))
+        self._stages = stages
+        self._memory_limit = memory_limit
+        self._max_tasks_in_flight = max(1, max_tasks_in_flight)
+
+    def execute(
+        self,
+        inputs: Iterator[Tuple[ObjectRef[Block], BlockMetadata]],
+        num_inputs: Optional[int] = None,
+    ) -> Iterator[Tuple[ObjectRef[Block], BlockMetadata]]:
+        """Execute the stages over the input blocks.
+
+        Args:
+            inputs: An iterator over the input blocks and their metadata. Inputs
+                are only pulled when there is capacity to process them.
+            num_inputs: The number of input blocks, if known, for reporting the
+                progress of the first stage.
+
+        Returns:
+            An iterator over the output blocks and their metadata, in the order of
+            the input blocks. The memory of an output block no longer counts
+            against the budget once it is returned to the caller.
+        """
+        ctx = DatasetContext.get_current()
+        states = [_StageState(stage) for stage in self._stages]
+        outputs: Deque[Tuple[ObjectRef[Block], BlockMetadata]] = collections.deque()
+        inputs_done = False
+        name = "->".join(stage.name for stage in self._stages)
+        progress = ProgressBar(name.title(), total=num_inputs or 1)
+        try:
+            while True:
+                while outputs:
+                    yield outputs.popleft()
+                inputs_done = self._schedule(states, inputs, inputs_done, ctx)
+                if inputs_done and not any(s.inputs or s.running for s in states):
+                    break
+                self._process_finished_tasks(states, outputs, progress)
+            while outputs:
+                yield outputs.popleft()
+        except BaseException:
+            # Either a task failed, or the consumer stopped early; either way,
+            # cancel all tasks that are still running.
+            for state in states:
+                for task in state.running:
+                    ray.cancel(task.ref)
+            raise
+        finally:
+            progress.close()
+
+    def _memory_usage(self, states: List[_StageState]) -> int:
+        usage = 0
+        for i, state in enumerate(states):
+            if i > 0:
+                # Blocks that were produced by the previous stage.
+                usage += sum(meta.size_bytes or 0 for _, meta in state.inputs)
+            usage += sum(task.estimated_output_bytes for task in state.running)
+        return usage
+
+    def _can_launch(self, states: List[_StageState], estimated_bytes: int) -> bool:
+        num_running = sum(len(state.running) for state in states)
+        if num_running == 0:
+            # Always make progress, even if a single block exceeds the budget.
+            return True
+        if num_running >= self._max_tasks_in_flight:
+            return False
+        return self._memory_usage(states) + estimated_bytes <= self._memory_limit
+
+    def _schedule(
+        self,
+        states: List[_StageState],
+        inputs: Iterator[Tuple[ObjectRef[Block], BlockMetadata]],
+        inputs_done: bool,
+        ctx: DatasetContext,
+    ) -> bool:
+        """Launch as many tasks as the budget allows, returning if inputs are done."""
+        while True:
+            # Prefer downstream stages, since they free memory.
+            for state in reversed(states):
+                while state.inputs:
+                    estimate = state.estimate_output_bytes(ctx.target_max_block_size)
+                    if not self._can_launch(states, estimate):
+                        break
+                    block, meta = state.inputs.popleft()
+                    ref = state.map_block.remote(
+                        block, state.stage.block_fn, meta.input_files
+                    )
+                    state.running.append(_RunningTask(ref, estimate))
+            if inputs_done or states[0].inputs:
+                # Either there are no more inputs, or no capacity to process them.
+                return inputs_done
+            estimate = states[0].estimate_output_bytes(ctx.target_max_block_size)
+            if not self._can_launch(states, estimate):
+                return inputs_done
+            try:
+                states[0].inputs.append(next(inputs))
+            except StopIteration:
+                return True
+
+    def _process_finished_tasks(
+        self,
+        states: List[_StageState],
+        outputs: Deque[Tuple[ObjectRef[Block], BlockMetadata]],
+        progress: ProgressBar,
+    ) -> None:
+        """Wait for a task to finish and pass on the outputs of finished tasks."""
+        # Only wait on the oldest task of each stage, since outputs are passed on
+        # in order.
+        heads = [state.running[0].ref for state in states if state.running]
+        if not heads:
+            return
+        ray.wait(heads, num_returns=1, fetch_local=False)
+        for i, state in enumerate(states):
+            while state.running:
+                ready, _ = ray.wait(
+                    [state.running[0].ref], timeout=0, fetch_local=False
+                )
+                if not ready:
+                    break
+                task = state.running.popleft()
+                partition = ray.get(task.ref)
+                state.num_tasks_finished += 1
+                state.output_bytes += sum(meta.size_bytes or 0 for _, meta in partition)
+                if i == 0:
+                    progress.update(1)
+                if i + 1 < len(states):
+                    states[i + 1].inputs.extend(partition)
+                else:
+                    outputs.extend(partition)
@@ -1,7 +1,15 @@
 import logging
-from typing import Union
+import math
+from typing import Any, List, Optional, Union, TYPE_CHECKING
 from types import ModuleType
 
+import numpy as np
+
+import ray
+
+if TYPE_CHECKING:
+    from ray.data.context import DatasetContext
+
 logger = logging.getLogger(__name__)
 
 MIN_PYARROW_VERSION = (6, 0, 1)
@@ -24,6 +32,32 @@ def _lazy_import_pyarrow_dataset() -> LazyModule:
     return _pyarrow_dataset
 
 
+def _autodetect_parallelism(
+    parallelism: int, ctx: "DatasetContext", data_size: Optional[int]
+) -> int:
+    """Returns the given parallelism, or if it is -1, chooses one automatically.
+
+    The parallelism is chosen so that blocks are no larger than the target max block
+    size, and so that there are enough read tasks to use all CPUs in the cluster at
+    least twice over (for load balancing).
+
+    Args:
+        parallelism: The user-requested parallelism, or -1 for auto-detection.
+        ctx: The current DatasetContext.
+        data_size: The estimated in-memory size of the data to read, if known.
+
+    Returns:
+        The parallelism to read with.
+    """
+    if parallelism >= 0:
+        return parallelism
+    if data_size is None:
+        return ctx.min_parallelism
+    num_cpus = int(ray.cluster_resources().get("CPU", 1))
+    min_safe_parallelism = math.ceil(data_size / ctx.target_max_block_size)
+    return max(1, min_safe_parallelism, 2 * num_cpus)
+
+
 def _check_pyarrow_version():
     global _VERSION_VALIDATED
     if not _VERSION_VALIDATED:
@@ -51,3 +85,34 @@ def _check_pyarrow_version():
             )
         else:
             _VERSION_VALIDATED = True
+
+
+def _hash_partition(keys: List[Any], num_partitions: int) -> np.ndarray:
+    """Assign each key to one of ``num_partitions`` partitions by hash.
+
+    Unlike the builtin ``hash()``, the hash is stable across processes, so the
+    same key is assigned to the same partition by every task.
+    """
+    import pandas
+
+    # Keys are hashed by their string representation so that arbitrary
+    # (e.g. tuple) keys are supported. Numeric keys are normalized first so that
+    # keys that compare equal (e.g. 1 and 1.0) are assigned the same partition.
+    values = np.empty(len(keys), dtype=object)
+    for i, k in enumerate(keys):
+        values[i] = None if k is None else str(_normalize_hash_key(k))
+    hashes = pandas.util.hash_array(values)
+    return (hashes % np.uint64(num_partitions)).astype(np.int64)
+
+
+def _normalize_hash_key(key: Any) -> Any:
+    """Convert integral floats to ints, including the elements of tuple keys.
+
+    An integer column with missing values is read as a float column, so the same
+    join key may be 1 on one side and 1.0 on the other.
+    """
+    if isinstance(key, tuple):
+        return tuple(_normalize_hash_key(k) for k in key)
+    if isinstance(key, float) and key.is_integer():
+        return int(key)
+    return key
@@ -103,12 +103,18 @@ class BlockExecStats:
         wall_time_s: The wall-clock time it took to compute this block.
         cpu_time_s: The CPU time it took to compute this block.
         node_id: A unique id for the node that computed this block.
+        start_time_s: The UNIX timestamp at which computing this block started.
+        end_time_s: The UNIX timestamp at which computing this block finished.
+        input_size_bytes: The size in bytes of the input block, if known.
     """
 
     def __init__(self):
         self.wall_time_s: Optional[float] = None
         self.cpu_time_s: Optional[float] = None
         self.node_id = ray.runtime_context.get_runtime_context().node_id.hex()
+        self.start_time_s: Optional[float] = None
+        self.end_time_s: Optional[float] = None
+        self.input_size_bytes: Optional[int] = None
 
     @staticmethod
     def builder() -> "_BlockExecStatsBuilder":
@@ -120,6 +126,9 @@ class BlockExecStats:
                 "wall_time_s": self.wall_time_s,
                 "cpu_time_s": self.cpu_time_s,
                 "node_id": self.node_id,
+                "start_time_s": self.start_time_s,
+                "end_time_s": self.end_time_s,
+                "input_size_bytes": self.input_size_bytes,
             }
         )
 
@@ -134,11 +143,14 @@ class _BlockExecStatsBuilder:
     def __init__(self):
         self.start_time = time.perf_counter()
         self.start_cpu = time.process_time()
+        self.start_timestamp = time.time()
 
     def build(self) -> "BlockExecStats":
         stats = BlockExecStats()
         stats.wall_time_s = time.perf_counter() - self.start_time
         stats.cpu_time_s = time.process_time() - self.start_cpu
+        stats.start_time_s = self.start_timestamp
+        stats.end_time_s = self.start_timestamp + stats.wall_time_s
         return stats
 
 
@@ -206,6 +218,22 @@ class BlockAccessor(Generic[T]):
         """Randomly shuffle this block."""
         raise NotImplementedError
 
+    def take(self, indices: List[int]) -> Block:
+        """Return a new block with the rows at the given indices, in order."""
+        raise NotImplementedError
+
+    def filter(self, predicate: "pyarrow.dataset.Expression") -> Block:
+        """Return a new block with only the rows matching the given expression.
+
+        Args:
+            predicate: A boolean Arrow expression, e.g. ``col("x") > 5``.
+        """
+        raise NotImplementedError
+
+    def select(self, columns: List[str]) -> Block:
+        """Return a new block with only the given columns, in the given order."""
+        raise NotImplementedError
+
     def to_pandas(self) -> "pandas.DataFrame":
         """Convert this block into a Pandas dataframe."""
         raise NotImplementedError
@@ -295,6 +323,12 @@ class BlockAccessor(Generic[T]):
         """Combine rows with the same key into an accumulator."""
         raise NotImplementedError
 
+    def hash_partition_and_combine(
+        self, key: KeyFn, agg: "AggregateFn", num_partitions: int
+    ) -> List[Block[U]]:
+        """Hash partition rows by key and combine rows with the same key."""
+        raise NotImplementedError
+
     @staticmethod
     def merge_sorted_blocks(
         blocks: List["Block[T]"], key: Any, descending: bool
@@ -308,3 +342,10 @@ class BlockAccessor(Generic[T]):
     ) -> Tuple[Block[U], BlockMetadata]:
         """Aggregate partially combined and sorted blocks."""
         raise NotImplementedError
+
+    @staticmethod
+    def aggregate_hash_combined_blocks(
+        blocks: List[Block], key: KeyFn, agg: "AggregateFn"
+    ) -> Tuple[Block[U], BlockMetadata]:
+        """Aggregate partially combined blocks by hashing their keys."""
+        raise NotImplementedError
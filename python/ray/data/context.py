@@ -10,11 +10,28 @@ from ray.util.scheduling_strategies import SchedulingStrategyT
 _default_context: "Optional[DatasetContext]" = None
 _context_lock = threading.Lock()
 
-# The max target block size in bytes for reads and transformations.
-DEFAULT_TARGET_MAX_BLOCK_SIZE = 2048 * 1024 * 1024
+# The max target block size in bytes for reads and transformations. With adaptive
+# block sizing, this is an upper bound on the target derived from the cluster.
+DEFAULT_TARGET_MAX_BLOCK_SIZE = 512 * 1024 * 1024
+
+# The min target block size in bytes, which bounds adaptive block sizing.
+DEFAULT_TARGET_MIN_BLOCK_SIZE = 1024 * 1024
 
 # Whether block splitting is on by default
-DEFAULT_BLOCK_SPLITTING_ENABLED = False
+DEFAULT_BLOCK_SPLITTING_ENABLED = True
+
+# Whether to derive the target max block size from the object store capacity of
+# the cluster. This requires block splitting to be enabled.
+DEFAULT_ADAPTIVE_BLOCK_SIZING_ENABLED = True
+
+# With adaptive block sizing, the target max block size is chosen so that this many
+# blocks per CPU fit into the object store (e.g., the input and output blocks of
+# each running task, plus blocks waiting to be consumed).
+ADAPTIVE_BLOCKS_PER_CPU = 8
+
+# The read parallelism to use when it is chosen automatically, but the size of the
+# data to read is unknown.
+DEFAULT_MIN_PARALLELISM = 200
 
 # Whether pandas block format is enabled.
 # TODO (kfstorm): Remove this once stable.
@@ -30,6 +47,9 @@ DEFAULT_OPTIMIZE_FUSE_READ_STAGES = True
 # Whether to furthermore fuse prior map tasks with shuffle stages.
 DEFAULT_OPTIMIZE_FUSE_SHUFFLE_STAGES = True
 
+# Whether to push down column selections and filters into read stages.
+DEFAULT_OPTIMIZE_PUSHDOWN_READ_STAGES = True
+
 # Wether to use actor based block prefetcher.
 DEFAULT_ACTOR_PREFETCHER_ENABLED = True
 
@@ -38,6 +58,28 @@ DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
     os.environ.get("RAY_DATASET_PUSH_BASED_SHUFFLE", None)
 )
 
+# Whether to use hash-based (instead of sort-based) aggregation for groupby by default.
+DEFAULT_USE_HASH_BASED_AGGREGATION = bool(
+    os.environ.get("RAY_DATASET_HASH_BASED_AGGREGATION", None)
+)
+
+# Whether to use the streaming executor to pipeline transformations with writes and
+# iteration. This also makes transformations lazy, since they are executed on
+# consumption.
+DEFAULT_USE_STREAMING_EXECUTOR = bool(
+    os.environ.get("RAY_DATASET_USE_STREAMING_EXECUTOR", None)
+)
+
+# The fraction of the object store memory of the cluster that the streaming executor
+# may use for blocks that have been produced but not yet consumed.
+DEFAULT_STREAMING_OBJECT_STORE_MEMORY_FRACTION = 0.25
+
+# The local directory that sort reducers spill their sorted input runs to, so that
+# they stream their inputs from disk while merging instead of holding all of them in
+# memory. Spilling is disabled if this is None. This only applies to the simple (not
+# push-based) shuffle.
+DEFAULT_SORT_SPILL_DIR = os.environ.get("RAY_DATASET_SORT_SPILL_DIR", None)
+
 # The default global scheduling strategy.
 DEFAULT_SCHEDULING_STRATEGY = "DEFAULT"
 
@@ -55,25 +97,46 @@ class DatasetContext:
         block_owner: ray.actor.ActorHandle,
         block_splitting_enabled: bool,
         target_max_block_size: int,
+        target_min_block_size: int,
+        adaptive_block_sizing_enabled: bool,
+        min_parallelism: int,
         enable_pandas_block: bool,
         optimize_fuse_stages: bool,
         optimize_fuse_read_stages: bool,
         optimize_fuse_shuffle_stages: bool,
+        optimize_pushdown_read_stages: bool,
         actor_prefetcher_enabled: bool,
         use_push_based_shuffle: bool,
+        use_hash_based_aggregation: bool,
+        use_streaming_executor: bool,
+        streaming_object_store_memory_fraction: float,
+        sort_spill_dir: Optional[str],
         scheduling_strategy: SchedulingStrategyT,
     ):
         """Private constructor (use get_current() instead)."""
         self.block_owner = block_owner
         self.block_splitting_enabled = block_splitting_enabled
         self.target_max_block_size = target_max_block_size
+        self.target_min_block_size = target_min_block_size
+        self.adaptive_block_sizing_enabled = adaptive_block_sizing_enabled
+        self.min_parallelism = min_parallelism
         self.enable_pandas_block = enable_pandas_block
         self.optimize_fuse_stages = optimize_fuse_stages
         self.optimize_fuse_read_stages = optimize_fuse_read_stages
         self.optimize_fuse_shuffle_stages = optimize_fuse_shuffle_stages
+        self.optimize_pushdown_read_stages = optimize_pushdown_read_stages
         self.actor_prefetcher_enabled = actor_prefetcher_enabled
         self.use_push_based_shuffle = use_push_based_shuffle
+        self.use_hash_based_aggregation = use_hash_based_aggregation
+        self.use_streaming_executor = use_streaming_executor
+        self.streaming_object_store_memory_fraction = (
+            streaming_object_store_memory_fraction
+        )
+        self.sort_spill_dir = sort_spill_dir
         self.scheduling_strategy = scheduling_strategy
+        # The last target max block size chosen by adaptive block sizing, used to
+        # tell adapted values apart from values set by the user.
+        self._adapted_target_max_block_size = None
 
     @staticmethod
     def get_current() -> "DatasetContext":
@@ -91,12 +154,26 @@ class DatasetContext:
                     block_owner=None,
                     block_splitting_enabled=DEFAULT_BLOCK_SPLITTING_ENABLED,
                     target_max_block_size=DEFAULT_TARGET_MAX_BLOCK_SIZE,
+                    target_min_block_size=DEFAULT_TARGET_MIN_BLOCK_SIZE,
+                    adaptive_block_sizing_enabled=(
+                        DEFAULT_ADAPTIVE_BLOCK_SIZING_ENABLED
+                    ),
+                    min_parallelism=DEFAULT_MIN_PARALLELISM,
                     enable_pandas_block=DEFAULT_ENABLE_PANDAS_BLOCK,
                     optimize_fuse_stages=DEFAULT_OPTIMIZE_FUSE_STAGES,
                     optimize_fuse_read_stages=DEFAULT_OPTIMIZE_FUSE_READ_STAGES,
                     optimize_fuse_shuffle_stages=DEFAULT_OPTIMIZE_FUSE_SHUFFLE_STAGES,
+                    optimize_pushdown_read_stages=(
+                        DEFAULT_OPTIMIZE_PUSHDOWN_READ_STAGES
+                    ),
                     actor_prefetcher_enabled=DEFAULT_ACTOR_PREFETCHER_ENABLED,
                     use_push_based_shuffle=DEFAULT_USE_PUSH_BASED_SHUFFLE,
+                    use_hash_based_aggregation=DEFAULT_USE_HASH_BASED_AGGREGATION,
+                    use_streaming_executor=DEFAULT_USE_STREAMING_EXECUTOR,
+                    streaming_object_store_memory_fraction=(
+                        DEFAULT_STREAMING_OBJECT_STORE_MEMORY_FRACTION
+                    ),
+                    sort_spill_dir=DEFAULT_SORT_SPILL_DIR,
                     scheduling_strategy=DEFAULT_SCHEDULING_STRATEGY,
                 )
 
@@ -118,6 +195,24 @@ class DatasetContext:
                 ray.worker._post_init_hooks.append(clear_owner)
                 _default_context.block_owner = owner
 
+                # The owner is (re)created once per Ray session, so this is also
+                # when the block size is adapted to the (new) cluster. A target
+                # max block size set by the user is left as is.
+                if _default_context.adaptive_block_sizing_enabled and (
+                    _default_context.target_max_block_size
+                    in (
+                        DEFAULT_TARGET_MAX_BLOCK_SIZE,
+                        _default_context._adapted_target_max_block_size,
+                    )
+                ):
+                    target_max_block_size = _get_adaptive_target_max_block_size(
+                        _default_context.target_min_block_size
+                    )
+                    _default_context.target_max_block_size = target_max_block_size
+                    _default_context._adapted_target_max_block_size = (
+                        target_max_block_size
+                    )
+
             return _default_context
 
     @staticmethod
@@ -131,6 +226,17 @@ class DatasetContext:
         _default_context = context
 
 
+def _get_adaptive_target_max_block_size(target_min_block_size: int) -> int:
+    """Derive the target max block size from the object store capacity per CPU."""
+    resources = ray.cluster_resources()
+    object_store_memory = resources.get("object_store_memory")
+    num_cpus = resources.get("CPU")
+    if not object_store_memory or not num_cpus:
+        return DEFAULT_TARGET_MAX_BLOCK_SIZE
+    target = int(object_store_memory / num_cpus / ADAPTIVE_BLOCKS_PER_CPU)
+    return max(target_min_block_size, min(target, DEFAULT_TARGET_MAX_BLOCK_SIZE))
+
+
 @ray.remote(num_cpus=0)
 class _DesignatedBlockOwner:
     def ping(self):
@@ -62,6 +62,7 @@ from ray.data.datasource import (
     WriteResult,
 )
 from ray.data.datasource.file_based_datasource import (
+    FileBasedDatasource,
     _wrap_arrow_serialization_workaround,
     _unwrap_arrow_serialization_workaround,
 )
@@ -172,7 +173,9 @@ class Dataset(Generic[T]):
         self._epoch = epoch
         self._lazy = lazy
 
-        if not lazy:
+        if not lazy and not DatasetContext.get_current().use_streaming_executor:
+            # With the streaming executor, transformations are executed when the
+            # dataset is consumed instead.
             self._plan.execute(allow_clear_input_blocks=False)
 
     @staticmethod
@@ -238,10 +241,10 @@ class Dataset(Generic[T]):
             output_buffer = BlockOutputBuffer(None, context.target_max_block_size)
             for row in block.iter_rows():
                 output_buffer.add(fn(row))
-                if output_buffer.has_next():
+                while output_buffer.has_next():
                     yield output_buffer.next()
             output_buffer.finalize()
-            if output_buffer.has_next():
+            while output_buffer.has_next():
                 yield output_buffer.next()
 
         plan = self._plan.with_stage(
@@ -365,11 +368,11 @@ class Dataset(Generic[T]):
                         "pandas.DataFrame, or pyarrow.Table"
                     )
                 output_buffer.add_block(applied)
-                if output_buffer.has_next():
+                while output_buffer.has_next():
                     yield output_buffer.next()
 
             output_buffer.finalize()
-            if output_buffer.has_next():
+            while output_buffer.has_next():
                 yield output_buffer.next()
 
         plan = self._plan.with_stage(
@@ -464,10 +467,10 @@ class Dataset(Generic[T]):
             for row in block.iter_rows():
                 for r2 in fn(row):
                     output_buffer.add(r2)
-                    if output_buffer.has_next():
+                    while output_buffer.has_next():
                         yield output_buffer.next()
             output_buffer.finalize()
-            if output_buffer.has_next():
+            while output_buffer.has_next():
                 yield output_buffer.next()
 
         plan = self._plan.with_stage(
@@ -477,20 +480,32 @@ class Dataset(Generic[T]):
 
     def filter(
         self,
-        fn: Union[CallableClass, Callable[[T], bool]],
+        fn: Optional[Union[CallableClass, Callable[[T], bool]]] = None,
         *,
+        expr: Optional["pyarrow.dataset.Expression"] = None,
         compute: Optional[str] = None,
         **ray_remote_args,
     ) -> "Dataset[T]":
         """Filter out records that do not satisfy the given predicate.
 
-        This is a blocking operation. Consider using ``.map_batches()`` for
-        better performance (you can implement filter by dropping records).
+        The predicate is either a function applied to each record, or, for
+        tabular datasets, an expression built with
+        :func:`ray.data.expressions.col`. Expressions are evaluated on whole
+        blocks with vectorized Arrow kernels and can be pushed down into
+        datasources that support it (e.g., ``read_parquet()``), so they are much
+        faster than filter functions.
+
+        Function filters are blocking operations. Consider using
+        ``.map_batches()`` for better performance (you can implement filter by
+        dropping records).
 
         Examples:
             >>> import ray
+            >>> from ray.data.expressions import col
             >>> ds = ray.data.range(100) # doctest: +SKIP
             >>> ds.filter(lambda x: x % 2 == 0) # doctest: +SKIP
+            >>> ds = ray.data.range_table(100) # doctest: +SKIP
+            >>> ds.filter(expr=col("value") > 5) # doctest: +SKIP
 
         Time complexity: O(dataset size / parallelism)
 
@@ -498,11 +513,17 @@ class Dataset(Generic[T]):
             fn: The predicate to apply to each record, or a class type
                 that can be instantiated to create such a callable. Callable classes are
                 only supported for the actor compute strategy.
+            expr: A boolean Arrow expression to filter the records of a tabular
+                dataset with. Exactly one of ``fn`` and ``expr`` must be given.
             compute: The compute strategy, either "tasks" (default) to use Ray
                 tasks, or ActorPoolStrategy(min, max) to use an autoscaling actor pool.
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
+        if (fn is None) == (expr is None):
+            raise ValueError("Exactly one of `fn` and `expr` must be specified.")
+        if expr is not None:
+            return self._filter_expr(expr, compute, ray_remote_args)
 
         self._warn_slow()
         fn = cache_wrapper(fn, compute)
@@ -522,6 +543,78 @@ class Dataset(Generic[T]):
         )
         return Dataset(plan, self._epoch, self._lazy)
 
+    def _filter_expr(
+        self,
+        expr: "pyarrow.dataset.Expression",
+        compute: Optional[str],
+        ray_remote_args: Dict[str, Any],
+    ) -> "Dataset[T]":
+        import pyarrow.dataset as pads
+
+        if not isinstance(expr, pads.Expression):
+            raise ValueError(
+                "`expr` must be a pyarrow.dataset.Expression, got {}".format(expr)
+            )
+        context = DatasetContext.get_current()
+
+        def transform(block: Block) -> Iterable[Block]:
+            DatasetContext._set_current(context)
+            return [BlockAccessor.for_block(block).filter(expr)]
+
+        plan = self._plan.with_stage(
+            OneToOneStage("filter", transform, compute, ray_remote_args, predicate=expr)
+        )
+        return Dataset(plan, self._epoch, self._lazy)
+
+    def select_columns(
+        self,
+        cols: List[str],
+        *,
+        compute: Optional[str] = None,
+        **ray_remote_args,
+    ) -> "Dataset[T]":
+        """Select the given columns of a tabular dataset, dropping all others.
+
+        Unlike a ``.map_batches()`` based projection, this never converts the
+        data to another format, and it can be pushed down into datasources that
+        support it (e.g., ``read_parquet()``) so that the dropped columns are
+        never read at all.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range_table(100) # doctest: +SKIP
+            >>> ds = ds.add_column( # doctest: +SKIP
+            ...     "new_col", lambda df: df["value"] * 2)
+            >>> ds.select_columns(["new_col"]) # doctest: +SKIP
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            cols: Names of the columns to select, in the order they should
+                appear in the output.
+            compute: The compute strategy, either "tasks" (default) to use Ray
+                tasks, or ActorPoolStrategy(min, max) to use an autoscaling actor pool.
+            ray_remote_args: Additional resource requirements to request from
+                ray (e.g., num_gpus=1 to request GPUs for the map tasks).
+        """
+        if isinstance(cols, str) or not all(isinstance(c, str) for c in cols):
+            raise ValueError(
+                "`cols` must be a list of column names, got {}".format(cols)
+            )
+        cols = list(cols)
+        context = DatasetContext.get_current()
+
+        def transform(block: Block) -> Iterable[Block]:
+            DatasetContext._set_current(context)
+            return [BlockAccessor.for_block(block).select(cols)]
+
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "select_columns", transform, compute, ray_remote_args, projection=cols
+            )
+        )
+        return Dataset(plan, self._epoch, self._lazy)
+
     def repartition(self, num_blocks: int, *, shuffle: bool = False) -> "Dataset[T]":
         """Repartition the dataset into exactly this number of blocks.
 
@@ -1721,6 +1814,84 @@ class Dataset(Generic[T]):
         plan = self._plan.with_stage(AllToAllStage("zip", None, do_zip_all))
         return Dataset(plan, self._epoch, self._lazy)
 
+    def join(
+        self,
+        other: "Dataset[U]",
+        on: Union[None, str, List[str], Callable[[T], Any]] = None,
+        how: str = "inner",
+        *,
+        broadcast: bool = False,
+    ) -> "Dataset[Any]":
+        """Join this dataset with another on the specified key.
+
+        This is a blocking operation.
+
+        By default, both datasets are hash partitioned by key in a distributed
+        shuffle, and each output block joins the rows of one key partition.
+        If ``broadcast`` is True, the other dataset is instead combined into a
+        single block that is sent to every block of this dataset, which avoids
+        the shuffle entirely. This requires the other dataset to fit in the
+        object store of a single node.
+
+        NOTE: Joined datasets are not lineage-serializable, i.e. they can not be used
+        as a tunable hyperparameter in Ray Tune.
+
+        Examples:
+            >>> import ray
+            >>> ds1 = ray.data.from_items( # doctest: +SKIP
+            ...     [{"id": i, "a": i * 2} for i in range(5)])
+            >>> ds2 = ray.data.from_items( # doctest: +SKIP
+            ...     [{"id": i, "b": i * 3} for i in range(3)])
+            >>> ds1.join(ds2, on="id").take() # doctest: +SKIP
+            [{'id': 0, 'a': 0, 'b': 0}, {'id': 1, 'a': 2, 'b': 3}, ...]
+            >>> # Join simple datasets on a key function.
+            >>> ds = ray.data.range(5) # doctest: +SKIP
+            >>> ds.join(ds, on=lambda x: x % 2).count() # doctest: +SKIP
+            13
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            other: The dataset to join with on the right hand side. It must have
+                the same format (simple or tabular) as this dataset.
+            on:
+                - For Arrow or Pandas datasets, the name or list of names of the
+                  columns to join on. Duplicate non-key column names from the
+                  other dataset are disambiguated with a _1 suffix.
+                - For datasets of Python objects, a function that returns the
+                  join key of a record, or None to join on the entire record.
+            how: One of "inner", "left", or "outer".
+            broadcast: Whether to broadcast the other dataset to each block of
+                this dataset instead of shuffling both. Only "inner" and "left"
+                joins are supported in this mode.
+
+        Returns:
+            For tabular datasets, a dataset with the columns of both datasets.
+            For datasets of Python objects, a dataset of (left, right) tuples
+            of the joined records, where a missing record is None.
+        """
+        from ray.data._internal.join import JOIN_TYPES, join_impl
+
+        if how not in JOIN_TYPES:
+            raise ValueError(f"`how` must be one of {JOIN_TYPES}, got: {how}.")
+        if broadcast and how == "outer":
+            raise ValueError("Broadcast joins do not support `how='outer'`.")
+        keys = on if isinstance(on, list) else [on]
+        if not keys:
+            raise ValueError("`on` must be a list of non-zero length")
+
+        def do_join(block_list, clear_input_blocks: bool, *_):
+            for key in keys:
+                _validate_key_fn(self, key)
+                _validate_key_fn(other, key)
+            right_blocks = other._plan.execute()
+            return join_impl(
+                block_list, right_blocks, clear_input_blocks, on, how, broadcast
+            )
+
+        plan = self._plan.with_stage(AllToAllStage("join", None, do_join))
+        return Dataset(plan, self._epoch, self._lazy)
+
     def limit(self, limit: int) -> "Dataset[T]":
         """Limit the dataset to the first number of records specified.
 
@@ -2148,27 +2319,13 @@ class Dataset(Generic[T]):
         """
 
         ctx = DatasetContext.get_current()
+        if ctx.use_streaming_executor and not self._plan.has_computed_output():
+            self._write_datasource_streaming(datasource, ray_remote_args, write_args)
+            return
         blocks, metadata = zip(*self._plan.execute().get_blocks_with_metadata())
-
-        # TODO(ekl) remove this feature flag.
-        if "RAY_DATASET_FORCE_LOCAL_METADATA" in os.environ:
-            write_results: List[ObjectRef[WriteResult]] = datasource.do_write(
-                blocks, metadata, ray_remote_args=ray_remote_args, **write_args
-            )
-        else:
-            # Prepare write in a remote task so that in Ray client mode, we
-            # don't do metadata resolution from the client machine.
-            do_write = cached_remote_fn(_do_write, retry_exceptions=False, num_cpus=0)
-            write_results: List[ObjectRef[WriteResult]] = ray.get(
-                do_write.remote(
-                    datasource,
-                    ctx,
-                    blocks,
-                    metadata,
-                    ray_remote_args,
-                    _wrap_arrow_serialization_workaround(write_args),
-                )
-            )
+        write_results = _submit_write(
+            datasource, ctx, blocks, metadata, ray_remote_args, write_args
+        )
 
         progress = ProgressBar("Write Progress", len(write_results))
         try:
@@ -2180,6 +2337,54 @@ class Dataset(Generic[T]):
         finally:
             progress.close()
 
+    def _write_datasource_streaming(
+        self,
+        datasource: Datasource[T],
+        ray_remote_args: Dict[str, Any],
+        write_args: Dict[str, Any],
+    ) -> None:
+        """Write blocks as they are produced by the streaming executor.
+
+        Blocks are written in windows of one block per CPU in the cluster, and
+        the next window is only written once the previous window's writes are
+        done, so that at most two windows of blocks are held for writing.
+        """
+        ctx = DatasetContext.get_current()
+        window_size = max(1, int(ray.cluster_resources().get("CPU", 1)))
+        write_results: List[ObjectRef[WriteResult]] = []
+        pending: List[ObjectRef[WriteResult]] = []
+        window = []
+        num_written = 0
+
+        def write_window():
+            nonlocal num_written, pending
+            blocks, metadata = zip(*window)
+            args = write_args
+            if isinstance(datasource, FileBasedDatasource):
+                # Keep output file names unique across windows.
+                args = dict(write_args, _block_index_offset=num_written)
+            results = _submit_write(
+                datasource, ctx, blocks, metadata, ray_remote_args, args
+            )
+            num_written += len(window)
+            window.clear()
+            if pending:
+                ray.wait(pending, num_returns=len(pending), fetch_local=False)
+            write_results.extend(results)
+            pending = results
+
+        try:
+            for block, meta in self._plan.execute_streaming():
+                window.append((block, meta))
+                if len(window) >= window_size:
+                    write_window()
+            if window:
+                write_window()
+            datasource.on_write_complete(ray.get(write_results))
+        except Exception as e:
+            datasource.on_write_failed(write_results, e)
+            raise
+
     def iter_rows(self, *, prefetch_blocks: int = 0) -> Iterator[Union[T, TableRow]]:
         """Return a local row iterator over the dataset.
 
@@ -2255,13 +2460,20 @@ class Dataset(Generic[T]):
         Returns:
             An iterator over record batches.
         """
-        blocks = self._plan.execute()
-        stats = self._plan.stats()
+        if (
+            DatasetContext.get_current().use_streaming_executor
+            and not self._plan.has_computed_output()
+        ):
+            block_iter = (block for block, _ in self._plan.execute_streaming())
+            stats = DatasetStats(stages={}, parent=None)
+        else:
+            block_iter = self._plan.execute().iter_blocks()
+            stats = self._plan.stats()
 
         time_start = time.perf_counter()
 
         yield from batch_blocks(
-            blocks.iter_blocks(),
+            block_iter,
             stats,
             prefetch_blocks=prefetch_blocks,
             batch_size=batch_size,
@@ -2789,13 +3001,24 @@ class Dataset(Generic[T]):
         self,
         key: str,
         num_workers: Optional[int] = None,
+        *,
+        index: str = "sorted",
     ) -> RandomAccessDataset:
         """Convert this Dataset into a distributed RandomAccessDataset (EXPERIMENTAL).
 
-        RandomAccessDataset partitions the dataset across the cluster by the given sort
-        key, providing efficient random access to records via binary search. A number
-        of worker actors are created, each of which has zero-copy access to the
-        underlying sorted data blocks of the Dataset.
+        RandomAccessDataset partitions the dataset across the cluster by the given
+        key, providing efficient random access to records. A number of worker actors
+        are created, each of which serves queries for a partition of the data.
+
+        With the default ``"sorted"`` index, the dataset is sorted by the key, and
+        records are found via binary search. Workers have zero-copy access to the
+        underlying sorted data blocks of the Dataset, and range scans over the key
+        are supported via ``scan_range()``.
+
+        With the ``"hash"`` index, the dataset is hash partitioned by the key instead
+        of sorted, which avoids the cost of a sort at build time. Each worker builds
+        an in-memory hash index over its partition, so that point lookups are
+        constant time, and ``multiget()`` sends a single batch of keys to each worker.
 
         Note that the key must be unique in the dataset. If there are duplicate keys,
         an arbitrary value is returned.
@@ -2809,10 +3032,11 @@ class Dataset(Generic[T]):
                 in the cluster by four. As a rule of thumb, you can expect each worker
                 to provide ~3000 records / second via ``get_async()``, and
                 ~10000 records / second via ``multiget()``.
+            index: The type of index to build, either ``"sorted"`` or ``"hash"``.
         """
         if num_workers is None:
             num_workers = 4 * len(ray.nodes())
-        return RandomAccessDataset(self, key, num_workers=num_workers)
+        return RandomAccessDataset(self, key, num_workers=num_workers, index=index)
 
     def repeat(self, times: Optional[int] = None) -> "DatasetPipeline[T]":
         """Convert this into a DatasetPipeline by looping over this dataset.
@@ -3063,6 +3287,30 @@ class Dataset(Generic[T]):
         """Returns a string containing execution timing information."""
         return self._plan.stats().summary_string()
 
+    def export_stats(self, path: str, *, format: str = "json") -> None:
+        """Write detailed execution stats to a file in a machine-readable format.
+
+        In addition to the information in ``stats()``, this includes the start
+        and end time, node, and input and output bytes of each task, and a
+        timeline of the time that the consumer of ``iter_batches()`` spent waiting
+        for blocks versus in user code.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(1000).map(lambda x: x * 2) # doctest: +SKIP
+            >>> for _ in ds.iter_batches(): # doctest: +SKIP
+            ...     pass # doctest: +SKIP
+            >>> ds.export_stats( # doctest: +SKIP
+            ...     "/tmp/trace.json", format="chrome_trace")
+
+        Args:
+            path: The local path of the file to write.
+            format: Either "json" for a nested dict of the stats of each stage, or
+                "chrome_trace" for a list of events that can be loaded in
+                ``chrome://tracing`` or Perfetto.
+        """
+        self._plan.stats().export(path, format)
+
     @DeveloperAPI
     def get_internal_block_refs(self) -> List[ObjectRef[Block]]:
         """Get a list of references to the underlying blocks of this dataset.
@@ -3507,6 +3755,34 @@ def _split_block(
     return b0, m0, b1, m1
 
 
+def _submit_write(
+    datasource: Datasource,
+    ctx: DatasetContext,
+    blocks: List[ObjectRef[Block]],
+    metadata: List[BlockMetadata],
+    ray_remote_args: Dict[str, Any],
+    write_args: Dict[str, Any],
+) -> List[ObjectRef[WriteResult]]:
+    # TODO(ekl) remove this feature flag.
+    if "RAY_DATASET_FORCE_LOCAL_METADATA" in os.environ:
+        return datasource.do_write(
+            blocks, metadata, ray_remote_args=ray_remote_args, **write_args
+        )
+    # Prepare write in a remote task so that in Ray client mode, we
+    # don't do metadata resolution from the client machine.
+    do_write = cached_remote_fn(_do_write, retry_exceptions=False, num_cpus=0)
+    return ray.get(
+        do_write.remote(
+            datasource,
+            ctx,
+            blocks,
+            metadata,
+            ray_remote_args,
+            _wrap_arrow_serialization_workaround(write_args),
+        )
+    )
+
+
 def _do_write(
     ds: Datasource,
     ctx: DatasetContext,
@@ -36,7 +36,14 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Operations that can be naively applied per dataset row in the pipeline.
-_PER_DATASET_OPS = ["map", "map_batches", "add_column", "flat_map", "filter"]
+_PER_DATASET_OPS = [
+    "map",
+    "map_batches",
+    "add_column",
+    "flat_map",
+    "filter",
+    "select_columns",
+]
 
 # Operations that apply to each dataset holistically in the pipeline.
 _HOLISTIC_PER_DATASET_OPS = ["repartition", "random_shuffle", "sort"]
@@ -721,6 +728,19 @@ class DatasetPipeline(Generic[T]):
         """
         return self._stats.summary_string(exclude_first_window)
 
+    def export_stats(self, path: str, *, format: str = "json") -> None:
+        """Write detailed execution stats to a file in a machine-readable format.
+
+        This includes the per-task stats of the most recent windows, and a
+        timeline of the time that the consumer of the pipeline spent waiting for
+        windows and blocks versus in user code. See ``Dataset.export_stats()``.
+
+        Args:
+            path: The local path of the file to write.
+            format: Either "json" or "chrome_trace".
+        """
+        self._stats.export(path, format)
+
     @staticmethod
     def from_iterable(
         iterable: Iterable[Callable[[], Dataset[T]]],
@@ -1,8 +1,22 @@
 import builtins
-from typing import Any, Generic, List, Dict, Callable, Union, Tuple, Iterable
+from typing import (
+    Any,
+    Generic,
+    List,
+    Dict,
+    Callable,
+    Optional,
+    Union,
+    Tuple,
+    Iterable,
+    TYPE_CHECKING,
+)
 
 import numpy as np
 
+if TYPE_CHECKING:
+    import pyarrow
+
 import ray
 from ray.types import ObjectRef
 from ray.data.block import (
@@ -131,6 +145,28 @@ class ReadTask(Callable[[], BlockPartition]):
     def get_metadata(self) -> BlockPartitionMetadata:
         return self._metadata
 
+    def with_pushdown(
+        self,
+        columns: Optional[List[str]],
+        predicate: Optional["pyarrow.dataset.Expression"],
+    ) -> Optional["ReadTask"]:
+        """Return a copy of this read task that only reads the given columns and
+        the rows matching the given predicate.
+
+        This is used by the execution plan optimizer to push column selections
+        and filters down into the datasource. Read tasks that don't support
+        pushdown return None.
+
+        Args:
+            columns: The names of the columns to read, or None to read all columns.
+            predicate: An Arrow expression that the returned rows must match, or
+                None to return all rows.
+
+        Raises:
+            ValueError: If any of the columns is not read by this task.
+        """
+        return None
+
     def __call__(self) -> MaybeBlockPartition:
         context = DatasetContext.get_current()
         result = self._read_fn()
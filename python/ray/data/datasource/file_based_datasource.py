@@ -32,7 +32,7 @@ from ray.data.datasource.file_meta_provider import (
     DefaultFileMetadataProvider,
 )
 from ray.util.annotations import DeveloperAPI
-from ray.data._internal.util import _check_pyarrow_version
+from ray.data._internal.util import _autodetect_parallelism, _check_pyarrow_version
 from ray.data._internal.remote_fn import cached_remote_fn
 
 logger = logging.getLogger(__name__)
@@ -157,7 +157,14 @@ class FileBasedDatasource(Datasource[Union[ArrowRow, Any]]):
         paths, filesystem = _resolve_paths_and_filesystem(paths, filesystem)
         paths, file_sizes = meta_provider.expand_paths(paths, filesystem)
         if partition_filter is not None:
+            path_to_size = dict(zip(paths, file_sizes))
             paths = partition_filter(paths)
+            file_sizes = [path_to_size[p] for p in paths]
+        if parallelism < 0:
+            data_size = None if None in list(file_sizes) else sum(file_sizes)
+            parallelism = _autodetect_parallelism(
+                parallelism, DatasetContext.get_current(), data_size
+            )
 
         read_stream = self._read_stream
 
@@ -209,10 +216,10 @@ class FileBasedDatasource(Datasource[Union[ArrowRow, Any]]):
                 with self._open_input_source(fs, read_path, **open_stream_args) as f:
                     for data in read_stream(f, read_path, **reader_args):
                         output_buffer.add_block(data)
-                        if output_buffer.has_next():
+                        while output_buffer.has_next():
                             yield output_buffer.next()
             output_buffer.finalize()
-            if output_buffer.has_next():
+            while output_buffer.has_next():
                 yield output_buffer.next()
 
         # fix https://github.com/ray-project/ray/issues/24296
@@ -288,6 +295,7 @@ class FileBasedDatasource(Datasource[Union[ArrowRow, Any]]):
         write_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
         _block_udf: Optional[Callable[[Block], Block]] = None,
         ray_remote_args: Dict[str, Any] = None,
+        _block_index_offset: int = 0,
         **write_args,
     ) -> List[ObjectRef[WriteResult]]:
         """Creates and returns write tasks for a file-based datasource."""
@@ -333,7 +341,7 @@ class FileBasedDatasource(Datasource[Union[ArrowRow, Any]]):
                 filesystem=filesystem,
                 dataset_uuid=dataset_uuid,
                 block=block,
-                block_index=block_idx,
+                block_index=_block_index_offset + block_idx,
                 file_format=file_format,
             )
             write_task = write_block.remote(write_path, block)
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
 
 import ray
 from ray.types import ObjectRef
-from ray.data.block import Block
+from ray.data.block import Block, BlockMetadata
 from ray.data.context import DatasetContext
 from ray.data.datasource.datasource import ReadTask
 from ray.data.datasource.file_based_datasource import _resolve_paths_and_filesystem
@@ -21,7 +21,7 @@ from ray.data.datasource.file_meta_provider import (
 from ray.data._internal.output_buffer import BlockOutputBuffer
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
-from ray.data._internal.util import _check_pyarrow_version
+from ray.data._internal.util import _autodetect_parallelism, _check_pyarrow_version
 from ray.util.annotations import PublicAPI
 
 
@@ -101,17 +101,22 @@ class ParquetDatasource(ParquetBaseDatasource):
             paths = paths[0]
 
         dataset_kwargs = reader_args.pop("dataset_kwargs", {})
+        filter_expr = reader_args.pop("filter", None)
         pq_ds = pq.ParquetDataset(
             paths, **dataset_kwargs, filesystem=filesystem, use_legacy_dataset=False
         )
         if schema is None:
             schema = pq_ds.schema
+        dataset_schema = schema
         if columns:
-            schema = pa.schema(
-                [schema.field(column) for column in columns], schema.metadata
-            )
-
-        def read_pieces(serialized_pieces: str) -> Iterator[pa.Table]:
+            schema = _project_schema(schema, columns)
+
+        def read_pieces(
+            serialized_pieces: str,
+            columns: Optional[List[str]],
+            schema: "pyarrow.lib.Schema",
+            filter_expr: Optional["pyarrow.dataset.Expression"],
+        ) -> Iterator[pa.Table]:
             # Implicitly trigger S3 subsystem initialization by importing
             # pyarrow.fs.
             import pyarrow.fs  # noqa: F401
@@ -139,10 +144,14 @@ class ParquetDatasource(ParquetBaseDatasource):
             use_threads = reader_args.pop("use_threads", False)
             for piece in pieces:
                 part = _get_partition_keys(piece.partition_expression)
+                # Filters may reference columns that are not read, so scan with
+                # the full dataset schema in that case. Row groups whose statistics
+                # don't match the filter are skipped by the reader.
                 batches = piece.to_batches(
                     use_threads=use_threads,
                     columns=columns,
-                    schema=schema,
+                    schema=schema if filter_expr is None else dataset_schema,
+                    filter=filter_expr,
                     batch_size=PARQUET_READER_ROW_BATCH_SIZE,
                     **reader_args,
                 )
@@ -150,18 +159,22 @@ class ParquetDatasource(ParquetBaseDatasource):
                     table = pyarrow.Table.from_batches([batch], schema=schema)
                     if part:
                         for col, value in part.items():
+                            idx = table.schema.get_field_index(col)
+                            if idx < 0:
+                                # The partition column was not selected.
+                                continue
                             table = table.set_column(
-                                table.schema.get_field_index(col),
+                                idx,
                                 col,
                                 pa.array([value] * len(table)),
                             )
                     # If the table is empty, drop it.
                     if table.num_rows > 0:
                         output_buffer.add_block(table)
-                        if output_buffer.has_next():
+                        while output_buffer.has_next():
                             yield output_buffer.next()
             output_buffer.finalize()
-            if output_buffer.has_next():
+            while output_buffer.has_next():
                 yield output_buffer.next()
 
         if _block_udf is not None:
@@ -181,6 +194,17 @@ class ParquetDatasource(ParquetBaseDatasource):
             inferred_schema = schema
         read_tasks = []
         metadata = meta_provider.prefetch_file_metadata(pq_ds.pieces) or []
+        if parallelism < 0:
+            data_size = None
+            if metadata and len(metadata) == len(pq_ds.pieces):
+                # The uncompressed size of the row groups.
+                data_size = sum(
+                    sum(m.row_group(i).total_byte_size for i in range(m.num_row_groups))
+                    for m in metadata
+                )
+            parallelism = _autodetect_parallelism(
+                parallelism, DatasetContext.get_current(), data_size
+            )
         try:
             _register_parquet_file_fragment_serialization()
             for pieces, metadata in zip(
@@ -198,7 +222,15 @@ class ParquetDatasource(ParquetBaseDatasource):
                     prefetched_metadata=metadata,
                 )
                 read_tasks.append(
-                    ReadTask(lambda p=serialized_pieces: read_pieces(p), meta)
+                    _ParquetReadTask(
+                        read_pieces,
+                        serialized_pieces,
+                        columns,
+                        schema,
+                        dataset_schema,
+                        filter_expr,
+                        meta,
+                    )
                 )
         finally:
             _deregister_parquet_file_fragment_serialization()
@@ -206,6 +238,82 @@ class ParquetDatasource(ParquetBaseDatasource):
         return read_tasks
 
 
+class _ParquetReadTask(ReadTask):
+    """A Parquet read task that supports column selection and filter pushdown."""
+
+    def __init__(
+        self,
+        read_pieces: Callable[..., Iterator["pyarrow.Table"]],
+        serialized_pieces: str,
+        columns: Optional[List[str]],
+        schema: "pyarrow.lib.Schema",
+        dataset_schema: "pyarrow.lib.Schema",
+        filter_expr: Optional["pyarrow.dataset.Expression"],
+        metadata: BlockMetadata,
+    ):
+        super().__init__(
+            lambda: read_pieces(serialized_pieces, columns, schema, filter_expr),
+            metadata,
+        )
+        self._read_pieces = read_pieces
+        self._serialized_pieces = serialized_pieces
+        self._columns = columns
+        self._schema = schema
+        self._dataset_schema = dataset_schema
+        self._filter_expr = filter_expr
+
+    def with_pushdown(
+        self,
+        columns: Optional[List[str]],
+        predicate: Optional["pyarrow.dataset.Expression"],
+    ) -> "_ParquetReadTask":
+        meta = self.get_metadata()
+        schema = self._schema
+        meta_schema = meta.schema
+        if columns is not None:
+            missing = [c for c in columns if c not in schema.names]
+            if missing:
+                raise ValueError(
+                    f"Cannot select columns {missing}, available columns: "
+                    f"{schema.names}"
+                )
+            schema = _project_schema(schema, columns)
+            if meta_schema is not None:
+                meta_schema = _project_schema(
+                    meta_schema, [c for c in columns if c in meta_schema.names]
+                )
+        else:
+            columns = self._columns
+        filter_expr = self._filter_expr
+        if predicate is not None:
+            filter_expr = predicate if filter_expr is None else filter_expr & predicate
+        metadata = BlockMetadata(
+            # The number of rows is unknown until the filter is applied.
+            num_rows=meta.num_rows if predicate is None else None,
+            size_bytes=meta.size_bytes,
+            schema=meta_schema,
+            input_files=meta.input_files,
+            exec_stats=None,
+        )
+        return _ParquetReadTask(
+            self._read_pieces,
+            self._serialized_pieces,
+            columns,
+            schema,
+            self._dataset_schema,
+            filter_expr,
+            metadata,
+        )
+
+
+def _project_schema(
+    schema: "pyarrow.lib.Schema", columns: List[str]
+) -> "pyarrow.lib.Schema":
+    import pyarrow as pa
+
+    return pa.schema([schema.field(column) for column in columns], schema.metadata)
+
+
 def _fetch_metadata_remotely(
     pieces: List["pyarrow._dataset.ParquetFileFragment"],
 ) -> List[ObjectRef["pyarrow.parquet.FileMetaData"]]:
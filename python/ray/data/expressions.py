@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pyarrow.dataset
+
+
+@PublicAPI(stability="beta")
+def col(name: str) -> "pyarrow.dataset.Expression":
+    """Reference a column of a tabular dataset in an expression.
+
+    The result is an Arrow dataset expression, which can be combined with
+    comparison operators, ``&``, ``|`` and ``~``, and passed to
+    ``Dataset.filter(expr=...)``. Expressions are evaluated with Arrow's
+    vectorized compute kernels, and may be pushed down into datasources that
+    support it (e.g., Parquet).
+
+    Examples:
+        >>> import ray
+        >>> from ray.data.expressions import col
+        >>> ds = ray.data.range_table(100) # doctest: +SKIP
+        >>> ds.filter(expr=(col("value") > 5) & (col("value") < 10)) # doctest: +SKIP
+
+    Args:
+        name: The name of the column.
+
+    Returns:
+        An Arrow expression referencing the column.
+    """
+    import pyarrow.dataset as pads
+
+    return pads.field(name)
@@ -9,6 +9,7 @@ from ray.data._internal.plan import AllToAllStage
 from ray.data._internal.compute import CallableClass, ComputeStrategy
 from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
 from ray.data.block import Block, BlockAccessor, BlockMetadata, T, U, KeyType
+from ray.data.context import DatasetContext
 
 
 class _GroupbyOp(ShuffleOp):
@@ -51,6 +52,39 @@ class SimpleShuffleGroupbyOp(_GroupbyOp, SimpleShufflePlan):
     pass
 
 
+class _HashGroupbyOp(ShuffleOp):
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: KeyFn,
+        aggs: Tuple[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        """Hash partition the block and combine rows with the same key."""
+        stats = BlockExecStats.builder()
+        parts = BlockAccessor.for_block(block).hash_partition_and_combine(
+            key, aggs, output_num_blocks
+        )
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return [meta] + parts
+
+    @staticmethod
+    def reduce(
+        key: KeyFn, aggs: Tuple[AggregateFn], *mapper_outputs: List[Block]
+    ) -> (Block, BlockMetadata):
+        """Aggregate hash partitioned and partially combined blocks."""
+        return BlockAccessor.for_block(
+            mapper_outputs[0]
+        ).aggregate_hash_combined_blocks(list(mapper_outputs), key, aggs)
+
+
+class SimpleShuffleHashGroupbyOp(_HashGroupbyOp, SimpleShufflePlan):
+    pass
+
+
 @PublicAPI
 class GroupedDataset(Generic[T]):
     """Represents a grouped dataset created by calling ``Dataset.groupby()``.
@@ -72,6 +106,12 @@ class GroupedDataset(Generic[T]):
 
         This is a blocking operation.
 
+        By default, this sorts the dataset by key in order to group it. If
+        ``DatasetContext.use_hash_based_aggregation`` is set, rows are instead
+        hash partitioned by key and partially aggregated within each block,
+        which avoids sampling and sorting the dataset. In that case, the output
+        is not sorted by key.
+
         Examples:
             >>> import ray
             >>> from ray.data.aggregate import AggregateFn
@@ -114,6 +154,16 @@ class GroupedDataset(Generic[T]):
             if self._key is None:
                 num_reducers = 1
                 boundaries = []
+            elif DatasetContext.get_current().use_hash_based_aggregation:
+                # Hash partitioning needs no boundaries, so skip sampling.
+                shuffle_op = SimpleShuffleHashGroupbyOp(
+                    map_args=[self._key, aggs], reduce_args=[self._key, aggs]
+                )
+                return shuffle_op.execute(
+                    blocks,
+                    num_reducers,
+                    clear_input_blocks,
+                )
             else:
                 boundaries = sort.sample_boundaries(
                     blocks.get_blocks(),
@@ -8,9 +8,12 @@ from typing import List, Any, Generic, Optional, TYPE_CHECKING
 
 import ray
 from ray.types import ObjectRef
-from ray.data.block import T, BlockAccessor
+from ray.data.block import T, Block, BlockAccessor, BlockExecStats, BlockMetadata
 from ray.data.context import DatasetContext, DEFAULT_SCHEDULING_STRATEGY
+from ray.data._internal.join import _JoinOp, _concat_blocks
 from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.shuffle import SimpleShufflePlan
+from ray.data._internal.util import _hash_partition
 from ray.util.annotations import PublicAPI
 
 if TYPE_CHECKING:
@@ -31,6 +34,7 @@ class RandomAccessDataset(Generic[T]):
         dataset: "Dataset[T]",
         key: str,
         num_workers: int,
+        index: str = "sorted",
     ):
         """Construct a RandomAccessDataset (internal API).
 
@@ -40,8 +44,15 @@ class RandomAccessDataset(Generic[T]):
         self._format = dataset._dataset_format()
         if self._format not in ["arrow", "pandas"]:
             raise ValueError("RandomAccessDataset only supports Arrow-format datasets.")
+        if index not in INDEX_TYPES:
+            raise ValueError(f"The index must be one of {INDEX_TYPES}, got: {index}")
+        self._index = index
 
         start = time.perf_counter()
+        if index == "hash":
+            self._build_hash_index(dataset, key, num_workers)
+            self._build_time = time.perf_counter() - start
+            return
         logger.info("[setup] Indexing dataset by sort key.")
         sorted_ds = dataset.sort(key)
         get_bounds = cached_remote_fn(_get_bounds)
@@ -60,15 +71,10 @@ class RandomAccessDataset(Generic[T]):
                 self._upper_bounds.append(b[1])
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
-        ctx = DatasetContext.get_current()
-        if ctx.scheduling_strategy != DEFAULT_SCHEDULING_STRATEGY:
-            scheduling_strategy = ctx.scheduling_strategy
-        else:
-            scheduling_strategy = "SPREAD"
         self._workers = [
-            _RandomAccessWorker.options(scheduling_strategy=scheduling_strategy).remote(
-                key, self._format
-            )
+            _RandomAccessWorker.options(
+                scheduling_strategy=_get_scheduling_strategy()
+            ).remote(key, self._format)
             for _ in range(num_workers)
         ]
         (
@@ -94,6 +100,35 @@ class RandomAccessDataset(Generic[T]):
         logger.info("[setup] Finished assigning blocks to workers.")
         self._build_time = time.perf_counter() - start
 
+    def _build_hash_index(
+        self, dataset: "Dataset[T]", key: str, num_workers: int
+    ) -> None:
+        schema = dataset.schema(fetch_if_missing=True)
+        if key not in schema.names:
+            raise ValueError(f"The key {key} is not a column of the dataset.")
+
+        logger.info("[setup] Hash partitioning dataset by key.")
+        blocks = dataset._plan.execute()
+        op = _SimpleShuffleHashIndexOp(map_args=[key])
+        partitions, _ = op.execute(blocks, num_workers, clear_input_blocks=False)
+
+        logger.info("[setup] Creating {} hash index workers.".format(num_workers))
+        self._workers = [
+            _HashIndexWorker.options(
+                scheduling_strategy=_get_scheduling_strategy()
+            ).remote(key, self._format)
+            for _ in range(num_workers)
+        ]
+        # Worker i serves partition i, so each worker builds its index from a
+        # single block.
+        ray.get(
+            [
+                w.assign_block.remote(block)
+                for w, block in zip(self._workers, partitions.get_blocks())
+            ]
+        )
+        logger.info("[setup] Finished building hash indexes.")
+
     def _compute_block_to_worker_assignments(self):
         # Return values.
         block_to_workers: dict[int, List["ray.ActorHandle"]] = defaultdict(list)
@@ -134,6 +169,9 @@ class RandomAccessDataset(Generic[T]):
         Returns:
             ObjectRef containing the record (in pydict form), or None if not found.
         """
+        if self._index == "hash":
+            worker_index = _hash_partition([key], len(self._workers))[0]
+            return self._workers[worker_index].get.remote(key)
         block_index = self._find_le(key)
         if block_index is None:
             return ray.put(None)
@@ -148,6 +186,8 @@ class RandomAccessDataset(Generic[T]):
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
+        if self._index == "hash":
+            return self._multiget_hash(keys)
         batches = defaultdict(list)
         for k in keys:
             batches[self._find_le(k)].append(k)
@@ -167,6 +207,56 @@ class RandomAccessDataset(Generic[T]):
                 results[k] = v
         return [results.get(k) for k in keys]
 
+    def _multiget_hash(self, keys: List[Any]) -> List[Optional[T]]:
+        # Send one batch of keys to each worker, and scatter the results back into
+        # the order of the keys.
+        worker_indices = _hash_partition(keys, len(self._workers))
+        order = np.argsort(worker_indices, kind="stable")
+        bounds = np.searchsorted(
+            worker_indices[order], np.arange(len(self._workers) + 1)
+        )
+        futures = []
+        for i, worker in enumerate(self._workers):
+            positions = order[bounds[i] : bounds[i + 1]]
+            if len(positions) > 0:
+                batch = [keys[p] for p in positions]
+                futures.append((positions, worker.multiget.remote(batch)))
+        results = [None] * len(keys)
+        for positions, values in zip(
+            [p for p, _ in futures], ray.get([f for _, f in futures])
+        ):
+            for p, v in zip(positions, values):
+                results[p] = v
+        return results
+
+    def scan_range(self, lower: Any, upper: Any) -> List[T]:
+        """Synchronously find the records with keys in the range [lower, upper).
+
+        This is only supported for the sorted index.
+
+        Args:
+            lower: The inclusive lower bound of the keys to find.
+            upper: The exclusive upper bound of the keys to find.
+
+        Returns:
+            List of found records (in pydict form), sorted by key.
+        """
+        if self._index != "sorted":
+            raise ValueError("Range scans are only supported for the sorted index.")
+        if not self._upper_bounds or not lower < upper:
+            return []
+        # Blocks are sorted and non-overlapping, so the records in range are in
+        # a contiguous run of blocks.
+        first = bisect.bisect_left(self._upper_bounds, lower)
+        last = min(
+            bisect.bisect_left(self._upper_bounds, upper), len(self._upper_bounds) - 1
+        )
+        futures = [
+            self._worker_for(i).scan_range.remote(i, lower, upper)
+            for i in range(first, last + 1)
+        ]
+        return [r for records in ray.get(futures) for r in records]
+
     def stats(self) -> str:
         """Returns a string containing access timing information."""
         stats = ray.get([w.stats.remote() for w in self._workers])
@@ -197,6 +287,92 @@ class RandomAccessDataset(Generic[T]):
         return i
 
 
+# The supported index types.
+INDEX_TYPES = ("sorted", "hash")
+
+
+def _get_scheduling_strategy():
+    ctx = DatasetContext.get_current()
+    if ctx.scheduling_strategy != DEFAULT_SCHEDULING_STRATEGY:
+        return ctx.scheduling_strategy
+    return "SPREAD"
+
+
+class _SimpleShuffleHashIndexOp(_JoinOp, SimpleShufflePlan):
+    """Hash partitions blocks by key, in the same way as hash joins."""
+
+    @staticmethod
+    def reduce(*mapper_outputs: List[Block]) -> (Block, BlockMetadata):
+        stats = BlockExecStats.builder()
+        ret = _concat_blocks(*mapper_outputs)
+        return ret, BlockAccessor.for_block(ret).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+
+
+@ray.remote(num_cpus=0)
+class _HashIndexWorker:
+    """Serves lookups from an in-memory hash index over a single block."""
+
+    def __init__(self, key_field, dataset_format):
+        self.block = None
+        self.index = None
+        self.key_field = key_field
+        self.dataset_format = dataset_format
+        self.num_accesses = 0
+        self.total_time = 0
+
+    def assign_block(self, block: Block):
+        import pandas
+
+        acc = BlockAccessor.for_block(block)
+        if acc.num_rows() == 0:
+            # Empty partitions may not have a schema.
+            self.index = pandas.Index([])
+            return
+        if self.dataset_format == "arrow":
+            block = acc.to_arrow()
+            keys = block[self.key_field].to_pandas()
+        else:
+            block = acc.to_pandas()
+            keys = block[self.key_field]
+        index = pandas.Index(keys)
+        if not index.is_unique:
+            # Keep the first record of each key.
+            unique = ~index.duplicated()
+            block = BlockAccessor.for_block(block).take(np.nonzero(unique)[0])
+            index = index[unique]
+        self.block = block
+        self.index = index
+
+    def get(self, key):
+        return self.multiget([key])[0]
+
+    def multiget(self, keys: List[Any]) -> List[Optional[T]]:
+        start = time.perf_counter()
+        result = [None] * len(keys)
+        if self.block is not None:
+            # Vectorized hash lookup of all keys.
+            positions = self.index.get_indexer(keys)
+            found = np.nonzero(positions >= 0)[0]
+            rows = BlockAccessor.for_block(self.block).take(positions[found])
+            for i, row in zip(found, BlockAccessor.for_block(rows).iter_rows()):
+                result[i] = row
+        self.total_time += time.perf_counter() - start
+        self.num_accesses += 1
+        return result
+
+    def ping(self):
+        return ray.get_runtime_context().node_id.hex()
+
+    def stats(self) -> dict:
+        return {
+            "num_blocks": 1,
+            "num_accesses": self.num_accesses,
+            "total_time": self.total_time,
+        }
+
+
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
     def __init__(self, key_field, dataset_format):
@@ -226,7 +402,10 @@ class _RandomAccessWorker:
             indices = np.searchsorted(col, keys)
             acc = BlockAccessor.for_block(block)
             result = [
-                acc._create_table_row(acc.slice(i, i + 1, copy=True)) for i in indices
+                acc._create_table_row(acc.slice(i, i + 1, copy=True))
+                if i < len(col) and col[i].as_py() == k
+                else None
+                for i, k in zip(indices, keys)
             ]
             # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
         else:
@@ -235,6 +414,19 @@ class _RandomAccessWorker:
         self.num_accesses += 1
         return result
 
+    def scan_range(self, block_index, lower, upper):
+        start = time.perf_counter()
+        block = self.blocks[block_index]
+        column = block[self.key_field]
+        if self.dataset_format == "arrow":
+            column = column.to_numpy()
+        lo, hi = np.searchsorted(column, [lower, upper])
+        rows = BlockAccessor.for_block(block).slice(lo, hi, copy=True)
+        result = list(BlockAccessor.for_block(rows).iter_rows())
+        self.total_time += time.perf_counter() - start
+        self.num_accesses += 1
+        return result
+
     def ping(self):
         return ray.get_runtime_context().node_id.hex()
 
@@ -359,6 +359,109 @@ def test_zip_arrow(ray_start_regular_shared):
     assert result[0] == {"id": 0, "id_1": 0, "id_2": 0}
 
 
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_join(ray_start_regular_shared, broadcast):
+    ds1 = ray.data.range(10, parallelism=3)
+    ds2 = ray.data.range(6, parallelism=2).map(lambda x: x * 2)
+    ds = ds1.join(ds2, broadcast=broadcast)
+    assert sorted(ds.take_all()) == [(0, 0), (2, 2), (4, 4), (6, 6), (8, 8)]
+    ds = ds1.join(ds2, on=lambda x: x % 5, broadcast=broadcast)
+    assert ds.count() == 12
+    ds = ds1.join(ds2, how="left", broadcast=broadcast)
+    assert ds.count() == 10
+    assert sorted(r[0] for r in ds.take_all() if r[1] is None) == [1, 3, 5, 7, 9]
+    if not broadcast:
+        ds = ds1.join(ds2, how="outer")
+        assert sorted(r[1] for r in ds.take_all() if r[0] is None) == [10]
+    with pytest.raises(ValueError):
+        ds1.join(ds2, how="cross")
+    with pytest.raises(ValueError):
+        ds1.join(ds2, how="outer", broadcast=True)
+
+
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_join_tabular(ray_start_regular_shared, broadcast):
+    ds1 = ray.data.from_pandas(
+        pd.DataFrame({"id": [0, 1, 2, 3], "a": [1, 2, 3, 4], "b": [5, 6, 7, 8]})
+    ).repartition(2)
+    ds2 = ray.data.from_items(
+        [{"id": 1, "b": "x"}, {"id": 3, "b": "y"}, {"id": 3, "b": "z"}]
+    ).repartition(3)
+    ds = ds1.join(ds2, on="id", broadcast=broadcast)
+    result = sorted(
+        (r.as_pydict() for r in ds.iter_rows()), key=lambda r: (r["id"], r["b_1"])
+    )
+    assert result == [
+        {"id": 1, "a": 2, "b": 6, "b_1": "x"},
+        {"id": 3, "a": 4, "b": 8, "b_1": "y"},
+        {"id": 3, "a": 4, "b": 8, "b_1": "z"},
+    ]
+    ds = ds1.join(ds2, on=["id"], how="left", broadcast=broadcast)
+    assert ds.count() == 5
+    with pytest.raises(ValueError):
+        ds1.join(ds2, on="missing").count()
+
+
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_join_nullable_int_key(ray_start_regular_shared, broadcast):
+    # The right key column has nulls, so it's read as floats (1.0) while the
+    # left key column is read as ints (1). Equal keys must meet in one partition.
+    ds1 = ray.data.from_items(
+        [{"id": i, "k": i % 2, "a": i} for i in range(20)]
+    ).repartition(4)
+    ds2 = ray.data.from_items(
+        [{"id": i if i % 3 else None, "k": i % 2, "b": i} for i in range(20)]
+    ).repartition(3)
+    ds = ds1.join(ds2, on="id", broadcast=broadcast)
+    result = sorted((r["id"], r["b"]) for r in ds.iter_rows())
+    assert result == [(i, i) for i in range(20) if i % 3]
+    ds = ds1.join(ds2, on=["id", "k"], broadcast=broadcast)
+    result = sorted((r["id"], r["k"], r["b"]) for r in ds.iter_rows())
+    assert result == [(i, i % 2, i) for i in range(20) if i % 3]
+
+
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_join_null_keys(ray_start_regular_shared, broadcast):
+    # Null keys never match each other, as in SQL.
+    ds1 = ray.data.from_items(
+        [{"id": 1, "a": 1}, {"id": None, "a": 2}, {"id": None, "a": 3}]
+    ).repartition(2)
+    ds2 = ray.data.from_items(
+        [{"id": 1, "b": 4}, {"id": None, "b": 5}, {"id": 2, "b": 6}]
+    ).repartition(2)
+    ds = ds1.join(ds2, on="id", broadcast=broadcast)
+    assert [(r["a"], r["b"]) for r in ds.iter_rows()] == [(1, 4)]
+    ds = ds1.join(ds2, on="id", how="left", broadcast=broadcast)
+    result = sorted((r["a"], r["b"]) for r in ds.iter_rows())
+    assert result[0] == (1, 4)
+    assert [a for a, _ in result[1:]] == [2, 3]
+    assert all(pd.isna(b) for _, b in result[1:])
+    if not broadcast:
+        ds = ds1.join(ds2, on="id", how="outer")
+        assert ds.count() == 5
+        assert sorted(r["b"] for r in ds.iter_rows() if pd.isna(r["a"])) == [5, 6]
+
+    ds1 = ray.data.from_items([1, None, 2])
+    ds2 = ray.data.from_items([None, 1])
+    ds = ds1.join(ds2, broadcast=broadcast)
+    assert ds.take_all() == [(1, 1)]
+    if not broadcast:
+        ds = ds1.join(ds2, how="outer")
+        assert sorted(ds.take_all(), key=str) == sorted(
+            [(1, 1), (None, None), (2, None), (None, None)], key=str
+        )
+
+
+def test_join_empty_partition_types(ray_start_regular_shared):
+    # Partitions without left rows have the same column types as the others.
+    ds1 = ray.data.from_pandas(pd.DataFrame({"id": [0], "a": [0.5]}))
+    ds2 = ray.data.from_pandas(pd.DataFrame({"id": list(range(20))})).repartition(5)
+    ds = ds1.join(ds2, on="id", how="outer")
+    assert ds.count() == 20
+    types = {m.schema.field("a").type for m in ds._plan.execute().get_metadata()}
+    assert types == {pa.float64()}
+
+
 def test_batch_tensors(ray_start_regular_shared):
     import torch
 
@@ -1639,6 +1742,40 @@ def test_lazy_loading_iter_batches_exponential_rampup(ray_start_regular_shared):
         assert ds._plan.execute()._num_computed() == expected
 
 
+def test_streaming_executor(ray_start_regular_shared, tmp_path):
+    ctx = DatasetContext.get_current()
+    original = ctx.use_streaming_executor
+    ctx.use_streaming_executor = True
+    try:
+        ds = ray.data.range_table(100, parallelism=10)
+        ds = ds.map_batches(lambda df: df * 2, batch_format="pandas")
+        ds = ds.map(lambda r: {"value": r["value"] + 1}, num_cpus=0.5)
+        # Transformations are only executed on consumption.
+        assert not ds._plan.has_computed_output()
+        expected = [2 * i + 1 for i in range(100)]
+        assert [r["value"] for r in ds.iter_rows()] == expected
+        assert not ds._plan.has_computed_output()
+
+        ds.write_parquet(str(tmp_path))
+        assert len(os.listdir(tmp_path)) == 10
+        assert (
+            sorted(r["value"] for r in ray.data.read_parquet(str(tmp_path)).iter_rows())
+            == expected
+        )
+
+        # Shuffles are executed in bulk before the streamed stages.
+        ds = ray.data.range(100, parallelism=10).random_shuffle().map(lambda x: -x)
+        assert sorted(ds.iter_rows()) == list(range(-99, 1))
+
+        # A tiny memory budget still makes progress.
+        ctx.streaming_object_store_memory_fraction = 0
+        ds = ray.data.range(100, parallelism=10).map(lambda x: x * 2)
+        assert list(ds.iter_rows()) == [2 * i for i in range(100)]
+    finally:
+        ctx.use_streaming_executor = original
+        ctx.streaming_object_store_memory_fraction = 0.25
+
+
 def test_add_column(ray_start_regular_shared):
     ds = ray.data.range(5).add_column("foo", lambda x: 1)
     assert ds.take(1) == [{"value": 0, "foo": 1}]
@@ -1653,6 +1790,43 @@ def test_add_column(ray_start_regular_shared):
         ds = ray.data.range(5).add_column("value", 0)
 
 
+def test_filter_expr(ray_start_regular_shared):
+    from ray.data.expressions import col
+
+    ds = ray.data.range_table(10, parallelism=3)
+    ds = ds.filter(expr=(col("value") > 2) & (col("value") != 5))
+    assert [r["value"] for r in ds.take()] == [3, 4, 6, 7, 8, 9]
+
+    # Pandas blocks.
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    ds = ray.data.from_pandas(df).filter(expr=col("b").isin(["x", "z"]))
+    assert ds.to_pandas().equals(pd.DataFrame({"a": [1, 3], "b": ["x", "z"]}))
+
+    with pytest.raises(ValueError):
+        ray.data.range_table(5).filter()
+    with pytest.raises(ValueError):
+        ray.data.range_table(5).filter(lambda r: True, expr=col("value") > 2)
+    with pytest.raises(ValueError):
+        ray.data.range_table(5).filter(expr="value > 2")
+    with pytest.raises(ValueError):
+        ray.data.range(5).filter(expr=col("value") > 2).take()
+
+
+def test_select_columns(ray_start_regular_shared):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [1.0, 2.0, 3.0]})
+
+    ds = ray.data.from_pandas(df).select_columns(["c", "a"])
+    assert ds.to_pandas().equals(df[["c", "a"]])
+    ds = ray.data.from_arrow(pa.Table.from_pandas(df)).select_columns(["b"])
+    assert ds.schema().names == ["b"]
+    assert ds.take(1) == [{"b": "x"}]
+
+    with pytest.raises(ValueError):
+        ray.data.from_pandas(df).select_columns("a")
+    with pytest.raises(ValueError):
+        ray.data.range(5).select_columns(["value"]).take()
+
+
 def test_map_batch(ray_start_regular_shared, tmp_path):
     # Test input validation
     ds = ray.data.range(5)
@@ -2135,6 +2309,29 @@ def test_groupby_arrow(ray_start_regular_shared):
     assert agg_ds.count() == 0
 
 
+def test_arrow_block_combine_group_boundaries():
+    # Test that runs of equal keys (including nulls) in a sorted, multi-chunk
+    # block are combined into a single group each.
+    from ray.data._internal.arrow_block import ArrowBlockAccessor
+
+    table = pa.Table.from_batches(
+        [
+            pa.RecordBatch.from_pydict({"A": ["a", "a", "b"], "B": [1, 2, 3]}),
+            pa.RecordBatch.from_pydict({"A": ["b", "c", None], "B": [4, 5, 6]}),
+            pa.RecordBatch.from_pydict({"A": pa.array([None], pa.string()), "B": [7]}),
+        ]
+    )
+    combined = ArrowBlockAccessor(table).combine("A", (Count(), Sum("B")))
+    assert combined.to_pydict() == {
+        "A": ["a", "b", "c", None],
+        "count()": [2, 2, 1, 2],
+        "sum(B)": [[3, 1], [7, 1], [5, 1], [13, 1]],
+    }
+    # Global aggregation produces a single row without the key column.
+    combined = ArrowBlockAccessor(table).combine(None, (Count(),))
+    assert combined.to_pydict() == {"count()": [7]}
+
+
 def test_groupby_errors(ray_start_regular_shared):
     ds = ray.data.range(100)
 
@@ -2889,6 +3086,48 @@ def test_groupby_arrow_multi_agg(ray_start_regular_shared, num_parts):
             assert result == expected
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["simple", "arrow", "pandas"])
+def test_groupby_hash_based(ray_start_regular_shared, ds_format, num_parts):
+    ctx = ray.data.context.DatasetContext.get_current()
+    original = ctx.use_hash_based_aggregation
+    ctx.use_hash_based_aggregation = True
+    try:
+        xs = list(range(100))
+        random.shuffle(xs)
+        if ds_format == "simple":
+            ds = ray.data.from_items(xs).repartition(num_parts)
+            agg_ds = ds.groupby(lambda x: x % 3).aggregate(Count(), Sum())
+            assert sorted(agg_ds.take_all()) == [
+                (0, 34, 1683),
+                (1, 33, 1617),
+                (2, 33, 1650),
+            ]
+            assert ds.sum() == 4950
+            return
+        ds = ray.data.from_items([{"A": (x % 3), "B": x} for x in xs]).repartition(
+            num_parts
+        )
+        if ds_format == "pandas":
+            ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pandas")
+        agg_ds = ds.groupby("A").aggregate(Count(), Sum("B"), Std("B"))
+        assert agg_ds.count() == 3
+        agg_df = agg_ds.to_pandas().sort_values("A")
+        expected_grouped = pd.DataFrame({"A": [x % 3 for x in xs], "B": xs}).groupby(
+            "A"
+        )["B"]
+        np.testing.assert_array_equal(agg_df["count()"].to_numpy(), [34, 33, 33])
+        np.testing.assert_array_equal(
+            agg_df["sum(B)"].to_numpy(), expected_grouped.sum().to_numpy()
+        )
+        np.testing.assert_array_almost_equal(
+            agg_df["std(B)"].to_numpy(), expected_grouped.std().to_numpy()
+        )
+        assert ds.sum("B") == 4950
+    finally:
+        ctx.use_hash_based_aggregation = original
+
+
 def test_groupby_simple(ray_start_regular_shared):
     seed = int(time.time())
     print(f"Seeding RNG for test_groupby_simple with: {seed}")
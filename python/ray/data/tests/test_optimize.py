@@ -451,6 +451,131 @@ def test_optimize_lazy_reuse_base_data(
     assert num_reads == num_blocks, num_reads
 
 
+def test_optimize_pushdown_into_parquet_read(ray_start_regular_shared, tmp_path):
+    import pyarrow as pa
+    import pyarrow.compute as pac
+    import pyarrow.dataset as pads
+    import pyarrow.parquet as pq
+
+    from ray.data._internal.lazy_block_list import LazyBlockList
+    from ray.data._internal.plan import OneToOneStage
+
+    for i in range(3):
+        table = pa.table(
+            {"a": list(range(i * 10, (i + 1) * 10)), "b": ["x"] * 10, "c": [1.0] * 10}
+        )
+        pq.write_table(table, os.path.join(tmp_path, f"{i}.parquet"))
+
+    predicate = pads.field("a") >= 25
+    columns = ["a", "b"]
+
+    def block_fn(block):
+        block = block.filter(pac.greater_equal(block["a"], 25))
+        yield block.select(columns)
+
+    def make_ds():
+        ds = ray.data.read_parquet(str(tmp_path))
+        # The first block is read when the dataset is created.
+        assert ds._plan._in_blocks._execution_started
+        stage = OneToOneStage(
+            "select", block_fn, None, {}, projection=columns, predicate=predicate
+        )
+        return ray.data.Dataset(ds._plan.with_stage(stage), ds._epoch, True)
+
+    ds = make_ds()
+    blocks, _, stages = ds._plan._optimize()
+    assert stages == []
+    assert isinstance(blocks, LazyBlockList)
+    assert not blocks._execution_started
+    for task in blocks._tasks:
+        assert task._columns == columns
+        assert task._filter_expr.equals(predicate)
+        assert task.get_metadata().schema.names == columns
+        assert task.get_metadata().num_rows is None
+    assert sorted(r["a"] for r in ds.iter_rows()) == list(range(25, 30))
+    assert ds.schema().names == columns
+
+    # Disable pushdown.
+    context = DatasetContext.get_current()
+    try:
+        context.optimize_pushdown_read_stages = False
+        ds = make_ds()
+        _, _, stages = ds._plan._optimize()
+        _assert_has_stages(stages, ["read->select"])
+        assert sorted(r["a"] for r in ds.iter_rows()) == list(range(25, 30))
+    finally:
+        context.optimize_pushdown_read_stages = True
+
+
+def test_optimize_pushdown_filter_and_select(ray_start_regular_shared, tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from ray.data._internal.plan import _push_down_into_read_stage
+    from ray.data.expressions import col
+
+    for i in range(3):
+        table = pa.table(
+            {"a": list(range(i * 10, (i + 1) * 10)), "b": ["x"] * 10, "c": [1.0] * 10}
+        )
+        pq.write_table(table, os.path.join(tmp_path, f"{i}.parquet"))
+
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .experimental_lazy()
+        .filter(expr=col("a") >= 5)
+        .select_columns(["a", "c"])
+        .filter(expr=col("c") > 0)
+        .map_batches(lambda df: df, batch_format="pandas")
+    )
+
+    # The filters and the column selection are pushed into the read tasks.
+    blocks, stages = _push_down_into_read_stage(
+        ds._plan._in_blocks, ds._plan._stages_after_snapshot
+    )
+    _assert_has_stages(stages, ["map_batches"])
+    for task in blocks._tasks:
+        assert task._columns == ["a", "c"]
+        assert task.get_metadata().schema.names == ["a", "c"]
+    # The read tasks themselves only return the selected columns and the rows
+    # matching the filters.
+    read = pa.concat_tables(
+        [table for task in blocks._tasks for table in task._read_fn()]
+    )
+    assert read.column_names == ["a", "c"]
+    assert sorted(read["a"].to_pylist()) == list(range(5, 30))
+
+    assert sorted(r["a"] for r in ds.iter_rows()) == list(range(5, 30))
+    assert ds.schema().names == ["a", "c"]
+    _assert_has_stages(ds._plan._last_optimized_stages, ["read->map_batches"])
+
+
+@pytest.mark.parametrize("pushdown", [True, False])
+def test_optimize_pushdown_unknown_columns(
+    ray_start_regular_shared, tmp_path, pushdown
+):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table({"a": list(range(10)), "b": ["x"] * 10})
+    pq.write_table(table, os.path.join(tmp_path, "0.parquet"))
+
+    context = DatasetContext.get_current()
+    try:
+        context.optimize_pushdown_read_stages = pushdown
+        ds = ray.data.read_parquet(str(tmp_path)).experimental_lazy()
+        # Selecting a column that isn't in the files fails, with or without
+        # pushing the selection down into the read.
+        with pytest.raises(ValueError):
+            ds.select_columns(["a", "c"]).fully_executed()
+        # So does selecting a column that an earlier selection dropped.
+        with pytest.raises(ValueError):
+            ds.select_columns(["a"]).select_columns(["a", "b"]).fully_executed()
+        assert ds.select_columns(["b"]).schema().names == ["b"]
+    finally:
+        context.optimize_pushdown_read_stages = True
+
+
 if __name__ == "__main__":
     import sys
 
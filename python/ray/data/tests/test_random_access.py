@@ -32,6 +32,56 @@ def test_basic(ray_start_regular_shared, pandas):
     assert results == [None] + [expected(i) for i in range(10)] + [None]
 
 
+@pytest.mark.parametrize("pandas", [False, True])
+def test_hash_index(ray_start_regular_shared, pandas):
+    ds = ray.data.range_table(100, parallelism=10)
+    ds = ds.add_column("embedding", lambda b: b["value"] ** 2)
+    if not pandas:
+        ds = ds.map_batches(lambda df: pyarrow.Table.from_pandas(df))
+
+    rad = ds.to_random_access_dataset("value", num_workers=3, index="hash")
+
+    def expected(i):
+        return {"value": i, "embedding": i ** 2}
+
+    # Test get.
+    assert ray.get(rad.get_async(-1)) is None
+    assert ray.get(rad.get_async(100)) is None
+    for i in range(100):
+        assert ray.get(rad.get_async(i)) == expected(i)
+
+    # Test multiget, which preserves the order of the keys.
+    keys = [-1] + list(range(99, -1, -3)) + [100]
+    results = rad.multiget(keys)
+    assert results == [None] + [expected(i) for i in keys[1:-1]] + [None]
+
+    with pytest.raises(ValueError):
+        rad.scan_range(0, 10)
+
+
+@pytest.mark.parametrize("pandas", [False, True])
+def test_scan_range(ray_start_regular_shared, pandas):
+    ds = ray.data.range_table(100, parallelism=10).random_shuffle()
+    if not pandas:
+        ds = ds.map_batches(lambda df: pyarrow.Table.from_pandas(df))
+    rad = ds.to_random_access_dataset("value", num_workers=2)
+
+    def scan(lower, upper):
+        return [r["value"] for r in rad.scan_range(lower, upper)]
+
+    assert scan(5, 35) == list(range(5, 35))
+    assert scan(-10, 3) == [0, 1, 2]
+    assert scan(95, 200) == list(range(95, 100))
+    assert scan(200, 300) == []
+    assert scan(10, 10) == []
+
+    # Missing keys in the sorted index fast path.
+    ds = ray.data.range_table(10)
+    ds = ds.map_batches(lambda df: pyarrow.Table.from_pandas(df * 2))
+    rad = ds.repartition(1).to_random_access_dataset("value", num_workers=1)
+    assert rad.multiget([1, 2, 3]) == [None, {"value": 2}, None]
+
+
 def test_empty_blocks(ray_start_regular_shared):
     ds = ray.data.range_table(10).repartition(20)
     assert ds.num_blocks() == 20
@@ -48,6 +98,10 @@ def test_errors(ray_start_regular_shared):
     ds = ray.data.range_table(10)
     with pytest.raises(ValueError):
         ds.to_random_access_dataset("invalid")
+    with pytest.raises(ValueError):
+        ds.to_random_access_dataset("invalid", index="hash")
+    with pytest.raises(ValueError):
+        ds.to_random_access_dataset("value", index="btree")
 
 
 def test_stats(ray_start_regular_shared):
@@ -1,6 +1,7 @@
 import pytest
 import os
 import uuid
+from unittest.mock import patch
 
 import ray
 from ray.tests.conftest import *  # noqa
@@ -258,6 +259,98 @@ def test_split_map_batches(ray_start_regular_shared):
     assert 4 < nblocks < 7, nblocks
 
 
+def test_split_oversized_map_batches_output(ray_start_regular_shared):
+    import pandas as pd
+
+    ctx = ray.data.context.DatasetContext.get_current()
+    ctx.target_max_block_size = 2_000_000
+    ctx.block_splitting_enabled = True
+    # A UDF that explodes each batch into a single ~10MB batch.
+    ds = ray.data.range_table(10, parallelism=1).map_batches(
+        lambda df: pd.DataFrame({"value": [LARGE_VALUE] * (100 * len(df))}),
+        batch_size=None,
+    )
+    nrow = ds._block_num_rows()
+    assert 4 < len(nrow) < 8, nrow
+    assert sum(nrow) == 1000, nrow
+
+
+def test_output_buffer_split_oversized_block():
+    from ray.data._internal.output_buffer import BlockOutputBuffer
+
+    output = BlockOutputBuffer(None, 20_000)
+    output.add_block([SMALL_VALUE] * 1000)
+    blocks = []
+    while output.has_next():
+        blocks.append(output.next())
+    output.finalize()
+    while output.has_next():
+        blocks.append(output.next())
+    assert 4 < len(blocks) < 8, [len(b) for b in blocks]
+    assert sum(blocks, []) == [SMALL_VALUE] * 1000
+
+
+def test_autodetect_read_parallelism(ray_start_regular_shared, tmp_path):
+    from ray.data._internal.util import _autodetect_parallelism
+
+    ctx = ray.data.context.DatasetContext.get_current()
+    num_cpus = int(ray.cluster_resources()["CPU"])
+    assert _autodetect_parallelism(7, ctx, 10 ** 12) == 7
+    assert _autodetect_parallelism(-1, ctx, None) == ctx.min_parallelism
+    assert _autodetect_parallelism(-1, ctx, 1000) == 2 * num_cpus
+    data_size = 1000 * ctx.target_max_block_size
+    assert _autodetect_parallelism(-1, ctx, data_size) == max(1000, 2 * num_cpus)
+
+    # Each small file gets its own read task, up to twice the number of CPUs.
+    num_files = 2 * num_cpus + 3
+    for i in range(num_files):
+        ray.data.range(10, parallelism=1).write_csv(os.path.join(tmp_path, str(i)))
+    ds = ray.data.read_csv([os.path.join(tmp_path, str(i)) for i in range(num_files)])
+    assert ds.num_blocks() == 2 * num_cpus
+    assert ds.count() == 10 * num_files
+
+
+def test_read_parallelism_warning(ray_start_regular_shared, tmp_path):
+    from ray.data import read_api
+
+    path = os.path.join(tmp_path, "single")
+    ray.data.range(10, parallelism=1).write_csv(path)
+
+    with patch.object(ray, "available_resources", return_value={"CPU": 8}):
+        # The automatically chosen parallelism is limited by the number of files.
+        with patch.object(read_api.logger, "warning") as warning:
+            ray.data.read_csv(path)
+        assert warning.called
+
+        # The requested parallelism isn't.
+        with patch.object(read_api.logger, "warning") as warning:
+            ray.data.read_csv(path, parallelism=1)
+        assert not warning.called
+
+
+def test_adaptive_target_max_block_size(ray_start_regular_shared):
+    from ray.data.context import (
+        DEFAULT_TARGET_MAX_BLOCK_SIZE,
+        _get_adaptive_target_max_block_size,
+    )
+
+    ctx = ray.data.context.DatasetContext.get_current()
+    ctx.adaptive_block_sizing_enabled = True
+    expected = _get_adaptive_target_max_block_size(ctx.target_min_block_size)
+
+    # The default block size is adapted when the block owner is (re)created.
+    ctx.target_max_block_size = DEFAULT_TARGET_MAX_BLOCK_SIZE
+    ctx.block_owner = None
+    ctx = ray.data.context.DatasetContext.get_current()
+    assert ctx.target_max_block_size == expected
+
+    # A block size set by the user is kept.
+    ctx.target_max_block_size = 3_000_000
+    ctx.block_owner = None
+    ctx = ray.data.context.DatasetContext.get_current()
+    assert ctx.target_max_block_size == 3_000_000
+
+
 if __name__ == "__main__":
     import sys
 
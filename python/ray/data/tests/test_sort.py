@@ -4,6 +4,7 @@ from collections import defaultdict
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pac
 import pytest
 
 import ray
@@ -165,6 +166,117 @@ def test_sort_arrow_with_empty_blocks(ray_start_regular, use_push_based_shuffle)
         ctx.use_push_based_shuffle = original
 
 
+@pytest.mark.parametrize("descending", [False, True])
+def test_merge_sorted_runs(descending):
+    from ray.data._internal import arrow_block
+
+    order = "descending" if descending else "ascending"
+    rng = random.Random(0)
+    blocks = []
+    for _ in range(5):
+        values = [rng.choice([None, float("nan"), *range(20)]) for _ in range(100)]
+        table = pa.table({"a": pa.array(values, type=pa.float64())})
+        blocks.append(table.take(pac.sort_indices(table, [("a", order)])))
+    full = pa.concat_tables(blocks)
+    expected = full.take(pac.sort_indices(full, [("a", order)]))
+
+    original = arrow_block.SORT_MERGE_BATCH_SIZE
+    try:
+        # Merge in many small steps.
+        arrow_block.SORT_MERGE_BATCH_SIZE = 100
+        merged, meta = BlockAccessor.for_block(blocks[0]).merge_sorted_blocks(
+            blocks, [("a", order)], descending
+        )
+    finally:
+        arrow_block.SORT_MERGE_BATCH_SIZE = original
+    assert meta.num_rows == 500
+    assert merged["a"].to_pandas().equals(expected["a"].to_pandas())
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_merge_sorted_runs_multi_key(descending):
+    from ray.data._internal import arrow_block
+
+    order = "descending" if descending else "ascending"
+    # The second key is sorted in the opposite order of the first one.
+    key = [("a", order), ("b", "descending" if order == "ascending" else "ascending")]
+    rng = random.Random(0)
+    blocks = []
+    for _ in range(5):
+        a = [rng.choice([None, float("nan"), *range(3)]) for _ in range(100)]
+        b = [rng.choice([None, *range(20)]) for _ in range(100)]
+        table = pa.table(
+            {"a": pa.array(a, type=pa.float64()), "b": pa.array(b, type=pa.int64())}
+        )
+        blocks.append(table.take(pac.sort_indices(table, key)))
+    full = pa.concat_tables(blocks)
+    expected = full.take(pac.sort_indices(full, key))
+
+    original = arrow_block.SORT_MERGE_BATCH_SIZE
+    try:
+        # Merge in many small steps, so that runs of equal first keys span steps.
+        arrow_block.SORT_MERGE_BATCH_SIZE = 100
+        merged, meta = BlockAccessor.for_block(blocks[0]).merge_sorted_blocks(
+            blocks, key, descending
+        )
+    finally:
+        arrow_block.SORT_MERGE_BATCH_SIZE = original
+    assert meta.num_rows == 500
+    assert merged.to_pandas().equals(expected.to_pandas())
+
+
+@pytest.mark.parametrize("pandas", [False, True])
+def test_sort_spill_to_disk(ray_start_regular, tmp_path, pandas):
+    ctx = ray.data.context.DatasetContext.get_current()
+    original = ctx.sort_spill_dir
+    try:
+        ctx.sort_spill_dir = str(tmp_path)
+        xs = list(range(1000))
+        random.shuffle(xs)
+        ds = ray.data.from_items([{"a": x} for x in xs], parallelism=8)
+        if pandas:
+            ds = ds.map_batches(lambda df: df, batch_format="pandas")
+        assert [r["a"] for r in ds.sort("a").iter_rows()] == list(range(1000))
+        assert [r["a"] for r in ds.sort("a", descending=True).iter_rows()] == list(
+            reversed(range(1000))
+        )
+        # Spilled runs are cleaned up.
+        assert list(tmp_path.iterdir()) == []
+
+        # Simple blocks are merged in memory.
+        assert ray.data.from_items(xs, parallelism=8).sort().take(1000) == list(
+            range(1000)
+        )
+    finally:
+        ctx.sort_spill_dir = original
+
+
+@pytest.mark.parametrize("spill", [False, True])
+def test_sort_splits_output_blocks(ray_start_regular, tmp_path, spill):
+    ctx = ray.data.context.DatasetContext.get_current()
+    original_spill_dir = ctx.sort_spill_dir
+    original_block_size = ctx.target_max_block_size
+    try:
+        ctx.sort_spill_dir = str(tmp_path) if spill else None
+        ctx.target_max_block_size = 1000
+        xs = [x // 10 for x in range(2000)]
+        random.shuffle(xs)
+        ds = ray.data.from_items([{"a": x, "b": 0} for x in xs], parallelism=4)
+        ds = ds.sort("a").fully_executed()
+        # The merged partitions are output as multiple blocks.
+        assert ds.num_blocks() > 4
+        assert [r["a"] for r in ds.iter_rows()] == sorted(xs)
+        # Rows with the same key are never split across blocks.
+        block_keys = [
+            set(BlockAccessor.for_block(ray.get(block)).to_pandas()["a"])
+            for block in ds.get_internal_block_refs()
+        ]
+        assert sum(len(keys) for keys in block_keys) == 200
+    finally:
+        ctx.sort_spill_dir = original_spill_dir
+        ctx.target_max_block_size = original_block_size
+
+
 def test_push_based_shuffle_schedule():
     def _test(num_input_blocks, merge_factor, num_cpus_per_node_map):
         num_cpus = sum(v for v in num_cpus_per_node_map.values())
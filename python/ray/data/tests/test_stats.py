@@ -1,3 +1,4 @@
+import json
 import pytest
 import re
 
@@ -307,6 +308,65 @@ DatasetPipeline iterator time breakdown:
     )
 
 
+def test_dataset_stats_export(ray_start_regular_shared, tmp_path):
+    context = DatasetContext.get_current()
+    context.optimize_fuse_stages = True
+    ds = ray.data.range(1000, parallelism=10)
+    ds = ds.map_batches(lambda x: x)
+    ds = ds.map(lambda x: x)
+    for batch in ds.iter_batches():
+        pass
+
+    path = str(tmp_path / "stats.json")
+    ds.export_stats(path)
+    with open(path) as f:
+        stats = json.load(f)
+    assert [s["name"] for s in stats["stages"]] == ["map"]
+    tasks = stats["stages"][0]["tasks"]
+    assert len(tasks) == 10
+    for task in tasks:
+        assert task["num_rows"] == 100
+        assert task["input_size_bytes"] > 0
+        assert task["start_time_s"] <= task["end_time_s"]
+        assert task["scheduling_delay_s"] >= 0
+    parent = stats["parents"][0]
+    assert [s["name"] for s in parent["stages"]] == ["read->map_batches"]
+    iter_stats = stats["iter"]
+    assert iter_stats["blocked_s"] <= iter_stats["total_s"]
+    assert {e["name"] for e in iter_stats["events"]} >= {"wait", "get", "total"}
+
+    path = str(tmp_path / "trace.json")
+    ds.export_stats(path, format="chrome_trace")
+    with open(path) as f:
+        events = json.load(f)
+    tasks = [e for e in events if e["cat"] == "task"]
+    assert len(tasks) == 20
+    assert {e["name"] for e in tasks} == {"map", "read->map_batches"}
+    assert all(e["ph"] == "X" and e["pid"].startswith("Node ") for e in tasks)
+    assert any(e["cat"] == "iter" for e in events)
+
+    with pytest.raises(ValueError):
+        ds.export_stats(path, format="csv")
+
+
+def test_dataset_pipeline_stats_export(ray_start_regular_shared, tmp_path):
+    pipe = ray.data.range(1000, parallelism=10).repeat(2).map(lambda x: x)
+    for batch in pipe.iter_batches():
+        pass
+
+    path = str(tmp_path / "stats.json")
+    pipe.export_stats(path)
+    with open(path) as f:
+        stats = json.load(f)
+    assert [w["window"] for w in stats["windows"]] == [0, 1]
+    assert "ds_wait_s" in stats["iter"]
+
+    pipe.export_stats(path, format="chrome_trace")
+    with open(path) as f:
+        events = json.load(f)
+    assert {e["args"]["window"] for e in events if e["cat"] == "task"} == {0, 1}
+
+
 if __name__ == "__main__":
     import sys
 
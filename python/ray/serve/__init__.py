@@ -10,6 +10,7 @@ try:
         run,
     )
     from ray.serve.batching import batch
+    from ray.serve.multiplex import get_multiplexed_model_id, multiplexed
     from ray.serve.config import HTTPOptions
 except ModuleNotFoundError as e:
     e.msg += (
@@ -26,6 +27,8 @@ ray.worker.blocking_get_inside_async_warned = True
 
 __all__ = [
     "batch",
+    "multiplexed",
+    "get_multiplexed_model_id",
     "start",
     "HTTPOptions",
     "get_replica_context",
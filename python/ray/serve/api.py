@@ -366,6 +366,8 @@ def deployment(
     _graceful_shutdown_timeout_s: Optional[float] = None,
     _health_check_period_s: Optional[float] = None,
     _health_check_timeout_s: Optional[float] = None,
+    _replica_selection_policy: Optional[str] = None,
+    _max_queued_requests: Optional[int] = None,
 ) -> Callable[[Callable], Deployment]:
     pass
 
@@ -388,6 +390,8 @@ def deployment(
     _graceful_shutdown_timeout_s: Optional[float] = None,
     _health_check_period_s: Optional[float] = None,
     _health_check_timeout_s: Optional[float] = None,
+    _replica_selection_policy: Optional[str] = None,
+    _max_queued_requests: Optional[int] = None,
 ) -> Callable[[Callable], Deployment]:
     """Define a Serve deployment.
 
@@ -468,6 +472,8 @@ def deployment(
         graceful_shutdown_timeout_s=_graceful_shutdown_timeout_s,
         health_check_period_s=_health_check_period_s,
         health_check_timeout_s=_health_check_timeout_s,
+        replica_selection_policy=_replica_selection_policy,
+        max_queued_requests=_max_queued_requests,
     )
 
     def decorator(_func_or_class):
@@ -1,15 +1,15 @@
 import threading
-import bisect
-from collections import defaultdict
+from array import array
+from collections import deque
 import logging
 from threading import Event
 from typing import Type
 import time
-from typing import Callable, DefaultDict, Dict, List, Optional
+from typing import Callable, Deque, Dict, List, Optional
 from dataclasses import dataclass, field
 
 import ray
-from ray.serve.constants import SERVE_LOGGER_NAME
+from ray.serve.constants import METRICS_STORE_MAX_POINTS_PER_KEY, SERVE_LOGGER_NAME
 
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
@@ -91,11 +91,162 @@ class TimeStampedValue:
     value: float = field(compare=False)
 
 
+class _TimeSeries:
+    """The data points of a single metric, in a ring buffer sorted by time.
+
+    The buffer is backed by arrays that grow up to `max_points`, after which
+    the oldest data point is dropped for each new one. A running sum of the
+    values and a monotonic queue of the max candidates are kept up to date as
+    data points are added and dropped, so that the average and max over a
+    window that moves forward cost amortized O(1) per data point.
+    """
+
+    def __init__(self, max_points: int):
+        self._max_points = max_points
+        capacity = min(16, max_points)
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        # Physical index of the oldest data point.
+        self._start = 0
+        self._size = 0
+        # Data points are also numbered in the order they are kept in, from the
+        # first one that was added. _offset is the number of the oldest one.
+        self._offset = 0
+        self._sum = 0.0
+        # Numbers of the data points that are larger than all the data points
+        # after them, so the first one is the number of the max.
+        self._max_candidates: Deque[int] = deque()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _index(self, i: int) -> int:
+        """Physical index of the i-th oldest data point."""
+        return (self._start + i) % len(self._values)
+
+    def _grow(self) -> None:
+        capacity = min(2 * len(self._values), self._max_points)
+        timestamps = array("d", bytes(8 * capacity))
+        values = array("d", bytes(8 * capacity))
+        for i in range(self._size):
+            j = self._index(i)
+            timestamps[i] = self._timestamps[j]
+            values[i] = self._values[j]
+        self._timestamps, self._values = timestamps, values
+        self._start = 0
+
+    def _push_max_candidate(self, i: int) -> None:
+        value = self._values[self._index(i)]
+        while (
+            self._max_candidates
+            and self._values[self._index(self._max_candidates[-1] - self._offset)]
+            <= value
+        ):
+            self._max_candidates.pop()
+        self._max_candidates.append(self._offset + i)
+
+    def add(self, timestamp: float, value: float) -> None:
+        if self._size == len(self._values):
+            if len(self._values) < self._max_points:
+                self._grow()
+            elif timestamp < self._timestamps[self._start]:
+                # The data point would be dropped right away.
+                return
+            else:
+                self._pop_oldest()
+
+        # Data points usually arrive in order, but may be inserted a few places
+        # from the end if their senders' clocks differ.
+        i = self._size
+        while i > 0 and self._timestamps[self._index(i - 1)] > timestamp:
+            j, k = self._index(i), self._index(i - 1)
+            self._timestamps[j] = self._timestamps[k]
+            self._values[j] = self._values[k]
+            i -= 1
+        j = self._index(i)
+        self._timestamps[j] = timestamp
+        self._values[j] = value
+        self._size += 1
+        self._sum += value
+
+        if i == self._size - 1:
+            self._push_max_candidate(i)
+        else:
+            # The numbers of the data points after this one shifted.
+            self._max_candidates.clear()
+            for i in range(self._size):
+                self._push_max_candidate(i)
+
+    def _pop_oldest(self) -> None:
+        self._sum -= self._values[self._start]
+        self._start = self._index(1)
+        self._size -= 1
+        self._offset += 1
+        if self._max_candidates and self._max_candidates[0] < self._offset:
+            self._max_candidates.popleft()
+        if self._size == 0:
+            # Don't let floating point errors build up.
+            self._sum = 0.0
+
+    def compact(self, window_start_timestamp_s: float) -> None:
+        """Drop the data points on or before window_start_timestamp_s."""
+        while (
+            self._size > 0 and self._timestamps[self._start] <= window_start_timestamp_s
+        ):
+            self._pop_oldest()
+
+    def _window_start_index(self, window_start_timestamp_s: float) -> int:
+        """Index of the first data point after window_start_timestamp_s."""
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamps[self._index(mid)] <= window_start_timestamp_s:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def average(self, window_start_timestamp_s: float) -> Optional[float]:
+        start = self._window_start_index(window_start_timestamp_s)
+        if start == self._size:
+            return None
+        if start == 0:
+            return self._sum / self._size
+        # The window usually starts close to the oldest data point, so
+        # subtract the data points before it from the running sum.
+        window_sum = self._sum - sum(self._values[self._index(i)] for i in range(start))
+        return window_sum / (self._size - start)
+
+    def max(self, window_start_timestamp_s: float) -> Optional[float]:
+        start = self._offset + self._window_start_index(window_start_timestamp_s)
+        for candidate in self._max_candidates:
+            if candidate >= start:
+                return self._values[self._index(candidate - self._offset)]
+        return None
+
+    def points(self) -> List[TimeStampedValue]:
+        return [
+            TimeStampedValue(self._timestamps[j], self._values[j])
+            for j in map(self._index, range(self._size))
+        ]
+
+
 class InMemoryMetricsStore:
-    """A very simple, in memory time series database"""
+    """A simple, in memory time series database.
 
-    def __init__(self):
-        self.data: DefaultDict[str, List[TimeStampedValue]] = defaultdict(list)
+    Each metric is kept in a bounded ring buffer, so that adding data points
+    and querying windows that move forward, as the autoscaler does each
+    control loop iteration, don't slow down with the number of data points.
+    """
+
+    def __init__(self, max_points_per_key: int = METRICS_STORE_MAX_POINTS_PER_KEY):
+        self._max_points_per_key = max_points_per_key
+        self._series: Dict[str, _TimeSeries] = dict()
+
+    @property
+    def data(self) -> Dict[str, List[TimeStampedValue]]:
+        """All data points of each metric, from the oldest to the newest."""
+        return {key: series.points() for key, series in self._series.items()}
 
     def add_metrics_point(self, data_points: Dict[str, float], timestamp: float):
         """Push new data points to the store.
@@ -108,21 +259,11 @@ class InMemoryMetricsStore:
               collected at.
         """
         for name, value in data_points.items():
-            # Using in-sort to insert while maintaining sorted ordering.
-            bisect.insort(a=self.data[name], x=TimeStampedValue(timestamp, value))
-
-    def _get_datapoints(self, key: str, window_start_timestamp_s: float) -> List[float]:
-        """Get all data points given key after window_start_timestamp_s"""
-
-        datapoints = self.data[key]
-
-        idx = bisect.bisect(
-            a=datapoints,
-            x=TimeStampedValue(
-                timestamp=window_start_timestamp_s, value=0  # dummy value
-            ),
-        )
-        return datapoints[idx:]
+            series = self._series.get(name)
+            if series is None:
+                series = _TimeSeries(self._max_points_per_key)
+                self._series[name] = series
+            series.add(timestamp, value)
 
     def window_average(
         self, key: str, window_start_timestamp_s: float, do_compact: bool = True
@@ -141,16 +282,16 @@ class InMemoryMetricsStore:
             The average of all the datapoints for the key on and after time
             window_start_timestamp_s, or None if there are no such points.
         """
-        points_after_idx = self._get_datapoints(key, window_start_timestamp_s)
-
+        series = self._series.get(key)
+        if series is None:
+            return None
         if do_compact:
-            self.data[key] = points_after_idx
-
-        if len(points_after_idx) == 0:
-            return
-        return sum(point.value for point in points_after_idx) / len(points_after_idx)
+            series.compact(window_start_timestamp_s)
+        return series.average(window_start_timestamp_s)
 
-    def max(self, key: str, window_start_timestamp_s: float):
+    def max(
+        self, key: str, window_start_timestamp_s: float, do_compact: bool = True
+    ) -> Optional[float]:
         """Perform a max operation for metric `key`.
 
         Args:
@@ -158,10 +299,16 @@ class InMemoryMetricsStore:
             window_start_timestamp_s(float): the unix epoch timestamp for the
               start of the window. The computed average will use all datapoints
               from this timestamp until now.
+            do_compact(bool): whether or not to delete the datapoints that's
+              before `window_start_timestamp_s` to save memory. Default is
+              true.
         Returns:
             Max value of the data points for the key on and after time
             window_start_timestamp_s, or None if there are no such points.
         """
-        points_after_idx = self._get_datapoints(key, window_start_timestamp_s)
-
-        return max((point.value for point in points_after_idx), default=None)
+        series = self._series.get(key)
+        if series is None:
+            return None
+        if do_compact:
+            series.compact(window_start_timestamp_s)
+        return series.max(window_start_timestamp_s)
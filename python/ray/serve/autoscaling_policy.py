@@ -4,7 +4,7 @@ import math
 from ray.serve.config import AutoscalingConfig
 from ray.serve.constants import CONTROL_LOOP_PERIOD_S
 
-from typing import List
+from typing import List, Optional
 
 
 def calculate_desired_num_replicas(
@@ -124,6 +124,11 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
         # scale_up_periods or scale_down_periods.
         self.decision_counter = 0
 
+    def _get_desired_num_replicas(
+        self, current_num_ongoing_requests: List[float]
+    ) -> int:
+        return calculate_desired_num_replicas(self.config, current_num_ongoing_requests)
+
     def get_decision_num_replicas(
         self,
         curr_target_num_replicas: int,
@@ -139,8 +144,8 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
 
         decision_num_replicas = curr_target_num_replicas
 
-        desired_num_replicas = calculate_desired_num_replicas(
-            self.config, current_num_ongoing_requests
+        desired_num_replicas = self._get_desired_num_replicas(
+            current_num_ongoing_requests
         )
         # Scale up.
         if desired_num_replicas > curr_target_num_replicas:
@@ -176,3 +181,62 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
             self.decision_counter = 0
 
         return decision_num_replicas
+
+
+class PredictiveAutoscalingPolicy(BasicAutoscalingPolicy):
+    """An autoscaling policy that scales up ahead of load ramps.
+
+    The total number of ongoing requests is smoothed with Holt's linear
+    exponential smoothing, which tracks both its level and its trend. While
+    the load is rising, the number of replicas is based on the load forecast
+    `forecast_horizon_s` seconds ahead instead of the current load, so that
+    new replicas are started before the existing ones are overloaded. The
+    policy never scales down based on a forecast, and otherwise behaves like
+    `BasicAutoscalingPolicy`.
+    """
+
+    def __init__(
+        self,
+        config: AutoscalingConfig,
+        level_smoothing_factor: float = 0.5,
+        trend_smoothing_factor: float = 0.1,
+    ):
+        super().__init__(config)
+        self.level_smoothing_factor = level_smoothing_factor
+        self.trend_smoothing_factor = trend_smoothing_factor
+        # The smoothed total number of ongoing requests, and its trend in
+        # requests per second.
+        self.level: Optional[float] = None
+        self.trend = 0.0
+
+    def _update_forecast(self, total_num_ongoing_requests: float) -> float:
+        """Update the smoothed load and return the forecast load."""
+        if self.level is None:
+            self.level = total_num_ongoing_requests
+        else:
+            prev_level = self.level
+            self.level = self.level_smoothing_factor * total_num_ongoing_requests + (
+                1 - self.level_smoothing_factor
+            ) * (prev_level + self.trend * self.loop_period_s)
+            self.trend = (
+                self.trend_smoothing_factor
+                * ((self.level - prev_level) / self.loop_period_s)
+                + (1 - self.trend_smoothing_factor) * self.trend
+            )
+        return self.level + self.trend * self.config.forecast_horizon_s
+
+    def _get_desired_num_replicas(
+        self, current_num_ongoing_requests: List[float]
+    ) -> int:
+        total_num_ongoing_requests = sum(current_num_ongoing_requests)
+        forecast = self._update_forecast(total_num_ongoing_requests)
+        if forecast > total_num_ongoing_requests:
+            num_replicas = len(current_num_ongoing_requests)
+            current_num_ongoing_requests = [forecast / num_replicas] * num_replicas
+        return calculate_desired_num_replicas(self.config, current_num_ongoing_requests)
+
+
+AUTOSCALING_POLICY_CLASSES = {
+    "basic": BasicAutoscalingPolicy,
+    "predictive": PredictiveAutoscalingPolicy,
+}
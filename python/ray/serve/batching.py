@@ -1,13 +1,33 @@
 import asyncio
+import bisect
+import collections
 from functools import wraps
 from inspect import iscoroutinefunction
 import time
-from typing import Any, Callable, Dict, List, Optional, overload, Tuple, TypeVar
-from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    overload,
+    Tuple,
+    TypeVar,
+)
+from dataclasses import dataclass, field
 
 
 from ray._private.signature import extract_signature, flatten_args, recover_args
+from ray.serve.constants import (
+    ADAPTIVE_BATCH_LATENCY_WINDOW,
+    ADAPTIVE_BATCH_MIN_SAMPLES,
+    DEFAULT_BATCH_SIZE_BUCKETS,
+    DEFAULT_LATENCY_BUCKET_MS,
+)
+from ray.serve.context import get_internal_replica_context
 from ray.serve.exceptions import RayServeException
+from ray.util import metrics
 
 
 @dataclass
@@ -15,6 +35,7 @@ class SingleRequest:
     self_arg: Optional[Any]
     flattened_args: List[Any]
     future: asyncio.Future
+    enqueue_time: float = field(default_factory=time.time)
 
 
 def _batch_args_kwargs(
@@ -42,12 +63,103 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchSizer:
+    """Chooses the batch size and wait timeout of a batch queue adaptively.
+
+    The latency of the batch handler is measured per batch size bucket (powers
+    of two up to max_batch_size). The batch size is set to the bucket with the
+    highest throughput (items per second of handler time) among the buckets
+    whose p99 latency is within the target latency, and the timeout is set to
+    the latency budget that this leaves for waiting, up to max_timeout_s.
+
+    Once the largest measured bucket is chosen, the next larger bucket is tried
+    out if its latency, extrapolated from the measured buckets, would still
+    meet the target.
+    """
+
+    def __init__(
+        self, max_batch_size: int, max_timeout_s: float, target_latency_s: float
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_timeout_s = max_timeout_s
+        self.target_latency_s = target_latency_s
+        self._buckets = sorted(
+            {min(2 ** i, max_batch_size) for i in range(max_batch_size.bit_length())}
+            | {max_batch_size}
+        )
+        # (batch size, handler latency) of the most recent batches per bucket.
+        self._samples: Dict[int, Deque[Tuple[int, float]]] = {
+            bucket: collections.deque(maxlen=ADAPTIVE_BATCH_LATENCY_WINDOW)
+            for bucket in self._buckets
+        }
+        # Start with unbatched requests until the handler latency is known.
+        self.batch_size = 1
+        self.timeout_s = 0.0
+
+    def record(self, batch_size: int, latency_s: float) -> None:
+        """Record the handler latency of a batch and update the batch size."""
+        bucket = self._buckets[bisect.bisect_left(self._buckets, batch_size)]
+        self._samples[bucket].append((batch_size, latency_s))
+        self._update()
+
+    def _p99_latency_s(self, bucket: int) -> Optional[float]:
+        samples = self._samples[bucket]
+        if len(samples) < ADAPTIVE_BATCH_MIN_SAMPLES:
+            return None
+        latencies = sorted(latency for _, latency in samples)
+        return latencies[int(0.99 * (len(latencies) - 1))]
+
+    def _throughput(self, bucket: int) -> float:
+        samples = self._samples[bucket]
+        total_latency_s = sum(latency for _, latency in samples)
+        return sum(size for size, _ in samples) / max(total_latency_s, 1e-9)
+
+    def _extrapolate_latency_s(self, i: int) -> float:
+        """Estimate the p99 latency of bucket i from the smaller buckets."""
+        bucket, prev = self._buckets[i], self._buckets[i - 1]
+        prev_latency_s = self._p99_latency_s(prev)
+        if i > 1 and self._p99_latency_s(self._buckets[i - 2]) is not None:
+            # Fit a line through the two largest measured buckets, to account
+            # for the fixed per batch overhead.
+            prev2 = self._buckets[i - 2]
+            slope = (prev_latency_s - self._p99_latency_s(prev2)) / (prev - prev2)
+            return prev_latency_s + max(slope, 0.0) * (bucket - prev)
+        return prev_latency_s * bucket / prev
+
+    def _update(self) -> None:
+        best = self._buckets[0]
+        best_throughput = 0.0
+        best_latency_s = self._p99_latency_s(best) or 0.0
+        for i, bucket in enumerate(self._buckets):
+            latency_s = self._p99_latency_s(bucket)
+            if latency_s is None:
+                if i > 0 and best == self._buckets[i - 1]:
+                    # Try out this bucket if the largest measured one has
+                    # enough latency headroom.
+                    estimate_s = self._extrapolate_latency_s(i)
+                    if estimate_s <= self.target_latency_s:
+                        best, best_latency_s = bucket, estimate_s
+                break
+            if latency_s > self.target_latency_s:
+                # Larger batches won't be any faster.
+                break
+            throughput = self._throughput(bucket)
+            if throughput >= best_throughput:
+                best, best_throughput, best_latency_s = bucket, throughput, latency_s
+
+        self.batch_size = best
+        self.timeout_s = min(
+            self.max_timeout_s, max(0.0, self.target_latency_s - best_latency_s)
+        )
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        target_latency_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -64,12 +176,49 @@ class _BatchQueue:
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            target_latency_s: if provided, the batch size and timeout are
+                adapted to the measured latency of handle_batch_func, so that
+                throughput is maximized while keeping the p99 latency of
+                requests within this target. max_batch_size and timeout_s are
+                then the upper bounds of the batch size and timeout.
         """
         self.queue: asyncio.Queue[SingleRequest] = asyncio.Queue()
         self.full_batch_event = asyncio.Event()
         self.max_batch_size = max_batch_size
         self.timeout_s = timeout_s
 
+        self._sizer = None
+        if target_latency_s is not None:
+            self._sizer = _AdaptiveBatchSizer(
+                max_batch_size, timeout_s, target_latency_s
+            )
+            self.max_batch_size = self._sizer.batch_size
+            self.timeout_s = self._sizer.timeout_s
+
+        context = get_internal_replica_context()
+        default_tags = {
+            "deployment": context.deployment if context else "",
+            "replica": context.replica_tag if context else "",
+            "function": getattr(handle_batch_func, "__name__", ""),
+        }
+        self.batch_size_tracker = metrics.Histogram(
+            "serve_batch_size",
+            description="The number of requests in batches executed by @serve.batch.",
+            boundaries=DEFAULT_BATCH_SIZE_BUCKETS,
+            tag_keys=("deployment", "replica", "function"),
+        )
+        self.batch_size_tracker.set_default_tags(default_tags)
+        self.queue_wait_tracker = metrics.Histogram(
+            "serve_batch_queue_wait_ms",
+            description=(
+                "The time requests to @serve.batch wait in the queue before "
+                "their batch is executed."
+            ),
+            boundaries=DEFAULT_LATENCY_BUCKET_MS,
+            tag_keys=("deployment", "replica", "function"),
+        )
+        self.queue_wait_tracker.set_default_tags(default_tags)
+
         self._handle_batch_task = None
         if handle_batch_func is not None:
             self._handle_batch_task = asyncio.get_event_loop().create_task(
@@ -80,7 +229,7 @@ class _BatchQueue:
         self.queue.put_nowait(request)
         # Signal when the full batch is ready. The event will be reset
         # in wait_for_batch.
-        if self.queue.qsize() == self.max_batch_size:
+        if self.queue.qsize() >= self.max_batch_size:
             self.full_batch_event.set()
 
     async def wait_for_batch(self) -> List[Any]:
@@ -135,6 +284,11 @@ class _BatchQueue:
             args, kwargs = _batch_args_kwargs([item.flattened_args for item in batch])
             futures = [item.future for item in batch]
 
+            start_time = time.time()
+            self.batch_size_tracker.observe(len(batch))
+            for item in batch:
+                self.queue_wait_tracker.observe(1000 * (start_time - item.enqueue_time))
+
             try:
                 # Method call.
                 if self_arg is not None:
@@ -155,6 +309,11 @@ class _BatchQueue:
             except Exception as e:
                 for future in futures:
                     future.set_exception(e)
+            else:
+                if self._sizer is not None:
+                    self._sizer.record(len(batch), time.time() - start_time)
+                    self.max_batch_size = self._sizer.batch_size
+                    self.timeout_s = self._sizer.timeout_s
 
     def __del__(self):
         if self._handle_batch_task is None or not asyncio.get_event_loop().is_running():
@@ -205,12 +364,16 @@ def batch(func: F) -> G:
 # "Decorator factory" use case (called with arguments).
 @overload
 def batch(
-    max_batch_size: Optional[int] = 10, batch_wait_timeout_s: Optional[float] = 0.0
+    max_batch_size: Optional[int] = 10,
+    batch_wait_timeout_s: Optional[float] = 0.0,
+    target_latency_s: Optional[float] = None,
 ) -> Callable[[F], G]:
     pass
 
 
-def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
+def batch(
+    _func=None, max_batch_size=10, batch_wait_timeout_s=0.0, target_latency_s=None
+):
     """Converts a function to asynchronously handle batches.
 
     The function can be a standalone function or a class method. In both
@@ -236,6 +399,12 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the underlying function.
+        target_latency_s: if set, the batch size and wait timeout are chosen
+            adaptively instead: the latency of the underlying function is
+            measured per batch size, and the batch size and timeout that
+            maximize throughput while keeping the p99 latency of requests
+            within this target are used. `max_batch_size` and
+            `batch_wait_timeout_s` are then upper bounds.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -263,6 +432,13 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
     if batch_wait_timeout_s < 0:
         raise ValueError("batch_wait_timeout_s must be a float >= 0")
 
+    if target_latency_s is not None:
+        if not isinstance(target_latency_s, (float, int)):
+            raise TypeError("target_latency_s must be a float > 0")
+
+        if target_latency_s <= 0:
+            raise ValueError("target_latency_s must be a float > 0")
+
     def _batch_decorator(_func):
         @wraps(_func)
         async def batch_wrapper(*args, **kwargs):
@@ -285,7 +461,9 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
             # runs, we just get a reference to the attribute.
             batch_queue_attr = f"__serve_batch_queue_{_func.__name__}"
             if not hasattr(batch_queue_object, batch_queue_attr):
-                batch_queue = _BatchQueue(max_batch_size, batch_wait_timeout_s, _func)
+                batch_queue = _BatchQueue(
+                    max_batch_size, batch_wait_timeout_s, _func, target_latency_s
+                )
                 setattr(batch_queue_object, batch_queue_attr, batch_queue)
             else:
                 batch_queue = getattr(batch_queue_object, batch_queue_attr)
@@ -0,0 +1,75 @@
+# A benchmark for assigning queries to replicas in the router, without the
+# controller, proxy or handles in the way.
+#
+# A ReplicaSet is set up with no-op replica actors, and many more queries are
+# submitted than the replicas accept, so that most of them wait in the router
+# for a free replica. As max_concurrent_queries grows, the number of in-flight
+# queries tracked by the router grows with it. Since in-flight queries are
+# tracked by counters that are updated on query completion, the assignment
+# throughput should stay flat instead of degrading with the number of
+# in-flight queries.
+#
+# Output format:
+# 4 replicas, 1 max concurrent queries: <N> assignments/s
+
+import asyncio
+import pickle
+import time
+
+import ray
+from ray.serve.common import RunningReplicaInfo
+from ray.serve.router import Query, ReplicaSet, RequestMetadata
+
+num_replicas = 4
+num_queries = 10000
+
+ray.init(address="auto")
+
+
+@ray.remote(num_cpus=0)
+class NoopReplica:
+    @ray.method(num_returns=2)
+    async def handle_request(self, request_metadata: bytes, *args, **kwargs):
+        pickle.loads(request_metadata)
+        return b"", b"Hello World"
+
+
+async def run_test(replicas, max_concurrent_queries):
+    replica_set = ReplicaSet("benchmark", asyncio.get_event_loop())
+    replica_set.update_running_replicas(
+        [
+            RunningReplicaInfo(
+                deployment_name="benchmark",
+                replica_tag=str(i),
+                actor_handle=replica,
+                max_concurrent_queries=max_concurrent_queries,
+            )
+            for i, replica in enumerate(replicas)
+        ]
+    )
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+
+    # warmup
+    await asyncio.gather(*[replica_set.assign_replica(query) for _ in range(100)])
+
+    # real test
+    start = time.time()
+    refs = await asyncio.gather(
+        *[replica_set.assign_replica(query) for _ in range(num_queries)]
+    )
+    qps = num_queries / (time.time() - start)
+    await asyncio.gather(*refs)
+
+    print(
+        f"{len(replicas)} replicas, {max_concurrent_queries} max concurrent "
+        f"queries: {int(qps)} assignments/s"
+    )
+
+
+async def main():
+    replicas = [NoopReplica.remote() for _ in range(num_replicas)]
+    for max_concurrent_queries in [1, 10, 100, 1000]:
+        await run_test(replicas, max_concurrent_queries)
+
+
+asyncio.get_event_loop().run_until_complete(main())
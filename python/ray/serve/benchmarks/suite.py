@@ -0,0 +1,369 @@
+# A load generation and latency benchmark suite for Serve on a single node.
+#
+# For each combination of the given payload sizes, batch sizes, numbers of
+# replicas and max_concurrent_queries, a no-op deployment is deployed and
+# driven with open-loop traffic at each target QPS: requests are sent on a
+# fixed schedule whether or not earlier ones have completed, and latency is
+# measured from the scheduled send time. This way, queueing in the proxy, the
+# router or the replicas shows up in the tail latencies instead of slowing
+# down the load generator.
+#
+# The results of each trial (throughput, p50/p90/p99/p999 latency and the full
+# latency histogram) are written as JSON. With --baseline, the results are
+# compared to the JSON of a previous run, and the script exits with code 1 if
+# the throughput of any trial dropped, or its p99 latency grew, by more than
+# --tolerance.
+#
+# Usage:
+# python suite.py --qps 100 --qps 1000 --payload-bytes 0 \
+#     --payload-bytes 1048576 --num-replicas 1 --num-replicas 4 \
+#     --output results.json
+# python suite.py ... --baseline baselines/<date>/suite.json
+#
+# Output format, for each trial:
+# mode:http/qps:100/payload_bytes:0/max_batch_size:1/num_replicas:1/
+# max_concurrent_queries:100: <N> requests/s, p50 <N>ms, p90 <N>ms,
+# p99 <N>ms, p999 <N>ms, <N> errors
+
+import asyncio
+import itertools
+import json
+import math
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import click
+import starlette.requests
+
+import ray
+from ray import serve
+
+DEPLOYMENT_NAME = "benchmark"
+URL = f"http://127.0.0.1:8000/{DEPLOYMENT_NAME}"
+
+# Latencies are recorded in log-spaced buckets, with a relative error of at
+# most HISTOGRAM_GROWTH_FACTOR - 1.
+HISTOGRAM_MIN_LATENCY_MS = 0.01
+HISTOGRAM_GROWTH_FACTOR = 1.05
+PERCENTILES = {"p50": 50, "p90": 90, "p99": 99, "p999": 99.9}
+
+
+class LatencyHistogram:
+    """A histogram of latencies that can be merged across load generators."""
+
+    def __init__(self, counts: Optional[Dict[int, int]] = None):
+        # Map bucket -> number of latencies in the bucket. Bucket i holds the
+        # latencies up to HISTOGRAM_MIN_LATENCY_MS * HISTOGRAM_GROWTH_FACTOR**i.
+        self.counts: Dict[int, int] = dict(counts or {})
+
+    @staticmethod
+    def bucket_upper_bound_ms(bucket: int) -> float:
+        return HISTOGRAM_MIN_LATENCY_MS * HISTOGRAM_GROWTH_FACTOR ** bucket
+
+    def record(self, latency_ms: float) -> None:
+        ratio = max(latency_ms, HISTOGRAM_MIN_LATENCY_MS) / HISTOGRAM_MIN_LATENCY_MS
+        bucket = math.ceil(math.log(ratio, HISTOGRAM_GROWTH_FACTOR))
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        total = self.total()
+        if total == 0:
+            return None
+        rank = math.ceil(total * percentile / 100)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return self.bucket_upper_bound_ms(bucket)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "min_latency_ms": HISTOGRAM_MIN_LATENCY_MS,
+            "growth_factor": HISTOGRAM_GROWTH_FACTOR,
+            "counts": {
+                str(bucket): self.counts[bucket] for bucket in sorted(self.counts)
+            },
+        }
+
+
+@ray.remote(num_cpus=0)
+class LoadGenerator:
+    async def run(
+        self,
+        mode: str,
+        qps: float,
+        duration_s: float,
+        payload: bytes,
+        max_in_flight: int,
+    ) -> Tuple[Dict[int, int], int, float]:
+        """Send requests at the given rate for duration_s.
+
+        Returns the latency histogram counts, the number of failed requests,
+        and the time it took until all requests completed.
+        """
+        histogram = LatencyHistogram()
+        num_errors = 0
+        # Limit the number of requests in flight, so that an overloaded
+        # deployment doesn't exhaust the generator's sockets or memory.
+        # Requests that wait for the limit still count toward their latency.
+        semaphore = asyncio.Semaphore(max_in_flight)
+        if mode == "http":
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=max_in_flight)
+            )
+        else:
+            handle = serve.get_deployment(DEPLOYMENT_NAME).get_handle(sync=False)
+
+        async def send(scheduled_time: float):
+            nonlocal num_errors
+            try:
+                async with semaphore:
+                    if mode == "http":
+                        async with session.post(URL, data=payload) as response:
+                            await response.read()
+                            response.raise_for_status()
+                    else:
+                        await (await handle.remote(payload))
+            except Exception:
+                num_errors += 1
+                return
+            histogram.record((time.perf_counter() - scheduled_time) * 1000)
+
+        tasks = []
+        start = time.perf_counter()
+        for i in range(int(qps * duration_s)):
+            scheduled_time = start + i / qps
+            delay_s = scheduled_time - time.perf_counter()
+            if delay_s > 0:
+                await asyncio.sleep(delay_s)
+            tasks.append(asyncio.get_event_loop().create_task(send(scheduled_time)))
+        await asyncio.gather(*tasks)
+        elapsed_s = time.perf_counter() - start
+
+        if mode == "http":
+            await session.close()
+        return histogram.counts, num_errors, elapsed_s
+
+
+def deploy(num_replicas: int, max_concurrent_queries: int, max_batch_size: int):
+    @serve.deployment(
+        name=DEPLOYMENT_NAME,
+        num_replicas=num_replicas,
+        max_concurrent_queries=max_concurrent_queries,
+    )
+    class Noop:
+        @serve.batch(max_batch_size=max_batch_size)
+        async def batch(self, requests):
+            return [b"ok"] * len(requests)
+
+        async def __call__(self, request):
+            if isinstance(request, starlette.requests.Request):
+                await request.body()
+            if max_batch_size > 1:
+                return await self.batch(request)
+            return b"ok"
+
+    Noop.deploy()
+
+
+def run_trial(
+    generators: List[ray.actor.ActorHandle],
+    mode: str,
+    qps: float,
+    duration_s: float,
+    payload_bytes: int,
+    max_in_flight: int,
+) -> Tuple[LatencyHistogram, int, float]:
+    payload = b"x" * payload_bytes
+    qps_per_generator = qps / len(generators)
+    max_in_flight_per_generator = max(1, max_in_flight // len(generators))
+    results = ray.get(
+        [
+            generator.run.remote(
+                mode,
+                qps_per_generator,
+                duration_s,
+                payload,
+                max_in_flight_per_generator,
+            )
+            for generator in generators
+        ]
+    )
+    histogram = LatencyHistogram()
+    for counts, _, _ in results:
+        histogram.merge(LatencyHistogram(counts))
+    num_errors = sum(num_errors for _, num_errors, _ in results)
+    elapsed_s = max(elapsed_s for _, _, elapsed_s in results)
+    return histogram, num_errors, elapsed_s
+
+
+def compare_to_baseline(
+    trials: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Return the regressions of the trials compared to the baseline run."""
+    baseline_trials = {trial["key"]: trial for trial in baseline["trials"]}
+    regressions = []
+    for trial in trials:
+        baseline_trial = baseline_trials.get(trial["key"])
+        if baseline_trial is None:
+            continue
+        throughput = trial["throughput_qps"]
+        baseline_throughput = baseline_trial["throughput_qps"]
+        if throughput < baseline_throughput * (1 - tolerance):
+            regressions.append(
+                f"{trial['key']}: throughput dropped from "
+                f"{baseline_throughput:.1f} to {throughput:.1f} requests/s"
+            )
+        p99 = trial["latency_ms"]["p99"]
+        baseline_p99 = baseline_trial["latency_ms"]["p99"]
+        if None not in (p99, baseline_p99) and p99 > baseline_p99 * (1 + tolerance):
+            regressions.append(
+                f"{trial['key']}: p99 latency grew from {baseline_p99:.2f}ms "
+                f"to {p99:.2f}ms"
+            )
+    return regressions
+
+
+@click.command()
+@click.option("--mode", type=click.Choice(["http", "handle"]), default="http")
+@click.option("--qps", type=float, multiple=True, default=[100, 1000])
+@click.option("--payload-bytes", type=int, multiple=True, default=[0])
+@click.option("--max-batch-size", type=int, multiple=True, default=[1])
+@click.option("--num-replicas", type=int, multiple=True, default=[1])
+@click.option("--max-concurrent-queries", type=int, multiple=True, default=[100])
+@click.option("--duration-s", type=float, default=10.0, help="Duration of a trial.")
+@click.option("--warmup-s", type=float, default=2.0, help="Warmup before a trial.")
+@click.option("--num-generators", type=int, default=4, help="Load generator actors.")
+@click.option(
+    "--max-in-flight", type=int, default=1000, help="Max requests in flight in total."
+)
+@click.option("--output", type=click.Path(), help="Path to write the JSON results to.")
+@click.option("--baseline", type=click.Path(exists=True), help="Results to compare to.")
+@click.option(
+    "--tolerance",
+    type=float,
+    default=0.1,
+    help="The relative throughput drop or p99 latency increase that is a regression.",
+)
+def main(
+    mode: str,
+    qps: List[float],
+    payload_bytes: List[int],
+    max_batch_size: List[int],
+    num_replicas: List[int],
+    max_concurrent_queries: List[int],
+    duration_s: float,
+    warmup_s: float,
+    num_generators: int,
+    max_in_flight: int,
+    output: Optional[str],
+    baseline: Optional[str],
+    tolerance: float,
+):
+    ray.init(namespace="serve")
+    # Start a detached instance, so that the load generators can connect to it
+    # in handle mode.
+    serve.start(detached=True)
+    generators = [LoadGenerator.remote() for _ in range(num_generators)]
+
+    trials = []
+    for (
+        trial_num_replicas,
+        trial_max_concurrent_queries,
+        trial_max_batch_size,
+        trial_payload_bytes,
+    ) in itertools.product(
+        num_replicas, max_concurrent_queries, max_batch_size, payload_bytes
+    ):
+        deploy(trial_num_replicas, trial_max_concurrent_queries, trial_max_batch_size)
+        for trial_qps in qps:
+            key = (
+                f"mode:{mode}/qps:{trial_qps:g}/payload_bytes:{trial_payload_bytes}/"
+                f"max_batch_size:{trial_max_batch_size}/"
+                f"num_replicas:{trial_num_replicas}/"
+                f"max_concurrent_queries:{trial_max_concurrent_queries}"
+            )
+            if warmup_s > 0:
+                run_trial(
+                    generators,
+                    mode,
+                    trial_qps,
+                    warmup_s,
+                    trial_payload_bytes,
+                    max_in_flight,
+                )
+            histogram, num_errors, elapsed_s = run_trial(
+                generators,
+                mode,
+                trial_qps,
+                duration_s,
+                trial_payload_bytes,
+                max_in_flight,
+            )
+            latency_ms = {
+                name: histogram.percentile(percentile)
+                for name, percentile in PERCENTILES.items()
+            }
+            trial = {
+                "key": key,
+                "config": {
+                    "mode": mode,
+                    "qps": trial_qps,
+                    "payload_bytes": trial_payload_bytes,
+                    "max_batch_size": trial_max_batch_size,
+                    "num_replicas": trial_num_replicas,
+                    "max_concurrent_queries": trial_max_concurrent_queries,
+                },
+                "throughput_qps": histogram.total() / elapsed_s,
+                "num_requests": histogram.total() + num_errors,
+                "num_errors": num_errors,
+                "latency_ms": latency_ms,
+                "histogram": histogram.to_json(),
+            }
+            trials.append(trial)
+            latencies = ", ".join(
+                f"{name} {value:.2f}ms"
+                for name, value in latency_ms.items()
+                if value is not None
+            )
+            print(
+                f"{key}: {trial['throughput_qps']:.1f} requests/s, {latencies}, "
+                f"{num_errors} errors"
+            )
+
+    results = {
+        "metadata": {
+            "ray_version": ray.__version__,
+            "timestamp": time.time(),
+            "duration_s": duration_s,
+            "num_generators": num_generators,
+            "max_in_flight": max_in_flight,
+        },
+        "trials": trials,
+    }
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    serve.shutdown()
+
+    if baseline is not None:
+        with open(baseline) as f:
+            regressions = compare_to_baseline(trials, json.load(f), tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
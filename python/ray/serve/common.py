@@ -7,6 +7,7 @@ import ray
 from ray.actor import ActorHandle
 from ray.serve.config import DeploymentConfig, ReplicaConfig
 from ray.serve.autoscaling_policy import AutoscalingPolicy
+from ray.serve.constants import DEFAULT_REPLICA_SELECTION_POLICY
 from ray.serve.generated.serve_pb2 import (
     DeploymentInfo as DeploymentInfoProto,
     DeploymentStatusInfo as DeploymentStatusInfoProto,
@@ -283,3 +284,6 @@ class RunningReplicaInfo:
     replica_tag: ReplicaTag
     actor_handle: ActorHandle
     max_concurrent_queries: int
+    node_id: Optional[NodeId] = None
+    replica_selection_policy: str = DEFAULT_REPLICA_SELECTION_POLICY
+    max_queued_requests: int = -1
@@ -16,12 +16,16 @@ from pydantic import (
 
 from ray import cloudpickle
 from ray.serve.constants import (
+    AUTOSCALING_POLICIES,
+    DEFAULT_AUTOSCALING_POLICY,
     DEFAULT_GRACEFUL_SHUTDOWN_TIMEOUT_S,
     DEFAULT_GRACEFUL_SHUTDOWN_WAIT_LOOP_S,
     DEFAULT_HEALTH_CHECK_PERIOD_S,
     DEFAULT_HEALTH_CHECK_TIMEOUT_S,
     DEFAULT_HTTP_HOST,
     DEFAULT_HTTP_PORT,
+    DEFAULT_REPLICA_SELECTION_POLICY,
+    REPLICA_SELECTION_POLICIES,
 )
 from ray.serve.generated.serve_pb2 import (
     DeploymentConfig as DeploymentConfigProto,
@@ -63,6 +67,11 @@ class AutoscalingConfig(BaseModel):
     # How long to wait before scaling up replicas
     upscale_delay_s: NonNegativeFloat = 30.0
 
+    # The autoscaling policy, one of "basic" or "predictive"
+    policy: str = DEFAULT_AUTOSCALING_POLICY
+    # How far ahead the "predictive" policy forecasts the load when scaling up
+    forecast_horizon_s: NonNegativeFloat = 30.0
+
     @validator("max_replicas")
     def max_replicas_greater_than_or_equal_to_min_replicas(cls, v, values):
         if "min_replicas" in values and v < values["min_replicas"]:
@@ -73,6 +82,12 @@ class AutoscalingConfig(BaseModel):
             )
         return v
 
+    @validator("policy", always=True)
+    def policy_valid(cls, v):  # noqa 805
+        if v not in AUTOSCALING_POLICIES:
+            raise ValueError(f"policy must be one of {AUTOSCALING_POLICIES}, got: {v}")
+        return v
+
     # TODO(architkulkarni): implement below
     # The number of replicas to start with when creating the deployment
     # initial_replicas: int = 1
@@ -106,6 +121,13 @@ class DeploymentConfig(BaseModel):
         health_check_timeout_s (Optional[float]):
             Timeout that the controller will wait for a response from the
             replica's health check before marking it unhealthy.
+        replica_selection_policy (Optional[str]): How routers choose the
+            replica to send each query to. One of "round_robin",
+            "power_of_two_choices", or "prefer_local".
+        max_queued_requests (Optional[int]): The max number of requests that
+            each router (e.g., each HTTP proxy or handle) queues for the
+            deployment while all replicas are busy. Additional requests are
+            rejected. -1 means no limit.
     """
 
     num_replicas: NonNegativeInt = 1
@@ -122,6 +144,10 @@ class DeploymentConfig(BaseModel):
     health_check_period_s: PositiveFloat = DEFAULT_HEALTH_CHECK_PERIOD_S
     health_check_timeout_s: PositiveFloat = DEFAULT_HEALTH_CHECK_TIMEOUT_S
 
+    replica_selection_policy: str = DEFAULT_REPLICA_SELECTION_POLICY
+
+    max_queued_requests: int = -1
+
     autoscaling_config: Optional[AutoscalingConfig] = None
 
     # This flag is used to let replica know they are deplyed from
@@ -150,6 +176,21 @@ class DeploymentConfig(BaseModel):
                 raise ValueError("max_concurrent_queries must be >= 0")
         return v
 
+    @validator("replica_selection_policy", always=True)
+    def replica_selection_policy_valid(cls, v):  # noqa 805
+        if v not in REPLICA_SELECTION_POLICIES:
+            raise ValueError(
+                f"replica_selection_policy must be one of "
+                f"{REPLICA_SELECTION_POLICIES}, got: {v}"
+            )
+        return v
+
+    @validator("max_queued_requests", always=True)
+    def max_queued_requests_valid(cls, v):  # noqa 805
+        if v != -1 and v < 1:
+            raise ValueError("max_queued_requests must be -1 (no limit) or >= 1")
+        return v
+
     def to_proto(self):
         data = self.dict()
         if data.get("user_config"):
@@ -177,13 +218,22 @@ class DeploymentConfig(BaseModel):
             else:
                 data["user_config"] = None
         if "autoscaling_config" in data:
-            data["autoscaling_config"] = AutoscalingConfig(**data["autoscaling_config"])
+            autoscaling_config = data["autoscaling_config"]
+            if autoscaling_config.get("policy") == "":
+                autoscaling_config["policy"] = DEFAULT_AUTOSCALING_POLICY
+            data["autoscaling_config"] = AutoscalingConfig(**autoscaling_config)
         if "prev_version" in data:
             if data["prev_version"] == "":
                 data["prev_version"] = None
         if "version" in data:
             if data["version"] == "":
                 data["version"] = None
+        if "replica_selection_policy" in data:
+            if data["replica_selection_policy"] == "":
+                data["replica_selection_policy"] = DEFAULT_REPLICA_SELECTION_POLICY
+        if "max_queued_requests" in data:
+            if data["max_queued_requests"] == 0:
+                data["max_queued_requests"] = -1
         return cls(**data)
 
     @classmethod
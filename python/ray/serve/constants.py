@@ -56,6 +56,37 @@ DEFAULT_LATENCY_BUCKET_MS = [
     5000,
 ]
 
+#: Default histogram buckets for batch size tracker.
+DEFAULT_BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024]
+
+#: The number of most recent batches per batch size bucket that the latency of
+#: an adaptive @serve.batch queue is estimated from.
+ADAPTIVE_BATCH_LATENCY_WINDOW = 100
+
+#: The min number of batches of a batch size bucket that must be measured
+#: before an adaptive @serve.batch queue uses its latency estimate.
+ADAPTIVE_BATCH_MIN_SAMPLES = 10
+
+#: The max number of ASGI messages of a streaming HTTP response that a replica
+#: buffers before the HTTP proxy pulls them. Once the buffer is full, the
+#: response is paused until the proxy catches up.
+STREAMING_RESPONSE_MAX_BUFFERED_MESSAGES = 16
+
+#: A streaming HTTP response is cancelled if the HTTP proxy hasn't pulled its
+#: messages for this long (e.g., because the proxy died), so that it doesn't
+#: wait for the proxy forever.
+STREAMING_RESPONSE_IDLE_TIMEOUT_S = 60
+
+#: Policies for choosing which replica a router sends a query to:
+#: - "round_robin": cycle through the replicas, skipping full ones.
+#: - "power_of_two_choices": pick the less loaded of two random replicas.
+#: - "prefer_local": like "power_of_two_choices", but prefer replicas on the
+#:   same node as the caller (e.g., the HTTP proxy) if any of them are free.
+REPLICA_SELECTION_POLICIES = ("round_robin", "power_of_two_choices", "prefer_local")
+
+#: Default replica selection policy.
+DEFAULT_REPLICA_SELECTION_POLICY = "round_robin"
+
 #: Name of deployment health check method implemented by user.
 HEALTH_CHECK_METHOD = "check_health"
 
@@ -99,6 +130,19 @@ ANONYMOUS_NAMESPACE_PATTERN = re.compile(
 # Handle metric push interval. (This interval will affect the cold start time period)
 HANDLE_METRIC_PUSH_INTERVAL_S = 10
 
+#: The max number of data points the controller keeps for each autoscaling
+#: metric. The oldest data point of a metric is dropped once it has this many.
+METRICS_STORE_MAX_POINTS_PER_KEY = 10000
+
+#: Autoscaling policies:
+#: - "basic": scale on the average number of ongoing requests per replica.
+#: - "predictive": like "basic", but scale up ahead of load ramps, based on the
+#:   trend of the number of ongoing requests.
+AUTOSCALING_POLICIES = ("basic", "predictive")
+
+#: Default autoscaling policy.
+DEFAULT_AUTOSCALING_POLICY = "basic"
+
 
 class ServeHandleType(str, Enum):
     SYNC = "SYNC"
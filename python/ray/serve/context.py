@@ -3,6 +3,7 @@ This file stores global state for a Serve application. Deployment replicas
 can use this state to access metadata or the Serve controller.
 """
 
+import contextvars
 import logging
 from dataclasses import dataclass
 from typing import Callable, Optional
@@ -19,6 +20,13 @@ logger = logging.getLogger(__file__)
 _INTERNAL_REPLICA_CONTEXT: "ReplicaContext" = None
 _global_client: ServeControllerClient = None
 
+# The model id of the request that is being handled, for multiplexed
+# deployments. Each request is handled in its own asyncio task, so this is set
+# per request.
+_multiplexed_model_id: "contextvars.ContextVar[str]" = contextvars.ContextVar(
+    "serve_multiplexed_model_id", default=""
+)
+
 
 @dataclass
 class ReplicaContext:
@@ -15,7 +15,7 @@ from ray._private.utils import import_attr
 from ray.exceptions import RayTaskError
 
 from ray.serve.autoscaling_metrics import InMemoryMetricsStore
-from ray.serve.autoscaling_policy import BasicAutoscalingPolicy
+from ray.serve.autoscaling_policy import AUTOSCALING_POLICY_CLASSES
 from ray.serve.common import (
     DeploymentInfo,
     EndpointTag,
@@ -207,20 +207,21 @@ class ServeController:
                 deployment_name
             ]._replicas
             running_replicas = replicas.get([ReplicaState.RUNNING])
+            window_start_timestamp_s = (
+                time.time() - autoscaling_policy.config.look_back_period_s
+            )
 
             current_num_ongoing_requests = []
             for replica in running_replicas:
                 replica_tag = replica.replica_tag
                 num_ongoing_requests = self.autoscaling_metrics_store.window_average(
-                    replica_tag,
-                    time.time() - autoscaling_policy.config.look_back_period_s,
+                    replica_tag, window_start_timestamp_s
                 )
                 if num_ongoing_requests is not None:
                     current_num_ongoing_requests.append(num_ongoing_requests)
 
             current_handle_queued_queries = self.handle_metrics_store.max(
-                deployment_name,
-                time.time() - autoscaling_policy.config.look_back_period_s,
+                deployment_name, window_start_timestamp_s
             )
 
             if current_handle_queued_queries is None:
@@ -383,7 +384,9 @@ class ServeController:
             # TODO: is this the desired behaviour? Should this be a setting?
             deployment_config.num_replicas = autoscaling_config.min_replicas
 
-            autoscaling_policy = BasicAutoscalingPolicy(autoscaling_config)
+            autoscaling_policy = AUTOSCALING_POLICY_CLASSES[autoscaling_config.policy](
+                autoscaling_config
+            )
         else:
             autoscaling_policy = None
 
@@ -288,6 +288,8 @@ class Deployment:
         _graceful_shutdown_timeout_s: Optional[float] = None,
         _health_check_period_s: Optional[float] = None,
         _health_check_timeout_s: Optional[float] = None,
+        _replica_selection_policy: Optional[str] = None,
+        _max_queued_requests: Optional[int] = None,
     ) -> "Deployment":
         """Return a copy of this deployment with updated options.
 
@@ -352,6 +354,12 @@ class Deployment:
         if _health_check_timeout_s is not None:
             new_config.health_check_timeout_s = _health_check_timeout_s
 
+        if _replica_selection_policy is not None:
+            new_config.replica_selection_policy = _replica_selection_policy
+
+        if _max_queued_requests is not None:
+            new_config.max_queued_requests = _max_queued_requests
+
         return Deployment(
             func_or_class,
             name,
@@ -384,6 +392,8 @@ class Deployment:
         _graceful_shutdown_timeout_s: Optional[float] = None,
         _health_check_period_s: Optional[float] = None,
         _health_check_timeout_s: Optional[float] = None,
+        _replica_selection_policy: Optional[str] = None,
+        _max_queued_requests: Optional[int] = None,
     ) -> None:
         """Overwrite this deployment's options. Mutates the deployment.
 
@@ -408,6 +418,8 @@ class Deployment:
             _graceful_shutdown_timeout_s=_graceful_shutdown_timeout_s,
             _health_check_period_s=_health_check_period_s,
             _health_check_timeout_s=_health_check_timeout_s,
+            _replica_selection_policy=_replica_selection_policy,
+            _max_queued_requests=_max_queued_requests,
         )
 
         self._func_or_class = validated._func_or_class
@@ -475,6 +487,8 @@ def deployment_to_schema(d: Deployment) -> DeploymentSchema:
         graceful_shutdown_timeout_s=d._config.graceful_shutdown_timeout_s,
         health_check_period_s=d._config.health_check_period_s,
         health_check_timeout_s=d._config.health_check_timeout_s,
+        replica_selection_policy=d._config.replica_selection_policy,
+        max_queued_requests=d._config.max_queued_requests,
         ray_actor_options=ray_actor_options_schema,
     )
 
@@ -495,6 +509,8 @@ def schema_to_deployment(s: DeploymentSchema) -> Deployment:
         graceful_shutdown_timeout_s=s.graceful_shutdown_timeout_s,
         health_check_period_s=s.health_check_period_s,
         health_check_timeout_s=s.health_check_timeout_s,
+        replica_selection_policy=s.replica_selection_policy,
+        max_queued_requests=s.max_queued_requests,
     )
 
     return Deployment(
@@ -160,6 +160,8 @@ class ActorReplicaWrapper:
 
         self._actor_resources: Dict[str, float] = None
         self._max_concurrent_queries: int = None
+        self._replica_selection_policy: str = None
+        self._max_queued_requests: int = -1
         self._graceful_shutdown_timeout_s: float = 0.0
         self._healthy: bool = True
         self._health_check_period_s: float = 0.0
@@ -208,6 +210,14 @@ class ActorReplicaWrapper:
     def max_concurrent_queries(self) -> int:
         return self._max_concurrent_queries
 
+    @property
+    def replica_selection_policy(self) -> str:
+        return self._replica_selection_policy
+
+    @property
+    def max_queued_requests(self) -> int:
+        return self._max_queued_requests
+
     @property
     def node_id(self) -> Optional[str]:
         """Returns the node id of the actor, None if not placed."""
@@ -256,6 +266,12 @@ class ActorReplicaWrapper:
         self._max_concurrent_queries = (
             deployment_info.deployment_config.max_concurrent_queries
         )
+        self._replica_selection_policy = (
+            deployment_info.deployment_config.replica_selection_policy
+        )
+        self._max_queued_requests = (
+            deployment_info.deployment_config.max_queued_requests
+        )
         self._graceful_shutdown_timeout_s = (
             deployment_info.deployment_config.graceful_shutdown_timeout_s
         )
@@ -413,6 +429,10 @@ class ActorReplicaWrapper:
 
                 deployment_config, version = ray.get(self._ready_obj_ref)
                 self._max_concurrent_queries = deployment_config.max_concurrent_queries
+                self._replica_selection_policy = (
+                    deployment_config.replica_selection_policy
+                )
+                self._max_queued_requests = deployment_config.max_queued_requests
                 self._graceful_shutdown_timeout_s = (
                     deployment_config.graceful_shutdown_timeout_s
                 )
@@ -642,6 +662,9 @@ class DeploymentReplica(VersionedReplica):
             replica_tag=self._replica_tag,
             actor_handle=self._actor.actor_handle,
             max_concurrent_queries=self._actor.max_concurrent_queries,
+            node_id=self._actor.node_id,
+            replica_selection_policy=self._actor.replica_selection_policy,
+            max_queued_requests=self._actor.max_queued_requests,
         )
 
     @property
@@ -1,2 +1,16 @@
 class RayServeException(Exception):
     pass
+
+
+class BackPressureError(RayServeException):
+    """Raised when a request is rejected because too many requests are queued
+    for the deployment."""
+
+    pass
+
+
+class DeadlineExceededError(RayServeException):
+    """Raised when a request is rejected because its deadline has passed, or
+    can't be met given the current load of the deployment."""
+
+    pass
@@ -3,6 +3,7 @@ import concurrent.futures
 from dataclasses import dataclass
 from typing import Coroutine, Dict, Optional, Union
 import threading
+import time
 
 from ray.actor import ActorHandle
 
@@ -41,6 +42,9 @@ class HandleOptions:
     """Options for each ServeHandle instances. These fields are immutable."""
 
     method_name: str = "__call__"
+    multiplexed_model_id: str = ""
+    request_timeout_s: Optional[float] = None
+    priority: int = 0
 
 
 class RayServeHandle:
@@ -145,16 +149,37 @@ class RayServeHandle:
         self,
         *,
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
+        multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
+        request_timeout_s: Union[float, None, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[int, DEFAULT] = DEFAULT.VALUE,
     ):
         """Set options for this handle.
 
         Args:
             method_name(str): The method to invoke.
+            multiplexed_model_id(str): The model id that requests are for, for
+                deployments that use ``@serve.multiplexed``. Requests are
+                routed to replicas that have the model loaded if possible.
+            request_timeout_s(float): The time after which requests are
+                rejected with a DeadlineExceededError if they haven't been
+                handled, measured from the `.remote()` call. Requests are also
+                rejected early if the deployment is too loaded to meet it.
+            priority(int): Requests with a higher priority are assigned to
+                replicas before lower priority requests that are waiting for a
+                free replica. Defaults to 0.
         """
         new_options_dict = self.handle_options.__dict__.copy()
         user_modified_options_dict = {
             key: value
-            for key, value in zip(["method_name"], [method_name])
+            for key, value in zip(
+                [
+                    "method_name",
+                    "multiplexed_model_id",
+                    "request_timeout_s",
+                    "priority",
+                ],
+                [method_name, multiplexed_model_id, request_timeout_s, priority],
+            )
             if value != DEFAULT.VALUE
         }
         new_options_dict.update(user_modified_options_dict)
@@ -174,6 +199,13 @@ class RayServeHandle:
             deployment_name,
             call_method=handle_options.method_name,
             http_arg_is_pickled=self._pickled_http_request,
+            multiplexed_model_id=handle_options.multiplexed_model_id,
+            deadline_s=(
+                time.time() + handle_options.request_timeout_s
+                if handle_options.request_timeout_s is not None
+                else None
+            ),
+            priority=handle_options.priority,
         )
         coro = self.router.assign_request(request_metadata, *args, **kwargs)
         return coro
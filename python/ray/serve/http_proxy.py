@@ -1,5 +1,6 @@
 import asyncio
 from asyncio.tasks import FIRST_COMPLETED
+import dataclasses
 import os
 import logging
 import pickle
@@ -19,13 +20,16 @@ from ray import serve
 from ray.serve.handle import RayServeHandle
 from ray.serve.http_util import (
     HTTPRequestWrapper,
+    is_final_asgi_message,
     RawASGIResponse,
     receive_http_body,
     Response,
     set_socket_reuse_port,
+    StreamingASGIResponse,
 )
 from ray.serve.common import EndpointInfo, EndpointTag
 from ray.serve.constants import SERVE_LOGGER_NAME
+from ray.serve.exceptions import BackPressureError, DeadlineExceededError
 from ray.serve.long_poll import LongPollClient, LongPollNamespace
 from ray.serve.logging_utils import access_log_msg, configure_component_logger
 from ray.serve.utils import node_id_to_ip_addr
@@ -33,10 +37,23 @@ from ray.serve.utils import node_id_to_ip_addr
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
 MAX_REPLICA_FAILURE_RETRIES = 10
+# The HTTP header with the model id of requests to multiplexed deployments.
+MULTIPLEXED_MODEL_ID_HEADER = b"serve_multiplexed_model_id"
+# The HTTP header with the timeout of a request in seconds, after which it is
+# rejected with a 503 if it hasn't been handled.
+REQUEST_TIMEOUT_HEADER = b"serve_request_timeout_s"
+# The HTTP header with the (integer) priority of a request.
+REQUEST_PRIORITY_HEADER = b"serve_request_priority"
 DISCONNECT_ERROR_CODE = "disconnection"
 SOCKET_REUSE_PORT_ENABLED = (
     os.environ.get("SERVE_SOCKET_REUSE_PORT_ENABLED", "1") == "1"
 )
+# HTTP request bodies of at least this many bytes are put in the object store
+# once and passed to replicas by reference, instead of being pickled with the
+# request and copied into each attempt.
+HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES = int(
+    os.environ.get("SERVE_HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES", str(100 * 1024))
+)
 
 
 async def _send_request_to_handle(handle, scope, receive, send) -> str:
@@ -45,10 +62,35 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
     # NOTE(edoakes): it's important that we defer building the starlette
     # request until it reaches the replica to avoid unnecessary
     # serialization cost, so we use a simple dataclass here.
-    request = HTTPRequestWrapper(scope, http_body_bytes)
-    # Perform a pickle here to improve latency. Stdlib pickle for simple
-    # dataclasses are 10-100x faster than cloudpickle.
-    request = pickle.dumps(request)
+    if len(http_body_bytes) >= HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES:
+        # Put large bodies in the object store once, so that retries reuse
+        # them. Replicas get the body as a separate argument, which Ray
+        # resolves from the object store.
+        request = HTTPRequestWrapper(scope, b"")
+        request_args = (pickle.dumps(request), ray.put(http_body_bytes))
+    else:
+        request = HTTPRequestWrapper(scope, http_body_bytes)
+        # Perform a pickle here to improve latency. Stdlib pickle for simple
+        # dataclasses are 10-100x faster than cloudpickle.
+        request_args = (pickle.dumps(request),)
+
+    options = {}
+    deadline_s = None
+    for key, value in scope.get("headers", []):
+        key = key.lower()
+        try:
+            if key == MULTIPLEXED_MODEL_ID_HEADER:
+                options["multiplexed_model_id"] = value.decode()
+            elif key == REQUEST_TIMEOUT_HEADER:
+                deadline_s = time.time() + float(value)
+            elif key == REQUEST_PRIORITY_HEADER:
+                options["priority"] = int(value)
+        except ValueError:
+            await Response(
+                f"Invalid value for header '{key.decode()}': {value.decode()}.",
+                status_code=400,
+            ).send(scope, receive, send)
+            return "400"
 
     retries = 0
     backoff_time_s = 0.05
@@ -57,7 +99,17 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
     # call might never arrive; if it does, it can only be `http.disconnect`.
     client_disconnection_task = loop.create_task(receive())
     while retries < MAX_REPLICA_FAILURE_RETRIES:
-        assignment_task = loop.create_task(handle.remote(request))
+        if deadline_s is not None:
+            # The deadline doesn't move when the request is retried.
+            options["request_timeout_s"] = max(0, deadline_s - time.time())
+        if not options:
+            assignment_task = loop.create_task(handle.remote(*request_args))
+        else:
+            # Don't use handle.options(), which creates a new handle per request.
+            handle_options = dataclasses.replace(handle.handle_options, **options)
+            assignment_task = loop.create_task(
+                handle._remote(handle.deployment_name, handle_options, request_args, {})
+            )
         done, _ = await asyncio.wait(
             [assignment_task, client_disconnection_task], return_when=FIRST_COMPLETED
         )
@@ -77,12 +129,18 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         try:
             object_ref = await assignment_task
             result = await object_ref
-            client_disconnection_task.cancel()
+            if not isinstance(result, StreamingASGIResponse):
+                client_disconnection_task.cancel()
             break
         except asyncio.CancelledError:
             # Here because the client disconnected, we will return a custom
             # error code for metric tracking.
             return DISCONNECT_ERROR_CODE
+        except (BackPressureError, DeadlineExceededError) as error:
+            # The request was shed because the deployment is overloaded. This
+            # also catches errors raised by replicas for expired requests.
+            await Response(str(error), status_code=503).send(scope, receive, send)
+            return "503"
         except RayTaskError as error:
             error_message = "Task Error. Traceback: {}.".format(error)
             await Response(error_message, status_code=500).send(scope, receive, send)
@@ -93,6 +151,12 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
                 f"{MAX_REPLICA_FAILURE_RETRIES - retries} retries "
                 "remaining."
             )
+            if deadline_s is not None and time.time() + backoff_time_s > deadline_s:
+                error_message = "Request failed and its deadline has passed."
+                await Response(error_message, status_code=503).send(
+                    scope, receive, send
+                )
+                return "503"
             await asyncio.sleep(backoff_time_s)
             # Be careful about the expotential backoff scaling here.
             # Assuming 10 retries, 1.5x scaling means the last retry is 38x the
@@ -104,7 +168,11 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         await Response(error_message, status_code=500).send(scope, receive, send)
         return "500"
 
-    if isinstance(result, (starlette.responses.Response, RawASGIResponse)):
+    if isinstance(result, StreamingASGIResponse):
+        return await _send_streaming_response(
+            result, scope, receive, send, client_disconnection_task
+        )
+    elif isinstance(result, (starlette.responses.Response, RawASGIResponse)):
         await result(scope, receive, send)
         return str(result.status_code)
     else:
@@ -112,6 +180,62 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         return "200"
 
 
+async def _send_streaming_response(
+    stream: StreamingASGIResponse,
+    scope,
+    receive,
+    send,
+    client_disconnection_task: asyncio.Task,
+) -> str:
+    """Forward the ASGI messages of a streaming response as they are produced.
+
+    Only one batch of messages is pulled from the replica at a time, so the
+    memory used by the proxy is bounded regardless of the response size.
+    """
+    loop = asyncio.get_event_loop()
+    status_code = None
+    finished = False
+    try:
+        while not finished:
+            pull_task = loop.create_task(stream.get_messages())
+            done, _ = await asyncio.wait(
+                [pull_task, client_disconnection_task], return_when=FIRST_COMPLETED
+            )
+            if client_disconnection_task in done:
+                logger.warning(
+                    f"Client from {scope['client']} disconnected, cancelling the "
+                    "streaming response."
+                )
+                pull_task.cancel()
+                return DISCONNECT_ERROR_CODE
+            try:
+                messages = await pull_task
+            except (RayTaskError, RayActorError) as error:
+                if status_code is None:
+                    error_message = "Task Error. Traceback: {}.".format(error)
+                    await Response(error_message, status_code=500).send(
+                        scope, receive, send
+                    )
+                else:
+                    # The response has already started, so the client only sees
+                    # the connection being closed.
+                    logger.error(f"Streaming response failed: {error}")
+                return "500"
+
+            # An empty list means the response finished without a final message.
+            finished = len(messages) == 0
+            for message in messages:
+                if message["type"] == "http.response.start":
+                    status_code = str(message["status"])
+                finished = is_final_asgi_message(message)
+                await send(message)
+        return status_code
+    finally:
+        client_disconnection_task.cancel()
+        if not finished:
+            stream.cancel()
+
+
 class LongestPrefixRouter:
     """Router that performs longest prefix matches on incoming routes."""
 
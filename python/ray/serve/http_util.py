@@ -1,16 +1,18 @@
 import asyncio
+import collections
 import socket
 from dataclasses import dataclass
 import inspect
 import json
 import logging
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Optional, Type
 
 import starlette.responses
 import starlette.requests
 from starlette.types import Send, ASGIApp
 from fastapi.encoders import jsonable_encoder
 
+from ray.actor import ActorHandle
 from ray.serve.exceptions import RayServeException
 from ray.serve.constants import SERVE_LOGGER_NAME
 
@@ -159,6 +161,96 @@ class ASGIHTTPSender(Send):
         return RawASGIResponse(self.messages)
 
 
+class ASGIMessageQueue(Send):
+    """Implement the interface for ASGI sender to buffer the messages of a
+    streaming response until they are pulled by the HTTP proxy.
+
+    At most max_buffered_messages are buffered; sending more messages blocks
+    until the buffered ones are pulled, which applies backpressure to the
+    response. The start message is held back until the first body message, so
+    that a response that fails before producing any content can still be
+    turned into an error response.
+    """
+
+    def __init__(self, max_buffered_messages: int) -> None:
+        self._messages = collections.deque()
+        self._max_buffered_messages = max_buffered_messages
+        self._message_event = asyncio.Event()
+        self._pulled_event = asyncio.Event()
+        self._start_message: Optional[Dict[str, Any]] = None
+        self._closed = False
+        self._error: Optional[Exception] = None
+
+    async def __call__(self, message):
+        assert message["type"] in ("http.response.start", "http.response.body")
+        if message["type"] == "http.response.start":
+            self._start_message = message
+            return
+        while len(self._messages) >= self._max_buffered_messages:
+            self._pulled_event.clear()
+            await self._pulled_event.wait()
+        if self._start_message is not None:
+            self._messages.append(self._start_message)
+            self._start_message = None
+        self._messages.append(message)
+        self._message_event.set()
+
+    def close(self, error: Optional[Exception] = None) -> None:
+        """Mark the response as finished, or failed with the given error."""
+        if self._start_message is not None and error is None:
+            self._messages.append(self._start_message)
+        self._start_message = None
+        self._closed = True
+        self._error = error
+        self._message_event.set()
+
+    async def get_messages(self) -> List[Dict[str, Any]]:
+        """Wait for messages and return all the buffered ones.
+
+        Returns an empty list once the response is finished, and raises the
+        error that the response failed with, if any.
+        """
+        while not self._messages and not self._closed:
+            self._message_event.clear()
+            await self._message_event.wait()
+        if self._messages:
+            messages = list(self._messages)
+            self._messages.clear()
+            self._pulled_event.set()
+            return messages
+        if self._error is not None:
+            raise self._error
+        return []
+
+
+def is_final_asgi_message(message: Dict[str, Any]) -> bool:
+    """Whether this is the last message of an ASGI HTTP response."""
+    return message["type"] == "http.response.body" and not message.get(
+        "more_body", False
+    )
+
+
+@dataclass
+class StreamingASGIResponse:
+    """Returned by a replica in place of a response that is streamed.
+
+    The ASGI messages of the response are pulled from the replica by the
+    HTTP proxy as they are produced, instead of being buffered in the
+    replica and the object store.
+    """
+
+    replica_handle: ActorHandle
+    stream_id: str
+
+    async def get_messages(self) -> List[Dict[str, Any]]:
+        return await self.replica_handle.get_streaming_response_messages.remote(
+            self.stream_id
+        )
+
+    def cancel(self) -> None:
+        self.replica_handle.cancel_streaming_response.remote(self.stream_id)
+
+
 def make_fastapi_class_based_view(fastapi_app, cls: Type) -> None:
     """Transform the `cls`'s methods and class annotations to FastAPI routes.
 
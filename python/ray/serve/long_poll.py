@@ -1,12 +1,12 @@
 import asyncio
 from asyncio.events import AbstractEventLoop
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from enum import Enum, auto
 import logging
 import os
 import random
-from typing import Any, Tuple, Callable, DefaultDict, Dict, Set, Union
+from typing import Any, Tuple, Callable, DefaultDict, Deque, Dict, List, Set, Union
 
 import ray
 from ray.serve.constants import SERVE_LOGGER_NAME
@@ -25,6 +25,14 @@ LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S = (
     int(os.environ.get("LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S_UPPER_BOUND", "60")),
 )
 
+# For objects that are lists or dicts (e.g., the running replicas of a
+# deployment), the host sends clients only the items that changed since their
+# snapshot, so that the size of updates scales with the size of the change
+# rather than the size of the object. The host keeps the changes of this many
+# past updates per object; clients that are further behind, or for which the
+# changes add up to more than the object, get the full object instead.
+LONG_POLL_MAX_DELTAS_PER_KEY = int(os.environ.get("LONG_POLL_MAX_DELTAS_PER_KEY", "16"))
+
 
 class LongPollNamespace(Enum):
     def __repr__(self):
@@ -34,12 +42,83 @@ class LongPollNamespace(Enum):
     ROUTE_TABLE = auto()
 
 
+@dataclass
+class ObjectDelta:
+    """The changes to a list or dict object between two of its snapshots.
+
+    Lists are treated as sets of (hashable) items, and their order isn't kept.
+    """
+
+    # Items added to a list, or added and updated items of a dict.
+    added: Union[List[Any], Dict[Any, Any]]
+    # Items removed from a list, or keys removed from a dict.
+    removed: List[Any]
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed)
+
+    @classmethod
+    def diff(cls, old: Union[list, dict], new: Union[list, dict]) -> "ObjectDelta":
+        if isinstance(new, dict):
+            added = {
+                key: value
+                for key, value in new.items()
+                if key not in old or old[key] != value
+            }
+            return cls(added, [key for key in old if key not in new])
+        old_items, new_items = set(old), set(new)
+        return cls(
+            [item for item in new if item not in old_items],
+            [item for item in old if item not in new_items],
+        )
+
+    def compose(self, other: "ObjectDelta") -> "ObjectDelta":
+        """Return the delta of applying this delta, then the other one."""
+        if isinstance(self.added, dict):
+            added = dict(self.added)
+            removed = set(self.removed)
+            for key in other.removed:
+                added.pop(key, None)
+                removed.add(key)
+            for key, value in other.added.items():
+                added[key] = value
+                removed.discard(key)
+            return ObjectDelta(added, list(removed))
+        added = dict.fromkeys(self.added)
+        removed = dict.fromkeys(self.removed)
+        for item in other.removed:
+            if item in added:
+                del added[item]
+            else:
+                removed[item] = None
+        for item in other.added:
+            if item in removed:
+                del removed[item]
+            else:
+                added[item] = None
+        return ObjectDelta(list(added), list(removed))
+
+    def apply(self, snapshot: Union[list, dict]) -> Union[list, dict]:
+        """Return a new object with the delta applied to the snapshot."""
+        removed = set(self.removed)
+        if isinstance(snapshot, dict):
+            updated = {
+                key: value for key, value in snapshot.items() if key not in removed
+            }
+            updated.update(self.added)
+            return updated
+        return [item for item in snapshot if item not in removed] + list(self.added)
+
+
 @dataclass
 class UpdatedObject:
     object_snapshot: Any
     # The identifier for the object's version. There is not sequential relation
     # among different object's snapshot_ids.
     snapshot_id: int
+    # Whether object_snapshot is an ObjectDelta from the client's snapshot
+    # rather than the full object.
+    is_delta: bool = False
 
 
 # Type signature for the update state callbacks. E.g.
@@ -151,13 +230,19 @@ class LongPollClient:
             f"{list(updates.keys())}."
         )
         for key, update in updates.items():
-            self.object_snapshots[key] = update.object_snapshot
+            if update.is_delta:
+                object_snapshot = update.object_snapshot.apply(
+                    self.object_snapshots[key]
+                )
+            else:
+                object_snapshot = update.object_snapshot
+            self.object_snapshots[key] = object_snapshot
             self.snapshot_ids[key] = update.snapshot_id
             callback = self.key_listeners[key]
 
             # Bind the parameters because closures are late-binding.
             # https://docs.python-guide.org/writing/gotchas/#late-binding-closures # noqa: E501
-            def chained(callback=callback, arg=update.object_snapshot):
+            def chained(callback=callback, arg=object_snapshot):
                 callback(arg)
                 self._on_callback_completed(trigger_at=len(updates))
 
@@ -175,7 +260,8 @@ class LongPollHost:
     Internally, we use snapshot_ids for each object to identify client with
     outdated object and immediately return the result. If the client has the
     up-to-date verison, then the listen_for_change call will only return when
-    the object is updated.
+    the object is updated. For list and dict objects, clients that have a
+    recent snapshot only receive the changes since then.
     """
 
     def __init__(self):
@@ -189,6 +275,28 @@ class LongPollHost:
         self.notifier_events: DefaultDict[KeyType, Set[asyncio.Event]] = defaultdict(
             set
         )
+        # Map object_key -> the deltas of its latest updates, each with the
+        # snapshot_id it applies to, from the oldest to the newest.
+        self.deltas: DefaultDict[KeyType, Deque[Tuple[int, ObjectDelta]]] = defaultdict(
+            lambda: deque(maxlen=LONG_POLL_MAX_DELTAS_PER_KEY)
+        )
+
+    def _get_update(self, key: KeyType, client_snapshot_id: int) -> UpdatedObject:
+        """Get the update for a client that has the given snapshot of the key.
+
+        Returns the delta since the client's snapshot if it's recent enough and
+        smaller than the object, and the full object otherwise.
+        """
+        deltas = self.deltas.get(key, ())
+        for i, (snapshot_id, _) in enumerate(deltas):
+            if snapshot_id == client_snapshot_id:
+                delta = deltas[i][1]
+                for j in range(i + 1, len(deltas)):
+                    delta = delta.compose(deltas[j][1])
+                if len(delta) < len(self.object_snapshots[key]):
+                    return UpdatedObject(delta, self.snapshot_ids[key], is_delta=True)
+                break
+        return UpdatedObject(self.object_snapshots[key], self.snapshot_ids[key])
 
     async def listen_for_change(
         self,
@@ -206,7 +314,7 @@ class LongPollHost:
         # If there are any outdated keys (by comparing snapshot ids)
         # return immediately.
         client_outdated_keys = {
-            key: UpdatedObject(self.object_snapshots[key], self.snapshot_ids[key])
+            key: self._get_update(key, keys_to_snapshot_ids[key])
             for key in existent_keys
             if self.snapshot_ids[key] != keys_to_snapshot_ids[key]
         }
@@ -238,9 +346,8 @@ class LongPollHost:
         else:
             updated_object_key: str = async_task_to_watched_keys[done.pop()]
             return {
-                updated_object_key: UpdatedObject(
-                    self.object_snapshots[updated_object_key],
-                    self.snapshot_ids[updated_object_key],
+                updated_object_key: self._get_update(
+                    updated_object_key, keys_to_snapshot_ids[updated_object_key]
                 )
             }
 
@@ -249,6 +356,22 @@ class LongPollHost:
         object_key: KeyType,
         updated_object: Any,
     ):
+        if type(updated_object) in (list, dict):
+            # Copy the object, since callers may keep updating it in place.
+            updated_object = type(updated_object)(updated_object)
+        old_object = self.object_snapshots.get(object_key)
+        if type(updated_object) in (list, dict) and type(old_object) is type(
+            updated_object
+        ):
+            self.deltas[object_key].append(
+                (
+                    self.snapshot_ids[object_key],
+                    ObjectDelta.diff(old_object, updated_object),
+                )
+            )
+        else:
+            self.deltas.pop(object_key, None)
+
         self.snapshot_ids[object_key] += 1
         self.object_snapshots[object_key] = updated_object
         logger.debug(f"LongPollHost: Notify change for key {object_key}.")
@@ -0,0 +1,181 @@
+import asyncio
+from collections import OrderedDict
+from functools import wraps
+from inspect import iscoroutinefunction
+import logging
+from typing import Any, Callable, Dict, List, Optional
+import weakref
+
+from ray.serve import context
+from ray.serve.constants import SERVE_LOGGER_NAME
+from ray.serve.exceptions import RayServeException
+from ray.util.annotations import PublicAPI
+
+logger = logging.getLogger(SERVE_LOGGER_NAME)
+
+# All model caches in this process. A replica reports the model ids that are
+# loaded in them to its routers, so that requests for a model are preferably
+# sent to a replica that already has it loaded.
+_model_caches: "weakref.WeakSet[_ModelCache]" = weakref.WeakSet()
+
+
+class _ModelCache:
+    """An LRU cache of the models loaded by a multiplexed deployment replica."""
+
+    def __init__(
+        self,
+        load_model_func: Callable,
+        self_arg: Optional[Any],
+        max_num_models: int,
+    ):
+        self._load_model_func = load_model_func
+        self._self_arg = self_arg
+        self.max_num_models = max_num_models
+        # Loaded models, from the least to the most recently used.
+        self.models: "OrderedDict[str, Any]" = OrderedDict()
+        # Models that are being loaded, so that concurrent requests for the same
+        # model only load it once.
+        self._loading: Dict[str, asyncio.Task] = dict()
+        _model_caches.add(self)
+
+    async def get_model(self, model_id: str) -> Any:
+        if model_id in self.models:
+            self.models.move_to_end(model_id)
+            return self.models[model_id]
+
+        if model_id not in self._loading:
+            self._loading[model_id] = asyncio.get_event_loop().create_task(
+                self._load_model(model_id)
+            )
+        # Shield the load from cancellation of a single request, since other
+        # requests may be waiting for the same model.
+        return await asyncio.shield(self._loading[model_id])
+
+    async def _load_model(self, model_id: str) -> Any:
+        try:
+            logger.info(f"Loading model '{model_id}'.")
+            if self._self_arg is not None:
+                model = await self._load_model_func(self._self_arg, model_id)
+            else:
+                model = await self._load_model_func(model_id)
+        finally:
+            del self._loading[model_id]
+
+        self.models[model_id] = model
+        while len(self.models) > self.max_num_models:
+            evicted_model_id, _ = self.models.popitem(last=False)
+            logger.info(f"Evicted model '{evicted_model_id}'.")
+        return model
+
+
+def _get_loaded_model_ids() -> Optional[List[str]]:
+    """Return the model ids loaded in this process, or None if there are no
+    multiplexed deployments in it."""
+    if len(_model_caches) == 0:
+        return None
+    return [model_id for cache in _model_caches for model_id in cache.models]
+
+
+@PublicAPI(stability="alpha")
+def get_multiplexed_model_id() -> str:
+    """Get the model id of the request that is being handled.
+
+    The model id is set with `handle.options(multiplexed_model_id=...)`, or
+    with the `serve_multiplexed_model_id` header of HTTP requests. It is an
+    empty string if the request has no model id.
+
+    Example:
+        >>> from ray import serve
+        >>> @serve.deployment # doctest: +SKIP
+        ... class Model:
+        ...     async def __call__(self, request):
+        ...         return serve.get_multiplexed_model_id()
+    """
+    return context._multiplexed_model_id.get()
+
+
+@PublicAPI(stability="alpha")
+def multiplexed(_func=None, max_num_models_per_replica: int = 3):
+    """Wraps a function or method that loads a model by id into an LRU cache.
+
+    This lets a single deployment serve many models: each replica keeps up to
+    `max_num_models_per_replica` models loaded, and evicts the least recently
+    used one when it loads a new one. Requests carry the id of the model they
+    are for, and are routed to a replica that already has the model loaded if
+    one is available.
+
+    The function must be `async def` and take the model id as its sole
+    argument.
+
+    Example:
+    >>> from ray import serve
+    >>> @serve.deployment # doctest: +SKIP
+    ... class ModelServer:
+    ...     @serve.multiplexed(max_num_models_per_replica=10) # doctest: +SKIP
+    ...     async def get_model(self, model_id: str):
+    ...         return load_model(model_id) # doctest: +SKIP
+    ...
+    ...     async def __call__(self, request):
+    ...         model = await self.get_model(serve.get_multiplexed_model_id())
+    ...         return model(request) # doctest: +SKIP
+
+    >>> handle = ModelServer.get_handle() # doctest: +SKIP
+    >>> handle.options(multiplexed_model_id="1").remote(...) # doctest: +SKIP
+
+    Arguments:
+        max_num_models_per_replica: the max number of models that are loaded
+            in a replica at the same time.
+    """
+    if _func is not None:
+        if not callable(_func):
+            raise TypeError(
+                "@serve.multiplexed can only be used to decorate functions or "
+                "methods."
+            )
+
+        if not iscoroutinefunction(_func):
+            raise TypeError(
+                "Functions decorated with @serve.multiplexed must be 'async def'"
+            )
+
+    if not isinstance(max_num_models_per_replica, int):
+        raise TypeError("max_num_models_per_replica must be integer >= 1")
+
+    if max_num_models_per_replica < 1:
+        raise ValueError("max_num_models_per_replica must be an integer >= 1")
+
+    def _multiplex_decorator(_func):
+        @wraps(_func)
+        async def multiplex_wrapper(*args):
+            if len(args) == 2:
+                # Method call, the first argument is `self`.
+                self_arg, model_id = args
+                cache_object = self_arg
+            elif len(args) == 1:
+                self_arg, (model_id,) = None, args
+                cache_object = _func
+            else:
+                raise TypeError(
+                    "Functions decorated with @serve.multiplexed must take the "
+                    "model id as their sole argument."
+                )
+            if not isinstance(model_id, str) or not model_id:
+                raise RayServeException(
+                    f"The model id must be a non-empty string, got {model_id!r}."
+                )
+
+            # The first time the function runs, we lazily construct the model
+            # cache and inject it under a custom attribute name, like
+            # @serve.batch does.
+            cache_attr = f"__serve_multiplex_cache_{_func.__name__}"
+            if not hasattr(cache_object, cache_attr):
+                cache = _ModelCache(_func, self_arg, max_num_models_per_replica)
+                setattr(cache_object, cache_attr, cache)
+            else:
+                cache = getattr(cache_object, cache_attr)
+
+            return await cache.get_model(model_id)
+
+        return multiplex_wrapper
+
+    return _multiplex_decorator(_func) if callable(_func) else _multiplex_decorator
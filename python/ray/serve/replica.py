@@ -6,7 +6,7 @@ import logging
 import os
 import pickle
 import time
-from typing import Any, Callable, Optional, Tuple, Dict
+from typing import Any, Callable, Optional, List, Tuple, Dict
 
 import starlette.responses
 
@@ -25,18 +25,39 @@ from ray.serve.constants import (
     RECONFIGURE_METHOD,
     DEFAULT_LATENCY_BUCKET_MS,
     SERVE_LOGGER_NAME,
+    STREAMING_RESPONSE_IDLE_TIMEOUT_S,
+    STREAMING_RESPONSE_MAX_BUFFERED_MESSAGES,
 )
 from ray.serve.deployment import Deployment
-from ray.serve.exceptions import RayServeException
-from ray.serve.http_util import ASGIHTTPSender
+from ray.serve.exceptions import DeadlineExceededError, RayServeException
+from ray.serve.http_util import (
+    ASGIHTTPSender,
+    ASGIMessageQueue,
+    is_final_asgi_message,
+    StreamingASGIResponse,
+)
 from ray.serve.logging_utils import access_log_msg, configure_component_logger
-from ray.serve.router import Query, RequestMetadata
-from ray.serve.utils import parse_import_path, parse_request_item, wrap_to_ray_error
+from ray.serve.multiplex import _get_loaded_model_ids
+from ray.serve.router import Query, RequestMetadata, StreamingQueryTracker
+from ray.serve.utils import (
+    get_random_letters,
+    parse_import_path,
+    parse_request_item,
+    wrap_to_ray_error,
+)
 from ray.serve.version import DeploymentVersion
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
 
+async def _mock_receive():
+    # This is called in a tight loop in response() just to check for an http
+    # disconnect.  So rather than return immediately we should suspend
+    # execution to avoid wasting CPU cycles.
+    never_set_event = asyncio.Event()
+    await never_set_event.wait()
+
+
 def create_replica_wrapper(name: str):
     """Creates a replica class wrapping the provided function or class.
 
@@ -213,10 +234,34 @@ def create_replica_wrapper(name: str):
         async def check_health(self):
             await self.replica.check_health()
 
+        async def get_streaming_response_messages(
+            self, stream_id: str
+        ) -> List[Dict[str, Any]]:
+            return await self.replica.get_streaming_response_messages(stream_id)
+
+        async def cancel_streaming_response(self, stream_id: str):
+            self.replica.cancel_streaming_response(stream_id)
+
+        async def wait_for_streaming_response(self, stream_id: str):
+            await self.replica.wait_for_streaming_response(stream_id)
+
     RayServeWrappedReplica.__name__ = name
     return RayServeWrappedReplica
 
 
+class _StreamingResponse:
+    """A response that is being streamed to the HTTP proxy."""
+
+    def __init__(self, queue: ASGIMessageQueue, task: asyncio.Task):
+        self.queue = queue
+        self.task = task
+        # Set when the response is removed from the replica.
+        self.done_event = asyncio.Event()
+        # Used to find responses that the HTTP proxy stopped pulling.
+        self.num_pulls_in_progress = 0
+        self.last_pull_time_s = time.time()
+
+
 class RayServeReplica:
     """Handles requests with the provided callable."""
 
@@ -249,6 +294,9 @@ class RayServeReplica:
         self.user_health_check = sync_to_async(user_health_check)
 
         self.num_ongoing_requests = 0
+        # Responses that are being streamed to the HTTP proxy, by stream id.
+        self.streaming_responses: Dict[str, _StreamingResponse] = dict()
+        self._idle_streaming_responses_task: Optional[asyncio.Task] = None
 
         self.request_counter = metrics.Counter(
             "serve_deployment_request_counter",
@@ -305,6 +353,7 @@ class RayServeReplica:
         self.restart_counter.inc()
 
         self._shutdown_wait_loop_s = deployment_config.graceful_shutdown_wait_loop_s
+        self._shutdown_timeout_s = deployment_config.graceful_shutdown_timeout_s
 
         if deployment_config.autoscaling_config:
             process_remote_func = controller_handle.record_autoscaling_metrics.remote
@@ -341,9 +390,10 @@ class RayServeReplica:
     def _collect_autoscaling_metrics(self):
         method_stat = self._get_handle_request_stats()
 
-        num_inflight_requests = 0
+        # Responses that are being streamed count as in-flight requests.
+        num_inflight_requests = len(self.streaming_responses)
         if method_stat is not None:
-            num_inflight_requests = method_stat["pending"] + method_stat["running"]
+            num_inflight_requests += method_stat["pending"] + method_stat["running"]
 
         return {self.replica_tag: num_inflight_requests}
 
@@ -371,19 +421,116 @@ class RayServeReplica:
 
     async def ensure_serializable_response(self, response: Any) -> Any:
         if isinstance(response, starlette.responses.StreamingResponse):
-
-            async def mock_receive():
-                # This is called in a tight loop in response() just to check
-                # for an http disconnect.  So rather than return immediately
-                # we should suspend execution to avoid wasting CPU cycles.
-                never_set_event = asyncio.Event()
-                await never_set_event.wait()
-
             sender = ASGIHTTPSender()
-            await response(scope=None, receive=mock_receive, send=sender)
+            await response(scope=None, receive=_mock_receive, send=sender)
             return sender.build_asgi_response()
         return response
 
+    def start_streaming_response(
+        self, response: Any, scope: Dict[str, Any]
+    ) -> StreamingASGIResponse:
+        """Start streaming a generator or StreamingResponse to the HTTP proxy.
+
+        The response runs in the background, and its ASGI messages are buffered
+        until the proxy pulls them with `get_streaming_response_messages`.
+        """
+        if not isinstance(response, starlette.responses.StreamingResponse):
+            response = starlette.responses.StreamingResponse(response)
+
+        stream_id = get_random_letters(10)
+        queue = ASGIMessageQueue(STREAMING_RESPONSE_MAX_BUFFERED_MESSAGES)
+
+        async def run_response():
+            try:
+                await response(scope=scope, receive=_mock_receive, send=queue)
+            except Exception as e:
+                logger.exception(
+                    f"Streaming response failed due to {type(e).__name__}:"
+                )
+                self.error_counter.inc()
+                queue.close(wrap_to_ray_error("streaming_response", e))
+            else:
+                queue.close()
+
+        task = asyncio.get_event_loop().create_task(run_response())
+        self.streaming_responses[stream_id] = _StreamingResponse(queue, task)
+        if (
+            self._idle_streaming_responses_task is None
+            or self._idle_streaming_responses_task.done()
+        ):
+            self._idle_streaming_responses_task = asyncio.get_event_loop().create_task(
+                self._cancel_idle_streaming_responses()
+            )
+        return StreamingASGIResponse(ray.get_runtime_context().current_actor, stream_id)
+
+    async def _cancel_idle_streaming_responses(self):
+        """Cancel streaming responses that the HTTP proxy stopped pulling.
+
+        Runs while there are streaming responses. A response that isn't pulled
+        is blocked on its full message queue, and would otherwise never finish.
+        """
+        while self.streaming_responses:
+            now = time.time()
+            next_check_time_s = now + STREAMING_RESPONSE_IDLE_TIMEOUT_S
+            for stream_id, stream in list(self.streaming_responses.items()):
+                if stream.num_pulls_in_progress > 0:
+                    continue
+                idle_deadline_s = (
+                    stream.last_pull_time_s + STREAMING_RESPONSE_IDLE_TIMEOUT_S
+                )
+                if idle_deadline_s <= now:
+                    logger.warning(
+                        f"Cancelling streaming response {stream_id} because it "
+                        "wasn't pulled by the HTTP proxy for "
+                        f"{STREAMING_RESPONSE_IDLE_TIMEOUT_S}s."
+                    )
+                    self._remove_streaming_response(stream_id)
+                else:
+                    next_check_time_s = min(next_check_time_s, idle_deadline_s)
+            await asyncio.sleep(next_check_time_s - now)
+
+    async def get_streaming_response_messages(
+        self, stream_id: str
+    ) -> List[Dict[str, Any]]:
+        """Return the next ASGI messages of a streaming response.
+
+        Waits until at least one message is available. Returns an empty list
+        if the response is finished.
+        """
+        if stream_id not in self.streaming_responses:
+            raise RayServeException(f"Streaming response {stream_id} doesn't exist.")
+        stream = self.streaming_responses[stream_id]
+        stream.num_pulls_in_progress += 1
+        try:
+            messages = await stream.queue.get_messages()
+        except Exception:
+            self._remove_streaming_response(stream_id)
+            raise
+        finally:
+            stream.num_pulls_in_progress -= 1
+            stream.last_pull_time_s = time.time()
+        if len(messages) == 0 or is_final_asgi_message(messages[-1]):
+            self._remove_streaming_response(stream_id)
+        return messages
+
+    def cancel_streaming_response(self, stream_id: str):
+        self._remove_streaming_response(stream_id)
+
+    async def wait_for_streaming_response(self, stream_id: str):
+        """Wait until the response has been streamed or cancelled."""
+        if stream_id in self.streaming_responses:
+            await self.streaming_responses[stream_id].done_event.wait()
+
+    def _remove_streaming_response(self, stream_id: str):
+        stream = self.streaming_responses.pop(stream_id, None)
+        if stream is not None:
+            stream.task.cancel()
+            # Unblock pulls that are in progress.
+            stream.queue.close(
+                RayServeException(f"Streaming response {stream_id} was cancelled.")
+            )
+            stream.done_event.set()
+
     async def invoke_single(self, request_item: Query) -> Tuple[Any, bool]:
         """Executes the provided request on this replica.
 
@@ -396,6 +543,9 @@ class RayServeReplica:
             )
         )
         args, kwargs = parse_request_item(request_item)
+        ray.serve.context._multiplexed_model_id.set(
+            request_item.metadata.multiplexed_model_id
+        )
 
         method_to_call = None
         success = True
@@ -419,7 +569,14 @@ class RayServeReplica:
                     # call with non-empty args
                     result = await method_to_call(*args, **kwargs)
 
-            result = await self.ensure_serializable_response(result)
+            if request_item.metadata.http_arg_is_pickled and _is_streaming_response(
+                result
+            ):
+                # Stream (async) generators and streaming responses to the HTTP
+                # proxy as they are produced, instead of buffering them.
+                result = self.start_streaming_response(result, args[0].scope)
+            else:
+                result = await self.ensure_serializable_response(result)
             self.request_counter.inc()
         except Exception as e:
             logger.exception(f"Request failed due to {type(e).__name__}:")
@@ -461,7 +618,20 @@ class RayServeReplica:
             self.num_processing_items.set(num_running_requests)
 
             start_time = time.time()
-            result, success = await self.invoke_single(request)
+            deadline_s = request.metadata.deadline_s
+            if deadline_s is not None and start_time > deadline_s:
+                # Don't spend time on requests whose callers have given up.
+                result = wrap_to_ray_error(
+                    "handle_request",
+                    DeadlineExceededError(
+                        f"Request {request.metadata.request_id} expired "
+                        f"{start_time - deadline_s:.3f}s before it started."
+                    ),
+                )
+                success = False
+                self.error_counter.inc()
+            else:
+                result, success = await self.invoke_single(request)
             latency_ms = (time.time() - start_time) * 1000
 
             self.processing_latency_tracker.observe(latency_ms)
@@ -475,33 +645,52 @@ class RayServeReplica:
                 )
             )
 
-            # Returns a small object for router to track request status.
+            # Returns a small object for router to track request status. For
+            # multiplexed deployments, this is the ids of the loaded models.
+            loaded_model_ids = _get_loaded_model_ids()
+            if isinstance(result, StreamingASGIResponse):
+                # The router counts the request as in flight until the response
+                # has been streamed.
+                done_ref = result.replica_handle.wait_for_streaming_response.remote(
+                    result.stream_id
+                )
+                return StreamingQueryTracker(done_ref, loaded_model_ids), result
+            if loaded_model_ids is not None:
+                return loaded_model_ids, result
             return b"", result
 
     async def prepare_for_shutdown(self):
         """Perform graceful shutdown.
 
         Trigger a graceful shutdown protocol that will wait for all the queued
-        tasks to be completed and return to the controller.
+        tasks to be completed and return to the controller. Responses that are
+        still being streamed after the graceful shutdown timeout are cancelled.
         """
+        start_time_s = time.time()
         while True:
             # Sleep first because we want to make sure all the routers receive
             # the notification to remove this replica first.
             await asyncio.sleep(self._shutdown_wait_loop_s)
             method_stat = self._get_handle_request_stats()
-            # The handle_request method wasn't even invoked.
-            if method_stat is None:
-                break
-            # The handle_request method has 0 inflight requests.
-            if method_stat["running"] + method_stat["pending"] == 0:
+            num_ongoing_requests = 0
+            # The stats are None if the handle_request method wasn't even invoked.
+            if method_stat is not None:
+                num_ongoing_requests = method_stat["running"] + method_stat["pending"]
+            if time.time() - start_time_s < self._shutdown_timeout_s:
+                num_ongoing_requests += len(self.streaming_responses)
+            # There are 0 inflight requests.
+            if num_ongoing_requests == 0:
                 break
             else:
                 logger.info(
                     "Waiting for an additional "
                     f"{self._shutdown_wait_loop_s}s to shut down because "
-                    f"there are {self.num_ongoing_requests} ongoing requests."
+                    f"there are {num_ongoing_requests} ongoing requests."
                 )
 
+        for stream_id in list(self.streaming_responses):
+            self._remove_streaming_response(stream_id)
+
         # Explicitly call the del method to trigger clean up.
         # We set the del method to noop after succssifully calling it so the
         # destructor is called only once.
@@ -514,3 +703,11 @@ class RayServeReplica:
         finally:
             if hasattr(self.callable, "__del__"):
                 del self.callable.__del__
+
+
+def _is_streaming_response(response: Any) -> bool:
+    return (
+        inspect.isgenerator(response)
+        or inspect.isasyncgen(response)
+        or isinstance(response, starlette.responses.StreamingResponse)
+    )
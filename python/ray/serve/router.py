@@ -1,18 +1,22 @@
 import asyncio
+import collections
 from dataclasses import dataclass
+import functools
+import heapq
 import itertools
 import logging
 import pickle
 import random
-import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple
 
 import ray
 from ray.actor import ActorHandle
 from ray.util import metrics
 
-from ray.serve.common import RunningReplicaInfo
-from ray.serve.constants import SERVE_LOGGER_NAME
+from ray.serve.common import NodeId, RunningReplicaInfo
+from ray.serve.constants import DEFAULT_REPLICA_SELECTION_POLICY, SERVE_LOGGER_NAME
+from ray.serve.exceptions import BackPressureError, DeadlineExceededError
 from ray.serve.long_poll import LongPollClient, LongPollNamespace
 from ray.serve.utils import compute_iterable_delta
 
@@ -29,6 +33,17 @@ class RequestMetadata:
     # and it needs to be deserialized by the replica.
     http_arg_is_pickled: bool = False
 
+    # The model id this request is for, for multiplexed deployments.
+    multiplexed_model_id: str = ""
+
+    # The time (in seconds since the epoch) by which the request must be
+    # handled, if any. Requests that can't meet their deadline are rejected.
+    deadline_s: Optional[float] = None
+
+    # Requests with a higher priority are assigned to replicas before requests
+    # with a lower priority that are waiting for a free replica.
+    priority: int = 0
+
 
 @dataclass
 class Query:
@@ -37,6 +52,149 @@ class Query:
     metadata: RequestMetadata
 
 
+@dataclass
+class StreamingQueryTracker:
+    """Returned by a replica to track a query whose response is streamed.
+
+    The query is still in flight until `done_ref` is ready, which is when the
+    response has been streamed to the HTTP proxy or cancelled.
+    """
+
+    done_ref: ray.ObjectRef
+    # The ids of the models loaded by the replica, for multiplexed deployments.
+    loaded_model_ids: Optional[List[str]] = None
+
+
+class ReplicaSelectionPolicy:
+    """Chooses the replica that a query is assigned to.
+
+    Policies only choose among replicas with fewer in-flight queries than their
+    max_concurrent_queries.
+    """
+
+    def __init__(self, node_id: Optional[NodeId] = None):
+        """Create a policy for a router running on the given node."""
+        self.node_id = node_id
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]) -> None:
+        """Called when the set of running replicas changes."""
+        pass
+
+    def select_replica(
+        self, num_in_flight_queries: Dict[RunningReplicaInfo, int]
+    ) -> Optional[RunningReplicaInfo]:
+        """Return an available replica, or None if all replicas are busy."""
+        raise NotImplementedError
+
+
+class RoundRobinReplicaSelectionPolicy(ReplicaSelectionPolicy):
+    """Cycle through the replicas, skipping overloaded replicas."""
+
+    def __init__(self, node_id: Optional[NodeId] = None):
+        super().__init__(node_id)
+        self.num_replicas = 0
+        self.replica_iterator = itertools.cycle([])
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]) -> None:
+        # Shuffle the replicas to avoid synchronization across clients.
+        replicas = list(replicas)
+        random.shuffle(replicas)
+        self.num_replicas = len(replicas)
+        self.replica_iterator = itertools.cycle(replicas)
+
+    def select_replica(
+        self, num_in_flight_queries: Dict[RunningReplicaInfo, int]
+    ) -> Optional[RunningReplicaInfo]:
+        for _ in range(self.num_replicas):
+            replica = next(self.replica_iterator)
+            if num_in_flight_queries[replica] < replica.max_concurrent_queries:
+                return replica
+        return None
+
+
+class PowerOfTwoChoicesReplicaSelectionPolicy(ReplicaSelectionPolicy):
+    """Pick the replica with fewer in-flight queries out of two random replicas.
+
+    Unlike round-robin, this avoids sending queries to replicas that are slow
+    to complete their queries, without tracking the load of all replicas.
+    """
+
+    def __init__(self, node_id: Optional[NodeId] = None):
+        super().__init__(node_id)
+        self.replicas: List[RunningReplicaInfo] = []
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]) -> None:
+        self.replicas = list(replicas)
+
+    def select_replica(
+        self, num_in_flight_queries: Dict[RunningReplicaInfo, int]
+    ) -> Optional[RunningReplicaInfo]:
+        return self._select_from(self.replicas, num_in_flight_queries)
+
+    def _select_from(
+        self,
+        replicas: List[RunningReplicaInfo],
+        num_in_flight_queries: Dict[RunningReplicaInfo, int],
+    ) -> Optional[RunningReplicaInfo]:
+        def available(replica: RunningReplicaInfo) -> bool:
+            return num_in_flight_queries[replica] < replica.max_concurrent_queries
+
+        candidates = [
+            r for r in random.sample(replicas, min(2, len(replicas))) if available(r)
+        ]
+        if not candidates:
+            # Both choices are full, so fall back to sampling from the available
+            # replicas.
+            candidates = [r for r in replicas if available(r)]
+            if len(candidates) > 2:
+                candidates = random.sample(candidates, 2)
+        if not candidates:
+            return None
+        return min(candidates, key=lambda r: num_in_flight_queries[r])
+
+
+class PreferLocalReplicaSelectionPolicy(PowerOfTwoChoicesReplicaSelectionPolicy):
+    """Prefer replicas on the same node as the router.
+
+    This avoids a network hop for the request and response when there is a free
+    replica on the local node, and otherwise falls back to power of two choices
+    over all replicas.
+    """
+
+    def __init__(self, node_id: Optional[NodeId] = None):
+        super().__init__(node_id)
+        self.local_replicas: List[RunningReplicaInfo] = []
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]) -> None:
+        super().update_replicas(replicas)
+        self.local_replicas = [
+            r for r in self.replicas if self.node_id and r.node_id == self.node_id
+        ]
+
+    def select_replica(
+        self, num_in_flight_queries: Dict[RunningReplicaInfo, int]
+    ) -> Optional[RunningReplicaInfo]:
+        replica = self._select_from(self.local_replicas, num_in_flight_queries)
+        if replica is None:
+            replica = self._select_from(self.replicas, num_in_flight_queries)
+        return replica
+
+
+# Maps the replica_selection_policy of a deployment to its implementation.
+REPLICA_SELECTION_POLICY_CLASSES = {
+    "round_robin": RoundRobinReplicaSelectionPolicy,
+    "power_of_two_choices": PowerOfTwoChoicesReplicaSelectionPolicy,
+    "prefer_local": PreferLocalReplicaSelectionPolicy,
+}
+
+
+def _get_current_node_id() -> Optional[NodeId]:
+    try:
+        return ray.get_runtime_context().node_id.hex()
+    except Exception:
+        return None
+
+
 class ReplicaSet:
     """Data structure representing a set of replica actor handles"""
 
@@ -44,27 +202,49 @@ class ReplicaSet:
         self,
         deployment_name,
         event_loop: asyncio.AbstractEventLoop,
+        node_id: Optional[NodeId] = None,
     ):
         self.deployment_name = deployment_name
-        self.in_flight_queries: Dict[RunningReplicaInfo, set] = dict()
-        # The iterator used for load balancing among replicas. Using itertools
-        # cycle, we implements a round-robin policy, skipping overloaded
-        # replicas.
-        # NOTE(simon): We can make this more pluggable and consider different
-        # policies like: min load, pick min of two replicas, pick replicas on
-        # the same node.
-        self.replica_iterator = itertools.cycle(self.in_flight_queries.keys())
-
-        # Used to unblock this replica set waiting for free replicas. A newly
-        # added replica or updated max_concurrent_queries value means the
-        # query that waits on a free replica might be unblocked on.
-
-        # Python 3.8 has deprecated the 'loop' parameter, and Python 3.10 has
-        # removed it alltogether. Call accordingly.
-        if sys.version_info.major >= 3 and sys.version_info.minor >= 10:
-            self.config_updated_event = asyncio.Event()
-        else:
-            self.config_updated_event = asyncio.Event(loop=event_loop)
+        self._event_loop = event_loop
+        # The number of queries assigned to each replica that haven't completed.
+        # This is decremented by a completion callback of each query, so that
+        # tracking in-flight queries doesn't scan all of them.
+        self.num_in_flight_queries: Dict[RunningReplicaInfo, int] = dict()
+        # The node that this replica set runs on, used for locality-aware
+        # replica selection.
+        self.node_id = node_id if node_id is not None else _get_current_node_id()
+        # The policy used for load balancing among replicas. The policy is
+        # configured per deployment, and is updated with the running replicas.
+        self.policy_name = DEFAULT_REPLICA_SELECTION_POLICY
+        self.policy: ReplicaSelectionPolicy = REPLICA_SELECTION_POLICY_CLASSES[
+            self.policy_name
+        ](self.node_id)
+
+        # The model ids loaded in each replica of a multiplexed deployment, as
+        # reported by the replica when a query completes, and the replicas that
+        # have each model id loaded.
+        self.multiplexed_model_ids: Dict[RunningReplicaInfo, Set[str]] = dict()
+        self._replicas_by_model_id: DefaultDict[
+            str, Set[RunningReplicaInfo]
+        ] = collections.defaultdict(set)
+
+        # Queries that wait for a free replica, as a heap ordered by priority
+        # and then arrival. A waiter is woken up when a query completes, and all
+        # of them are woken up when the set of replicas (or their
+        # max_concurrent_queries) changes. Waiters of cancelled queries are
+        # skipped when popped, so num_waiters tracks the actual number.
+        self._free_replica_waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._waiter_counter = itertools.count()
+        self.num_waiters = 0
+
+        # The max number of queued queries before new queries are rejected, or
+        # -1 for no limit. This is configured per deployment.
+        self.max_queued_requests = -1
+        # The total max_concurrent_queries of all replicas.
+        self._total_max_concurrent_queries = 0
+        # Exponential moving average of the time from assigning a query to its
+        # completion, used to reject queries that can't meet their deadline.
+        self._avg_query_latency_s: Optional[float] = None
 
         self.num_queued_queries = 0
         self.num_queued_queries_gauge = metrics.Gauge(
@@ -81,56 +261,204 @@ class ReplicaSet:
 
     def update_running_replicas(self, running_replicas: List[RunningReplicaInfo]):
         added, removed, _ = compute_iterable_delta(
-            self.in_flight_queries.keys(), running_replicas
+            self.num_in_flight_queries.keys(), running_replicas
         )
 
         for new_replica in added:
-            self.in_flight_queries[new_replica] = set()
+            self.num_in_flight_queries[new_replica] = 0
 
         for removed_replica in removed:
             # Delete it directly because shutdown is processed by controller.
-            del self.in_flight_queries[removed_replica]
+            del self.num_in_flight_queries[removed_replica]
+            self._update_multiplexed_model_ids(removed_replica, [])
+
+        if running_replicas:
+            self.max_queued_requests = running_replicas[0].max_queued_requests
+        self._total_max_concurrent_queries = sum(
+            replica.max_concurrent_queries for replica in self.num_in_flight_queries
+        )
+
+        policy_name = (
+            running_replicas[0].replica_selection_policy
+            if running_replicas
+            else self.policy_name
+        )
+        if policy_name != self.policy_name:
+            self.policy_name = policy_name
+            self.policy = REPLICA_SELECTION_POLICY_CLASSES[policy_name](self.node_id)
+            # Make sure the new policy is given the replicas below.
+            added = added or set(self.num_in_flight_queries.keys())
 
         if len(added) > 0 or len(removed) > 0:
-            # Shuffle the keys to avoid synchronization across clients.
-            replicas = list(self.in_flight_queries.keys())
-            random.shuffle(replicas)
-            self.replica_iterator = itertools.cycle(replicas)
+            self.policy.update_replicas(list(self.num_in_flight_queries.keys()))
             logger.debug(f"ReplicaSet: +{len(added)}, -{len(removed)} replicas.")
-            self.config_updated_event.set()
+            while self._free_replica_waiters:
+                self._wake_up_waiter()
 
     def _try_assign_replica(self, query: Query) -> Optional[ray.ObjectRef]:
         """Try to assign query to a replica, return the object ref if succeeded
         or return None if it can't assign this query to any replicas.
         """
-        for _ in range(len(self.in_flight_queries.keys())):
-            replica = next(self.replica_iterator)
-            if len(self.in_flight_queries[replica]) >= replica.max_concurrent_queries:
-                # This replica is overloaded, try next one
-                continue
-
-            logger.debug(
-                f"Assigned query {query.metadata.request_id} "
-                f"to replica {replica.replica_tag}."
+        model_id = query.metadata.multiplexed_model_id
+        replica = None
+        if model_id:
+            replica = self._select_replica_with_model(model_id)
+        if replica is None:
+            replica = self.policy.select_replica(self.num_in_flight_queries)
+        if replica is None:
+            return None
+        if model_id:
+            # The replica will load the model if it hasn't yet, so route
+            # subsequent queries for the model to it as well.
+            self._update_multiplexed_model_ids(
+                replica, self.multiplexed_model_ids.get(replica, set()) | {model_id}
             )
-            # Directly passing args because it might contain an ObjectRef.
-            tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
-                pickle.dumps(query.metadata), *query.args, **query.kwargs
+
+        logger.debug(
+            f"Assigned query {query.metadata.request_id} "
+            f"to replica {replica.replica_tag}."
+        )
+        # Directly passing args because it might contain an ObjectRef.
+        tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
+            pickle.dumps(query.metadata), *query.args, **query.kwargs
+        )
+        self.num_in_flight_queries[replica] += 1
+        asyncio.wrap_future(
+            tracker_ref.future(), loop=self._event_loop
+        ).add_done_callback(
+            functools.partial(self._on_query_completed, replica, time.time())
+        )
+        return user_ref
+
+    def _select_replica_with_model(self, model_id: str) -> Optional[RunningReplicaInfo]:
+        """Return the least loaded available replica that has loaded the model."""
+        candidates = [
+            replica
+            for replica in self._replicas_by_model_id.get(model_id, ())
+            if self.num_in_flight_queries[replica] < replica.max_concurrent_queries
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda r: self.num_in_flight_queries[r])
+
+    def _update_multiplexed_model_ids(
+        self, replica: RunningReplicaInfo, model_ids: Iterable[str]
+    ) -> None:
+        old_model_ids = self.multiplexed_model_ids.pop(replica, set())
+        new_model_ids = set(model_ids)
+        for model_id in old_model_ids - new_model_ids:
+            replicas = self._replicas_by_model_id[model_id]
+            replicas.discard(replica)
+            if not replicas:
+                del self._replicas_by_model_id[model_id]
+        for model_id in new_model_ids - old_model_ids:
+            self._replicas_by_model_id[model_id].add(replica)
+        if new_model_ids:
+            self.multiplexed_model_ids[replica] = new_model_ids
+
+    def _on_query_completed(
+        self, replica: RunningReplicaInfo, start_time: float, tracker: asyncio.Future
+    ) -> None:
+        result = None
+        if not tracker.cancelled() and tracker.exception() is None:
+            result = tracker.result()
+        if isinstance(result, StreamingQueryTracker):
+            # The query stays in flight until its response is streamed.
+            asyncio.wrap_future(
+                result.done_ref.future(), loop=self._event_loop
+            ).add_done_callback(
+                functools.partial(self._on_query_completed, replica, start_time)
             )
-            self.in_flight_queries[replica].add(tracker_ref)
-            return user_ref
-        return None
+            if replica in self.num_in_flight_queries and isinstance(
+                result.loaded_model_ids, list
+            ):
+                self._update_multiplexed_model_ids(replica, result.loaded_model_ids)
+            return
+
+        latency_s = time.time() - start_time
+        if self._avg_query_latency_s is None:
+            self._avg_query_latency_s = latency_s
+        else:
+            self._avg_query_latency_s += 0.1 * (latency_s - self._avg_query_latency_s)
+
+        if replica in self.num_in_flight_queries:
+            self.num_in_flight_queries[replica] -= 1
+            # Replicas of multiplexed deployments report their loaded model
+            # ids in the tracker object.
+            if isinstance(result, list):
+                self._update_multiplexed_model_ids(replica, result)
+            self._wake_up_waiter()
 
-    @property
-    def _all_query_refs(self):
-        return list(itertools.chain.from_iterable(self.in_flight_queries.values()))
+    def _wake_up_waiter(self) -> None:
+        while self._free_replica_waiters:
+            _, _, waiter = heapq.heappop(self._free_replica_waiters)
+            # Skip waiters whose queries were cancelled or timed out.
+            if not waiter.done():
+                waiter.set_result(None)
+                return
 
-    def _drain_completed_object_refs(self) -> int:
-        refs = self._all_query_refs
-        done, _ = ray.wait(refs, num_returns=len(refs), timeout=0)
-        for replica_in_flight_queries in self.in_flight_queries.values():
-            replica_in_flight_queries.difference_update(done)
-        return len(done)
+    async def _wait_for_free_replica(
+        self, key: Tuple[int, int], timeout_s: Optional[float]
+    ) -> bool:
+        """Wait to be woken up when a replica may be free.
+
+        Returns False if the timeout passed first. The key orders the waiters;
+        a query that was woken up but lost the race for the free replica (e.g.,
+        to a concurrent query completion) waits again with the same key to
+        keep its position.
+        """
+        waiter = asyncio.get_event_loop().create_future()
+        heapq.heappush(self._free_replica_waiters, (*key, waiter))
+        self.num_waiters += 1
+        try:
+            done, _ = await asyncio.wait([waiter], timeout=timeout_s)
+        except asyncio.CancelledError:
+            if waiter.done():
+                # Pass the wake up on to the next waiting query.
+                self._wake_up_waiter()
+            else:
+                waiter.cancel()
+            raise
+        finally:
+            self.num_waiters -= 1
+        if not done:
+            if waiter.done():
+                # Woken up after the timeout passed, pass the wake up on.
+                self._wake_up_waiter()
+            else:
+                waiter.cancel()
+            return False
+        return True
+
+    def _check_admission(self, metadata: RequestMetadata) -> None:
+        """Reject a query that would have to wait for a free replica if the
+        queue is full, or if it can't be handled before its deadline."""
+        num_queued = self.num_queued_queries - 1
+        if self.max_queued_requests != -1 and num_queued >= self.max_queued_requests:
+            raise BackPressureError(
+                f"Request {metadata.request_id} was rejected because "
+                f"{num_queued} requests are already queued for deployment "
+                f"'{self.deployment_name}' (max_queued_requests="
+                f"{self.max_queued_requests})."
+            )
+
+        if (
+            metadata.deadline_s is not None
+            and self._avg_query_latency_s is not None
+            and self._total_max_concurrent_queries > 0
+        ):
+            # The queued queries are handled at a rate of the total
+            # max_concurrent_queries per average query latency.
+            estimated_latency_s = self._avg_query_latency_s * (
+                1 + num_queued / self._total_max_concurrent_queries
+            )
+            if time.time() + estimated_latency_s > metadata.deadline_s:
+                raise DeadlineExceededError(
+                    f"Request {metadata.request_id} was rejected because it "
+                    f"can't be handled by its deadline: the estimated latency "
+                    f"of deployment '{self.deployment_name}' is "
+                    f"{estimated_latency_s:.3f}s."
+                )
 
     async def assign_replica(self, query: Query) -> ray.ObjectRef:
         """Given a query, submit it to a replica and return the object ref.
@@ -138,36 +466,46 @@ class ReplicaSet:
         and only send a query to available replicas (determined by the
         max_concurrent_quries value.)
         """
-        endpoint = query.metadata.endpoint
+        metadata = query.metadata
+        endpoint = metadata.endpoint
         self.num_queued_queries += 1
         self.num_queued_queries_gauge.set(
             self.num_queued_queries, tags={"endpoint": endpoint}
         )
-        assigned_ref = self._try_assign_replica(query)
-        while assigned_ref is None:  # Can't assign a replica right now.
-            logger.debug(
-                "Failed to assign a replica for " f"query {query.metadata.request_id}"
-            )
-            # Maybe there exists a free replica, we just need to refresh our
-            # query tracker.
-            num_finished = self._drain_completed_object_refs()
-            # All replicas are really busy, wait for a query to complete or the
-            # config to be updated.
-            if num_finished == 0:
-                logger.debug("All replicas are busy, waiting for a free replica.")
-                await asyncio.wait(
-                    self._all_query_refs + [self.config_updated_event.wait()],
-                    return_when=asyncio.FIRST_COMPLETED,
+        try:
+            if metadata.deadline_s is not None and time.time() >= metadata.deadline_s:
+                raise DeadlineExceededError(
+                    f"Request {metadata.request_id} was rejected because its "
+                    "deadline has passed."
                 )
-                if self.config_updated_event.is_set():
-                    self.config_updated_event.clear()
-            # We are pretty sure a free replica is ready now, let's recurse and
-            # assign this query a replica.
-            assigned_ref = self._try_assign_replica(query)
-        self.num_queued_queries -= 1
-        self.num_queued_queries_gauge.set(
-            self.num_queued_queries, tags={"endpoint": endpoint}
-        )
+
+            # Queries are assigned in order, so only try to assign this query
+            # right away if no other query is waiting.
+            assigned_ref = None
+            if self.num_waiters == 0:
+                assigned_ref = self._try_assign_replica(query)
+            if assigned_ref is None:
+                self._check_admission(metadata)
+            key = (-metadata.priority, next(self._waiter_counter))
+            while assigned_ref is None:  # Can't assign a replica right now.
+                logger.debug(
+                    "All replicas are busy, waiting for a free replica for "
+                    f"query {metadata.request_id}."
+                )
+                timeout_s = None
+                if metadata.deadline_s is not None:
+                    timeout_s = max(0, metadata.deadline_s - time.time())
+                if not await self._wait_for_free_replica(key, timeout_s):
+                    raise DeadlineExceededError(
+                        f"Request {metadata.request_id} was rejected because "
+                        "its deadline passed while waiting for a free replica."
+                    )
+                assigned_ref = self._try_assign_replica(query)
+        finally:
+            self.num_queued_queries -= 1
+            self.num_queued_queries_gauge.set(
+                self.num_queued_queries, tags={"endpoint": endpoint}
+            )
         return assigned_ref
 
 
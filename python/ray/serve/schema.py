@@ -196,6 +196,24 @@ class DeploymentSchema(
         gt=0,
         alias="_health_check_timeout_s",
     )
+    replica_selection_policy: str = Field(
+        default=None,
+        description=(
+            "How routers choose the replica to send each query to: "
+            '"round_robin", "power_of_two_choices", or "prefer_local". '
+            "Uses a default if null."
+        ),
+        alias="_replica_selection_policy",
+    )
+    max_queued_requests: int = Field(
+        default=None,
+        description=(
+            "The max number of requests that each router queues for this "
+            "deployment while all replicas are busy; additional requests are "
+            "rejected. -1 means no limit. Uses a default if null."
+        ),
+        alias="_max_queued_requests",
+    )
     ray_actor_options: RayActorOptionsSchema = Field(
         default=None, description="Options set for each replica actor."
     )
@@ -9,6 +9,7 @@ import ray
 from ray import serve
 from ray._private.test_utils import SignalActor, wait_for_condition
 from ray.serve.application import Application
+from ray.serve.http_proxy import HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES
 
 
 @serve.deployment()
@@ -115,6 +116,43 @@ def test_starlette_response(serve_instance):
     assert resp.status_code == 418
 
 
+def test_streaming_generator_response(serve_instance):
+    signal = SignalActor.remote()
+
+    @serve.deployment(name="sync_gen")
+    def sync_gen(_):
+        for i in range(3):
+            yield f"{i},"
+
+    sync_gen.deploy()
+    assert requests.get("http://127.0.0.1:8000/sync_gen").text == "0,1,2,"
+
+    @serve.deployment(name="async_gen")
+    async def async_gen(_):
+        yield "first"
+        # The first chunk is sent to the client before the response finishes.
+        await signal.wait.remote()
+        yield "second"
+
+    async_gen.deploy()
+    with requests.get("http://127.0.0.1:8000/async_gen", stream=True) as resp:
+        assert resp.status_code == 200
+        chunks = resp.iter_content(chunk_size=None, decode_unicode=True)
+        assert next(chunks) == "first"
+        ray.get(signal.send.remote())
+        assert "".join(chunks) == "second"
+
+    @serve.deployment(name="error_gen")
+    def error_gen(_):
+        raise ValueError("oops")
+        yield
+
+    error_gen.deploy()
+    resp = requests.get("http://127.0.0.1:8000/error_gen")
+    assert resp.status_code == 500
+    assert "oops" in resp.text
+
+
 @pytest.mark.parametrize("use_async", [False, True])
 def test_deploy_function_no_params(serve_instance, use_async):
     serve.start()
@@ -322,6 +360,15 @@ def test_starlette_request(serve_instance):
     resp = requests.post("http://127.0.0.1:8000/api", data=long_string).text
     assert resp == long_string
 
+    # Bodies on either side of the threshold for passing them through the
+    # object store.
+    for size in [
+        HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES - 1,
+        HTTP_BODY_OBJECT_STORE_THRESHOLD_BYTES,
+    ]:
+        resp = requests.post("http://127.0.0.1:8000/api", data="y" * size).text
+        assert resp == "y" * size
+
 
 def test_start_idempotent(serve_instance):
     @serve.deployment(name="start")
@@ -57,6 +57,28 @@ class TestInMemoryMetricsStore:
         assert s.max("m1", window_start_timestamp_s=0) == 2
         assert s.max("m2", window_start_timestamp_s=0) == -1
 
+    def test_max_points_per_key(self):
+        s = InMemoryMetricsStore(max_points_per_key=3)
+        for i in range(100):
+            s.add_metrics_point({"m1": i}, timestamp=i)
+        # Only the newest data points are kept.
+        assert [point.value for point in s.data["m1"]] == [97, 98, 99]
+        assert s.window_average("m1", window_start_timestamp_s=0) == 98
+
+        # Data points older than all kept ones are dropped.
+        s.add_metrics_point({"m1": 1000}, timestamp=0)
+        assert s.max("m1", window_start_timestamp_s=0) == 99
+
+    def test_sliding_window(self):
+        s = InMemoryMetricsStore()
+        values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+        for i, value in enumerate(values):
+            s.add_metrics_point({"m1": value}, timestamp=i)
+            window = values[max(0, i - 2) : i + 1]
+            window_start = i - 2.5
+            assert s.window_average("m1", window_start) == sum(window) / len(window)
+            assert s.max("m1", window_start) == max(window)
+
 
 def test_e2e(serve_instance):
     @serve.deployment(
@@ -9,6 +9,7 @@ from typing import List, Iterable
 from ray._private.test_utils import SignalActor, wait_for_condition
 from ray.serve.autoscaling_policy import (
     BasicAutoscalingPolicy,
+    PredictiveAutoscalingPolicy,
     calculate_desired_num_replicas,
 )
 from ray.serve.common import DeploymentInfo
@@ -533,6 +534,42 @@ def test_single_replica_receives_all_requests(ongoing_requests):
     assert new_num_replicas == sum(ongoing_requests) / target_requests
 
 
+def test_predictive_policy_scales_up_ahead_of_ramp():
+    config = AutoscalingConfig(
+        min_replicas=1,
+        max_replicas=100,
+        target_num_ongoing_requests_per_replica=10,
+        upscale_delay_s=0.0,
+        downscale_delay_s=0.0,
+        forecast_horizon_s=10.0,
+    )
+    basic_policy = BasicAutoscalingPolicy(config)
+    predictive_policy = PredictiveAutoscalingPolicy(config)
+
+    def decide(policy, ongoing_requests):
+        return policy.get_decision_num_replicas(
+            current_num_ongoing_requests=ongoing_requests,
+            curr_target_num_replicas=2,
+            current_handle_queued_queries=0,
+        )
+
+    # A steady load is handled the same way by both policies.
+    for _ in range(20):
+        assert decide(predictive_policy, [10, 10]) == decide(basic_policy, [10, 10])
+
+    # While the load ramps up, the predictive policy scales up further.
+    for i in range(50):
+        ongoing_requests = [10 + i * 0.5] * 2
+        basic_num_replicas = decide(basic_policy, ongoing_requests)
+        predictive_num_replicas = decide(predictive_policy, ongoing_requests)
+        assert predictive_num_replicas >= basic_num_replicas
+    assert predictive_num_replicas > basic_num_replicas
+
+    # It never scales down based on a forecast when the load drops.
+    for _ in range(20):
+        assert decide(predictive_policy, [10, 10]) == decide(basic_policy, [10, 10])
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="Failing on Windows.")
 def test_e2e_bursty(serve_instance):
     """
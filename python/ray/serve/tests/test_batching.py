@@ -4,6 +4,7 @@ import pytest
 
 import ray
 from ray import serve
+from ray.serve.batching import _AdaptiveBatchSizer
 
 
 def test_batching(serve_instance):
@@ -133,6 +134,20 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    with pytest.raises(ValueError):
+
+        class ZeroTargetLatency:
+            @serve.batch(target_latency_s=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class NonTargetLatency:
+            @serve.batch(target_latency_s="a")
+            async def method(self, requests):
+                pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -292,6 +307,42 @@ async def test_batch_args_kwargs(mode, use_class):
     assert result == [("hi1", "hi2"), ("hi3", "hi4")]
 
 
+def test_adaptive_batch_sizer():
+    # The handler takes 10ms plus 1ms per item.
+    sizer = _AdaptiveBatchSizer(64, 0.01, target_latency_s=0.05)
+    assert sizer.batch_size == 1
+    for _ in range(1000):
+        sizer.record(sizer.batch_size, 0.01 + 0.001 * sizer.batch_size)
+    # A batch of 32 takes 42ms, leaving 8ms to wait for a full batch; a batch
+    # of 64 would exceed the target latency.
+    assert sizer.batch_size == 32
+    assert sizer.timeout_s == pytest.approx(0.008)
+
+    # Fall back to unbatched requests if even those exceed the target latency.
+    sizer = _AdaptiveBatchSizer(64, 0.01, target_latency_s=0.005)
+    for _ in range(100):
+        sizer.record(sizer.batch_size, 0.01)
+    assert sizer.batch_size == 1
+    assert sizer.timeout_s == 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batching():
+    batch_sizes = []
+
+    @serve.batch(max_batch_size=8, batch_wait_timeout_s=0.1, target_latency_s=1)
+    async def adaptive(requests):
+        batch_sizes.append(len(requests))
+        await asyncio.sleep(0.01)
+        return requests
+
+    inputs = list(range(200))
+    assert await asyncio.gather(*[adaptive(i) for i in inputs]) == inputs
+    # Starts out unbatched, and grows the batch size as latency allows.
+    assert batch_sizes[0] == 1
+    assert max(batch_sizes) == 8
+
+
 if __name__ == "__main__":
     import sys
 
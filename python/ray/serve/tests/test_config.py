@@ -34,6 +34,12 @@ def test_autoscaling_config_validation():
     # Default values should not raise an error
     AutoscalingConfig()
 
+    # policy must be a known autoscaling policy
+    assert AutoscalingConfig().policy == "basic"
+    AutoscalingConfig(policy="predictive")
+    with pytest.raises(ValidationError, match="policy"):
+        AutoscalingConfig(policy="random")
+
 
 class TestDeploymentConfig:
     def test_deployment_config_validation(self):
@@ -51,6 +57,20 @@ class TestDeploymentConfig:
         # Test dynamic default for max_concurrent_queries.
         assert DeploymentConfig().max_concurrent_queries == 100
 
+        # Test replica_selection_policy validation.
+        assert DeploymentConfig().replica_selection_policy == "round_robin"
+        DeploymentConfig(replica_selection_policy="power_of_two_choices")
+        with pytest.raises(ValidationError, match="replica_selection_policy"):
+            DeploymentConfig(replica_selection_policy="random")
+
+        # Test max_queued_requests validation.
+        assert DeploymentConfig().max_queued_requests == -1
+        DeploymentConfig(max_queued_requests=1)
+        with pytest.raises(ValidationError, match="max_queued_requests"):
+            DeploymentConfig(max_queued_requests=0)
+        with pytest.raises(ValidationError, match="max_queued_requests"):
+            DeploymentConfig(max_queued_requests=-2)
+
     def test_deployment_config_update(self):
         b = DeploymentConfig(num_replicas=1, max_concurrent_queries=1)
 
@@ -229,6 +249,19 @@ def test_with_proto():
     config = DeploymentConfig(user_config={"python": ("native", ["objects"])})
     assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
 
+    config = DeploymentConfig(replica_selection_policy="prefer_local")
+    assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
+
+    config = DeploymentConfig(
+        autoscaling_config={"policy": "predictive", "forecast_horizon_s": 0}
+    )
+    assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
+
+    config = DeploymentConfig(max_queued_requests=10)
+    assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
+    config = DeploymentConfig()
+    assert DeploymentConfig.from_proto_bytes(config.to_proto_bytes()) == config
+
 
 def test_zero_default_proto():
     # Test that options set to zero (protobuf default value) still retain their
@@ -7,7 +7,13 @@ from typing import Dict
 import pytest
 
 import ray
-from ray.serve.long_poll import LongPollClient, LongPollHost, UpdatedObject
+from ray.serve.long_poll import (
+    LONG_POLL_MAX_DELTAS_PER_KEY,
+    LongPollClient,
+    LongPollHost,
+    ObjectDelta,
+    UpdatedObject,
+)
 
 
 def test_host_standalone(serve_instance):
@@ -51,6 +57,70 @@ def test_long_poll_wait_for_keys(serve_instance):
     assert {v.object_snapshot for v in result.values()} == {999}
 
 
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ([1, 2, 3], [2, 3, 4, 5]),
+        ([], [1]),
+        ({"a": 1, "b": 2}, {"b": 3, "c": 4}),
+        ({"a": 1}, {}),
+    ],
+)
+def test_object_delta(old, new):
+    delta = ObjectDelta.diff(old, new)
+    updated = delta.apply(old)
+    if isinstance(new, list):
+        assert sorted(updated) == sorted(new)
+    else:
+        assert updated == new
+
+    # Applying composed deltas is the same as applying them in order.
+    newer = ObjectDelta.diff(new, old)
+    assert delta.compose(newer).apply(old) == old
+
+
+@pytest.mark.asyncio
+async def test_host_delta_updates():
+    host = LongPollHost()
+    host.notify_changed("key", list(range(10)))
+    full_update = (await host.listen_for_change({"key": -1}))["key"]
+    assert not full_update.is_delta
+    assert full_update.object_snapshot == list(range(10))
+
+    # Clients with a recent snapshot only get the changes.
+    host.notify_changed("key", list(range(1, 11)))
+    update = (await host.listen_for_change({"key": full_update.snapshot_id}))["key"]
+    assert update.is_delta
+    assert update.object_snapshot.added == [10]
+    assert update.object_snapshot.removed == [0]
+    assert update.object_snapshot.apply(full_update.object_snapshot) == list(
+        range(1, 11)
+    )
+
+    # Clients that are too far behind get the full object.
+    for i in range(LONG_POLL_MAX_DELTAS_PER_KEY):
+        host.notify_changed("key", list(range(i + 2, i + 12)))
+    update = (await host.listen_for_change({"key": full_update.snapshot_id}))["key"]
+    assert not update.is_delta
+
+    # So do clients for which the changes are larger than the object.
+    snapshot_id = update.snapshot_id
+    host.notify_changed("key", [-1])
+    update = (await host.listen_for_change({"key": snapshot_id}))["key"]
+    assert not update.is_delta
+    assert update.object_snapshot == [-1]
+
+    # Objects updated in place are still diffed against their snapshots.
+    routes = {"/a": "A"}
+    host.notify_changed("routes", routes)
+    snapshot_id = (await host.listen_for_change({"routes": -1}))["routes"].snapshot_id
+    routes.update({"/b": "B", "/c": "C"})
+    host.notify_changed("routes", routes)
+    update = (await host.listen_for_change({"routes": snapshot_id}))["routes"]
+    assert update.is_delta
+    assert update.object_snapshot.added == {"/b": "B", "/c": "C"}
+
+
 def test_long_poll_restarts(serve_instance):
     @ray.remote(
         max_restarts=-1,
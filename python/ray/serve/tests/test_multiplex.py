@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+import requests
+
+import ray
+from ray import serve
+from ray.serve.context import _multiplexed_model_id
+from ray.serve.multiplex import _get_loaded_model_ids
+
+
+def test_decorator_validation():
+    with pytest.raises(TypeError):
+
+        @serve.multiplexed
+        def sync_load(model_id):
+            pass
+
+    with pytest.raises(TypeError):
+
+        @serve.multiplexed(max_num_models_per_replica="a")
+        async def non_int_load(model_id):
+            pass
+
+    with pytest.raises(ValueError):
+
+        @serve.multiplexed(max_num_models_per_replica=0)
+        async def zero_load(model_id):
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_class", [True, False])
+async def test_multiplexed_lru_cache(use_class):
+    loaded = []
+
+    if use_class:
+
+        class ModelServer:
+            @serve.multiplexed(max_num_models_per_replica=2)
+            async def get_model(self, model_id):
+                loaded.append(model_id)
+                await asyncio.sleep(0.01)
+                return f"model-{model_id}"
+
+        get_model = ModelServer().get_model
+
+    else:
+
+        @serve.multiplexed(max_num_models_per_replica=2)
+        async def get_model(model_id):
+            loaded.append(model_id)
+            await asyncio.sleep(0.01)
+            return f"model-{model_id}"
+
+    # Concurrent requests for the same model only load it once.
+    assert await asyncio.gather(*[get_model("1") for _ in range(5)]) == ["model-1"] * 5
+    assert loaded == ["1"]
+
+    assert await get_model("2") == "model-2"
+    assert await get_model("1") == "model-1"
+    assert loaded == ["1", "2"]
+    assert set(_get_loaded_model_ids()) >= {"1", "2"}
+
+    # Loading a third model evicts the least recently used one.
+    assert await get_model("3") == "model-3"
+    assert await get_model("1") == "model-1"
+    assert loaded == ["1", "2", "3"]
+    assert await get_model("2") == "model-2"
+    assert loaded == ["1", "2", "3", "2"]
+
+
+@pytest.mark.asyncio
+async def test_get_multiplexed_model_id():
+    assert serve.get_multiplexed_model_id() == ""
+
+    async def handle(model_id):
+        _multiplexed_model_id.set(model_id)
+        await asyncio.sleep(0.01)
+        return serve.get_multiplexed_model_id()
+
+    # Each request has its own model id.
+    assert await asyncio.gather(handle("1"), handle("2")) == ["1", "2"]
+
+
+def test_multiplexed_deployment(serve_instance):
+    @serve.deployment(num_replicas=2)
+    class ModelServer:
+        @serve.multiplexed(max_num_models_per_replica=2)
+        async def get_model(self, model_id):
+            return (model_id, serve.get_replica_context().replica_tag)
+
+        async def __call__(self, *args):
+            return await self.get_model(serve.get_multiplexed_model_id())
+
+    ModelServer.deploy()
+    handle = ModelServer.get_handle()
+    model_id, replica_tag = ray.get(handle.options(multiplexed_model_id="1").remote())
+    assert model_id == "1"
+    # Requests for the model are routed to the replica that loaded it.
+    for _ in range(10):
+        assert ray.get(handle.options(multiplexed_model_id="1").remote()) == (
+            "1",
+            replica_tag,
+        )
+
+    resp = requests.get(
+        "http://127.0.0.1:8000/ModelServer",
+        headers={"serve_multiplexed_model_id": "1"},
+    )
+    assert resp.json() == ["1", replica_tag]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s", __file__]))
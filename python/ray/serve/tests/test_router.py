@@ -3,12 +3,23 @@ Unit tests for the router class. Please don't add any test that will involve
 controller or the actual replica wrapper, use mock if necessary.
 """
 import asyncio
+import pickle
+import time
 
 import pytest
 
 import ray
 from ray.serve.common import RunningReplicaInfo
-from ray.serve.router import Query, ReplicaSet, RequestMetadata
+from ray.serve.exceptions import BackPressureError, DeadlineExceededError
+from ray.serve.router import (
+    PowerOfTwoChoicesReplicaSelectionPolicy,
+    PreferLocalReplicaSelectionPolicy,
+    Query,
+    ReplicaSet,
+    RequestMetadata,
+    RoundRobinReplicaSelectionPolicy,
+    StreamingQueryTracker,
+)
 from ray._private.test_utils import SignalActor
 
 pytestmark = pytest.mark.asyncio
@@ -137,6 +148,282 @@ async def test_replica_set(ray_instance):
     assert num_queries_set == {2, 1}
 
 
+async def test_replica_set_fifo_order(ray_instance):
+    signal = SignalActor.remote()
+
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        def __init__(self):
+            self._request_ids = []
+
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            self._request_ids.append(pickle.loads(request).request_id)
+            await signal.wait.remote()
+            return b"", "DONE"
+
+        async def request_ids(self):
+            return self._request_ids
+
+    rs = ReplicaSet("my_deployment", asyncio.get_event_loop(), node_id="node")
+    replica = RunningReplicaInfo(
+        deployment_name="my_deployment",
+        replica_tag="0",
+        actor_handle=MockWorker.remote(),
+        max_concurrent_queries=1,
+    )
+    rs.update_running_replicas([replica])
+
+    def query(request_id):
+        return Query([], {}, RequestMetadata(request_id, "endpoint"))
+
+    first_ref = await rs.assign_replica(query("0"))
+    assert rs.num_in_flight_queries[replica] == 1
+
+    # Queue up queries while the replica is busy.
+    pending_tasks = []
+    for i in range(1, 4):
+        pending_tasks.append(
+            asyncio.get_event_loop().create_task(rs.assign_replica(query(str(i))))
+        )
+        await asyncio.sleep(0.1)
+    assert not any(task.done() for task in pending_tasks)
+    assert rs.num_queued_queries == 3
+
+    # Queries are assigned in the order they arrived once the replica is freed.
+    await signal.send.remote()
+    assert await first_ref == "DONE"
+    for task in pending_tasks:
+        assert await (await task) == "DONE"
+    assert await replica.actor_handle.request_ids.remote() == ["0", "1", "2", "3"]
+
+    # The completion callbacks release the replica.
+    while rs.num_in_flight_queries[replica] != 0:
+        await asyncio.sleep(0.1)
+    assert rs.num_queued_queries == 0
+
+
+async def test_replica_set_priority_and_load_shedding(ray_instance):
+    signal = SignalActor.remote()
+
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        def __init__(self):
+            self._request_ids = []
+
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            self._request_ids.append(pickle.loads(request).request_id)
+            await signal.wait.remote()
+            return b"", "DONE"
+
+        async def request_ids(self):
+            return self._request_ids
+
+    rs = ReplicaSet("my_deployment", asyncio.get_event_loop(), node_id="node")
+    replica = RunningReplicaInfo(
+        deployment_name="my_deployment",
+        replica_tag="0",
+        actor_handle=MockWorker.remote(),
+        max_concurrent_queries=1,
+        max_queued_requests=3,
+    )
+    rs.update_running_replicas([replica])
+
+    def query(request_id, priority=0, deadline_s=None):
+        return Query(
+            [],
+            {},
+            RequestMetadata(
+                request_id, "endpoint", priority=priority, deadline_s=deadline_s
+            ),
+        )
+
+    first_ref = await rs.assign_replica(query("0"))
+
+    # Queries that time out while waiting are rejected.
+    with pytest.raises(DeadlineExceededError):
+        await rs.assign_replica(query("timeout", deadline_s=time.time() + 0.1))
+    # Queries whose deadline has passed are rejected right away.
+    with pytest.raises(DeadlineExceededError):
+        await rs.assign_replica(query("expired", deadline_s=time.time() - 1))
+
+    pending_tasks = []
+    for request_id, priority in [("1", 0), ("2", 1), ("3", 0)]:
+        pending_tasks.append(
+            asyncio.get_event_loop().create_task(
+                rs.assign_replica(query(request_id, priority))
+            )
+        )
+        await asyncio.sleep(0.1)
+    assert rs.num_queued_queries == 3
+
+    # Queries beyond max_queued_requests are shed.
+    with pytest.raises(BackPressureError):
+        await rs.assign_replica(query("4"))
+
+    # Higher priority queries are assigned first, then in arrival order.
+    await signal.send.remote()
+    assert await first_ref == "DONE"
+    for task in pending_tasks:
+        assert await (await task) == "DONE"
+    request_ids = await replica.actor_handle.request_ids.remote()
+    assert request_ids == ["0", "2", "1", "3"]
+
+
+async def test_replica_set_multiplexed_model_routing(ray_instance):
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        def __init__(self, tag):
+            self._tag = tag
+            self._model_ids = []
+
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            model_id = pickle.loads(request).multiplexed_model_id
+            if model_id and model_id not in self._model_ids:
+                self._model_ids.append(model_id)
+            # Replicas of multiplexed deployments report their loaded models.
+            return list(self._model_ids), self._tag
+
+    rs = ReplicaSet("my_deployment", asyncio.get_event_loop(), node_id="node")
+    replicas = [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=MockWorker.remote(str(i)),
+            max_concurrent_queries=10,
+        )
+        for i in range(4)
+    ]
+    rs.update_running_replicas(replicas)
+
+    def query(model_id):
+        return Query(
+            [],
+            {},
+            RequestMetadata("request-id", "endpoint", multiplexed_model_id=model_id),
+        )
+
+    # Queries for a model go to the replica that loaded it first.
+    for model_id in ["a", "b"]:
+        first_tag = await (await rs.assign_replica(query(model_id)))
+        for _ in range(10):
+            assert await (await rs.assign_replica(query(model_id))) == first_tag
+
+    while sum(rs.num_in_flight_queries.values()) != 0:
+        await asyncio.sleep(0.1)
+    assert sum(len(ids) for ids in rs.multiplexed_model_ids.values()) == 2
+
+    # Removed replicas are no longer considered to have models loaded.
+    rs.update_running_replicas([])
+    assert rs.multiplexed_model_ids == {}
+
+
+async def test_replica_set_streaming_query_in_flight(ray_instance):
+    signal = SignalActor.remote()
+
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            # The response is streamed until the signal is sent.
+            return StreamingQueryTracker(signal.wait.remote()), "STREAM"
+
+    rs = ReplicaSet("my_deployment", asyncio.get_event_loop())
+    replica = RunningReplicaInfo(
+        deployment_name="my_deployment",
+        replica_tag="0",
+        actor_handle=MockWorker.remote(),
+        max_concurrent_queries=1,
+    )
+    rs.update_running_replicas([replica])
+
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    assert await (await rs.assign_replica(query)) == "STREAM"
+
+    # The query is still in flight while its response is streamed, so the
+    # replica is full.
+    second_ref_pending_task = asyncio.get_event_loop().create_task(
+        rs.assign_replica(query)
+    )
+    await asyncio.sleep(0.5)
+    assert rs.num_in_flight_queries[replica] == 1
+    assert not second_ref_pending_task.done()
+
+    await signal.send.remote()
+    assert await (await second_ref_pending_task) == "STREAM"
+
+
+def _mock_replica_infos(num_replicas, node_ids=None, max_concurrent_queries=10):
+    return [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=None,
+            max_concurrent_queries=max_concurrent_queries,
+            node_id=node_ids[i] if node_ids else None,
+        )
+        for i in range(num_replicas)
+    ]
+
+
+async def test_power_of_two_choices_policy():
+    replicas = _mock_replica_infos(4)
+    policy = PowerOfTwoChoicesReplicaSelectionPolicy()
+    policy.update_replicas(replicas)
+
+    # The most loaded replica is never chosen.
+    in_flight = {r: i for i, r in enumerate(replicas)}
+    for _ in range(100):
+        assert policy.select_replica(in_flight) != replicas[3]
+
+    # Full replicas are skipped.
+    in_flight = {r: 10 for r in replicas}
+    assert policy.select_replica(in_flight) is None
+    in_flight[replicas[2]] = 3
+    for _ in range(10):
+        assert policy.select_replica(in_flight) == replicas[2]
+
+
+async def test_prefer_local_policy():
+    replicas = _mock_replica_infos(4, node_ids=["a", "b", "b", "c"])
+    policy = PreferLocalReplicaSelectionPolicy("b")
+    policy.update_replicas(replicas)
+
+    in_flight = {r: 0 for r in replicas}
+    for _ in range(100):
+        assert policy.select_replica(in_flight).node_id == "b"
+
+    # Fall back to remote replicas if the local ones are full.
+    in_flight[replicas[1]] = 10
+    in_flight[replicas[2]] = 10
+    for _ in range(100):
+        assert policy.select_replica(in_flight).node_id in {"a", "c"}
+
+
+async def test_replica_set_policy_from_replicas(ray_instance):
+    rs = ReplicaSet("my_deployment", asyncio.get_event_loop(), node_id="node")
+    assert isinstance(rs.policy, RoundRobinReplicaSelectionPolicy)
+
+    replicas = [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=mock_task_runner(),
+            max_concurrent_queries=1,
+            replica_selection_policy="power_of_two_choices",
+        )
+        for i in range(2)
+    ]
+    rs.update_running_replicas(replicas)
+    assert isinstance(rs.policy, PowerOfTwoChoicesReplicaSelectionPolicy)
+
+    query = Query([], {}, RequestMetadata("request-id", "endpoint"))
+    refs = [await rs.assign_replica(query) for _ in range(4)]
+    assert [await ref for ref in refs] == ["DONE"] * 4
+
+
 if __name__ == "__main__":
     import sys
 
@@ -37,12 +37,14 @@ class DEFAULT(Enum):
 
 
 def parse_request_item(request_item):
-    if len(request_item.args) == 1:
-        arg = request_item.args[0]
-        if request_item.metadata.http_arg_is_pickled:
-            assert isinstance(arg, bytes)
-            arg: HTTPRequestWrapper = pickle.loads(arg)
-            return (build_starlette_request(arg.scope, arg.body),), {}
+    if request_item.metadata.http_arg_is_pickled and len(request_item.args) in (1, 2):
+        arg, *body = request_item.args
+        assert isinstance(arg, bytes)
+        arg: HTTPRequestWrapper = pickle.loads(arg)
+        # Large bodies are passed through the object store, as a separate
+        # argument.
+        http_body = body[0] if body else arg.body
+        return (build_starlette_request(arg.scope, http_body),), {}
 
     return request_item.args, request_item.kwargs
 
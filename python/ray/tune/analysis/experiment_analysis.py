@@ -4,7 +4,7 @@ import os
 import traceback
 from numbers import Number
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from ray.air.checkpoint import Checkpoint
 from ray.tune.cloud import TrialCheckpoint
@@ -21,10 +21,12 @@ except ImportError:
     DataFrame = None
 
 from ray.tune.error import TuneError
+from ray.tune.logger import get_parquet_file_parts
 from ray.tune.result import (
     DEFAULT_METRIC,
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
+    EXPR_PARQUET_FILE,
     EXPR_PARAM_FILE,
     CONFIG_PREFIX,
     TRAINING_ITERATION,
@@ -32,6 +34,7 @@ from ray.tune.result import (
 from ray.tune.trial import Trial
 from ray.tune.trial_runner import (
     find_newest_experiment_checkpoint,
+    load_experiment_checkpoint,
     load_trial_from_checkpoint,
 )
 from ray.tune.utils.trainable import TrainableUtil
@@ -39,6 +42,9 @@ from ray.tune.utils.util import unflattened_lookup
 
 from ray.util.annotations import PublicAPI
 
+if TYPE_CHECKING:
+    import pyarrow.parquet as pq
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_FILE_TYPE = "csv"
@@ -64,6 +70,11 @@ class ExperimentAnalysis:
         default_mode: Default mode for comparing results. Has to be one
             of [min, max]. Can be overwritten with the ``mode`` parameter
             in the respective functions.
+        file_type: Read results from json, csv or parquet files. Has to be
+            one of [None, json, csv, parquet]. Defaults to csv. Parquet
+            results, as written by the ``ParquetLoggerCallback``, are loaded
+            lazily: only the columns that are needed are read, when they
+            are needed.
 
     Example:
         >>> from ray import tune
@@ -80,6 +91,7 @@ class ExperimentAnalysis:
         default_metric: Optional[str] = None,
         default_mode: Optional[str] = None,
         sync_config: Optional[SyncConfig] = None,
+        file_type: Optional[str] = None,
     ):
         # Load the experiment checkpoints and their parent paths.
         # This is important for when experiment folders have been
@@ -92,12 +104,13 @@ class ExperimentAnalysis:
 
         self._configs = {}
         self._trial_dataframes = {}
+        self._fetched_trial_dataframes = False
 
         self.default_metric = default_metric
         if default_mode and default_mode not in ["min", "max"]:
             raise ValueError("`default_mode` has to be None or one of [min, max]")
         self.default_mode = default_mode
-        self._file_type = self._validate_filetype(None)
+        self._file_type = self._validate_filetype(file_type)
 
         if self.default_metric is None and self.default_mode:
             # If only a mode was passed, use anonymous metric
@@ -110,7 +123,7 @@ class ExperimentAnalysis:
                 "pandas not installed. Run `pip install pandas` for "
                 "ExperimentAnalysis utilities."
             )
-        else:
+        elif self._file_type != "parquet":
             self.fetch_trial_dataframes()
 
         self._sync_config = sync_config
@@ -141,9 +154,8 @@ class ExperimentAnalysis:
     def _load_checkpoints_from_latest(self, latest_checkpoint: List[str]) -> None:
         # Collect all checkpoints and their directory paths.
         for path in latest_checkpoint:
-            with open(path) as f:
-                experiment_state = json.load(f, cls=TuneFunctionDecoder)
-                self._experiment_states.append(experiment_state)
+            experiment_state = load_experiment_checkpoint(path)
+            self._experiment_states.append(experiment_state)
 
             if "checkpoints" not in experiment_state:
                 raise TuneError("Experiment state invalid; no checkpoints found.")
@@ -301,7 +313,7 @@ class ExperimentAnalysis:
                 "parameter to `tune.run()`."
             )
         best_logdir = self.best_logdir
-        return self.trial_dataframes[best_logdir]
+        return self._get_trial_dataframe(best_logdir)
 
     @property
     def best_result(self) -> Dict:
@@ -367,6 +379,8 @@ class ExperimentAnalysis:
     @property
     def trial_dataframes(self) -> Dict[str, DataFrame]:
         """List of all dataframes of the trials."""
+        if self._file_type == "parquet" and not self._fetched_trial_dataframes:
+            self.fetch_trial_dataframes()
         return self._trial_dataframes
 
     def dataframe(
@@ -430,7 +444,9 @@ class ExperimentAnalysis:
             chkpt_df = TrainableUtil.get_checkpoints_paths(trial_dir)
 
             # Join with trial dataframe to get metrics.
-            trial_df = self.trial_dataframes[trial_dir]
+            trial_df = self._get_trial_dataframe(
+                trial_dir, columns=[TRAINING_ITERATION, metric]
+            )
             path_metric_df = chkpt_df.merge(
                 trial_df, on="training_iteration", how="inner"
             )
@@ -721,13 +737,30 @@ class ExperimentAnalysis:
                     df = pd.read_csv(
                         os.path.join(path, EXPR_PROGRESS_FILE), dtype=force_dtype
                     )
-                self.trial_dataframes[path] = df
+                elif self._file_type == "parquet":
+                    df = _read_parquet_results(path)
+                self._trial_dataframes[path] = df
             except Exception:
                 fail_count += 1
 
         if fail_count:
             logger.debug("Couldn't read results from {} paths".format(fail_count))
-        return self.trial_dataframes
+        self._fetched_trial_dataframes = True
+        return self._trial_dataframes
+
+    def _get_trial_dataframe(
+        self, path: str, columns: Optional[List[str]] = None
+    ) -> DataFrame:
+        """Returns the dataframe of a trial.
+
+        Parquet results that weren't fetched yet are read from disk, with only
+        the given columns if any."""
+        if path in self._trial_dataframes or self._file_type != "parquet":
+            return self._trial_dataframes[path]
+        df = _read_parquet_results(path, columns=columns)
+        if columns is None:
+            self._trial_dataframes[path] = df
+        return df
 
     def stats(self) -> Dict:
         """Returns a dictionary of the statistics of the experiment.
@@ -749,11 +782,16 @@ class ExperimentAnalysis:
         """Overrides the existing file type.
 
         Args:
-            file_type: Read results from json or csv files. Has to be one
-                of [None, json, csv]. Defaults to csv.
+            file_type: Read results from json, csv or parquet files. Has to
+                be one of [None, json, csv, parquet]. Defaults to csv.
         """
         self._file_type = self._validate_filetype(file_type)
-        self.fetch_trial_dataframes()
+        if self._file_type == "parquet":
+            # Parquet results are loaded lazily.
+            self._trial_dataframes = {}
+            self._fetched_trial_dataframes = False
+        else:
+            self.fetch_trial_dataframes()
         return True
 
     def runner_data(self) -> Dict:
@@ -807,8 +845,10 @@ class ExperimentAnalysis:
         return _trial_paths
 
     def _validate_filetype(self, file_type: Optional[str] = None):
-        if file_type not in {None, "json", "csv"}:
-            raise ValueError("`file_type` has to be None or one of [json, csv].")
+        if file_type not in {None, "json", "csv", "parquet"}:
+            raise ValueError(
+                "`file_type` has to be None or one of [json, csv, parquet]."
+            )
         return file_type or DEFAULT_FILE_TYPE
 
     def _validate_metric(self, metric: str) -> str:
@@ -834,6 +874,8 @@ class ExperimentAnalysis:
     ) -> Dict[str, Any]:
         assert mode is None or mode in ["max", "min"]
         assert not mode or metric
+        if self._file_type == "parquet" and not self._fetched_trial_dataframes:
+            return self._retrieve_parquet_rows(metric=metric, mode=mode)
         rows = {}
         for path, df in self.trial_dataframes.items():
             if mode == "max":
@@ -852,6 +894,35 @@ class ExperimentAnalysis:
 
         return rows
 
+    def _retrieve_parquet_rows(
+        self, metric: Optional[str] = None, mode: Optional[str] = None
+    ) -> Dict[str, Any]:
+        # Only read the metric column of each trial to find the row, and then
+        # the row group with that row.
+        rows = {}
+        fail_count = 0
+        for path in self._get_trial_paths():
+            try:
+                if mode:
+                    df = _read_parquet_results(path, columns=[metric])
+                    idx = df[metric].idxmax() if mode == "max" else df[metric].idxmin()
+                else:
+                    idx = -1
+            except Exception:
+                fail_count += 1
+                continue
+            try:
+                rows[path] = _read_parquet_row(path, idx)
+            except (TypeError, ValueError):
+                # idx is nan
+                logger.warning(
+                    "Warning: Non-numerical value(s) encountered for {}".format(path)
+                )
+
+        if fail_count:
+            logger.debug("Couldn't read results from {} paths".format(fail_count))
+        return rows
+
     def __getstate__(self) -> Dict[str, Any]:
         """Ensure that trials are marked as stubs when pickling,
         so that they can be loaded later without the trainable
@@ -870,5 +941,59 @@ class ExperimentAnalysis:
         return state
 
 
+def _read_parquet_results(
+    logdir: str, columns: Optional[List[str]] = None
+) -> DataFrame:
+    """Reads the Parquet results of a trial into a dataframe.
+
+    If ``columns`` is set, only these columns are read from disk."""
+    dfs = []
+    for parquet_file in _open_parquet_file_parts(logdir):
+        file_columns = None
+        if columns is not None:
+            names = parquet_file.schema_arrow.names
+            file_columns = [column for column in columns if column in names]
+        dfs.append(parquet_file.read(columns=file_columns).to_pandas())
+    if not dfs:
+        raise FileNotFoundError(os.path.join(logdir, EXPR_PARQUET_FILE))
+    return pd.concat(dfs, ignore_index=True)
+
+
+def _open_parquet_file_parts(logdir: str) -> List["pq.ParquetFile"]:
+    """Opens the Parquet result files of a trial.
+
+    The last part is skipped if it has no footer yet, i.e. if the trial is
+    still writing to it."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    paths = get_parquet_file_parts(logdir)
+    parquet_files = []
+    for i, path in enumerate(paths):
+        try:
+            parquet_files.append(pq.ParquetFile(path))
+        except pa.ArrowInvalid:
+            if i < len(paths) - 1:
+                raise
+    return parquet_files
+
+
+def _read_parquet_row(logdir: str, idx: int) -> Dict[str, Any]:
+    """Reads a single result of a trial from its Parquet results, only
+    loading the row group that contains it."""
+    parquet_files = _open_parquet_file_parts(logdir)
+    num_rows = sum(parquet_file.metadata.num_rows for parquet_file in parquet_files)
+    if idx < 0:
+        idx += num_rows
+    for parquet_file in parquet_files:
+        for i in range(parquet_file.num_row_groups):
+            row_group_rows = parquet_file.metadata.row_group(i).num_rows
+            if idx < row_group_rows:
+                row_group = parquet_file.read_row_group(i)
+                return row_group.slice(int(idx), 1).to_pandas().iloc[0].to_dict()
+            idx -= row_group_rows
+    raise ValueError(f"Row {idx} not found in the results of {logdir}.")
+
+
 def _decode_checkpoint_from_experiment_state(cp: Union[str, dict]) -> dict:
     return json.loads(cp, cls=TuneFunctionDecoder) if isinstance(cp, str) else cp
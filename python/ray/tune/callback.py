@@ -208,6 +208,30 @@ class Callback(metaclass=_CallbackMeta):
         """
         pass
 
+    def on_trial_results(
+        self,
+        iteration: int,
+        trials: List["Trial"],
+        trials_and_results: List[Tuple["Trial", Dict]],
+        **info,
+    ):
+        """Called after receiving a batch of results, one per trial.
+
+        The default implementation calls ``on_trial_result`` for each
+        result. Override this to handle the results of many trials at once.
+
+        Arguments:
+            iteration: Number of iterations of the tuning loop.
+            trials: List of trials.
+            trials_and_results: Trials that just sent a result, and the
+                results that they sent.
+            **info: Kwargs dict for forward compatibility.
+        """
+        for trial, result in trials_and_results:
+            self.on_trial_result(
+                iteration=iteration, trials=trials, trial=trial, result=result, **info
+            )
+
     def on_trial_complete(
         self, iteration: int, trials: List["Trial"], trial: "Trial", **info
     ):
@@ -319,6 +343,10 @@ class CallbackList(Callback):
         for callback in self._callbacks:
             callback.on_trial_result(**info)
 
+    def on_trial_results(self, **info):
+        for callback in self._callbacks:
+            callback.on_trial_results(**info)
+
     def on_trial_complete(self, **info):
         for callback in self._callbacks:
             callback.on_trial_complete(**info)
@@ -11,6 +11,7 @@ from numbers import Number
 
 from typing import Any, Callable, Optional
 
+import ray.cloudpickle as pickle
 from ray.util.annotations import DeveloperAPI
 from six.moves import queue
 
@@ -495,7 +496,13 @@ class FunctionRunner(Trainable):
 
         return checkpoint_path
 
-    def save_to_object(self):
+    def save_to_object(self, in_memory: bool = False):
+        if in_memory:
+            checkpoint = self._status_reporter.get_checkpoint()
+            if isinstance(checkpoint, dict):
+                return TrainableUtil.checkpoint_dict_to_object(
+                    checkpoint, self.get_state()
+                )
         checkpoint_path = self.save()
         obj = TrainableUtil.checkpoint_to_object(checkpoint_path)
         return obj
@@ -514,11 +521,15 @@ class FunctionRunner(Trainable):
         self._status_reporter.set_checkpoint(checkpoint, is_new=False)
 
     def restore_from_object(self, obj):
+        info = pickle.loads(obj)
+        if "checkpoint_dict" in info:
+            self._restore_from_dict(info["checkpoint_dict"], info["metadata"])
+            return
         self.temp_checkpoint_dir = FuncCheckpointUtil.mk_temp_checkpoint_dir(
             self.logdir
         )
         checkpoint_path = TrainableUtil.create_from_pickle(
-            obj, self.temp_checkpoint_dir
+            info, self.temp_checkpoint_dir
         )
         self.restore(checkpoint_path)
 
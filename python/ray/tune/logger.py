@@ -20,11 +20,14 @@ from ray.tune.result import (
     EXPR_PARAM_PICKLE_FILE,
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
+    EXPR_PARQUET_FILE,
 )
 from ray.tune.utils import flatten_dict
 from ray.util.annotations import PublicAPI, DeveloperAPI
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from ray.tune.trial import Trial  # noqa: F401
 
 logger = logging.getLogger(__name__)
@@ -617,6 +620,157 @@ class CSVLoggerCallback(LoggerCallback):
         del self._trial_files[trial]
 
 
+def get_parquet_file_parts(logdir: str) -> List[str]:
+    """Returns the Parquet result files of a trial, in the order they were
+    written."""
+    base, ext = os.path.splitext(EXPR_PARQUET_FILE)
+    parts = []
+    part = 0
+    while True:
+        file_name = EXPR_PARQUET_FILE if part == 0 else f"{base}.{part}{ext}"
+        path = os.path.join(logdir, file_name)
+        if not os.path.exists(path):
+            return parts
+        parts.append(path)
+        part += 1
+
+
+@PublicAPI(stability="alpha")
+class ParquetLoggerCallback(LoggerCallback):
+    """Logs results to progress.parquet under the trial directory.
+
+    Results are buffered and written as a Parquet row group every
+    ``row_group_size`` results, so that they can be read by column, e.g. with
+    ``ExperimentAnalysis(..., file_type="parquet")``. Nested dicts in the
+    result dict are flattened like in the ``CSVLoggerCallback``.
+
+    The columns are fixed by the first row group: columns that are added in
+    later results are not logged, and integer columns are stored as floats so
+    that later float values fit in them. A file is only readable once it's
+    closed, since the Parquet footer is written then. So the results are split
+    into parts, e.g. ``progress.1.parquet``, and a part is closed every
+    ``row_groups_per_part`` row groups and when the trial ends. Results that
+    are logged after a trial is restored are written to a new part as well.
+
+    Args:
+        row_group_size: Number of results in each row group.
+        row_groups_per_part: Number of row groups in each part.
+    """
+
+    # Columns that are always integers, and are kept as integers.
+    _INT_COLUMNS = (TRAINING_ITERATION,)
+
+    def __init__(self, row_group_size: int = 256, row_groups_per_part: int = 4):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            if log_once("parquet-install"):
+                logger.info("pip install pyarrow to log results in Parquet format.")
+            raise
+        self._pa = pa
+        self._pq = pq
+        self._row_group_size = row_group_size
+        self._row_groups_per_part = row_groups_per_part
+        self._trial_schemas: Dict["Trial", "pa.Schema"] = {}
+        self._trial_writers: Dict["Trial", "pa.parquet.ParquetWriter"] = {}
+        self._trial_row_groups: Dict["Trial", int] = {}
+        self._trial_rows: Dict["Trial", List[Dict]] = {}
+
+    def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
+        if trial not in self._trial_rows:
+            self._trial_rows[trial] = []
+
+        tmp = result.copy()
+        tmp.pop("config", None)
+        self._trial_rows[trial].append(flatten_dict(tmp, delimiter="/"))
+        if len(self._trial_rows[trial]) >= self._row_group_size:
+            self._write_row_group(trial)
+
+    def log_trial_end(self, trial: "Trial", failed: bool = False):
+        if trial not in self._trial_rows:
+            return
+
+        self._write_row_group(trial)
+        del self._trial_rows[trial]
+        self._close_part(trial)
+        self._trial_schemas.pop(trial, None)
+
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        # Close the files of trials that didn't end, e.g. paused trials.
+        for trial in list(self._trial_rows):
+            self.log_trial_end(trial)
+
+    def _write_row_group(self, trial: "Trial"):
+        rows = self._trial_rows[trial]
+        if not rows:
+            return
+
+        writer = self._trial_writers.get(trial)
+        if writer is None:
+            if trial not in self._trial_schemas:
+                self._trial_schemas[trial] = self._infer_schema(rows)
+            trial.init_logdir()
+            base, ext = os.path.splitext(EXPR_PARQUET_FILE)
+            num_parts = len(get_parquet_file_parts(trial.logdir))
+            file_name = (
+                EXPR_PARQUET_FILE if num_parts == 0 else f"{base}.{num_parts}{ext}"
+            )
+            writer = self._pq.ParquetWriter(
+                os.path.join(trial.logdir, file_name), self._trial_schemas[trial]
+            )
+            self._trial_writers[trial] = writer
+            self._trial_row_groups[trial] = 0
+
+        columns = []
+        for field in writer.schema:
+            values = [row.get(field.name) for row in rows]
+            try:
+                columns.append(self._pa.array(values, type=field.type))
+            except (self._pa.ArrowInvalid, self._pa.ArrowTypeError):
+                if log_once(f"parquet-column-{field.name}"):
+                    logger.warning(
+                        f"Values of `{field.name}` don't match the type of its "
+                        f"first values ({field.type}), writing them as nulls."
+                    )
+                columns.append(self._pa.nulls(len(rows), type=field.type))
+        writer.write_table(self._pa.Table.from_arrays(columns, schema=writer.schema))
+        rows.clear()
+        self._trial_row_groups[trial] += 1
+        if self._trial_row_groups[trial] >= self._row_groups_per_part:
+            # Write the footer, so that the results so far can be read.
+            self._close_part(trial)
+
+    def _close_part(self, trial: "Trial"):
+        writer = self._trial_writers.pop(trial, None)
+        if writer is not None:
+            writer.close()
+        self._trial_row_groups.pop(trial, None)
+
+    def _infer_schema(self, rows: List[Dict]) -> "pa.Schema":
+        pa = self._pa
+        fields = []
+        names = {}
+        for row in rows:
+            names.update(dict.fromkeys(row))
+        for name in names:
+            try:
+                arrow_type = pa.array([row.get(name) for row in rows]).type
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                if log_once(f"parquet-column-{name}"):
+                    logger.warning(
+                        f"Values of `{name}` can't be stored in Parquet, "
+                        f"skipping them."
+                    )
+                continue
+            if pa.types.is_null(arrow_type):
+                arrow_type = pa.float64()
+            elif pa.types.is_integer(arrow_type) and name not in self._INT_COLUMNS:
+                arrow_type = pa.float64()
+            fields.append(pa.field(name, arrow_type))
+        return pa.schema(fields)
+
+
 @PublicAPI
 class TBXLoggerCallback(LoggerCallback):
     """TensorBoardX Logger.
@@ -725,6 +725,7 @@ class RayTrialExecutor:
         trial: Trial,
         storage: str = _TuneCheckpoint.PERSISTENT,
         result: Optional[Dict] = None,
+        in_memory: bool = False,
     ) -> _TuneCheckpoint:
         """Saves the trial's state to a checkpoint asynchronously.
 
@@ -734,6 +735,9 @@ class RayTrialExecutor:
                 PERSISTENT.
             result: The state of this trial as a dictionary to be saved.
                 If result is None, the trial's last result will be used.
+            in_memory: If True and storage is MEMORY, dict checkpoints are
+                serialized into the object store without writing them to
+                disk first. See ``Trainable.save_to_object()``.
 
         Returns:
              Checkpoint object, or None if an Exception occurs.
@@ -742,7 +746,10 @@ class RayTrialExecutor:
         result = result or trial.last_result
         with self._change_working_directory(trial):
             if storage == _TuneCheckpoint.MEMORY:
-                value = trial.runner.save_to_object.remote()
+                if in_memory:
+                    value = trial.runner.save_to_object.remote(in_memory=True)
+                else:
+                    value = trial.runner.save_to_object.remote()
                 checkpoint = _TuneCheckpoint(storage, value, result)
                 trial.on_checkpoint(checkpoint)
             else:
@@ -973,43 +980,94 @@ class RayTrialExecutor:
             # non PG_READY event
             ###################################################################
             result_type, trial_or_pg = self._futures.pop(ready_future)
-            if result_type == _ExecutorEventType.STOP_RESULT:
-                pg = trial_or_pg
-                post_stop_cleanup(ready_future, pg)
+            event = self._get_event_for_future(ready_future, result_type, trial_or_pg)
+            if event is not None:
+                return event
+
+    def get_next_executor_events(
+        self, live_trials: Set[Trial], next_trial_exists: bool, max_events: int = 1
+    ) -> List[_ExecutorEvent]:
+        """Get the next executor events to be processed in TrialRunner.
+
+        Waits for the next event like `get_next_executor_event`. If it is a
+        training result, the training results of other trials that are ready
+        already are returned with it, up to `max_events` events in total and
+        at most one per trial. This lets TrialRunner process the results of
+        many trials in one step.
+        """
+        events = [self.get_next_executor_event(live_trials, next_trial_exists)]
+        if max_events <= 1 or events[0].type != _ExecutorEventType.TRAINING_RESULT:
+            return events
+
+        trials = {events[0].trial}
+        futures_to_check = [
+            future
+            for future, (result_type, trial_or_pg) in self._futures.items()
+            if result_type
+            in (_ExecutorEventType.TRAINING_RESULT, _ExecutorEventType.STOP_RESULT)
+            and trial_or_pg not in trials
+        ]
+        if not futures_to_check:
+            return events
+        ready_futures, _ = ray.wait(
+            futures_to_check, num_returns=len(futures_to_check), timeout=0
+        )
+        for ready_future in ready_futures:
+            if len(events) >= max_events:
+                break
+            result_type, trial_or_pg = self._futures.pop(ready_future)
+            event = self._get_event_for_future(ready_future, result_type, trial_or_pg)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _get_event_for_future(
+        self,
+        future: ray.ObjectRef,
+        result_type: _ExecutorEventType,
+        trial_or_pg: Union[Trial, PlacementGroup],
+    ) -> Optional[_ExecutorEvent]:
+        """Get the event for a ready future that was popped from `_futures`.
+
+        Returns None for `STOP_RESULT`, which is handled here."""
+        if result_type == _ExecutorEventType.STOP_RESULT:
+            pg = trial_or_pg
+            post_stop_cleanup(future, pg)
+            return None
+
+        trial = trial_or_pg
+        assert isinstance(trial, Trial)
+        try:
+            future_result = ray.get(future)
+            # For local mode
+            if isinstance(future_result, _LocalWrapper):
+                future_result = future_result.unwrap()
+            if result_type in (
+                _ExecutorEventType.TRAINING_RESULT,
+                _ExecutorEventType.SAVING_RESULT,
+                _ExecutorEventType.RESTORING_RESULT,
+            ):
+                logger.debug(f"Returning [{result_type}] for trial {trial}")
+                return _ExecutorEvent(
+                    result_type,
+                    trial,
+                    result={_ExecutorEvent.KEY_FUTURE_RESULT: future_result},
+                )
             else:
-                trial = trial_or_pg
-                assert isinstance(trial, Trial)
-                try:
-                    future_result = ray.get(ready_future)
-                    # For local mode
-                    if isinstance(future_result, _LocalWrapper):
-                        future_result = future_result.unwrap()
-                    if result_type in (
-                        _ExecutorEventType.TRAINING_RESULT,
-                        _ExecutorEventType.SAVING_RESULT,
-                        _ExecutorEventType.RESTORING_RESULT,
-                    ):
-                        logger.debug(f"Returning [{result_type}] for trial {trial}")
-                        return _ExecutorEvent(
-                            result_type,
-                            trial,
-                            result={_ExecutorEvent.KEY_FUTURE_RESULT: future_result},
-                        )
-                    else:
-                        raise TuneError(f"Unexpected future type - [{result_type}]")
-                except RayTaskError as e:
-                    return _ExecutorEvent(
-                        _ExecutorEventType.ERROR,
-                        trial,
-                        result={_ExecutorEvent.KEY_EXCEPTION: e.as_instanceof_cause()},
-                    )
-                except Exception:
-                    return _ExecutorEvent(
-                        _ExecutorEventType.ERROR,
-                        trial,
-                        result={
-                            _ExecutorEvent.KEY_EXCEPTION: _TuneNoNextExecutorEventError(
-                                traceback.format_exc()
-                            )
-                        },
+                raise TuneError(f"Unexpected future type - [{result_type}]")
+        except RayTaskError as e:
+            return _ExecutorEvent(
+                _ExecutorEventType.ERROR,
+                trial,
+                result={_ExecutorEvent.KEY_EXCEPTION: e.as_instanceof_cause()},
+            )
+        except Exception:
+            return _ExecutorEvent(
+                _ExecutorEventType.ERROR,
+                trial,
+                result={
+                    _ExecutorEvent.KEY_EXCEPTION: _TuneNoNextExecutorEventError(
+                        traceback.format_exc()
                     )
+                },
+            )
@@ -146,5 +146,10 @@ EXPR_PROGRESS_FILE = "progress.csv"
 # File that stores results of the trial.
 EXPR_RESULT_FILE = "result.json"
 
+# File that stores the results of the trial in Parquet format. Results that
+# are logged after the trial is restored are stored in numbered parts of it,
+# e.g. "progress.1.parquet".
+EXPR_PARQUET_FILE = "progress.parquet"
+
 # Config prefix when using ExperimentAnalysis.
 CONFIG_PREFIX = "config"
@@ -7,6 +7,8 @@ import random
 import shutil
 from typing import Callable, Dict, List, Optional, Tuple, Union
 
+import ray
+from ray.experimental import get_object_locations
 from ray.tune import trial_runner
 from ray.tune.error import TuneError
 from ray.tune.result import DEFAULT_METRIC, TRAINING_ITERATION
@@ -29,6 +31,7 @@ class _PBTTrialState:
         self.orig_tag = trial.experiment_tag
         self.last_score = None
         self.last_checkpoint = None
+        self.last_checkpoint_size = 0  # Used with a checkpoint memory budget.
         self.last_perturbation_time = 0
         self.last_train_time = 0  # Used for synchronous mode.
         self.last_result = None  # Used for synchronous mode.
@@ -208,6 +211,15 @@ class PopulationBasedTraining(FIFOScheduler):
             synced at the same time_attr every perturbation_interval.
             Defaults to False. See Appendix A.1 here
             https://arxiv.org/pdf/1711.09846.pdf.
+        checkpoint_memory_budget_bytes: If set, the checkpoints that are
+            taken for exploitation are passed from trial to trial through
+            the object store without writing them to disk, if the
+            Trainable returns them as dicts. A checkpoint is skipped (so
+            that it is not exploited) if it would make the checkpoints held
+            for exploitation exceed this size in bytes. To learn the size of
+            a new checkpoint, the scheduler waits until it is saved.
+            Defaults to None, which writes checkpoints to disk and
+            doesn't limit their size.
 
     .. code-block:: python
 
@@ -252,6 +264,7 @@ class PopulationBasedTraining(FIFOScheduler):
         log_config: bool = True,
         require_attrs: bool = True,
         synch: bool = False,
+        checkpoint_memory_budget_bytes: Optional[int] = None,
     ):
         hyperparam_mutations = hyperparam_mutations or {}
         for value in hyperparam_mutations.values():
@@ -287,6 +300,14 @@ class PopulationBasedTraining(FIFOScheduler):
                 "than 0. Current value: '{}'".format(perturbation_interval)
             )
 
+        if checkpoint_memory_budget_bytes is not None and (
+            checkpoint_memory_budget_bytes <= 0
+        ):
+            raise ValueError(
+                "checkpoint_memory_budget_bytes must be a positive number. "
+                "Current value: '{}'".format(checkpoint_memory_budget_bytes)
+            )
+
         if mode:
             assert mode in ["min", "max"], "`mode` must be 'min' or 'max'."
 
@@ -309,6 +330,7 @@ class PopulationBasedTraining(FIFOScheduler):
         self._log_config = log_config
         self._require_attrs = require_attrs
         self._synch = synch
+        self._checkpoint_memory_budget_bytes = checkpoint_memory_budget_bytes
         self._next_perturbation_sync = max(
             self._perturbation_interval,
             self._burn_in_period,
@@ -524,14 +546,45 @@ class PopulationBasedTraining(FIFOScheduler):
             # callback. So, we override with the current result.
             logger.debug("Trial {} is in upper quantile".format(trial))
             logger.debug("Checkpointing {}".format(trial))
-            if trial.status == Trial.PAUSED:
+            budget = self._checkpoint_memory_budget_bytes
+            held_size = 0
+            if budget is not None:
+                held_size = self._held_checkpoints_size(exclude=trial)
+            over_budget = (
+                budget is not None and held_size + state.last_checkpoint_size > budget
+            )
+            if over_budget:
+                # Don't take checkpoints that exceed the budget already with
+                # the size of the trial's previous checkpoint.
+                checkpoint = None
+            elif trial.status == Trial.PAUSED:
                 # Paused trial will always have an in-memory checkpoint.
-                state.last_checkpoint = trial.checkpoint
-            else:
-                state.last_checkpoint = trial_executor.save(
+                checkpoint = trial.checkpoint
+            elif budget is None:
+                checkpoint = trial_executor.save(
                     trial, _TuneCheckpoint.MEMORY, result=state.last_result
                 )
-            self._num_checkpoints += 1
+            else:
+                # Pass dict checkpoints through the object store directly.
+                checkpoint = trial_executor.save(
+                    trial,
+                    _TuneCheckpoint.MEMORY,
+                    result=state.last_result,
+                    in_memory=True,
+                )
+            if checkpoint and budget is not None:
+                # Count the new checkpoint against the budget before holding it.
+                state.last_checkpoint_size = self._checkpoint_size(checkpoint)
+                over_budget = held_size + state.last_checkpoint_size > budget
+            if over_budget:
+                logger.info(
+                    "[pbt]: checkpoint memory budget exceeded."
+                    " Skip checkpoint for Trial {}".format(trial)
+                )
+                checkpoint = None
+            state.last_checkpoint = checkpoint
+            if checkpoint:
+                self._num_checkpoints += 1
         else:
             state.last_checkpoint = None  # not a top trial
 
@@ -547,6 +600,43 @@ class PopulationBasedTraining(FIFOScheduler):
                 return
             self._exploit(trial_executor, trial, trial_to_clone)
 
+    def _held_checkpoints_size(self, exclude: Trial) -> int:
+        """Returns the size of the checkpoints held for exploitation.
+
+        Sizes are looked up in the object store. Checkpoints that are still
+        being saved are assumed to have the size of the trial's previous one.
+        """
+        states = {}
+        for trial, state in self._trial_state.items():
+            if (
+                trial is not exclude
+                and state.last_checkpoint
+                and isinstance(state.last_checkpoint.value, ray.ObjectRef)
+            ):
+                states[state.last_checkpoint.value] = state
+        if not states:
+            return 0
+
+        locations = get_object_locations(list(states))
+        for ref, state in states.items():
+            size = locations.get(ref, {}).get("object_size")
+            if size:
+                state.last_checkpoint_size = size
+        return sum(state.last_checkpoint_size for state in states.values())
+
+    @staticmethod
+    def _checkpoint_size(checkpoint: _TuneCheckpoint) -> int:
+        """Returns the size of a checkpoint in the object store.
+
+        This waits until the checkpoint is saved. Checkpoints that are not in
+        the object store have a size of 0.
+        """
+        if not isinstance(checkpoint.value, ray.ObjectRef):
+            return 0
+        ray.wait([checkpoint.value])
+        locations = get_object_locations([checkpoint.value])
+        return locations.get(checkpoint.value, {}).get("object_size") or 0
+
     def _log_config_on_step(
         self,
         trial_state: _PBTTrialState,
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ray.tune import trial_runner
 from ray.tune.result import DEFAULT_METRIC
@@ -79,6 +79,22 @@ class TrialScheduler:
 
         raise NotImplementedError
 
+    def on_trial_results(
+        self,
+        trial_runner: "trial_runner.TrialRunner",
+        trials_and_results: List[Tuple[Trial, Dict]],
+    ) -> List[str]:
+        """Called on a batch of intermediate results, one per trial.
+
+        Returns the decision for each trial, in the same order. The default
+        implementation calls `on_trial_result` for each result; schedulers can
+        override this to make their decisions for the whole batch at once."""
+
+        return [
+            self.on_trial_result(trial_runner, trial, result)
+            for trial, result in trials_and_results
+        ]
+
     def on_trial_complete(
         self, trial_runner: "trial_runner.TrialRunner", trial: Trial, result: Dict
     ):
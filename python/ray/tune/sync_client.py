@@ -3,6 +3,7 @@ import distutils
 import distutils.spawn
 import inspect
 import logging
+import os
 import pathlib
 import subprocess
 import tempfile
@@ -451,6 +452,11 @@ class RemoteTaskClient(SyncClient):
     (or ``wait_or_retry()``) to wait until the previous sync has finished,
     or call ``reset()`` to detach from the previous sync. Note that this
     will not kill the previous sync command, so it may still be executed.
+
+    If the environment variable ``TUNE_SYNC_INCREMENTAL`` is set to ``1``,
+    differing files are compared by the content hashes of their chunks, and
+    only the chunks that are not available on the target node already are
+    transferred. See ``sync_dir_between_nodes`` for details.
     """
 
     def __init__(self, _store_remotes: bool = False):
@@ -465,6 +471,7 @@ class RemoteTaskClient(SyncClient):
         self._last_target_tuple = None
 
         self._max_size_bytes = None  # No file size limit
+        self._incremental = os.environ.get("TUNE_SYNC_INCREMENTAL", "0") == "1"
 
     def _sync_still_running(self) -> bool:
         if not self._sync_future:
@@ -530,6 +537,7 @@ class RemoteTaskClient(SyncClient):
             target_path=target_path,
             return_futures=True,
             max_size_bytes=self._max_size_bytes,
+            incremental=self._incremental,
         )
 
         if self._store_remotes:
@@ -85,6 +85,32 @@ class ExperimentAnalysisSuite(unittest.TestCase):
         all_dataframes_via_csv2 = self.ea.fetch_trial_dataframes()
         assert set(all_dataframes_via_csv) == set(all_dataframes_via_csv2)
 
+    def testLoadParquet(self):
+        from ray.tune.logger import ParquetLoggerCallback
+
+        tune.run(
+            MyTrainableClass,
+            name="parquet_exp",
+            local_dir=self.test_dir,
+            stop={"training_iteration": 3},
+            num_samples=3,
+            callbacks=[ParquetLoggerCallback()],
+        )
+        ea = ExperimentAnalysis(
+            os.path.join(self.test_dir, "parquet_exp"), file_type="parquet"
+        )
+        # Results are only read when they're needed, and only the columns
+        # that are needed.
+        self.assertFalse(ea._trial_dataframes)
+        df = ea.dataframe(self.metric, mode="max")
+        self.assertEqual(df.shape[0], 3)
+        self.assertIn(self.metric, df.columns)
+        self.assertFalse(ea._trial_dataframes)
+
+        self.assertEqual(len(ea.trial_dataframes), 3)
+        for trial_df in ea.trial_dataframes.values():
+            self.assertEqual(trial_df.shape[0], 3)
+
     def testStats(self):
         assert self.ea.stats()
         assert self.ea.runner_data()
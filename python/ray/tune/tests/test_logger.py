@@ -14,6 +14,7 @@ from ray.tune.logger import (
     JsonLoggerCallback,
     JsonLogger,
     CSVLogger,
+    ParquetLoggerCallback,
     TBXLoggerCallback,
     TBXLogger,
 )
@@ -22,6 +23,7 @@ from ray.tune.result import (
     EXPR_PARAM_PICKLE_FILE,
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
+    EXPR_PARQUET_FILE,
 )
 
 
@@ -167,6 +169,65 @@ class LoggerSuite(unittest.TestCase):
 
         self.assertEqual(loaded_config, config)
 
+    def testParquet(self):
+        import pyarrow.parquet as pq
+
+        config = {"a": 2, "b": 5, "c": {"c": {"D": 123}, "e": None}}
+        t = Trial(evaluated_params=config, trial_id="parquet", logdir=self.test_dir)
+        logger = ParquetLoggerCallback(row_group_size=2)
+        logger.on_trial_result(0, [], t, result(0, 4))
+        logger.on_trial_result(1, [], t, result(1, 5))
+        logger.on_trial_result(2, [], t, result(2, 6, hello={"world": 1}))
+        logger.on_trial_complete(3, [], t)
+
+        parquet_file = pq.ParquetFile(os.path.join(self.test_dir, EXPR_PARQUET_FILE))
+        self.assertEqual(parquet_file.num_row_groups, 2)
+        table = parquet_file.read(columns=["episode_reward_mean"])
+        self.assertEqual(table.column_names, ["episode_reward_mean"])
+        self.assertSequenceEqual(
+            table.column("episode_reward_mean").to_pylist(), [4, 5, 6]
+        )
+        # Integer metrics are stored as floats, except the training iteration.
+        self.assertSequenceEqual(
+            parquet_file.read(columns=["training_iteration"])
+            .column("training_iteration")
+            .to_pylist(),
+            [0, 1, 2],
+        )
+        # Columns that weren't in the first row group are not logged.
+        self.assertNotIn("hello/world", parquet_file.schema_arrow.names)
+
+        # Results after a restart are written to a new part.
+        logger.on_trial_result(3, [], t, result(3, 7))
+        logger.on_experiment_end(trials=[t])
+        table = pq.read_table(os.path.join(self.test_dir, "progress.1.parquet"))
+        self.assertSequenceEqual(table.column("episode_reward_mean").to_pylist(), [7])
+
+    def testParquetRunningTrial(self):
+        from ray.tune.analysis.experiment_analysis import (
+            _read_parquet_results,
+            _read_parquet_row,
+        )
+
+        config = {"a": 2}
+        t = Trial(evaluated_params=config, trial_id="parquet", logdir=self.test_dir)
+        logger = ParquetLoggerCallback(row_group_size=1, row_groups_per_part=2)
+        for i in range(3):
+            logger.on_trial_result(i, [], t, result(i, i + 4))
+
+        # The first part is closed, and the open part without a footer is skipped.
+        self.assertTrue(
+            os.path.exists(os.path.join(self.test_dir, "progress.1.parquet"))
+        )
+        df = _read_parquet_results(self.test_dir)
+        self.assertSequenceEqual(df["episode_reward_mean"].tolist(), [4, 5])
+        self.assertEqual(_read_parquet_row(self.test_dir, -1)["episode_reward_mean"], 5)
+
+        logger.on_trial_result(3, [], t, result(3, 7))
+        df = _read_parquet_results(self.test_dir, columns=["episode_reward_mean"])
+        self.assertSequenceEqual(df["episode_reward_mean"].tolist(), [4, 5, 6, 7])
+        logger.on_trial_complete(4, [], t)
+
     def testLegacyTBX(self):
         config = {
             "a": 2,
@@ -33,6 +33,10 @@ from ray.tune.utils.file_transfer import (
     delete_on_node,
     _sync_dir_on_same_node,
     _sync_dir_between_different_nodes,
+    _get_chunk_cache_dir,
+    _hash_chunk,
+    _PackActor,
+    _unpack_chunks_from_actor,
 )
 
 
@@ -710,6 +714,103 @@ class TestSyncFunctionality(unittest.TestCase):
             # 6 directories (including root) + 2 files
             self.assertEqual(len(files_in_tar), 8, msg=str(files_in_tar))
 
+    def testSyncIncrementalBetweenNodes(self):
+        """Tests that incremental syncs only transfer missing file chunks."""
+        (
+            temp_source,
+            temp_up_target,
+            temp_down_target,
+        ) = self._prepareDirForTestSyncRemoteTask()
+        node_ip = ray.util.get_node_ip_address()
+
+        def sync(target_path):
+            future, pack_actor, _ = _sync_dir_between_different_nodes(
+                source_ip=node_ip,
+                source_path=temp_source,
+                target_ip=node_ip,
+                target_path=target_path,
+                return_futures=True,
+                incremental=True,
+            )
+            ray.get(future)
+            _, files = ray.get(pack_actor.get_manifest.remote())
+            return files, ray.get(pack_actor.get_full_data.remote())
+
+        sync(temp_up_target)
+        with open(os.path.join(temp_up_target, "A", "a1", "level_a2.txt"), "rt") as fp:
+            self.assertEqual(fp.read(), "Level A2\n")
+        assert os.path.isdir(os.path.join(temp_up_target, "B", "b1"))
+
+        # Nothing changed, so nothing is compared or transferred
+        files, data = sync(temp_up_target)
+        self.assertEqual(files, {})
+        self.assertEqual(data, b"")
+
+        with open(os.path.join(temp_source, "A", "a1", "level_a2.txt"), "wt") as fp:
+            fp.write("Level X2\n")  # Same length
+        with open(os.path.join(temp_source, "A", "level_a1x.txt"), "wt") as fp:
+            fp.write("Level A1X\n")  # New file
+
+        files, data = sync(temp_up_target)
+        self.assertEqual(
+            set(files),
+            {
+                os.path.join(".", "A", "a1", "level_a2.txt"),
+                os.path.join(".", "A", "level_a1x.txt"),
+            },
+        )
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            self.assertLessEqual(len(tar.getnames()), 2)
+        with open(os.path.join(temp_up_target, "A", "a1", "level_a2.txt"), "rt") as fp:
+            self.assertEqual(fp.read(), "Level X2\n")
+        with open(os.path.join(temp_up_target, "A", "level_a1x.txt"), "rt") as fp:
+            self.assertEqual(fp.read(), "Level A1X\n")
+
+        # All chunks are available on this node, so syncing the same files to
+        # another directory does not transfer anything
+        files, data = sync(temp_down_target)
+        self.assertEqual(len(files), 5)
+        self.assertEqual(data, b"")
+        with open(os.path.join(temp_down_target, "B", "level_b1.txt"), "rt") as fp:
+            self.assertEqual(fp.read(), "Level B1\n")
+
+    def testSyncIncrementalVerifiesChunks(self):
+        """Tests that chunks that don't match their hash never reach the cache."""
+        temp_source = tempfile.mkdtemp()
+        temp_target = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_source)
+        self.addCleanup(shutil.rmtree, temp_target)
+        path = os.path.join(temp_source, "checkpoint")
+        original = os.urandom(64)
+        changed = os.urandom(64)
+        with open(path, "wb") as fp:
+            fp.write(original)
+        cache_dir = _get_chunk_cache_dir()
+        original_chunk = os.path.join(cache_dir, _hash_chunk(original))
+
+        # The file changes after the manifest was created, so the sync fails
+        # instead of sending the changed contents under the original hash
+        pack_actor = _PackActor.remote(temp_source, incremental=True)
+        ray.get(pack_actor.get_manifest.remote())
+        with open(path, "wb") as fp:
+            fp.write(changed)
+        with self.assertRaises(RayTaskError):
+            ray.get(_unpack_chunks_from_actor.remote(pack_actor, temp_target))
+        self.assertFalse(os.path.exists(original_chunk))
+        self.assertFalse(os.path.exists(os.path.join(temp_target, "checkpoint")))
+
+        # A corrupted chunk in the cache is discarded and transferred again
+        with open(path, "wb") as fp:
+            fp.write(original)
+        with open(original_chunk, "wb") as fp:
+            fp.write(changed)
+        pack_actor = _PackActor.remote(temp_source, incremental=True)
+        ray.get(_unpack_chunks_from_actor.remote(pack_actor, temp_target))
+        with open(os.path.join(temp_target, "checkpoint"), "rb") as fp:
+            self.assertEqual(fp.read(), original)
+        with open(original_chunk, "rb") as fp:
+            self.assertEqual(fp.read(), original)
+
 
 if __name__ == "__main__":
     import pytest
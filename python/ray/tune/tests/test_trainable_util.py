@@ -91,6 +91,12 @@ class TrainableUtilTest(unittest.TestCase):
             path = os.path.join(self.checkpoint_dir, str(i))
             self.assertEqual(loaded["data"][str(i)], open(path, "rb").read())
 
+    def testCheckpointDictToObject(self):
+        obj = TrainableUtil.checkpoint_dict_to_object({"hi": 1}, {"iteration": 3})
+        info = cloudpickle.loads(obj)
+        self.assertEqual(info["checkpoint_dict"], {"hi": 1})
+        self.assertEqual(info["metadata"], {"iteration": 3, "saved_as_dict": True})
+
 
 class FlattenDictTest(unittest.TestCase):
     def test_output_type(self):
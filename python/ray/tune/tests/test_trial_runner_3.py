@@ -1,5 +1,6 @@
 import time
 from collections import Counter
+import json
 import os
 import pickle
 import shutil
@@ -18,7 +19,11 @@ from ray.tune.schedulers import TrialScheduler, FIFOScheduler
 from ray.tune.experiment import Experiment
 from ray.tune.suggest import BasicVariantGenerator
 from ray.tune.trial import Trial
-from ray.tune.trial_runner import TrialRunner
+from ray.tune.trial_runner import (
+    TrialRunner,
+    _ExperimentCheckpointWriter,
+    load_experiment_checkpoint,
+)
 from ray.tune.resources import Resources, json_to_resources, resources_to_json
 from ray.tune.suggest.repeater import Repeater
 from ray.tune.suggest._mock import _MockSuggestionAlgorithm
@@ -489,6 +494,24 @@ class TrialRunnerTest3(unittest.TestCase):
             runner2.step()
         self.assertEqual(restored_trial.status, Trial.TERMINATED)
 
+    def testResumeMaxEventsPerStep(self):
+        """Check that max_events_per_step is not restored from the checkpoint."""
+        ray.init(num_cpus=1)
+
+        runner = TrialRunner(
+            local_checkpoint_dir=self.tmpdir, checkpoint_period=0, max_events_per_step=1
+        )
+        runner.add_trial(Trial("__fake", stopping_criterion={"training_iteration": 1}))
+        while not runner.is_finished():
+            runner.step()
+        runner.checkpoint(force=True)
+
+        runner2 = TrialRunner(
+            resume="LOCAL", local_checkpoint_dir=self.tmpdir, max_events_per_step=4
+        )
+        self.assertEqual(runner2._max_events_per_step, 4)
+        self.assertIsNot(runner2._driver_loop_metrics, runner._driver_loop_metrics)
+
     def testTrialNoCheckpointSave(self):
         """Check that non-checkpointing trials *are* saved."""
         os.environ["TUNE_MAX_PENDING_TRIALS_PG"] = "1"
@@ -769,6 +792,51 @@ class TrialRunnerTest3(unittest.TestCase):
 
         self.assertGreaterEqual(runner._checkpoint_manager._checkpoint_period, 38.0)
 
+    def testIncrementalExperimentCheckpoint(self):
+        checkpoint_file = os.path.join(self.tmpdir, "experiment_state-test.json")
+        log_file = checkpoint_file + ".log"
+        writer = _ExperimentCheckpointWriter()
+
+        def trial_state(trial_id, value):
+            return json.dumps({"trial_id": trial_id, "value": value})
+
+        def load_values():
+            runner_state = load_experiment_checkpoint(checkpoint_file)
+            return {
+                json.loads(cp)["trial_id"]: json.loads(cp)["value"]
+                for cp in runner_state["checkpoints"]
+            }
+
+        trial_states = {str(i): trial_state(str(i), 0) for i in range(20)}
+        writer.write(checkpoint_file, trial_states, {"step": 0}, {})
+        writer.flush()
+        self.assertFalse(os.path.exists(log_file))
+
+        # Only the changed trials are appended to the log.
+        trial_states["1"] = trial_state("1", 1)
+        trial_states["new"] = trial_state("new", 1)
+        writer.write(checkpoint_file, trial_states, {"step": 1}, {})
+        writer.flush()
+        self.assertTrue(os.path.exists(log_file))
+        expected = {trial_id: 0 for trial_id in trial_states}
+        expected.update({"1": 1, "new": 1})
+        self.assertEqual(load_values(), expected)
+        runner_state = load_experiment_checkpoint(checkpoint_file)
+        self.assertEqual(runner_state["runner_data"], {"step": 1})
+        self.assertNotIn("log_id", runner_state)
+
+        # A record that was cut off while it was written is ignored.
+        with open(log_file, "a") as f:
+            f.write('{"log_id": "')
+        self.assertEqual(load_values(), expected)
+
+        # Compacting folds the log into the checkpoint.
+        trial_states["2"] = trial_state("2", 2)
+        writer.write(checkpoint_file, trial_states, {"step": 2}, {}, compact=True)
+        self.assertFalse(os.path.exists(log_file))
+        expected["2"] = 2
+        self.assertEqual(load_values(), expected)
+
 
 class SearchAlgorithmTest(unittest.TestCase):
     @classmethod
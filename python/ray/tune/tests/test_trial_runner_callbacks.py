@@ -73,6 +73,7 @@ class _MockTrialExecutor(RayTrialExecutor):
     def __init__(self):
         super().__init__()
         self.next_future_result = None
+        self.next_future_results = None
 
     def start_trial(self, trial: Trial):
         trial.status = Trial.RUNNING
@@ -84,6 +85,13 @@ class _MockTrialExecutor(RayTrialExecutor):
     def get_next_executor_event(self, live_trials, next_trial_exists):
         return self.next_future_result
 
+    def get_next_executor_events(self, live_trials, next_trial_exists, max_events=1):
+        if self.next_future_results is not None:
+            return self.next_future_results[:max_events]
+        return super().get_next_executor_events(
+            live_trials, next_trial_exists, max_events
+        )
+
 
 class TrialRunnerCallbacks(unittest.TestCase):
     def setUp(self):
@@ -215,6 +223,51 @@ class TrialRunnerCallbacks(unittest.TestCase):
         self.assertEqual(self.callback.state["trial_fail"]["iteration"], 6)
         self.assertEqual(self.callback.state["trial_fail"]["trial"].trial_id, "one")
 
+    def testCallbackBatchedResults(self):
+        batches = []
+
+        class BatchCallback(Callback):
+            def on_trial_results(self, iteration, trials, trials_and_results, **info):
+                batches.append([trial.trial_id for trial, _ in trials_and_results])
+
+        self.trial_runner = TrialRunner(
+            trial_executor=self.executor,
+            callbacks=[self.callback, BatchCallback()],
+            max_events_per_step=2,
+        )
+        trials = [Trial("__fake", trial_id="one"), Trial("__fake", trial_id="two")]
+        for t in trials:
+            self.trial_runner.add_trial(t)
+
+        self.executor.next_future_result = _ExecutorEvent(
+            event_type=_ExecutorEventType.PG_READY
+        )
+        self.trial_runner.step()
+        self.trial_runner.step()
+        self.assertTrue(all(t.status == Trial.RUNNING for t in trials))
+
+        # Results of both trials are processed in one step.
+        self.executor.next_future_results = [
+            _ExecutorEvent(
+                event_type=_ExecutorEventType.TRAINING_RESULT,
+                trial=trial,
+                result={
+                    _ExecutorEvent.KEY_FUTURE_RESULT: {
+                        TRAINING_ITERATION: 1,
+                        "metric": metric,
+                        "done": False,
+                    }
+                },
+            )
+            for trial, metric in zip(trials, [800, 900])
+        ]
+        self.trial_runner.step()
+        self.assertEqual(batches, [["one", "two"]])
+        # Callbacks that don't handle batches get each result.
+        self.assertEqual(self.callback.state["trial_result"]["trial"].trial_id, "two")
+        self.assertEqual(trials[0].last_result["metric"], 800)
+        self.assertEqual(trials[1].last_result["metric"], 900)
+
     def testCallbacksEndToEnd(self):
         def train(config):
             if config["do"] == "save":
@@ -9,7 +9,7 @@ import numpy as np
 import sys
 import tempfile
 import shutil
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import ray
 from ray import tune
@@ -248,7 +248,13 @@ class _MockTrialExecutor(RayTrialExecutor):
     def restore(self, trial, checkpoint=None, block=False):
         pass
 
-    def save(self, trial, type=_TuneCheckpoint.PERSISTENT, result=None):
+    def save(
+        self, trial, type=_TuneCheckpoint.PERSISTENT, result=None, in_memory=False
+    ):
+        if in_memory:
+            return _TuneCheckpoint(
+                _TuneCheckpoint.MEMORY, ray.put(trial.trainable_name), result
+            )
         return _TuneCheckpoint(_TuneCheckpoint.PERSISTENT, trial.trainable_name, result)
 
     def reset_trial(self, trial, new_config, new_experiment_tag):
@@ -881,6 +887,7 @@ class PopulationBasedTestingSuite(unittest.TestCase):
         hyperparam_mutations=None,
         step_once=True,
         synch=False,
+        checkpoint_memory_budget_bytes=None,
     ):
         hyperparam_mutations = hyperparam_mutations or {
             "float_factor": lambda: 100.0,
@@ -899,6 +906,7 @@ class PopulationBasedTestingSuite(unittest.TestCase):
             log_config=log_config,
             synch=synch,
             require_attrs=require_attrs,
+            checkpoint_memory_budget_bytes=checkpoint_memory_budget_bytes,
         )
         runner = _MockTrialRunner(pbt)
         for i in range(num_trials):
@@ -1039,6 +1047,63 @@ class PopulationBasedTestingSuite(unittest.TestCase):
         )
         self.assertEqual(pbt._num_checkpoints, 2)
 
+    def testCheckpointMemoryBudget(self):
+        # The checkpoints of the mock executor all have the same size.
+        size = PopulationBasedTraining._checkpoint_size(
+            _TuneCheckpoint(_TuneCheckpoint.MEMORY, ray.put("trial_0"), None)
+        )
+        self.assertGreater(size, 0)
+        pbt, runner = self.basicSetup(checkpoint_memory_budget_bytes=size)
+        trials = runner.get_trials()
+
+        # Only the first upper quantile trial was checkpointed, after which
+        # another checkpoint would exceed the budget.
+        self.assertEqual(
+            [bool(pbt._trial_state[t].last_checkpoint) for t in trials],
+            [False, True, False, False, False],
+        )
+        self.assertEqual(pbt._held_checkpoints_size(exclude=None), size)
+
+        # skip checkpoint: upper quantile, but over budget
+        self.on_trial_result(
+            pbt, runner, trials[4], result(20, 250), TrialScheduler.CONTINUE
+        )
+        self.assertIsNone(pbt._trial_state[trials[4]].last_checkpoint)
+        self.assertEqual(pbt._num_checkpoints, 0)
+
+        # skip exploit: lower quantile, but the upper quantile trials
+        # have no checkpoint
+        self.on_trial_result(
+            pbt, runner, trials[0], result(20, -100), TrialScheduler.CONTINUE
+        )
+        self.assertTrue("@perturbed" not in trials[0].experiment_tag)
+        self.assertEqual(pbt._num_perturbations, 0)
+
+    def testCheckpointMemoryBudgetNewCheckpoint(self):
+        pbt, runner = self.basicSetup(checkpoint_memory_budget_bytes=1)
+        trials = runner.get_trials()
+
+        # The first checkpoint is counted against the budget as well.
+        self.assertEqual(
+            [bool(pbt._trial_state[t].last_checkpoint) for t in trials],
+            [False, False, False, False, False],
+        )
+        self.assertEqual(pbt._held_checkpoints_size(exclude=None), 0)
+
+        # So are the checkpoints of paused trials, even without a previous size.
+        pbt._trial_state[trials[4]].last_checkpoint_size = 0
+        trials[4].status = Trial.PAUSED
+        checkpoint = _TuneCheckpoint(_TuneCheckpoint.MEMORY, ray.put("trial_4"), None)
+        with patch.object(
+            _MockTrial, "checkpoint", new_callable=PropertyMock
+        ) as mock_checkpoint:
+            mock_checkpoint.return_value = checkpoint
+            pbt._checkpoint_or_exploit(
+                trials[4], runner.trial_executor, [trials[4]], []
+            )
+        self.assertIsNone(pbt._trial_state[trials[4]].last_checkpoint)
+        self.assertEqual(pbt._num_checkpoints, 0)
+
     def testPerturbsLowPerformingTrials(self):
         pbt, runner = self.basicSetup()
         trials = runner.get_trials()
@@ -1856,6 +1921,7 @@ class E2EPopulationBasedTestingSuite(unittest.TestCase):
         hyperparams=None,
         hyperparam_mutations=None,
         step_once=True,
+        checkpoint_memory_budget_bytes=None,
     ):
         hyperparam_mutations = hyperparam_mutations or {
             "float_factor": lambda: 100.0,
@@ -1872,6 +1938,7 @@ class E2EPopulationBasedTestingSuite(unittest.TestCase):
             hyperparam_mutations=hyperparam_mutations,
             custom_explore_fn=explore,
             log_config=log_config,
+            checkpoint_memory_budget_bytes=checkpoint_memory_budget_bytes,
         )
         return pbt
 
@@ -1953,6 +2020,55 @@ class E2EPopulationBasedTestingSuite(unittest.TestCase):
             self.assertEqual(trial.status, Trial.TERMINATED)
             self.assertTrue(trial.has_checkpoint())
 
+    def testCheckpointDictInMemory(self):
+        pbt = self.basicSetup(
+            perturbation_interval=2, checkpoint_memory_budget_bytes=10 * 1024 * 1024
+        )
+
+        class train_dict(tune.Trainable):
+            def setup(self, config):
+                self.state = {"hi": 1}
+
+            def step(self):
+                return {"mean_accuracy": self.training_iteration}
+
+            def save_checkpoint(self, path):
+                return self.state
+
+            def load_checkpoint(self, state):
+                # Restored from memory, not from a checkpoint file.
+                assert "tune_checkpoint_path" not in state
+                self.state = state
+
+            def reset_config(self, config):
+                return True
+
+        trial_hyperparams = {
+            "float_factor": 2.0,
+            "const_factor": 3,
+            "int_factor": 10,
+            "id_factor": 0,
+        }
+
+        analysis = tune.run(
+            train_dict,
+            num_samples=3,
+            scheduler=pbt,
+            config=trial_hyperparams,
+            stop={"training_iteration": 30},
+        )
+
+        for trial in analysis.trials:
+            self.assertEqual(trial.status, Trial.TERMINATED)
+        self.assertGreater(pbt._num_perturbations, 0)
+        self.assertTrue(
+            any(
+                trial.last_result["iterations_since_restore"]
+                < trial.last_result["training_iteration"]
+                for trial in analysis.trials
+            )
+        )
+
 
 class AsyncHyperBandSuite(unittest.TestCase):
     def setUp(self):
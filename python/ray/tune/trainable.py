@@ -482,16 +482,37 @@ class Trainable:
                 sleep_time=1,
             )
 
-    def save_to_object(self):
+    def save_to_object(self, in_memory: bool = False):
         """Saves the current model state to a Python object.
 
         It also saves to disk but does not return the checkpoint path.
 
+        Args:
+            in_memory: If True and ``save_checkpoint()`` returns a dict
+                without writing any files, the dict is serialized directly
+                instead of being written to disk and read back. Only an
+                empty temporary directory is created for
+                ``save_checkpoint()`` and removed again in this case. The
+                checkpoint is not synced to cloud storage either.
+
         Returns:
             Object holding checkpoint data.
         """
         tmpdir = tempfile.mkdtemp("save_to_object", dir=self.logdir)
-        checkpoint_path = self.save(tmpdir)
+        if not in_memory:
+            checkpoint_path = self.save(tmpdir)
+        else:
+            checkpoint = self.save_checkpoint(tmpdir)
+            if isinstance(checkpoint, dict) and not os.listdir(tmpdir):
+                os.rmdir(tmpdir)
+                return TrainableUtil.checkpoint_dict_to_object(
+                    checkpoint, self.get_state()
+                )
+            # Drop the marker that make_checkpoint_dir() would have created.
+            open(os.path.join(tmpdir, ".is_checkpoint"), "a").close()
+            checkpoint_path = TrainableUtil.process_checkpoint(
+                checkpoint, parent_dir=tmpdir, trainable_state=self.get_state()
+            )
         # Save all files in subtree and delete the tmpdir.
         obj = TrainableUtil.checkpoint_to_object(checkpoint_path)
         shutil.rmtree(tmpdir)
@@ -568,11 +589,7 @@ class Trainable:
 
         with open(checkpoint_path + ".tune_metadata", "rb") as f:
             metadata = pickle.load(f)
-        self._experiment_id = metadata["experiment_id"]
-        self._iteration = metadata["iteration"]
-        self._timesteps_total = metadata["timesteps_total"]
-        self._time_total = metadata["time_total"]
-        self._episodes_total = metadata["episodes_total"]
+        self._restore_metadata(metadata)
         saved_as_dict = metadata["saved_as_dict"]
         if saved_as_dict:
             with open(checkpoint_path, "rb") as loaded_state:
@@ -581,12 +598,24 @@ class Trainable:
             self.load_checkpoint(checkpoint_dict)
         else:
             self.load_checkpoint(checkpoint_path)
+        self._on_restored(checkpoint_path)
+
+    def _restore_metadata(self, metadata: Dict):
+        self._experiment_id = metadata["experiment_id"]
+        self._iteration = metadata["iteration"]
+        self._timesteps_total = metadata["timesteps_total"]
+        self._time_total = metadata["time_total"]
+        self._episodes_total = metadata["episodes_total"]
+
+    def _on_restored(self, checkpoint_path: Optional[str]):
         self._time_since_restore = 0.0
         self._timesteps_since_restore = 0
         self._iterations_since_restore = 0
         self._restored = True
         logger.info(
-            "Restored on %s from checkpoint: %s", self.get_current_ip(), checkpoint_path
+            "Restored on %s from checkpoint: %s",
+            self.get_current_ip(),
+            checkpoint_path or "in-memory checkpoint",
         )
         state = {
             "_iteration": self._iteration,
@@ -601,11 +630,22 @@ class Trainable:
 
         These checkpoints are returned from calls to save_to_object().
         """
+        info = pickle.loads(obj)
+        if "checkpoint_dict" in info:
+            self._restore_from_dict(info["checkpoint_dict"], info["metadata"])
+            return
         tmpdir = tempfile.mkdtemp("restore_from_object", dir=self.logdir)
-        checkpoint_path = TrainableUtil.create_from_pickle(obj, tmpdir)
+        checkpoint_path = TrainableUtil.create_from_pickle(info, tmpdir)
         self.restore(checkpoint_path)
         shutil.rmtree(tmpdir)
 
+    def _restore_from_dict(self, checkpoint_dict: Dict, metadata: Dict):
+        """Restores training state from a dict checkpoint that was serialized
+        by ``save_to_object(in_memory=True)`` without writing it to disk."""
+        self._restore_metadata(metadata)
+        self.load_checkpoint(checkpoint_dict)
+        self._on_restored(None)
+
     def delete_checkpoint(self, checkpoint_path: str):
         """Deletes local copy of checkpoint.
 
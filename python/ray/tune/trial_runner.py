@@ -1,4 +1,6 @@
-from typing import Any, List, Mapping, Optional, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import Counter
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 import click
 from datetime import datetime
@@ -7,6 +9,7 @@ import logging
 import os
 import time
 import traceback
+import uuid
 import warnings
 
 import ray
@@ -41,11 +44,16 @@ from ray.tune.utils.log import Verbosity, has_verbosity
 from ray.tune.utils.placement_groups import PlacementGroupFactory
 from ray.tune.utils.serialization import TuneFunctionDecoder, TuneFunctionEncoder
 from ray.tune.web_server import TuneServer
+from ray.util import metrics
 from ray.util.annotations import DeveloperAPI
 from ray.util.debug import log_once
 
 MAX_DEBUG_TRIALS = 20
 
+# Incremental updates of an experiment checkpoint are appended to a log file
+# next to it, with this suffix.
+EXPERIMENT_CHECKPOINT_LOG_SUFFIX = ".log"
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +69,45 @@ def find_newest_experiment_checkpoint(ckpt_dir) -> Optional[str]:
     return max(full_paths)
 
 
+def load_experiment_checkpoint(checkpoint_file: str) -> Dict[str, Any]:
+    """Loads an experiment checkpoint, with the updates in its log applied.
+
+    Returns the TrialRunner state dict, in the same format whether or not the
+    checkpoint was written incrementally.
+    """
+    with open(checkpoint_file, "r") as f:
+        runner_state = json.load(f, cls=TuneFunctionDecoder)
+
+    log_id = runner_state.pop("log_id", None)
+    log_file = checkpoint_file + EXPERIMENT_CHECKPOINT_LOG_SUFFIX
+    if log_id is None or not os.path.exists(log_file):
+        return runner_state
+
+    records = []
+    with open(log_file, "r") as f:
+        for line in f:
+            try:
+                record = json.loads(line, cls=TuneFunctionDecoder)
+            except ValueError:
+                # The last record may have been cut off while it was written.
+                break
+            # Skip records that were already compacted into the checkpoint.
+            if record.pop("log_id", None) == log_id:
+                records.append(record)
+    if not records:
+        return runner_state
+
+    trial_states = {
+        json.loads(cp)["trial_id"] if isinstance(cp, str) else cp["trial_id"]: cp
+        for cp in runner_state["checkpoints"]
+    }
+    for record in records:
+        trial_states.update(record.pop("checkpoints"))
+        runner_state.update(record)
+    runner_state["checkpoints"] = list(trial_states.values())
+    return runner_state
+
+
 def load_trial_from_checkpoint(trial_cp: dict, stub: bool = False, **kwargs):
     new_trial = Trial(
         trial_cp["trainable_name"], stub=stub, _setup_default_resource=False, **kwargs
@@ -88,6 +135,146 @@ def load_trials_from_experiment_checkpoint(
     return trials
 
 
+class _ExperimentCheckpointWriter:
+    """Writes experiment checkpoints incrementally, off the driver's main loop.
+
+    Each checkpoint appends a JSON record with the states of the trials that
+    changed since the previous one, and the (small) runner state, to a log
+    next to the checkpoint file. This is done by a background thread, so the
+    driver only pays for serializing the changed state. Once the log grows
+    larger than the checkpoint file, it's compacted: the checkpoint file is
+    rewritten with the state of all trials, and the log is started anew.
+
+    The checkpoint file has the usual format, with an extra ``log_id`` that
+    identifies the records in the log that apply to it. Use
+    ``load_experiment_checkpoint`` to read a checkpoint with its log.
+
+    Args:
+        incremental: If False, rewrite the whole checkpoint file each
+            time, without a log.
+    """
+
+    def __init__(self, incremental: bool = True):
+        self._incremental = incremental
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tune_experiment_checkpoint"
+        )
+        self._last_write: Optional[Future] = None
+        # Map trial_id -> JSON state, as of the last write() call.
+        self._trial_states: Dict[str, str] = {}
+
+        # State that is only accessed by the writer thread.
+        self._written_trial_states: Dict[str, str] = {}
+        self._checkpoint_file: Optional[str] = None
+        self._log_id: Optional[str] = None
+        self._checkpoint_bytes = 0
+        self._log_bytes = 0
+
+    def write(
+        self,
+        checkpoint_file: str,
+        trial_states: Dict[str, str],
+        runner_data: Dict[str, Any],
+        stats: Dict[str, Any],
+        compact: bool = False,
+    ):
+        """Writes a checkpoint of the given state.
+
+        Trial states are compared by identity, since trials keep the same JSON
+        string until their state changes. If ``compact`` is set, waits until
+        the checkpoint file is rewritten with the whole state.
+        """
+        changed_trial_states = {
+            trial_id: state
+            for trial_id, state in trial_states.items()
+            if self._trial_states.get(trial_id) is not state
+        }
+        self._trial_states.update(changed_trial_states)
+        # Serialize on this thread, since the runner state may be modified
+        # once we return.
+        runner_data_json = json.dumps(runner_data, cls=TuneFunctionEncoder)
+        stats_json = json.dumps(stats, cls=TuneFunctionEncoder)
+
+        if self._last_write is not None and not self._last_write.done():
+            logger.debug(
+                "The previous experiment checkpoint is still being written, "
+                "queueing this one after it."
+            )
+        self._last_write = self._executor.submit(
+            self._write,
+            checkpoint_file,
+            changed_trial_states,
+            runner_data_json,
+            stats_json,
+            compact or not self._incremental,
+        )
+        if compact:
+            self.flush()
+
+    def flush(self):
+        """Waits until all checkpoints are written."""
+        if self._last_write is not None:
+            self._last_write.result()
+
+    def _write(
+        self,
+        checkpoint_file: str,
+        changed_trial_states: Dict[str, str],
+        runner_data_json: str,
+        stats_json: str,
+        compact: bool,
+    ):
+        self._written_trial_states.update(changed_trial_states)
+        try:
+            if (
+                compact
+                or checkpoint_file != self._checkpoint_file
+                or self._log_bytes >= self._checkpoint_bytes
+            ):
+                self._compact(checkpoint_file, runner_data_json, stats_json)
+            else:
+                record = (
+                    f'{{"log_id": "{self._log_id}", '
+                    f'"checkpoints": {json.dumps(changed_trial_states)}, '
+                    f'"runner_data": {runner_data_json}, "stats": {stats_json}}}\n'
+                )
+                with open(checkpoint_file + EXPERIMENT_CHECKPOINT_LOG_SUFFIX, "a") as f:
+                    f.write(record)
+                self._log_bytes += len(record)
+        except Exception:
+            logger.exception("Failed to write the experiment checkpoint.")
+            # Write the whole state next time.
+            self._checkpoint_file = None
+            raise
+
+    def _compact(self, checkpoint_file: str, runner_data_json: str, stats_json: str):
+        log_id = uuid.uuid4().hex
+        checkpoints_json = json.dumps(
+            list(self._written_trial_states.values()), indent=2
+        )
+        content = (
+            f'{{"log_id": "{log_id}", "checkpoints": {checkpoints_json}, '
+            f'"runner_data": {runner_data_json}, "stats": {stats_json}}}'
+        )
+        tmp_file_name = os.path.join(
+            os.path.dirname(checkpoint_file), ".tmp_checkpoint"
+        )
+        with open(tmp_file_name, "w") as f:
+            f.write(content)
+        os.replace(tmp_file_name, checkpoint_file)
+        # Records left in the old log don't match the new log_id, so they're
+        # ignored even if removing the log fails.
+        try:
+            os.remove(checkpoint_file + EXPERIMENT_CHECKPOINT_LOG_SUFFIX)
+        except FileNotFoundError:
+            pass
+
+        self._checkpoint_file = checkpoint_file
+        self._log_id = log_id
+        self._checkpoint_bytes = len(content)
+        self._log_bytes = 0
+
+
 class _ExperimentCheckpointManager:
     """Helper class for managing experiment-level checkpoints.
 
@@ -127,6 +314,11 @@ class _ExperimentCheckpointManager:
 
         self._last_checkpoint_time = 0.0
 
+        self._writer = _ExperimentCheckpointWriter(
+            incremental=os.environ.get("TUNE_INCREMENTAL_EXPERIMENT_CHECKPOINT", "1")
+            == "1"
+        )
+
     @property
     def auto_checkpoint_enabled(self):
         return self._auto_checkpoint_enabled
@@ -138,6 +330,7 @@ class _ExperimentCheckpointManager:
         trial_executor: RayTrialExecutor,
         search_alg: SearchAlgorithm,
         force: bool = False,
+        wait: bool = True,
     ):
         """Saves execution state to `self._local_checkpoint_dir`.
 
@@ -149,6 +342,9 @@ class _ExperimentCheckpointManager:
 
         Args:
             force: Forces a checkpoint despite checkpoint_period.
+            wait: Whether to wait until the experiment state is written. If
+                False, only the changes are serialized and they're written in
+                the background.
         """
         if not self._checkpoint_dir:
             return
@@ -158,19 +354,21 @@ class _ExperimentCheckpointManager:
             return
 
         def _serialize_and_write():
-            runner_state = {
-                "checkpoints": list(trial_executor.get_checkpoints().values()),
-                "runner_data": trial_runner.__getstate__(),
-                "stats": {
+            # Only the trials that changed since the last checkpoint are
+            # written, and forced checkpoints (e.g., at the end of the
+            # experiment) compact the whole state into the checkpoint file.
+            self._writer.write(
+                checkpoint_file,
+                trial_states=trial_executor.get_checkpoints(),
+                runner_data=trial_runner.__getstate__(),
+                stats={
                     "start_time": self._start_time,
                     "timestamp": self._last_checkpoint_time,
                 },
-            }
-            tmp_file_name = os.path.join(self._checkpoint_dir, ".tmp_checkpoint")
-            with open(tmp_file_name, "w") as f:
-                json.dump(runner_state, f, indent=2, cls=TuneFunctionEncoder)
-
-            os.replace(tmp_file_name, checkpoint_file)
+                compact=force,
+            )
+            if wait:
+                self._writer.flush()
             search_alg.save_to_dir(self._checkpoint_dir, session_str=self._session_str)
 
         checkpoint_time_start = time.monotonic()
@@ -205,6 +403,44 @@ class _ExperimentCheckpointManager:
         return self._checkpoint_dir
 
 
+class _DriverLoopMetrics:
+    """Metrics of the TrialRunner event loop on the driver.
+
+    They show whether the driver keeps up with the events of the trials: if
+    the time spent processing events approaches the time between them, trials
+    wait on the driver to continue training.
+    """
+
+    def __init__(self):
+        self._num_events = metrics.Counter(
+            "tune_driver_events_processed",
+            description="The number of executor events processed by the "
+            "Tune driver loop.",
+            tag_keys=("event_type",),
+        )
+        self._events_per_s = metrics.Gauge(
+            "tune_driver_events_per_s",
+            description="The number of executor events that the Tune driver "
+            "loop processed per second of its last step, not counting the "
+            "time spent waiting for events.",
+        )
+        self._phase_time_ms = metrics.Histogram(
+            "tune_driver_step_phase_ms",
+            description="The time spent in each phase of a Tune driver loop step.",
+            boundaries=[1, 5, 10, 50, 100, 500, 1000, 5000, 10000],
+            tag_keys=("phase",),
+        )
+
+    def record_phase(self, phase: str, duration_s: float):
+        self._phase_time_ms.observe(duration_s * 1000, tags={"phase": phase})
+
+    def record_events(self, events: List[_ExecutorEvent], busy_s: float):
+        for event_type, count in Counter(event.type for event in events).items():
+            self._num_events.inc(count, tags={"event_type": event_type.name})
+        if busy_s > 0:
+            self._events_per_s.set(len(events) / busy_s)
+
+
 @DeveloperAPI
 class TrialRunner:
     """A TrialRunner implements the event loop for scheduling trials on Ray.
@@ -258,6 +494,11 @@ class TrialRunner:
             reported without this metric, an error will be raised. The error
             can be omitted by not providing a metric or by setting the env
             variable ``TUNE_DISABLE_STRICT_METRIC_CHECKING=0``
+        max_events_per_step: The max number of executor events that are
+            processed in one step. Training results that are ready at the
+            same time are processed as a batch, with one call of the
+            scheduler and callbacks for the batch. Defaults to the env
+            variable ``TUNE_MAX_EVENTS_PER_STEP``, or 1.
 
     """
 
@@ -280,6 +521,7 @@ class TrialRunner:
         trial_executor: Optional[RayTrialExecutor] = None,
         callbacks: Optional[List[Callback]] = None,
         metric: Optional[str] = None,
+        max_events_per_step: Optional[int] = None,
         # Deprecate on next refactor
         driver_sync_trial_checkpoints: bool = False,
     ):
@@ -318,6 +560,23 @@ class TrialRunner:
             self._max_pending_trials = int(max_pending_trials)
         self.trial_executor.set_max_pending_trials(self._max_pending_trials)
 
+        if max_events_per_step is None:
+            max_events_per_step = int(os.getenv("TUNE_MAX_EVENTS_PER_STEP", "1"))
+        if (
+            max_events_per_step > 1
+            and not self._scheduler_alg.supports_buffered_results
+        ):
+            # Schedulers like HyperBand act on other trials than the one that
+            # reported, so their results have to be processed one by one.
+            logger.warning(
+                f"Processing the results of several trials at once is not "
+                f"supported by {type(self._scheduler_alg).__name__}, "
+                f"ignoring max_events_per_step={max_events_per_step}."
+            )
+            max_events_per_step = 1
+        self._max_events_per_step = max_events_per_step
+        self._driver_loop_metrics = _DriverLoopMetrics()
+
         self._metric = metric
 
         self._total_time = 0
@@ -594,7 +853,7 @@ class TrialRunner:
             for fname in os.listdir(directory)
         )
 
-    def checkpoint(self, force: bool = False):
+    def checkpoint(self, force: bool = False, wait: bool = True):
         """Saves execution state to `self._local_checkpoint_dir`.
 
         Overwrites the current session checkpoint, which starts when self
@@ -605,6 +864,8 @@ class TrialRunner:
 
         Args:
             force: Forces a checkpoint despite checkpoint_period.
+            wait: Whether to wait until the experiment state is written. If
+                False, it's written in the background.
         """
         with warn_if_slow(
             "experiment_checkpoint",
@@ -626,6 +887,7 @@ class TrialRunner:
                 trial_executor=self.trial_executor,
                 search_alg=self._search_alg,
                 force=force,
+                wait=wait,
             )
 
     def resume(self, run_errored_only=False):
@@ -643,9 +905,8 @@ class TrialRunner:
                 f"experiment checkpoint data was found."
             )
 
-        with open(newest_ckpt_path, "r") as f:
-            runner_state = json.load(f, cls=TuneFunctionDecoder)
-            self.checkpoint_file = newest_ckpt_path
+        runner_state = load_experiment_checkpoint(newest_ckpt_path)
+        self.checkpoint_file = newest_ckpt_path
 
         logger.warning(
             "".join(
@@ -724,9 +985,38 @@ class TrialRunner:
     def _wait_and_handle_event(self, next_trial: Optional[Trial]):
         try:
             # Single wait of entire tune loop.
-            event = self.trial_executor.get_next_executor_event(
-                self._live_trials, next_trial is not None
+            wait_start = time.monotonic()
+            events = self.trial_executor.get_next_executor_events(
+                self._live_trials,
+                next_trial is not None,
+                max_events=self._max_events_per_step,
             )
+            process_start = time.monotonic()
+            self._handle_events(next_trial, events)
+            process_end = time.monotonic()
+        except Exception as e:
+            if e is TuneError or self._fail_fast == TrialRunner.RAISE:
+                raise e
+            else:
+                raise TuneError(traceback.format_exc())
+        self._driver_loop_metrics.record_phase("wait", process_start - wait_start)
+        self._driver_loop_metrics.record_phase("process", process_end - process_start)
+        self._driver_loop_metrics.record_events(events, process_end - process_start)
+
+    def _handle_events(self, next_trial: Optional[Trial], events: List[_ExecutorEvent]):
+        # Training results are processed together, other events one by one in
+        # the order they were received.
+        training_results = []
+        for event in events:
+            if event.type == _ExecutorEventType.TRAINING_RESULT:
+                training_results.append(
+                    (event.trial, event.result[_ExecutorEvent.KEY_FUTURE_RESULT])
+                )
+                continue
+            if training_results:
+                self._on_training_results(training_results)
+                training_results = []
+
             if event.type == _ExecutorEventType.PG_READY:
                 self._on_pg_ready(next_trial)
             elif event.type == _ExecutorEventType.NO_RUNNING_TRIAL_TIMEOUT:
@@ -743,24 +1033,15 @@ class TrialRunner:
                 elif event.type == _ExecutorEventType.RESTORING_RESULT:
                     self._on_restoring_result(trial)
                 else:
-                    assert event.type in (
-                        _ExecutorEventType.SAVING_RESULT,
-                        _ExecutorEventType.TRAINING_RESULT,
+                    assert (
+                        event.type == _ExecutorEventType.SAVING_RESULT
                     ), f"Unexpected future type - {event.type}"
-                    if event.type == _ExecutorEventType.TRAINING_RESULT:
-                        self._on_training_result(
-                            trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
-                        )
-                    else:
-                        self._on_saving_result(
-                            trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
-                        )
+                    self._on_saving_result(
+                        trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
+                    )
                     self._post_process_on_training_saving_result(trial)
-        except Exception as e:
-            if e is TuneError or self._fail_fast == TrialRunner.RAISE:
-                raise e
-            else:
-                raise TuneError(traceback.format_exc())
+        if training_results:
+            self._on_training_results(training_results)
 
     def step(self):
         """Runs one step of the trial event loop.
@@ -785,10 +1066,15 @@ class TrialRunner:
 
         self._stop_experiment_if_needed()
 
+        checkpoint_start = time.monotonic()
         try:
-            self.checkpoint()
+            # Don't block the event loop on writing the experiment state.
+            self.checkpoint(wait=False)
         except Exception as e:
             logger.warning(f"Trial Runner checkpointing failed: {str(e)}")
+        self._driver_loop_metrics.record_phase(
+            "checkpoint", time.monotonic() - checkpoint_start
+        )
         self._iteration += 1
 
         if self._server:
@@ -869,11 +1155,15 @@ class TrialRunner:
                 iteration=self._iteration, trials=self._trials, trial=trial
             )
 
-    def _on_training_result(self, trial, result):
-        if not isinstance(result, list):
-            result = [result]
+    def _on_training_results(self, trials_and_results: List[Tuple[Trial, Any]]):
+        trials_and_results = [
+            (trial, results if isinstance(results, list) else [results])
+            for trial, results in trials_and_results
+        ]
         with warn_if_slow("process_trial_result"):
-            self._process_trial_results(trial, result)
+            self._process_trial_results_batch(trials_and_results)
+        for trial, _ in trials_and_results:
+            self._post_process_on_training_saving_result(trial)
 
     def _post_process_on_training_saving_result(self, trial):
         # `self._queued_trial_decisions` now contains a final decision
@@ -948,96 +1238,157 @@ class TrialRunner:
             ]
 
     def _process_trial_results(self, trial, results):
-        logger.debug(f"Processing trial results for trial {trial}: {results}")
+        self._process_trial_results_batch([(trial, results)])
+
+    def _process_trial_results_batch(
+        self, trials_and_results: List[Tuple[Trial, List[Dict]]]
+    ):
+        """Processes the results of several trials.
+
+        The i-th results of all trials are processed together, so that the
+        scheduler and callbacks are called once per batch of results.
+        """
+        logger.debug(f"Processing trial results: {trials_and_results}")
         with warn_if_slow(
             "process_trial_results",
             message="Processing trial results took {duration:.3f} s, "
             "which may be a performance bottleneck. Please consider "
             "reporting results less frequently to Ray Tune.",
         ):
-            for i, result in enumerate(results):
+            i = 0
+            while trials_and_results:
                 with warn_if_slow("process_trial_result"):
-                    decision = self._process_trial_result(trial, result)
-                if decision is None:
-                    # If we didn't get a decision, this means a
-                    # non-training future (e.g. a save) was scheduled.
-                    # We do not allow processing more results then.
+                    decisions = self._process_trial_result_batch(
+                        [(trial, results[i]) for trial, results in trials_and_results]
+                    )
+                remaining = []
+                for (trial, results), decision in zip(trials_and_results, decisions):
+                    if decision is None:
+                        # If we didn't get a decision, this means a
+                        # non-training future (e.g. a save) was scheduled.
+                        # We do not allow processing more results then.
+                        if i < len(results) - 1:
+                            if log_once("trial_runner_buffer_checkpoint"):
+                                logger.warning(
+                                    f"Trial {trial} has a non-training future "
+                                    f"scheduled but {len(results) - i} results "
+                                    f"left to process. This means that a "
+                                    f"checkpoint was requested, but buffered "
+                                    f"training was continued before it was "
+                                    f"saved. Consider using non-buffered "
+                                    f"training by setting the env variable "
+                                    f"`TUNE_RESULT_BUFFER_LENGTH=1`."
+                                )
+                    elif decision == TrialScheduler.STOP:
+                        # If the decision is to stop the trial,
+                        # ignore all results that came after that.
+                        continue
                     if i < len(results) - 1:
-                        if log_once("trial_runner_buffer_checkpoint"):
-                            logger.warning(
-                                f"Trial {trial} has a non-training future "
-                                f"scheduled but {len(results) - i} results "
-                                f"left to process. This means that a "
-                                f"checkpoint was requested, but buffered "
-                                f"training was continued before it was "
-                                f"saved. Consider using non-buffered "
-                                f"training by setting the env variable "
-                                f"`TUNE_RESULT_BUFFER_LENGTH=1`."
-                            )
-                elif decision == TrialScheduler.STOP:
-                    # If the decision is to stop the trial,
-                    # ignore all results that came after that.
-                    break
+                        remaining.append((trial, results))
+                trials_and_results = remaining
+                i += 1
 
     def _process_trial_result(self, trial, result):
-        result.update(trial_id=trial.trial_id)
-        is_duplicate = RESULT_DUPLICATE in result
-        force_checkpoint = result.get(SHOULD_CHECKPOINT, False)
-        # TrialScheduler and SearchAlgorithm still receive a
-        # notification because there may be special handling for
-        # the `on_trial_complete` hook.
-        if is_duplicate:
-            logger.debug("Trial finished without logging 'done'.")
-            result = trial.last_result
-            result.update(done=True)
-
-        self._total_time += result.get(TIME_THIS_ITER_S, 0)
-
-        flat_result = flatten_dict(result)
-        self._validate_result_metrics(flat_result)
-
-        if self._stopper(trial.trial_id, result) or trial.should_stop(flat_result):
-            decision = TrialScheduler.STOP
-        else:
+        return self._process_trial_result_batch([(trial, result)])[0]
+
+    def _process_trial_result_batch(
+        self, trials_and_results: List[Tuple[Trial, Dict]]
+    ) -> List[Optional[str]]:
+        """Processes one result for each of the given trials.
+
+        Returns the scheduler decision for each trial, or None if the decision
+        is cached until the trial is saved.
+        """
+        trials = []
+        results = []
+        flat_results = []
+        is_duplicates = []
+        force_checkpoints = []
+        decisions = []
+        for trial, result in trials_and_results:
+            result.update(trial_id=trial.trial_id)
+            is_duplicate = RESULT_DUPLICATE in result
+            force_checkpoints.append(result.get(SHOULD_CHECKPOINT, False))
+            # TrialScheduler and SearchAlgorithm still receive a
+            # notification because there may be special handling for
+            # the `on_trial_complete` hook.
+            if is_duplicate:
+                logger.debug("Trial finished without logging 'done'.")
+                result = trial.last_result
+                result.update(done=True)
+
+            self._total_time += result.get(TIME_THIS_ITER_S, 0)
+
+            flat_result = flatten_dict(result)
+            self._validate_result_metrics(flat_result)
+
+            if self._stopper(trial.trial_id, result) or trial.should_stop(flat_result):
+                decisions.append(TrialScheduler.STOP)
+            else:
+                decisions.append(None)
+            trials.append(trial)
+            results.append(result)
+            flat_results.append(flat_result)
+            is_duplicates.append(is_duplicate)
+
+        to_schedule = [i for i, decision in enumerate(decisions) if decision is None]
+        if to_schedule:
             with warn_if_slow("scheduler.on_trial_result"):
-                decision = self._scheduler_alg.on_trial_result(self, trial, flat_result)
-        if decision == TrialScheduler.STOP:
-            result.update(done=True)
-        else:
-            # Only updating search alg if the trial is not to be stopped.
-            with warn_if_slow("search_alg.on_trial_result"):
-                self._search_alg.on_trial_result(trial.trial_id, flat_result)
+                scheduler_decisions = self._scheduler_alg.on_trial_results(
+                    self, [(trials[i], flat_results[i]) for i in to_schedule]
+                )
+            for i, decision in zip(to_schedule, scheduler_decisions):
+                decisions[i] = decision
+
+        for trial, result, flat_result, decision in zip(
+            trials, results, flat_results, decisions
+        ):
+            if decision == TrialScheduler.STOP:
+                result.update(done=True)
+            else:
+                # Only updating search alg if the trial is not to be stopped.
+                with warn_if_slow("search_alg.on_trial_result"):
+                    self._search_alg.on_trial_result(trial.trial_id, flat_result)
 
         # If this is not a duplicate result, the callbacks should
         # be informed about the result.
-        if not is_duplicate:
+        callback_results = [
+            (trial, result.copy())
+            for trial, result, is_duplicate in zip(trials, results, is_duplicates)
+            if not is_duplicate
+        ]
+        if callback_results:
             with warn_if_slow("callbacks.on_trial_result"):
-                self._callbacks.on_trial_result(
+                self._callbacks.on_trial_results(
                     iteration=self._iteration,
                     trials=self._trials,
-                    trial=trial,
-                    result=result.copy(),
+                    trials_and_results=callback_results,
                 )
-            trial.update_last_result(result)
-            # Include in next experiment checkpoint
-            self.trial_executor.mark_trial_to_checkpoint(trial)
 
-        # Checkpoints to disk. This should be checked even if
-        # the scheduler decision is STOP or PAUSE. Note that
-        # PAUSE only checkpoints to memory and does not update
-        # the global checkpoint state.
-        self._checkpoint_trial_if_needed(trial, force=force_checkpoint)
+        for i, trial in enumerate(trials):
+            if not is_duplicates[i]:
+                trial.update_last_result(results[i])
+                # Include in next experiment checkpoint
+                self.trial_executor.mark_trial_to_checkpoint(trial)
+
+            # Checkpoints to disk. This should be checked even if
+            # the scheduler decision is STOP or PAUSE. Note that
+            # PAUSE only checkpoints to memory and does not update
+            # the global checkpoint state.
+            self._checkpoint_trial_if_needed(trial, force=force_checkpoints[i])
 
-        if trial.is_saving:
-            logger.debug(f"Caching trial decision for trial {trial}: {decision}")
-            # Cache decision to execute on after the save is processed.
-            # This prevents changing the trial's state or kicking off
-            # another training step prematurely.
-            self._cached_trial_decisions[trial.trial_id] = decision
-            return None
-        else:
-            self._queue_decision(trial, decision)
-            return decision
+            if trial.is_saving:
+                logger.debug(
+                    f"Caching trial decision for trial {trial}: {decisions[i]}"
+                )
+                # Cache decision to execute on after the save is processed.
+                # This prevents changing the trial's state or kicking off
+                # another training step prematurely.
+                self._cached_trial_decisions[trial.trial_id] = decisions[i]
+                decisions[i] = None
+            else:
+                self._queue_decision(trial, decisions[i])
+        return decisions
 
     def _validate_result_metrics(self, result):
         """
@@ -1405,6 +1756,8 @@ class TrialRunner:
             "_syncer",
             "_callbacks",
             "_checkpoint_manager",
+            "_max_events_per_step",
+            "_driver_loop_metrics",
         ]:
             del state[k]
         state["launch_web_server"] = bool(self._server)
@@ -1422,6 +1775,7 @@ class TrialRunner:
 
         self.__dict__.update(state)
         self._checkpoint_manager = self._create_checkpoint_manager()
+        self._driver_loop_metrics = _DriverLoopMetrics()
 
         if launch_web_server:
             self._server = TuneServer(self, self._server_port)
@@ -12,6 +12,7 @@ from ray.tune.logger import (
     JsonLoggerCallback,
     JsonLogger,
     LegacyLoggerCallback,
+    ParquetLoggerCallback,
     TBXLoggerCallback,
     TBXLogger,
 )
@@ -85,6 +86,8 @@ def create_default_callbacks(
         elif isinstance(callback, TBXLoggerCallback):
             has_tbx_logger = True
             last_logger_index = i
+        elif isinstance(callback, ParquetLoggerCallback):
+            last_logger_index = i
         elif isinstance(callback, SyncerCallback):
             syncer_index = i
             has_syncer_callback = True
@@ -1,9 +1,11 @@
+import hashlib
 import io
 import os
 import shutil
 import tarfile
+import tempfile
 
-from typing import Optional, Tuple, Dict, Generator, Union
+from typing import Optional, Tuple, Dict, Generator, List, Union
 
 import ray
 from ray.util.ml_utils.filelock import TempFileLock
@@ -12,6 +14,12 @@ from ray.util.ml_utils.filelock import TempFileLock
 _DEFAULT_CHUNK_SIZE_BYTES = 500 * 1024 * 1024  # 500 MiB
 _DEFAULT_MAX_SIZE_BYTES = 1 * 1024 * 1024 * 1024  # 1 GiB
 
+# Files are split into chunks of this size for incremental syncing.
+_DEFAULT_FILE_CHUNK_SIZE_BYTES = 4 * 1024 * 1024  # 4 MiB
+# Max size of the chunks that are cached on each node for incremental syncing.
+_DEFAULT_CHUNK_CACHE_MAX_SIZE_BYTES = 1 * 1024 * 1024 * 1024  # 1 GiB
+_CHUNK_CACHE_DIR_NAME = "ray_tune_sync_chunk_cache"
+
 
 def sync_dir_between_nodes(
     source_ip: str,
@@ -22,6 +30,7 @@ def sync_dir_between_nodes(
     chunk_size_bytes: int = _DEFAULT_CHUNK_SIZE_BYTES,
     max_size_bytes: Optional[int] = _DEFAULT_MAX_SIZE_BYTES,
     return_futures: bool = False,
+    incremental: bool = False,
 ) -> Union[
     None,
     Tuple[ray.ObjectRef, ray.ActorID, ray.ObjectRef],
@@ -52,6 +61,13 @@ def sync_dir_between_nodes(
         return_futures: If True, returns a tuple of the unpack future,
             the pack actor, and the files_stats future. If False (default) will
             block until synchronization finished and return None.
+        incremental: If True, only the chunks of the differing files that are
+            not available on the target node already are transferred. Chunks
+            are identified by their content hash, and are looked up in the
+            previous version of the file in the target directory and in a
+            cache of the chunks recently received by the target node, so
+            that e.g. identical checkpoints of different trials are only
+            transferred once. Ignored if ``source_ip==target_ip``.
 
     Returns:
         None, or Tuple of unpack future, pack actor, and files_stats future.
@@ -68,6 +84,7 @@ def sync_dir_between_nodes(
             chunk_size_bytes=chunk_size_bytes,
             max_size_bytes=max_size_bytes,
             return_futures=return_futures,
+            incremental=incremental,
         )
     elif source_path != target_path:
         ret = _sync_dir_on_same_node(
@@ -122,6 +139,7 @@ def _sync_dir_between_different_nodes(
     chunk_size_bytes: int = _DEFAULT_CHUNK_SIZE_BYTES,
     max_size_bytes: Optional[int] = _DEFAULT_MAX_SIZE_BYTES,
     return_futures: bool = False,
+    incremental: bool = False,
 ) -> Union[None, Tuple[ray.ObjectRef, ray.ActorID, ray.ObjectRef]]:
     """Synchronize directory on source node to directory on target node.
 
@@ -141,6 +159,8 @@ def _sync_dir_between_different_nodes(
         return_futures: If True, returns a tuple of the unpack future,
             the pack actor, and the files_stats future. If False (default) will
             block until synchronization finished and return None.
+        incremental: If True, only transfer the chunks of differing files
+            that are not available on the target node already.
 
     Returns:
         None, or Tuple of unpack future, pack actor, and files_stats future.
@@ -149,7 +169,8 @@ def _sync_dir_between_different_nodes(
     pack_actor_on_source_node = _PackActor.options(
         num_cpus=0, resources={f"node:{source_ip}": 0.01}, placement_group=None
     )
-    unpack_on_target_node = _unpack_from_actor.options(
+    unpack_func = _unpack_chunks_from_actor if incremental else _unpack_from_actor
+    unpack_on_target_node = unpack_func.options(
         num_cpus=0, resources={f"node:{target_ip}": 0.01}, placement_group=None
     )
 
@@ -165,6 +186,7 @@ def _sync_dir_between_different_nodes(
         files_stats=files_stats,
         chunk_size_bytes=chunk_size_bytes,
         max_size_bytes=max_size_bytes,
+        incremental=incremental,
     )
     unpack_future = unpack_on_target_node.remote(pack_actor, target_path)
 
@@ -272,6 +294,107 @@ def _pack_dir(
     return stream
 
 
+def _hash_chunk(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _hash_file_chunks(path: str, file_chunk_size_bytes: int) -> List[str]:
+    """Return the content hashes of the chunks of a file."""
+    chunk_hashes = []
+    with open(path, "rb") as f:
+        for data in iter(lambda: f.read(file_chunk_size_bytes), b""):
+            chunk_hashes.append(_hash_chunk(data))
+    return chunk_hashes
+
+
+def _get_files_manifest(
+    source_dir: str,
+    files_stats: Optional[Dict[str, Tuple[float, int]]] = None,
+    file_chunk_size_bytes: int = _DEFAULT_FILE_CHUNK_SIZE_BYTES,
+) -> Tuple[List[str], Dict[str, Tuple[int, int, List[str]]]]:
+    """Describe directory contents by the content hashes of their chunks.
+
+    Like in ``_pack_dir``, if ``files_stats`` are given only files whose stats
+    differ from these stats are included.
+
+    Args:
+        source_dir: Path to local directory to describe.
+        files_stats: Dict of relative filenames mapping to a tuple of
+            (mtime, filesize). Only files that differ from these stats
+            will be included.
+        file_chunk_size_bytes: Size of the chunks that are hashed.
+
+    Returns:
+        Tuple of the relative paths of all directories, and a dict of relative
+        filenames mapping to a tuple of (mtime in nanoseconds, mode,
+        chunk hashes).
+    """
+    dirs = []
+    files = {}
+    for root, dir_names, file_names in os.walk(source_dir, topdown=False):
+        rel_root = os.path.relpath(root, source_dir)
+        dirs.extend(os.path.join(rel_root, dir_name) for dir_name in dir_names)
+        for file_name in file_names:
+            key = os.path.join(rel_root, file_name)
+            path = os.path.join(source_dir, key)
+            # Compare the same stats as ``_get_recursive_files_and_stats``.
+            stat = os.lstat(path)
+            file_stat = stat.st_mtime, stat.st_size
+            if files_stats and key in files_stats and file_stat == files_stats[key]:
+                continue
+            mode = stat.st_mode
+            if os.path.islink(path):
+                # Symlinks are synced as files with the contents of their target.
+                mode = os.stat(path).st_mode
+            files[key] = (
+                stat.st_mtime_ns,
+                mode,
+                _hash_file_chunks(path, file_chunk_size_bytes),
+            )
+    return dirs, files
+
+
+def _pack_chunks(
+    source_dir: str,
+    files: Dict[str, Tuple[int, int, List[str]]],
+    chunk_hashes: List[str],
+    file_chunk_size_bytes: int = _DEFAULT_FILE_CHUNK_SIZE_BYTES,
+) -> io.BytesIO:
+    """Pack file chunks into an uncompressed tarfile, named by their hashes.
+
+    Args:
+        source_dir: Path to local directory that contains the files.
+        files: Files manifest as returned by ``_get_files_manifest``.
+        chunk_hashes: Hashes of the chunks to pack.
+        file_chunk_size_bytes: Size of the chunks the files were hashed in.
+
+    Returns:
+        Tarfile as a stream object.
+    """
+    chunk_locations = {}
+    for key, (_, _, file_chunk_hashes) in files.items():
+        for i, chunk_hash in enumerate(file_chunk_hashes):
+            chunk_locations.setdefault(chunk_hash, (key, i))
+
+    stream = io.BytesIO()
+    with tarfile.open(fileobj=stream, mode="w", format=tarfile.PAX_FORMAT) as tar:
+        for chunk_hash in chunk_hashes:
+            key, i = chunk_locations[chunk_hash]
+            with open(os.path.join(source_dir, key), "rb") as f:
+                f.seek(i * file_chunk_size_bytes)
+                data = f.read(file_chunk_size_bytes)
+            if _hash_chunk(data) != chunk_hash:
+                raise RuntimeError(
+                    f"File {key} in {source_dir} changed while it was synced. "
+                    "Please try again."
+                )
+            info = tarfile.TarInfo(name=chunk_hash)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    return stream
+
+
 def _gib_string(num_bytes: float) -> str:
     return f"{float(num_bytes / 1024 ** 3):.2f}GiB"
 
@@ -294,6 +417,10 @@ class _PackActor:
         chunk_size_bytes: Cut bytes stream into chunks of this size in bytes.
         max_size_bytes: If packed data exceeds this value, raise an error before
             transfer. If ``None``, no limit is enforced.
+        incremental: If True, don't pack the directory when initialized.
+            Instead, the target gets the files manifest with
+            ``get_manifest()``, and requests the chunks it's missing with
+            ``pack_chunks()``.
     """
 
     def __init__(
@@ -302,23 +429,50 @@ class _PackActor:
         files_stats: Optional[Dict[str, Tuple[float, int]]] = None,
         chunk_size_bytes: int = _DEFAULT_CHUNK_SIZE_BYTES,
         max_size_bytes: Optional[int] = _DEFAULT_MAX_SIZE_BYTES,
+        incremental: bool = False,
     ):
-        self.stream = _pack_dir(source_dir=source_dir, files_stats=files_stats)
+        self.source_dir = source_dir
+        self.chunk_size = chunk_size_bytes
+        self.max_size = max_size_bytes
+        self.iter = None
+
+        if incremental:
+            self.manifest = _get_files_manifest(
+                source_dir=source_dir, files_stats=files_stats
+            )
+            self.stream = io.BytesIO()
+        else:
+            self.manifest = None
+            self.stream = _pack_dir(source_dir=source_dir, files_stats=files_stats)
+            self._check_size()
 
+    def _check_size(self):
         # Get buffer size
         self.stream.seek(0, 2)
         file_size = self.stream.tell()
 
-        if max_size_bytes and file_size > max_size_bytes:
+        if self.max_size and file_size > self.max_size:
             raise RuntimeError(
-                f"Packed directory {source_dir} content has a size of "
+                f"Packed directory {self.source_dir} content has a size of "
                 f"{_gib_string(file_size)}, which exceeds the limit "
-                f"of {_gib_string(max_size_bytes)}. Please check the directory "
+                f"of {_gib_string(self.max_size)}. Please check the directory "
                 f"contents. If you want to transfer everything, you can increase "
                 f"or disable the limit by passing the `max_size` argument."
             )
-        self.chunk_size = chunk_size_bytes
-        self.max_size = max_size_bytes
+
+    def get_manifest(
+        self,
+    ) -> Tuple[List[str], Dict[str, Tuple[int, int, List[str]]]]:
+        return self.manifest
+
+    def pack_chunks(self, chunk_hashes: List[str]) -> None:
+        """Pack the given file chunks, to be received by calling ``next()``."""
+        self.stream = _pack_chunks(
+            source_dir=self.source_dir,
+            files=self.manifest[1],
+            chunk_hashes=chunk_hashes,
+        )
+        self._check_size()
         self.iter = None
 
     def get_full_data(self) -> bytes:
@@ -387,6 +541,185 @@ def _unpack_from_actor(pack_actor: ray.ActorID, target_dir: str) -> None:
     _unpack_dir(stream, target_dir=target_dir)
 
 
+def _get_chunk_cache_dir() -> str:
+    cache_dir = os.path.join(tempfile.gettempdir(), _CHUNK_CACHE_DIR_NAME)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def _evict_chunk_cache(cache_dir: str, max_size_bytes: int) -> None:
+    """Remove the least recently used chunks until the cache fits in
+    ``max_size_bytes``."""
+    chunks = []
+    for entry in os.scandir(cache_dir):
+        # Skip staging directories and temporary files.
+        if entry.name.startswith(".") or not entry.is_file():
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        chunks.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in chunks)
+    for _, size, path in sorted(chunks):
+        if total_size <= max_size_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+
+
+def _stage_local_chunks(
+    target_dir: str,
+    files: Dict[str, Tuple[int, int, List[str]]],
+    cache_dir: str,
+    staging_dir: str,
+    file_chunk_size_bytes: int = _DEFAULT_FILE_CHUNK_SIZE_BYTES,
+) -> List[str]:
+    """Put the chunks of ``files`` that are available on this node into
+    ``staging_dir``, and return the hashes of the missing chunks.
+
+    Chunks are taken from the chunk cache, or from the previous versions of
+    the files in the target directory. Cached chunks whose contents don't match
+    their hash are removed from the cache.
+    """
+    needed = {
+        chunk_hash
+        for _, _, chunk_hashes in files.values()
+        for chunk_hash in chunk_hashes
+    }
+    for chunk_hash in list(needed):
+        cached_chunk = os.path.join(cache_dir, chunk_hash)
+        staged_chunk = os.path.join(staging_dir, chunk_hash)
+        try:
+            # Link the chunk, so that it can't be evicted before it's used.
+            _link_or_copy(cached_chunk, staged_chunk)
+        except FileNotFoundError:
+            continue
+        with open(staged_chunk, "rb") as f:
+            valid = _hash_chunk(f.read()) == chunk_hash
+        if not valid:
+            os.remove(staged_chunk)
+            try:
+                os.remove(cached_chunk)
+            except FileNotFoundError:
+                pass
+            continue
+        os.utime(cached_chunk)
+        needed.discard(chunk_hash)
+
+    for key in files:
+        if not needed:
+            break
+        path = os.path.join(target_dir, key)
+        if not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            for data in iter(lambda: f.read(file_chunk_size_bytes), b""):
+                chunk_hash = _hash_chunk(data)
+                if chunk_hash in needed:
+                    with open(os.path.join(staging_dir, chunk_hash), "wb") as out:
+                        out.write(data)
+                    needed.discard(chunk_hash)
+
+    return sorted(needed)
+
+
+def _unpack_chunks(
+    stream: io.BytesIO, staging_dir: str, cache_dir: str, cache_max_size_bytes: int
+) -> None:
+    """Unpack received chunks into ``staging_dir``, and add them to the
+    chunk cache.
+
+    Raises a RuntimeError if a chunk doesn't match its hash, before any of the
+    received chunks are added to the cache.
+    """
+    stream.seek(0)
+    with tarfile.open(fileobj=stream) as tar:
+        for member in tar.getmembers():
+            data = tar.extractfile(member).read()
+            if _hash_chunk(data) != member.name:
+                raise RuntimeError(
+                    f"Received file chunk {member.name} doesn't match its hash."
+                )
+            with open(os.path.join(staging_dir, member.name), "wb") as f:
+                f.write(data)
+
+    for chunk_hash in os.listdir(staging_dir):
+        cached_chunk = os.path.join(cache_dir, chunk_hash)
+        if not os.path.exists(cached_chunk):
+            tmp_chunk = os.path.join(cache_dir, f".{chunk_hash}.{os.getpid()}")
+            _link_or_copy(os.path.join(staging_dir, chunk_hash), tmp_chunk)
+            os.replace(tmp_chunk, cached_chunk)
+    _evict_chunk_cache(cache_dir, cache_max_size_bytes)
+
+
+def _assemble_files(
+    target_dir: str,
+    dirs: List[str],
+    files: Dict[str, Tuple[int, int, List[str]]],
+    staging_dir: str,
+) -> None:
+    """Write files from the chunks in ``staging_dir`` into the target dir."""
+    target_dir = os.path.normpath(target_dir)
+    with TempFileLock(f"{target_dir}.lock"):
+        os.makedirs(target_dir, exist_ok=True)
+        for dir in dirs:
+            os.makedirs(os.path.join(target_dir, dir), exist_ok=True)
+        for key, (mtime_ns, mode, chunk_hashes) in files.items():
+            path = os.path.join(target_dir, key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first, so that readers never see a
+            # partially written file.
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                for chunk_hash in chunk_hashes:
+                    with open(os.path.join(staging_dir, chunk_hash), "rb") as chunk:
+                        shutil.copyfileobj(chunk, f)
+            os.chmod(tmp_path, mode & 0o7777)
+            os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+            os.replace(tmp_path, path)
+
+
+@ray.remote
+def _unpack_chunks_from_actor(
+    pack_actor: ray.ActorID,
+    target_dir: str,
+    cache_max_size_bytes: int = _DEFAULT_CHUNK_CACHE_MAX_SIZE_BYTES,
+) -> None:
+    """Receive the chunks that are missing on this node from the pack actor,
+    and assemble the files from them."""
+    dirs, files = ray.get(pack_actor.get_manifest.remote())
+    cache_dir = _get_chunk_cache_dir()
+    staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=cache_dir)
+    try:
+        missing_chunks = _stage_local_chunks(
+            target_dir=target_dir,
+            files=files,
+            cache_dir=cache_dir,
+            staging_dir=staging_dir,
+        )
+        if missing_chunks:
+            ray.get(pack_actor.pack_chunks.remote(missing_chunks))
+            stream = io.BytesIO()
+            for buffer in _iter_remote(pack_actor):
+                stream.write(buffer)
+            _unpack_chunks(stream, staging_dir, cache_dir, cache_max_size_bytes)
+        _assemble_files(target_dir, dirs, files, staging_dir)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
 def _copy_dir(source_dir: str, target_dir: str, *, _retry: bool = True) -> None:
     """Copy dir with shutil on the actor."""
     target_dir = os.path.normpath(target_dir)
@@ -109,6 +109,24 @@ class TrainableUtil:
         out.write(data_dict)
         return out.getvalue()
 
+    @staticmethod
+    def checkpoint_dict_to_object(checkpoint: Dict, trainable_state: Dict) -> bytes:
+        """Serializes a dict checkpoint without writing it to disk.
+
+        Like the objects returned by ``checkpoint_to_object()``, the returned
+        object can be restored with ``Trainable.restore_from_object()``.
+        """
+        trainable_state["saved_as_dict"] = True
+        data_dict = pickle.dumps(
+            {
+                "checkpoint_dict": checkpoint,
+                "metadata": trainable_state,
+            }
+        )
+        if len(data_dict) > 10e6:  # getting pretty large
+            logger.info("Checkpoint size is {} bytes".format(len(data_dict)))
+        return data_dict
+
     @staticmethod
     def find_checkpoint_dir(checkpoint_path):
         """Returns the directory containing the checkpoint path.
@@ -173,8 +191,8 @@ class TrainableUtil:
         return checkpoint_dir
 
     @staticmethod
-    def create_from_pickle(obj, tmpdir):
-        info = pickle.loads(obj)
+    def create_from_pickle(obj: Union[bytes, Dict], tmpdir: str) -> str:
+        info = pickle.loads(obj) if isinstance(obj, bytes) else obj
         data = info["data"]
         checkpoint_path = os.path.join(tmpdir, info["checkpoint_name"])
 